@@ -1,4 +1,9 @@
+import bisect
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 from ai.llm_client import GenericLLMClient
 
@@ -109,12 +114,180 @@ _NPC_MOVE_DAMAGE_MULTIPLIERS: Dict[str, float] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Suggestion cache
+# ---------------------------------------------------------------------------
+#
+# Consecutive beats often present the LLM with what is, tactically, the same
+# situation: a point of HP or a foot of distance changes the prompt text but
+# not the advice. The fingerprint below keeps only what the system prompt
+# tells the model to act on, quantised at the thresholds the prompt itself
+# uses, so such beats share one cached answer.
+#
+# Deliberately excluded: the narrative history and previous move (flavour,
+# never decisive), move descriptions (static per move), and absolute
+# positions (distance is what matters and is kept, banded).
+
+# Bucket edges are the prompt's own thresholds (CRITICAL < 25%, LOW < 50%)
+# plus a few finer steps so "nearly dead" and "barely scratched" differ.
+_PCT_EDGES = (0.10, 0.25, 0.40, 0.50, 0.75, 0.90)
+# The heat labels switch at 0.8 / 1.2 / 2.0; the extra edges keep a 1.3x and a
+# 1.9x streak apart.
+_HEAT_EDGES = (0.8, 1.0, 1.2, 1.5, 2.0, 3.0, 5.0)
+# Feet. Point-blank (<= 1) and "safe distance" (> 5) are called out in the
+# prompt; per-move reach is captured separately through viable targets.
+_DISTANCE_EDGES = (1, 3, 5, 10, 15, 25, 40)
+# Beats until an enemy's telegraphed move lands; the prompt only
+# distinguishes 1, 2 and "later".
+_IMPACT_CAP = 3
+
+_DEFAULT_CACHE_SIZE = 256
+_DEFAULT_CACHE_TTL = 120.0
+
+
+def _band(value, edges):
+    try:
+        return bisect.bisect_right(edges, float(value))
+    except (TypeError, ValueError):
+        return -1
+
+
+def _pct_band(current, maximum):
+    try:
+        return _band(float(current or 0) / float(maximum or 1), _PCT_EDGES)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return -1
+
+
+def _status_names(effects) -> tuple:
+    names = []
+    for effect in effects or ():
+        name = effect.get("name") if isinstance(effect, dict) else str(effect)
+        if name:
+            names.append(str(name))
+    return tuple(sorted(names))
+
+
+def _combatant_key(c: Dict[str, Any]) -> tuple:
+    mip = c.get("move_in_process") or None
+    intent = None
+    if isinstance(mip, dict):
+        intent = (
+            mip.get("name"),
+            min(CombatStrategist._beats_until_impact(mip), _IMPACT_CAP),
+        )
+    return (
+        str(c.get("id")),
+        _pct_band(c.get("hp"), c.get("max_hp")),
+        _pct_band(c.get("fatigue"), c.get("max_fatigue") or c.get("maxfatigue")),
+        _band(c.get("distance") or 0, _DISTANCE_EDGES),
+        intent,
+        _status_names(c.get("status_effects")),
+    )
+
+
+def combat_fingerprint(ctx: Dict[str, Any], max_suggestions: int = 1) -> str:
+    """Return a stable digest of the tactically relevant parts of ``ctx``.
+
+    Two contexts with the same fingerprint would get the same advice: same
+    HP/fatigue/heat bands, the same enemies at the same distance bands with
+    the same telegraphed intents, and the same available moves and targets.
+    """
+    player = ctx.get("player") or {}
+    stats = player.get("stats") or {}
+    moves = []
+    for m in ctx.get("available_moves") or ():
+        if not isinstance(m, dict) or not m.get("available", True):
+            continue
+        targets = tuple(sorted(str(t.get("id")) for t in m.get("viable_targets") or () if isinstance(t, dict)))
+        moves.append((str(m.get("name")), targets))
+    key = (
+        int(max_suggestions),
+        (
+            _pct_band(player.get("hp"), player.get("max_hp")),
+            _pct_band(player.get("fatigue"), player.get("max_fatigue")),
+            _band(player.get("heat") or 1.0, _HEAT_EDGES),
+            stats.get("evasion"),
+            stats.get("defense"),
+            _status_names(player.get("status_effects")),
+            tuple(sorted(
+                str(c.get("name")) for c in player.get("consumables") or ()
+                if isinstance(c, dict) and c.get("qty", 1)
+            )),
+        ),
+        tuple(sorted(_combatant_key(e) for e in ctx.get("enemies") or () if isinstance(e, dict))),
+        tuple(sorted(_combatant_key(a) for a in ctx.get("allies") or () if isinstance(a, dict))),
+        tuple(sorted(moves)),
+        tuple(sorted((str(k), v) for k, v in (ctx.get("defensive_cooldowns") or {}).items())),
+    )
+    return hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SuggestionCache:
+    """Thread-safe LRU of suggestion lists with a per-entry TTL and hit metrics."""
+
+    def __init__(self, max_entries: int = _DEFAULT_CACHE_SIZE, ttl: float = _DEFAULT_CACHE_TTL):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl = float(ttl)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        # Callers (and the adapter's filtering) mutate suggestion dicts.
+        return [dict(s) for s in value]
+
+    def put(self, key: str, suggestions: List[Dict[str, Any]]) -> None:
+        value = [dict(s) for s in suggestions]
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evicted": self.evicted,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
 class CombatStrategist:
     """Strategist that suggests tactical moves during combat using an LLM."""
 
-    def __init__(self, client: Optional[GenericLLMClient] = None):
+    def __init__(self, client: Optional[GenericLLMClient] = None, cache: Optional[SuggestionCache] = None):
         logger.info("DEBUG: Initializing CombatStrategist")
         self.client = client or GenericLLMClient()
+        # Only LLM answers are cached; the heuristic fallback is cheaper to
+        # recompute than to look up stale.
+        self.cache = cache if cache is not None else SuggestionCache()
         self.system_prompt = (
             "You are the Tactical Strategist for Jean Claire, a male human protagonist. "
             "Your goal is to analyze the current combat state and suggest the best moves.\n"
@@ -174,7 +347,13 @@ class CombatStrategist:
         logger.info(f"DEBUG: CombatStrategist.get_suggestions called (max: {max_suggestions})")
 
         suggestions = []
+        fingerprint = None
         if self.client.available():
+            fingerprint = combat_fingerprint(combat_context, max_suggestions)
+            cached = self.cache.get(fingerprint)
+            if cached is not None:
+                logger.debug(f"Suggestion cache hit ({self.cache.stats()['hit_rate']:.0%} hit rate)")
+                return cached
             try:
                 user_prompt = self._build_user_prompt(combat_context)
                 wrapped_prompt = (
@@ -210,6 +389,8 @@ class CombatStrategist:
         suggestions.sort(key=lambda x: x["score"], reverse=True)
         results = suggestions[:max_suggestions]
         self._ensure_target_ids(results, combat_context)
+        if fingerprint is not None:
+            self.cache.put(fingerprint, results)
         logger.info(f"DEBUG: CombatStrategist returning {len(results)} suggestions.")
         return results
 
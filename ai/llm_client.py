@@ -3,7 +3,7 @@ import os
 import logging
 import threading
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 try:
     import requests
 except ImportError:
@@ -82,6 +82,125 @@ class _JSONTools:
         return t[:500]
 
 
+class _StreamingJSON:
+    """Incremental reader for a JSON object reply that arrives token by token.
+
+    ``_JSONTools.try_parse_json`` needs the whole completion. When a reply is
+    streamed, callers want the text of one field (the NPC's line) while the rest
+    of the object is still being generated, so this tracks just enough JSON
+    structure -- nesting depth, string state, escapes -- to decode the values of
+    the watched *top-level string* fields as their characters arrive. Anything
+    before the first ``{`` (code fences, preamble) is ignored.
+
+    Usage::
+
+        reader = _StreamingJSON(watch=("npc_text",))
+        for token in tokens:
+            for field, text_so_far in reader.feed(token):
+                render(text_so_far)
+        obj = reader.value()
+    """
+
+    def __init__(self, watch=()):
+        self.watch = frozenset(watch)
+        self.fields: Dict[str, str] = {}
+        self._chunks: List[str] = []
+        self._started = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape: Optional[str] = None
+        self._string: List[str] = []
+        self._role: Optional[str] = None  # "key", "value" or None for strings we skip
+        self._expect_key = False
+        self._after_colon = False
+        self._key: Optional[str] = None
+
+    @property
+    def complete(self) -> bool:
+        """True once the outermost object has been closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[tuple]:
+        """Consume ``chunk``; return ``(field, text_so_far)`` for each watched field that grew."""
+        self._chunks.append(chunk)
+        grown: Dict[str, str] = {}
+        for c in chunk:
+            if self._done:
+                break
+            if not self._started:
+                if c == "{":
+                    self._started = True
+                    self._depth = 1
+                    self._expect_key = True
+                continue
+            if self._in_string:
+                self._string_char(c, grown)
+                continue
+            if c == '"':
+                self._in_string = True
+                self._string = []
+                if self._depth == 1 and self._expect_key:
+                    self._role = "key"
+                elif self._depth == 1 and self._after_colon:
+                    self._role = "value"
+                    self._after_colon = False
+                else:
+                    self._role = None
+            elif c in "{[":
+                self._depth += 1
+                self._after_colon = False
+            elif c in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._done = True
+            elif self._depth == 1 and c == ":":
+                self._after_colon = True
+            elif self._depth == 1 and c == ",":
+                self._expect_key = True
+                self._after_colon = False
+        return list(grown.items())
+
+    def _string_char(self, c: str, grown: Dict[str, str]) -> None:
+        if self._escape is not None:
+            self._escape += c
+            if (self._escape[1] != "u" and len(self._escape) == 2) or len(self._escape) == 6:
+                try:
+                    decoded = json.loads('"' + self._escape + '"')
+                except ValueError:
+                    decoded = ""
+                self._escape = None
+                self._emit(decoded, grown)
+            return
+        if c == "\\":
+            self._escape = c
+        elif c == '"':
+            self._in_string = False
+            if self._role == "key":
+                self._key = "".join(self._string)
+                self._expect_key = False
+            self._role = None
+        else:
+            self._emit(c, grown)
+
+    def _emit(self, text: str, grown: Dict[str, str]) -> None:
+        if not text:
+            return
+        self._string.append(text)
+        if self._role == "value" and self._key in self.watch:
+            value = self.fields.get(self._key, "") + text
+            self.fields[self._key] = value
+            grown[self._key] = value
+
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._chunks)
+
+    def value(self) -> Optional[Dict[str, Any]]:
+        """Parse the accumulated reply (same rules as ``_JSONTools.try_parse_json``)."""
+        return _JSONTools.try_parse_json(self.text())
+
+
 class GenericLLMClient:
     """Adapter for generating responses using either a local Ollama model or an OpenRouter API model.
 
@@ -101,6 +220,7 @@ class GenericLLMClient:
         - OPENROUTER_API_KEY=... (required when provider=openrouter)
         - OPENROUTER_SITE=https://example.com (optional ranking metadata)
         - OPENROUTER_SITE_TITLE="Your Site"   (optional ranking metadata)
+        - OPENROUTER_BASE_URL=...             (optional chat-completions base override)
 
     Defaults:
       - model: 'llama3.1:7b' for ollama, first free OpenRouter model for openrouter (if unset)
@@ -127,6 +247,13 @@ class GenericLLMClient:
     # All other threads wait on this event rather than launching duplicate fetches.
     _discovery_event: threading.Event = threading.Event()
     _discovery_event.set()  # Initially "done" so the first caller proceeds immediately.
+    # Keep-alive transport, one pooled requests.Session per provider plus one
+    # OpenAI SDK client per API key. Building these per call paid a fresh TCP
+    # (and, for OpenRouter, TLS) handshake on every chat turn.
+    _http_sessions: Dict[str, Any] = {}
+    _sdk_clients: Dict[tuple, Any] = {}
+    _transport_lock = threading.Lock()
+    HTTP_POOL_SIZE: int = 8
 
     # -----------------------------------------------
 
@@ -141,6 +268,10 @@ class GenericLLMClient:
         self._openrouter_api_key = os.getenv("OPENROUTER_API_KEY", "").strip()
         self._openrouter_site = os.getenv("OPENROUTER_SITE", "").strip() or None
         self._openrouter_site_title = os.getenv("OPENROUTER_SITE_TITLE", "").strip() or None
+        # Override to point chat completions at a proxy or a local fake server.
+        self._openrouter_base_url = (
+            os.getenv("OPENROUTER_BASE_URL", "").strip().rstrip("/") or "https://openrouter.ai/api/v1"
+        )
 
         # Probe availability lazily; we don't want to fail import-time
         self._available: Optional[bool] = None
@@ -164,6 +295,104 @@ class GenericLLMClient:
             cls._discovery_done = False
         # Ensure the event is set so tests don't deadlock waiting on a discovery
         cls._discovery_event.set()
+        cls.close_transports()
+
+    # ------------------------------------------------------------------
+    # Pooled transport
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _http_session(cls, provider: str) -> Any:
+        """Return the shared keep-alive session for ``provider``.
+
+        ``requests.Session`` reuses connections through its urllib3 pool, so
+        consecutive turns against the same host skip the connect/TLS round trip.
+        The pool holds up to ``HTTP_POOL_SIZE`` idle connections, enough for the
+        suggestion pool's workers plus NPC chat to share one host.
+        """
+        with cls._transport_lock:
+            session = cls._http_sessions.get(provider)
+            if session is None:
+                session = requests.Session()
+                pooled = requests.adapters.HTTPAdapter(
+                    pool_connections=1, pool_maxsize=cls.HTTP_POOL_SIZE
+                )
+                session.mount("http://", pooled)
+                session.mount("https://", pooled)
+                cls._http_sessions[provider] = session
+            return session
+
+    @classmethod
+    def close_transports(cls) -> None:
+        """Close pooled sessions and drop cached SDK clients."""
+        with cls._transport_lock:
+            sessions = list(cls._http_sessions.values())
+            cls._http_sessions = {}
+            cls._sdk_clients = {}
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _iter_ollama_stream(resp, on_token) -> str:
+        """Read an Ollama ``stream: true`` reply (NDJSON, one message delta per line).
+
+        Calls ``on_token`` with each content delta and returns the joined text.
+        """
+        parts: List[str] = []
+        for line in resp.iter_lines(decode_unicode=True):
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(event, dict):
+                continue
+            if event.get("error"):
+                raise RuntimeError(f"Ollama stream error: {event['error']}")
+            msg = event.get("message")
+            piece = msg.get("content") if isinstance(msg, dict) else None
+            if piece:
+                parts.append(piece)
+                on_token(piece)
+            if event.get("done"):
+                break
+        return "".join(parts)
+
+    @staticmethod
+    def _iter_openai_stream(resp, on_token) -> str:
+        """Read an OpenAI-style ``stream: true`` reply (server-sent events).
+
+        Calls ``on_token`` with each ``choices[0].delta.content`` and returns the
+        joined text.
+        """
+        parts: List[str] = []
+        for line in resp.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue  # blank separators and ": keep-alive" comments
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            try:
+                event = json.loads(data)
+            except ValueError:
+                continue
+            if not isinstance(event, dict):
+                continue
+            if event.get("error"):
+                raise RuntimeError(f"OpenRouter stream error: {event['error']}")
+            choices = event.get("choices")
+            if not isinstance(choices, list) or not choices or not isinstance(choices[0], dict):
+                continue
+            delta = choices[0].get("delta") or {}
+            piece = delta.get("content") if isinstance(delta, dict) else None
+            if piece:
+                parts.append(piece)
+                on_token(piece)
+        return "".join(parts)
 
     # ------------------------------------------------------------------
     # Model discovery
@@ -524,11 +753,23 @@ class GenericLLMClient:
             "reason": None if avail else self._unavailable_reason,
         }
 
-    def generate_plain(self, system_prompt: str, user_prompt: str) -> Optional[str]:
+    def generate_plain(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> Optional[str]:
+        """Return a plain-text completion.
+
+        ``on_token`` receives content deltas as they stream in (Ollama only;
+        other providers answer in one piece and never call it).
+        """
         if not self.available():
             return None
         if self.provider == "ollama":
-            res = self._ollama_chat(system_prompt=system_prompt, user_prompt=user_prompt, structured=False)
+            res = self._ollama_chat(
+                system_prompt=system_prompt, user_prompt=user_prompt, structured=False, on_token=on_token
+            )
         elif self.provider == "openrouter":
             res = self._openrouter_chat(system_prompt=system_prompt, user_prompt=user_prompt, structured=False)
         else:
@@ -548,14 +789,26 @@ class GenericLLMClient:
 
         return str(res)
 
-    def generate_structured(self, system_prompt: str, user_prompt: str) -> Optional[Dict[str, Any]]:
+    def generate_structured(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return a JSON-object completion; ``on_token`` as for :meth:`generate_plain`.
+
+        Feed the deltas to a ``_StreamingJSON`` to read fields before the
+        object is complete.
+        """
         if not self.available():
             logger.warning("generate_structured called but LLM is not available.")
             return None
 
         logger.info(f"generate_structured using provider: {self.provider}")
         if self.provider == "ollama":
-            res = self._ollama_chat(system_prompt=system_prompt, user_prompt=user_prompt, structured=True)
+            res = self._ollama_chat(
+                system_prompt=system_prompt, user_prompt=user_prompt, structured=True, on_token=on_token
+            )
         elif self.provider == "openrouter":
             res = self._openrouter_chat(system_prompt=system_prompt, user_prompt=user_prompt, structured=True)
         else:
@@ -573,8 +826,21 @@ class GenericLLMClient:
     # Provider: Ollama (local)
     # ------------------------------------------------------------------
 
-    def _ollama_chat(self, system_prompt: str, user_prompt: str, structured: bool) -> Optional[Any]:
-        import requests  # type: ignore
+    def _ollama_chat(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        structured: bool,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> Optional[Any]:
+        """Chat against Ollama over the pooled session.
+
+        With ``on_token`` the request is sent with ``stream: true`` and each
+        content delta is passed to it as it arrives; the return value is the
+        same as for the blocking call.
+        """
+        if requests is None:
+            return None
         url = self.base_url + "/api/chat"
         payload = {
             "model": self.model,
@@ -582,7 +848,7 @@ class GenericLLMClient:
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            "stream": False,
+            "stream": on_token is not None,
             "options": {
                 "temperature": 0.2,
                 "top_p": 0.9,
@@ -590,7 +856,17 @@ class GenericLLMClient:
             },
         }
         try:
-            r = requests.post(url, json=payload, timeout=30)
+            session = self._http_session("ollama")
+            if on_token is not None:
+                with session.post(url, json=payload, timeout=30, stream=True) as r:
+                    if r.status_code != 200:
+                        return None
+                    content = self._iter_ollama_stream(r, on_token)
+                if structured:
+                    return _JSONTools.try_parse_json(content)
+                return _JSONTools.sanitize_text(content or "")
+
+            r = session.post(url, json=payload, timeout=30)
             if r.status_code != 200:
                 return None
             content = None
@@ -651,12 +927,26 @@ class GenericLLMClient:
         dependency (requirements.txt), so this always resolves to the real SDK when
         installed. The broad except still guards against import/construction errors
         so callers gracefully fall back to the raw HTTP path.
+
+        The client is cached per API key: it owns an httpx connection pool, so
+        reusing it keeps the OpenRouter connection alive across attempts.
         """
+        key = (self._openrouter_base_url, self._openrouter_api_key)
+        with GenericLLMClient._transport_lock:
+            cached = GenericLLMClient._sdk_clients.get(key)
+        if cached is not None:
+            return cached
         try:
             from openai import OpenAI  # type: ignore
-            return OpenAI(base_url="https://openrouter.ai/api/v1", api_key=self._openrouter_api_key)
+            sdk_client = OpenAI(base_url=self._openrouter_base_url, api_key=self._openrouter_api_key)
         except Exception:
             return None
+        with GenericLLMClient._transport_lock:
+            return GenericLLMClient._sdk_clients.setdefault(key, sdk_client)
+
+    @property
+    def _openrouter_chat_url(self) -> str:
+        return self._openrouter_base_url + "/chat/completions"
 
     def _build_openrouter_headers(self) -> Dict[str, str]:
         """Build extra HTTP headers for OpenRouter ranking metadata."""
@@ -747,8 +1037,9 @@ class GenericLLMClient:
                 # Fall through to the direct HTTP path
 
         # Direct HTTP fallback
+        if requests is None:
+            return None
         try:
-            import requests
             http_headers = {
                 "Authorization": f"Bearer {self._openrouter_api_key}",
                 "Content-Type": "application/json",
@@ -767,8 +1058,8 @@ class GenericLLMClient:
                 "max_tokens": 1024 if structured else 256,
             }
 
-            resp = requests.post(
-                "https://openrouter.ai/api/v1/chat/completions",
+            resp = self._http_session("openrouter").post(
+                self._openrouter_chat_url,
                 json=payload,
                 headers=http_headers,
                 timeout=timeout,
@@ -1140,6 +1431,7 @@ class NpcChatLLMAdapter(GenericLLMClient):
         history: List[Dict[str, str]],
         is_opening: bool,
         jean_text: Optional[str] = None,
+        on_npc_text: Optional[Callable[[str], None]] = None,
     ) -> Optional[Dict[str, Any]]:
         """Generate the NPC turn *and* Jean's three options in one LLM call.
 
@@ -1152,6 +1444,11 @@ class NpcChatLLMAdapter(GenericLLMClient):
              jean_options: [{tone, text} x3]}
         The mixin still runs its own QC on ``npc_text`` and ``jean_options``.
         Returns None if the LLM is unavailable or the response is unusable.
+
+        With ``on_npc_text`` the reply is streamed and the callback receives the
+        NPC line decoded *so far* each time it grows, so a caller can render it
+        before the options at the end of the object arrive. Those partial lines
+        are unreviewed; the returned dict is what passed parsing.
         """
         history_block = self._format_history(history)
         if is_opening:
@@ -1202,7 +1499,8 @@ class NpcChatLLMAdapter(GenericLLMClient):
         # The reply is 1-3 sentences plus three short options (~150-250 tokens in
         # practice); a tight cap keeps typical latency low so the 6s ceiling only
         # ever bites on a genuinely stuck call.
-        raw = self._call_llm(system_prompt, user, max_tokens=300, temperature=temp)
+        on_token = self._npc_text_streamer(on_npc_text) if on_npc_text is not None else None
+        raw = self._call_llm(system_prompt, user, max_tokens=300, temperature=temp, on_token=on_token)
         if not raw:
             return None
         parsed = _JSONTools.try_parse_json(raw)
@@ -1247,6 +1545,17 @@ class NpcChatLLMAdapter(GenericLLMClient):
 
         return parsed
 
+    @staticmethod
+    def _npc_text_streamer(on_npc_text: Callable[[str], None]) -> Callable[[str], None]:
+        """Return a token callback that reports the streamed ``npc_text`` so far."""
+        reader = _StreamingJSON(watch=("npc_text",))
+
+        def on_token(piece: str) -> None:
+            for _field, text_so_far in reader.feed(piece):
+                on_npc_text(text_so_far)
+
+        return on_token
+
     # ------------------------------------------------------------------
     # Call 3 — Jean's three response options (single call)
     # ------------------------------------------------------------------
@@ -1349,18 +1658,22 @@ class NpcChatLLMAdapter(GenericLLMClient):
         user_prompt: str,
         max_tokens: int = 512,
         temperature: float = 0.7,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> Optional[str]:
-        """Dispatch to the active provider. Returns raw text or None."""
+        """Dispatch to the active provider. Returns raw text or None.
+
+        ``on_token``, when given, streams the reply and receives each delta.
+        """
         if not self.enabled:
             return None
         if self.provider == "ollama":
-            return self._call_ollama(system_prompt, user_prompt, max_tokens, temperature)
+            return self._call_ollama(system_prompt, user_prompt, max_tokens, temperature, on_token)
         elif self.provider == "openrouter":
-            return self._call_openrouter(system_prompt, user_prompt, max_tokens, temperature)
+            return self._call_openrouter(system_prompt, user_prompt, max_tokens, temperature, on_token)
         return None
 
     def _call_ollama(
-        self, system: str, user: str, max_tokens: int, temperature: float
+        self, system: str, user: str, max_tokens: int, temperature: float, on_token=None
     ) -> Optional[str]:
         if requests is None:
             return None
@@ -1371,14 +1684,24 @@ class NpcChatLLMAdapter(GenericLLMClient):
                     {"role": "system", "content": system},
                     {"role": "user", "content": user},
                 ],
-                "stream": False,
+                "stream": on_token is not None,
                 "options": {
                     "temperature": temperature,
                     "num_predict": max_tokens,
                     "top_p": 0.9,
                 },
             }
-            r = requests.post(
+            session = self._http_session("ollama")
+            if on_token is not None:
+                with session.post(
+                    self.base_url + "/api/chat",
+                    json=payload,
+                    timeout=self._round_timeout(),
+                    stream=True,
+                ) as r:
+                    r.raise_for_status()
+                    return self._iter_ollama_stream(r, on_token).strip() or None
+            r = session.post(
                 self.base_url + "/api/chat",
                 json=payload,
                 timeout=self._round_timeout(),
@@ -1391,7 +1714,7 @@ class NpcChatLLMAdapter(GenericLLMClient):
             return None
 
     def _call_openrouter(
-        self, system: str, user: str, max_tokens: int, temperature: float
+        self, system: str, user: str, max_tokens: int, temperature: float, on_token=None
     ) -> Optional[str]:
         if requests is None or not self._openrouter_api_key:
             return None
@@ -1417,8 +1740,20 @@ class NpcChatLLMAdapter(GenericLLMClient):
             "top_p": 0.9,
         }
         try:
-            r = requests.post(
-                "https://openrouter.ai/api/v1/chat/completions",
+            session = self._http_session("openrouter")
+            if on_token is not None:
+                payload["stream"] = True
+                with session.post(
+                    self._openrouter_chat_url,
+                    json=payload,
+                    headers=headers,
+                    timeout=self._round_timeout(),
+                    stream=True,
+                ) as r:
+                    r.raise_for_status()
+                    return self._iter_openai_stream(r, on_token).strip() or None
+            r = session.post(
+                self._openrouter_chat_url,
                 json=payload,
                 headers=headers,
                 timeout=self._round_timeout(),
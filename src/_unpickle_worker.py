@@ -9,11 +9,19 @@ unpickles untrusted bytes itself -- it only parses primitive JSON.
 Combined with a wall-clock timeout enforced by the parent, this bounds both the
 blast radius (isolation) and the resource cost (CPU/time) of loading a save of
 uncertain provenance.
+
+``python -m src._unpickle_worker --serve`` is the same worker kept warm for
+:class:`src.secure_pickle.SandboxPool`: it imports the engine once, then serves
+length-prefixed jobs over stdin/stdout until the parent closes stdin (see
+:func:`serve` for the framing).
 """
 
 import io
+import os
 import sys
 import json
+import contextlib
+import traceback
 
 
 def main():
@@ -22,10 +30,11 @@ def main():
     # non-zero exit with a message on stderr rather than an import-time crash.
     from src.secure_pickle import safe_pickle_load
     from src.save_format import player_to_data
+    from src.universe import DeltaSaveUnpickler
 
     # Strict mode is the right default for untrusted input; the parent sets the
     # env var when it wants it. safe_pickle_load handles header + size cap.
-    obj = safe_pickle_load(io.BytesIO(raw))
+    obj = safe_pickle_load(io.BytesIO(raw), unpickler=DeltaSaveUnpickler)
     if obj is None:
         sys.stderr.write("worker: failed to deserialize save\n")
         return 2
@@ -33,5 +42,72 @@ def main():
     return 0
 
 
+def _read_exact(stream, size):
+    """Read exactly ``size`` bytes, or return None at end of input."""
+    chunks = []
+    while size:
+        chunk = stream.read(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _run_job(raw, strict):
+    from src.secure_pickle import safe_pickle_load
+    from src.save_format import player_to_data
+    from src.universe import DeltaSaveUnpickler
+
+    obj = safe_pickle_load(io.BytesIO(raw), strict=strict, unpickler=DeltaSaveUnpickler)
+    if obj is None:
+        raise ValueError("worker: failed to deserialize save")
+    return json.dumps(player_to_data(obj)).encode("utf-8")
+
+
+def serve():
+    """Serve sandbox jobs until stdin closes.
+
+    Once the engine is imported the worker writes ``SANDBOX_READY``. Each job
+    is a ``SANDBOX_JOB`` header (strict flag, payload length) followed by the
+    save bytes; each reply is a ``SANDBOX_REPLY`` header (``b"O"`` or ``b"E"``,
+    body length) followed by the v2 JSON or the error text. Anything the
+    unpickled code prints goes to stderr, never into the reply stream.
+    """
+    from src.secure_pickle import (
+        SANDBOX_JOB, SANDBOX_READY, SANDBOX_REPLY, SANDBOX_REPLY_ERROR,
+        SANDBOX_REPLY_OK, get_allowlist,
+    )
+    import src.save_format  # noqa: F401 -- warm the converter too
+
+    get_allowlist()  # imports every engine module a save can reference
+
+    requests = sys.stdin.buffer
+    replies = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    replies.write(SANDBOX_READY)
+    replies.flush()
+    while True:
+        header = _read_exact(requests, SANDBOX_JOB.size)
+        if header is None:
+            return 0
+        strict, size = SANDBOX_JOB.unpack(header)
+        raw = _read_exact(requests, size)
+        if raw is None:
+            return 0
+        captured = io.StringIO()
+        try:
+            with contextlib.redirect_stderr(captured):
+                body = _run_job(raw, strict)
+            status = SANDBOX_REPLY_OK
+        except Exception:
+            status = SANDBOX_REPLY_ERROR
+            body = (captured.getvalue() + traceback.format_exc()).encode("utf-8", "replace")
+        replies.write(SANDBOX_REPLY.pack(status, len(body)) + body)
+        replies.flush()
+
+
 if __name__ == "__main__":  # pragma: no cover - exercised via subprocess
-    sys.exit(main())
+    sys.exit(serve() if "--serve" in sys.argv[1:] else main())
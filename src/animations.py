@@ -20,6 +20,8 @@ from asciimatics.exceptions import ResizeScreenError
 
 from PIL import Image
 
+from src.headless import is_headless
+
 # API mode flag - when True, terminal animations are suppressed
 _API_MODE = False
 
@@ -219,8 +221,9 @@ def animate_to_main_screen(animation, rawtext=""):
     filename of a gif in resources/animations, as a string
     :param rawtext: Text to display with the animation, if any. You can pass in colored text (color will be stripped)
     """
-    # Skip animations in API mode (web app)
-    if _API_MODE:
+    # Skip animations in API mode (web app), or while the caller runs the
+    # engine headless (see src/headless.py).
+    if _API_MODE or is_headless():
         return
 
     # Terminal animations need a real terminal. Under pytest/CI/headless runs
@@ -6,8 +6,13 @@ from pathlib import Path
 from flask import Flask
 from flask_cors import CORS
 from flask_socketio import SocketIO
-from src.api.config import DevelopmentConfig, combat_socket_streaming_enabled
+from src.api.config import (
+    DevelopmentConfig,
+    combat_socket_streaming_enabled,
+    request_profiling_enabled,
+)
 from src.api.services import SessionManager, GameService
+from src.api.services.session_store import create_session_store
 import src.universe as universe_module
 
 
@@ -59,6 +64,10 @@ def create_app(config_class=None):
     app = Flask(__name__)
     app.config.from_object(config_class)
     app.config["COMBAT_SOCKET_STREAMING"] = combat_socket_streaming_enabled()
+    # The env var turns profiling on for any config class; a config class
+    # (or a test) can also set REQUEST_PROFILING directly.
+    if request_profiling_enabled():
+        app.config["REQUEST_PROFILING"] = True
 
     # Honor a reverse proxy's X-Forwarded-* headers so request.remote_addr (and
     # thus the login rate-limit key) reflects the real client. Off by default —
@@ -267,8 +276,13 @@ def create_app(config_class=None):
         universe = None
         game_service = GameService()
 
-    # Initialize session manager (now with universe reference if available)
-    session_manager = SessionManager(universe=universe)
+    # Initialize session manager (now with universe reference if available).
+    # A shared SESSION_STORE_URL lets several gunicorn workers serve the same
+    # sessions; without one they stay in this process only.
+    session_manager = SessionManager(
+        universe=universe,
+        store=create_session_store(app.config.get("SESSION_STORE_URL")),
+    )
 
     # Store in app context
     app.session_manager = session_manager
@@ -310,6 +324,15 @@ def create_app(config_class=None):
 
     register_socket_handlers(socketio)
 
+    # Opt-in request instrumentation. Installed before the preflight hook so
+    # its timer also covers requests that hook short-circuits.
+    if app.config.get("REQUEST_PROFILING"):
+        from src.api.profiling import install_profiling
+        from src.api.routes.internal import internal_bp
+
+        install_profiling(app)
+        app.register_blueprint(internal_bp, url_prefix="/api/internal")
+
     # Global before_request handler for CORS preflight
     @app.before_request
     def handle_preflight():
@@ -334,6 +357,42 @@ def create_app(config_class=None):
                 response.headers["Access-Control-Max-Age"] = "3600"
             return response, 200
 
+    @app.after_request
+    def checkpoint_session(response):
+        """Checkpoint the request's session to the shared store, if any.
+
+        If another worker checkpointed the session first, this request's
+        changes were discarded, so the response becomes a 409 the client can
+        retry instead of a success for a write that never landed.
+        """
+        from flask import g, jsonify
+
+        session_id = g.pop("hov_session_id", None)
+        if session_id and app.session_manager.store is not None:
+            if not app.session_manager.release(session_id):
+                response = jsonify(
+                    {
+                        "success": False,
+                        "error": "session_conflict",
+                        "message": "The session was changed by another request; retry.",
+                    }
+                )
+                response.status_code = 409
+        return response
+
+    @app.teardown_request
+    def release_session(_exc=None):
+        """Checkpoint the request's session if ``checkpoint_session`` didn't
+        run (an unhandled error), and let the next request for it in."""
+        from flask import g
+
+        session_id = g.pop("hov_session_id", None)
+        if session_id and app.session_manager.store is not None:
+            app.session_manager.release(session_id)
+        checkout = g.pop("hov_checkout", None)
+        if checkout:
+            app.session_manager.checkin(checkout)
+
     # Health check endpoint
     @app.route("/health", methods=["GET"])
     def health():
@@ -0,0 +1,184 @@
+"""Delta encoding for per-beat combat snapshots.
+
+A multi-beat move returns one full ``serialize_combat_state`` frame per beat in
+``beat_states`` -- up to ``max_beats`` of them, each repeating every
+combatant's name, stats, passives and equipment even though a beat normally
+changes only HP, fatigue, position, status effects and the active move. Long
+charge-ups (BloodOfMartyrs' prep stage is 40 beats) made that the bulk of the
+``/combat/move`` response.
+
+:func:`encode_beat_frames` keeps the first frame whole (the *base*) and turns
+every later frame into a delta against the frame before it:
+
+``set``
+    top-level keys whose value changed (``round``, ``last_move_outcome``, ...).
+``unset``
+    top-level keys that disappeared.
+``combatants``
+    ``{id: {field: value}}`` for combatant fields that changed; unchanged
+    combatants and fields are omitted.
+``added``
+    full combatant dicts for ids not present in the previous frame.
+``order`` / ``player`` / ``allies`` / ``enemies``
+    the roster as ids, only when it changed (a death, a reinforcement).
+``log``
+    the beat's own log entries, always present (they are already per-beat).
+
+``player``/``allies``/``enemies`` and ``combatants`` carry the same combatant
+dicts, so a delta stores each combatant once and the roster lists as ids.
+:func:`decode_beat_frames` rebuilds the full frames. Frames that cannot be
+keyed by combatant id (a missing or duplicated ``id``) are left unencoded:
+:func:`encode_beat_frames` returns ``None`` and callers keep ``beat_states``.
+"""
+
+from typing import Any, Dict, List, Optional
+
+# Keys handled by the combatant table rather than compared as opaque values.
+_ROSTER_KEYS = ("player", "allies", "enemies", "combatants", "log")
+
+_MISSING = object()
+
+
+def _combatant_index(frame: Dict[str, Any]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Map combatant id to dict for one frame, or None if ids are not usable."""
+    index: Dict[str, Dict[str, Any]] = {}
+    members = list(frame.get("combatants") or [])
+    player = frame.get("player")
+    if player:
+        members.append(player)
+    members.extend(frame.get("allies") or [])
+    members.extend(frame.get("enemies") or [])
+    for combatant in members:
+        if not isinstance(combatant, dict):
+            return None
+        cid = combatant.get("id")
+        if not isinstance(cid, str) or not cid:
+            return None
+        seen = index.get(cid)
+        if seen is not None and seen != combatant:
+            return None  # two different combatants sharing one id
+        index[cid] = combatant
+    if len({c.get("id") for c in frame.get("combatants") or []}) != len(frame.get("combatants") or []):
+        return None
+    return index
+
+
+def _roster(frame: Dict[str, Any]) -> Dict[str, Any]:
+    player = frame.get("player")
+    return {
+        "order": [c["id"] for c in frame.get("combatants") or []],
+        "player": player["id"] if player else None,
+        "allies": [c["id"] for c in frame.get("allies") or []],
+        "enemies": [c["id"] for c in frame.get("enemies") or []],
+    }
+
+
+def _combatant_delta(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    changed = {key: value for key, value in after.items() if before.get(key, _MISSING) != value}
+    dropped = [key for key in before if key not in after]
+    if dropped:
+        changed["_unset"] = dropped
+    return changed
+
+
+def encode_beat_frames(frames: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Encode full beat frames as ``{"beat_base": ..., "beat_deltas": [...]}``.
+
+    Returns ``None`` when ``frames`` is empty or a frame's combatants cannot be
+    keyed by id, in which case the caller should send the frames unencoded.
+    """
+    if not frames:
+        return None
+    indexes = [_combatant_index(frame) for frame in frames]
+    if any(index is None for index in indexes):
+        return None
+
+    deltas = []
+    for prev, frame, prev_index, index in zip(frames, frames[1:], indexes, indexes[1:]):
+        delta: Dict[str, Any] = {"log": frame.get("log", [])}
+
+        changed = {
+            key: value
+            for key, value in frame.items()
+            if key not in _ROSTER_KEYS and prev.get(key, _MISSING) != value
+        }
+        if changed:
+            delta["set"] = changed
+        unset = [key for key in prev if key not in frame and key not in _ROSTER_KEYS]
+        if unset:
+            delta["unset"] = unset
+
+        combatants = {}
+        added = []
+        for cid, combatant in index.items():
+            before = prev_index.get(cid)
+            if before is None:
+                added.append(combatant)
+            elif before is not combatant and before != combatant:
+                combatants[cid] = _combatant_delta(before, combatant)
+        if combatants:
+            delta["combatants"] = combatants
+        if added:
+            delta["added"] = added
+
+        prev_roster, roster = _roster(prev), _roster(frame)
+        for key, ids in roster.items():
+            if ids != prev_roster[key]:
+                delta[key] = ids
+
+        deltas.append(delta)
+
+    return {"beat_base": frames[0], "beat_deltas": deltas}
+
+
+def decode_beat_frames(base: Dict[str, Any], deltas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Rebuild the full frames that :func:`encode_beat_frames` encoded.
+
+    Unchanged combatant dicts are shared between consecutive decoded frames;
+    treat the result as read-only.
+    """
+    frames = [base]
+    index = _combatant_index(base) or {}
+    roster = _roster(base)
+    for delta in deltas:
+        prev = frames[-1]
+        index = dict(index)
+        for combatant in delta.get("added", []):
+            index[combatant["id"]] = combatant
+        for cid, fields in delta.get("combatants", {}).items():
+            merged = dict(index.get(cid, {}))
+            for key in fields.get("_unset", []):
+                merged.pop(key, None)
+            merged.update((k, v) for k, v in fields.items() if k != "_unset")
+            index[cid] = merged
+        roster = {key: delta.get(key, ids) for key, ids in roster.items()}
+
+        frame = {key: value for key, value in prev.items() if key not in delta.get("unset", [])}
+        frame.update(delta.get("set", {}))
+        frame["player"] = index[roster["player"]] if roster["player"] is not None else None
+        frame["allies"] = [index[cid] for cid in roster["allies"]]
+        frame["enemies"] = [index[cid] for cid in roster["enemies"]]
+        frame["combatants"] = [index[cid] for cid in roster["order"]]
+        frame["log"] = delta.get("log", [])
+        frames.append(frame)
+    return frames
+
+
+def apply_beat_encoding(payload: Dict[str, Any], encoding: Optional[str]) -> Dict[str, Any]:
+    """Replace ``payload["beat_states"]`` with base + deltas when ``encoding == "delta"``.
+
+    ``beat_states`` stays the default wire format; only clients that ask for
+    deltas (and can decode them) get ``beat_base``/``beat_deltas`` instead.
+    """
+    if encoding != "delta" or not isinstance(payload, dict):
+        return payload
+    frames = payload.get("beat_states")
+    if not isinstance(frames, list):
+        return payload
+    encoded = encode_beat_frames(frames)
+    if encoded is None:
+        return payload
+    del payload["beat_states"]
+    payload.update(encoded)
+    payload["beat_encoding"] = "delta"
+    return payload
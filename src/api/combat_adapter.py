@@ -24,6 +24,8 @@ from src.api.serializers.combat import (
 from src.api.constants import ITEM_USE_RANGE, ALLY_HEAL_THRESHOLD
 from src.api.schemas.combat_beat import SUGGESTIONS_EVENT
 from src.api.combat_beat_stream import CombatBeatStreamer
+from src.api.combat_log import CombatLog, combat_log_of
+from src.api.suggestion_pool import get_suggestion_pool
 from ai.combat_strategist import CombatStrategist
 from src.moves._base import select_weighted_target, display_name_of
 from src.story import gorran_flavor
@@ -162,6 +164,9 @@ class ApiCombatAdapter:
         # Prevent concurrent status polls or duplicate cleanup paths from
         # emitting the terminal SocketIO event more than once per combat.
         self._terminal_event_emitted = False
+        # Incremental distance table behind _synchronize_distances; rebuilt
+        # whenever initialize_combat (re)places the combatants.
+        self._spatial_index = None
 
         # Initialize persistent state if missing
         if not hasattr(self.player, "combat_adapter_state"):
@@ -174,7 +179,6 @@ class ApiCombatAdapter:
 
         # Track async suggestion loading state
         self.player.suggestions_loading = False
-        self._suggestion_thread = None
         self._suggestion_generation = (
             0  # Generation counter for race condition prevention
         )
@@ -393,8 +397,7 @@ class ApiCombatAdapter:
                     "move_name": "Attack"
                 }
         """
-        if not hasattr(self.player, "combat_log"):
-            self.player.combat_log = []
+        combat_log = combat_log_of(self.player)
 
         # Check for duplicate.
         # We key on (message, round) plus the acting entity's id so that two
@@ -402,15 +405,10 @@ class ApiCombatAdapter:
         # (e.g. two same-species NPCs) don't collide — otherwise the second
         # entry's animation would be silently dropped from the frontend log.
         # For non-animation entries source_id is None on both sides, preserving
-        # the original (message, round) dedup behaviour.
+        # the original (message, round) dedup behaviour. The log keeps an index
+        # of these keys, so this is a lookup rather than a scan of the fight.
         new_source = (animation_data or {}).get("source_id")
-        is_duplicate = any(
-            existing.get("message") == message
-            and existing.get("round") == round_num
-            and (existing.get("animation") or {}).get("source_id") == new_source
-            for existing in self.player.combat_log
-        )
-        if not is_duplicate:
+        if not combat_log.contains(message, round_num, new_source):
             entry = {
                 "round": round_num,
                 "message": message,
@@ -423,7 +421,7 @@ class ApiCombatAdapter:
             if animation_data:
                 entry["animation"] = animation_data
 
-            self.player.combat_log.append(entry)
+            combat_log.append(entry)
 
             # Emit socket event if session is known
             if self.session_id:
@@ -465,10 +463,11 @@ class ApiCombatAdapter:
         try:
             # Import here to avoid circular dependencies
 
+            self._spatial_index = None
             if not reinit:
                 self.player.combat_beat = 1  # Start at beat 1 for synchronization
                 self._terminal_event_emitted = False
-                self.player.combat_log = []  # Clear log for new combat
+                self.player.combat_log = CombatLog()  # Clear log for new combat
                 # Stable identity for this fight, minted alongside the beat/log
                 # reset so it changes exactly when a genuinely new combat starts
                 # — not on a reinit (wave transition, reinforcement spawn).
@@ -1098,60 +1097,52 @@ class ApiCombatAdapter:
         """
         player = self.player
 
-        # Calculate proximity from coordinates for units with combat_position set
-        all_combatants = player.combat_list_allies + player.combat_list
+        # Calculate proximity from coordinates for units with combat_position set.
+        # The spatial index only recomputes distances for units that moved
+        # since the last beat, and its rows are symmetric, so positioned pairs
+        # need no mirroring; they only lose the units that have died.
+        allies = player.combat_list_allies
+        enemies = player.combat_list
+        all_combatants = allies + enemies
+        index = getattr(self, "_spatial_index", None)
+        if index is None:
+            index = self._spatial_index = positions.SpatialIndex()
+        index.sync(all_combatants)
+        dead = {unit for unit in all_combatants if not unit.is_alive()}
+        loose = set()
         for unit in all_combatants:
-            if hasattr(unit, "combat_position") and unit.combat_position is not None:
-                unit.combat_proximity = positions.recalculate_proximity_dict(
-                    unit, all_combatants
-                )
-
-        # Original proximity synchronization logic for backward compatibility/fallback
-        # Logic adapted from combat.py
-        for each_ally in player.combat_list_allies:
-            remove_these = []
-            for each_enemy in each_ally.combat_proximity:
-                if not each_enemy.is_alive():
-                    remove_these.append(each_enemy)
-            for each_enemy in remove_these:
-                del each_ally.combat_proximity[each_enemy]
-
-            for each_enemy in player.combat_list:
-                remove_these = []
-                for each_ally_in_prox in each_enemy.combat_proximity:
-                    if not each_ally_in_prox.is_alive():
-                        remove_these.append(each_ally_in_prox)
-                for each_ally_that_died in remove_these:
-                    del each_enemy.combat_proximity[each_ally_that_died]
-
+            if getattr(unit, "combat_position", None) is not None:
+                proximity = index.proximity(unit)
+                for each_dead in dead:
+                    proximity.pop(each_dead, None)
+                unit.combat_proximity = proximity
+            else:
+                loose.add(unit)
+                proximity = unit.combat_proximity
+                for each_dead in [other for other in proximity if not other.is_alive()]:
+                    del proximity[each_dead]
+
+        # Legacy fallback (logic adapted from combat.py) for pairs where either
+        # side has no position: mirror the ally's distance onto the enemy, or
+        # seed both with a randomised default_proximity.
+        if not loose:
+            return
+        loose_enemies = [enemy for enemy in enemies if enemy in loose]
+        for each_ally in allies:
+            if each_ally in dead:
+                continue
+            for each_enemy in enemies if each_ally in loose else loose_enemies:
+                if each_enemy in dead:
+                    continue
                 if each_enemy in each_ally.combat_proximity:
                     each_enemy.combat_proximity[each_ally] = each_ally.combat_proximity[
                         each_enemy
                     ]
                 else:
-                    # Enemy not in list (legacy/fallback), add with random distance
-                    # But ONLY if we don't have positions (which would have handled it above)
-                    if not (
-                        hasattr(each_enemy, "combat_position")
-                        and each_enemy.combat_position is not None
-                        and hasattr(each_ally, "combat_position")
-                        and each_ally.combat_position is not None
-                    ):
-
-                        default = getattr(each_enemy, "default_proximity", 20)
-                        each_distance = int(default * random.uniform(0.75, 1.25))
-                        each_ally.combat_proximity[each_enemy] = each_distance
-                        each_enemy.combat_proximity[each_ally] = each_distance
-
-        # Ensure reverse mapping for enemies
-        for each_enemy in player.combat_list:
-            for each_ally in player.combat_list_allies:
-                if each_ally not in each_enemy.combat_proximity:
-                    # If missed above, sync
-                    if each_enemy in each_ally.combat_proximity:
-                        each_enemy.combat_proximity[each_ally] = (
-                            each_ally.combat_proximity[each_enemy]
-                        )
+                    default = getattr(each_enemy, "default_proximity", 20)
+                    each_distance = int(default * random.uniform(0.75, 1.25))
+                    each_ally.combat_proximity[each_enemy] = each_distance
+                    each_enemy.combat_proximity[each_ally] = each_distance
 
     def _move_deals_damage(self, move) -> bool:
         """Check if a move deals damage (for animation fallback logic).
@@ -1294,13 +1285,15 @@ class ApiCombatAdapter:
                 current_beat_index = len(beat_states)
                 self.current_beat_state_index = current_beat_index
 
-                # Snapshot the log length before this beat's output is captured, so
+                # Snapshot the log cursor before this beat's output is captured, so
                 # beat_state["log"] below can be scoped to just this beat's entries
                 # (issue #436 — CombatBeatStreamer._last_animation walks the log
                 # backward for the latest animation; a cumulative log let it pick up
                 # a stale animation from several beats ago on quiet beats, misattributing
                 # e.g. a Whirl Attack wind-up beat to the enemy's last attack).
-                log_len_before = len(getattr(self.player, "combat_log", []))
+                # A seq rather than a length: the log is capped, so a length taken
+                # before the beat stops lining up once old entries are evicted.
+                log_seq_before = combat_log_of(self.player).last_seq
 
                 # Capture output for THIS beat only
                 with self._capture_output():
@@ -1344,9 +1337,7 @@ class ApiCombatAdapter:
 
                 # Add log to beat state — only entries added during THIS beat, not
                 # the full cumulative combat log (see log_len_before above).
-                beat_state["log"] = list(
-                    getattr(self.player, "combat_log", [])[log_len_before:]
-                )
+                beat_state["log"] = combat_log_of(self.player).since(log_seq_before)
                 beat_states.append(beat_state)
 
                 beats_processed += 1
@@ -1622,13 +1613,13 @@ class ApiCombatAdapter:
 
     def _process_npc_turns(self):
         """Process all NPC turns (allies and enemies)."""
-        from src.functions import refresh_stat_bonuses
+        from src.functions import ensure_stat_bonuses
 
-        # Refresh stats
+        # Refresh stats (a no-op for combatants whose gear/states are unchanged)
         for friendly in self.player.combat_list_allies:
-            refresh_stat_bonuses(friendly)
+            ensure_stat_bonuses(friendly)
         for enemy in self.player.combat_list:
-            refresh_stat_bonuses(enemy)
+            ensure_stat_bonuses(enemy)
 
         # Process friendly NPCs
         for ally in self.player.combat_list_allies:
@@ -1907,11 +1898,17 @@ class ApiCombatAdapter:
             logger.warning(f"Failed to capture flask app context: {e}")
             flask_app = None
 
-        # Create and start a new thread for fetching suggestions
+        # Runs on a suggestion-pool worker thread
         def fetch_suggestions_worker():
             logger.debug(f"Suggestion worker started (Gen: {current_gen})")
 
             def run_with_context():
+                # A newer refresh may have landed while this job waited in the
+                # pool; skip the strategist call rather than discard its result.
+                with self._suggestion_lock:
+                    if current_gen != self._suggestion_generation:
+                        logger.debug(f"Suggestion fetch superseded (Gen: {current_gen})")
+                        return
                 logger.debug(f"Suggestion fetch started (Gen: {current_gen})")
                 try:
                     # Calculate allowed suggestions count
@@ -2054,9 +2051,14 @@ class ApiCombatAdapter:
             else:
                 run_with_context()
 
-        import threading
-
-        threading.Thread(target=fetch_suggestions_worker, daemon=True).start()
+        # The shared pool bounds concurrent fetches across sessions and
+        # replaces this session's still-queued fetch, if any, with this one.
+        # When it is saturated, skip suggestions for this beat.
+        key = self.session_id or id(self)
+        if not get_suggestion_pool().submit(key, fetch_suggestions_worker):
+            with self._suggestion_lock:
+                if current_gen == self._suggestion_generation:
+                    self.player.suggestions_loading = False
 
     def _handle_victory(self):
         """Handle combat victory."""
@@ -2634,7 +2636,7 @@ class ApiCombatAdapter:
             "map_size": grid_size[0],
             "battle_state": battle_state,
             "beat_states": [battle_state],  # Initial state as a single beat state
-            "log": getattr(self.player, "combat_log", []),
+            "log": combat_log_of(self.player),
             "suggested_moves": getattr(self.player, "suggested_moves", []),
             "suggestions_loading": getattr(self.player, "suggestions_loading", False),
             "last_move_outcome": getattr(self.player, "last_move_summary", ""),
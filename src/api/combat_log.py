@@ -0,0 +1,193 @@
+"""Bounded, indexed combat log with a sequence cursor.
+
+``player.combat_log`` used to be a plain list that only ever grew during a
+fight. ``ApiCombatAdapter._add_log_entry`` scanned all of it for a duplicate on
+every captured line, and ``/combat/status`` shipped all of it on every poll, so
+both the CPU per line and the bytes per poll grew with the length of the fight.
+
+:class:`CombatLog` is still a ``list`` of entry dicts -- every existing reader
+(slicing, iteration, ``json`` serialization, direct ``append`` from
+``src/moves``) keeps working -- with three additions:
+
+  * **Sequence numbers.** Each appended entry is stamped with a monotonically
+    increasing ``seq``. Clients pass the last one they saw back as
+    ``since_seq`` and receive only newer entries (:func:`apply_log_cursor`).
+  * **Dedup index.** A dict of ``(message, round, source_id)`` keys makes the
+    duplicate check O(1) instead of a scan.
+  * **Ring-buffer cap.** Once ``max_entries`` is exceeded the oldest entries are
+    dropped (``COMBAT_LOG_MAX_ENTRIES``, default 500). A client whose cursor
+    falls behind the oldest retained entry is told so via ``log_truncated``.
+
+The log pickles (and deep-copies) as a plain list, so save files never depend
+on this class; :func:`combat_log_of` re-wraps a plain list on first use,
+keeping the ``seq`` values already stamped on its entries.
+"""
+
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 500
+
+
+def _max_entries_from_env() -> int:
+    try:
+        return max(1, int(os.environ.get("COMBAT_LOG_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)))
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_ENTRIES
+
+
+def dedup_key(message: Any, round_num: Any, source_id: Any) -> Tuple[Any, Any, Any]:
+    """The identity ``_add_log_entry`` deduplicates on."""
+    return (message, round_num, source_id)
+
+
+def _entry_key(entry: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    return dedup_key(
+        entry.get("message"),
+        entry.get("round"),
+        (entry.get("animation") or {}).get("source_id"),
+    )
+
+
+class CombatLog(list):
+    """A combat log list with ``seq`` stamping, a dedup index and a size cap."""
+
+    def __init__(self, entries: Iterable[Dict[str, Any]] = (), max_entries: Optional[int] = None):
+        super().__init__()
+        self.max_entries = max_entries or _max_entries_from_env()
+        self.next_seq = 1
+        self._keys: Dict[Tuple[Any, Any, Any], int] = {}
+        for entry in entries:
+            self.append(entry)
+
+    # --- indexed mutation -------------------------------------------------
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        seq = entry.get("seq")
+        if not isinstance(seq, int) or isinstance(seq, bool) or seq < self.next_seq:
+            seq = self.next_seq
+            entry["seq"] = seq
+        self.next_seq = seq + 1
+        super().append(entry)
+        key = _entry_key(entry)
+        self._keys[key] = self._keys.get(key, 0) + 1
+        overflow = len(self) - self.max_entries
+        if overflow > 0:
+            self._evict(overflow)
+
+    def extend(self, entries: Iterable[Dict[str, Any]]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def __iadd__(self, entries):
+        self.extend(entries)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._keys.clear()
+
+    def _evict(self, count: int) -> None:
+        for entry in self[:count]:
+            key = _entry_key(entry)
+            remaining = self._keys.get(key, 0) - 1
+            if remaining > 0:
+                self._keys[key] = remaining
+            else:
+                self._keys.pop(key, None)
+        super().__delitem__(slice(0, count))
+
+    # Nothing in the engine edits the log other than by appending, but keep
+    # the index honest if something does.
+    def _reindex(self) -> None:
+        self._keys = {}
+        for entry in self:
+            key = _entry_key(entry)
+            self._keys[key] = self._keys.get(key, 0) + 1
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._reindex()
+
+    def insert(self, index, entry):
+        super().insert(index, entry)
+        self._reindex()
+
+    def pop(self, index=-1):
+        entry = super().pop(index)
+        self._reindex()
+        return entry
+
+    def remove(self, entry):
+        super().remove(entry)
+        self._reindex()
+
+    # --- queries ----------------------------------------------------------
+
+    def contains(self, message: Any, round_num: Any, source_id: Any = None) -> bool:
+        """True if an entry with this ``(message, round, source_id)`` is retained."""
+        return dedup_key(message, round_num, source_id) in self._keys
+
+    @property
+    def last_seq(self) -> int:
+        """``seq`` of the newest entry ever appended (0 before the first)."""
+        return self.next_seq - 1
+
+    @property
+    def first_seq(self) -> int:
+        """``seq`` of the oldest retained entry (``next_seq`` when empty)."""
+        return self[0].get("seq", 0) if self else self.next_seq
+
+    def since(self, seq: int) -> List[Dict[str, Any]]:
+        """Entries with ``seq`` greater than ``seq``, oldest first."""
+        lo, hi = 0, len(self)
+        while lo < hi:  # entries are in ascending seq order
+            mid = (lo + hi) // 2
+            if self[mid].get("seq", 0) <= seq:
+                lo = mid + 1
+            else:
+                hi = mid
+        return list(self[lo:])
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def combat_log_of(player: Any) -> CombatLog:
+    """Return ``player.combat_log`` as a :class:`CombatLog`, upgrading a plain list in place."""
+    log = getattr(player, "combat_log", None)
+    if not isinstance(log, CombatLog):
+        log = CombatLog(log or ())
+        player.combat_log = log
+    return log
+
+
+def apply_log_cursor(payload: Dict[str, Any], player: Any, since_seq: Optional[int]) -> Dict[str, Any]:
+    """Scope ``payload["log"]`` to entries newer than ``since_seq``.
+
+    Stamps ``log_seq`` -- the cursor to send next time -- on any payload that
+    carries a log. Without ``since_seq`` the full retained log is left in place,
+    which is what existing clients expect. ``log_truncated`` is True when
+    entries the client never received have already been evicted.
+
+    A cursor ahead of the log belongs to an earlier fight (each new combat
+    starts a fresh log at seq 1); the full log is returned with ``log_reset``
+    so the client replaces its copy instead of appending.
+    """
+    if not isinstance(payload, dict) or "log" not in payload:
+        return payload
+    log = combat_log_of(player)
+    payload["log_seq"] = log.last_seq
+    if since_seq is None:
+        return payload
+    if since_seq > log.last_seq:
+        payload["log"] = list(log)
+        payload["log_reset"] = True
+        return payload
+    payload["log"] = log.since(since_seq)
+    payload["log_truncated"] = since_seq < log.first_seq - 1
+    return payload
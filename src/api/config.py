@@ -10,6 +10,12 @@ def combat_socket_streaming_enabled():
     return value.lower() not in ("0", "false", "no", "")
 
 
+def request_profiling_enabled():
+    """Read the opt-in request instrumentation switch at app creation time."""
+    value = os.environ.get("REQUEST_PROFILING", "false")
+    return value.lower() not in ("0", "false", "no", "")
+
+
 class Config:
     """Base configuration."""
 
@@ -47,6 +53,13 @@ class Config:
     SOCKETIO_CORS_ALLOWED_ORIGINS = CORS_ORIGINS
     SOCKETIO_MESSAGE_QUEUE = None  # Use simple in-memory queue for now
 
+    # Where SessionManager keeps the authoritative copy of each session. Unset
+    # (or "memory") keeps sessions in the worker's own dicts, which requires
+    # gunicorn -w 1. "sqlite:///path/to/sessions.db" shares them between
+    # workers on one host via checkpoint/restore, so -w N works (pair it with
+    # SOCKETIO_MESSAGE_QUEUE when combat streaming is on).
+    SESSION_STORE_URL = os.environ.get("SESSION_STORE_URL")
+
     # Engine-driven combat streaming over SocketIO (issue #436). Off by default:
     # while off, combat resolves via the existing lump-response replay path. When
     # on, the engine streams per-beat events the frontend animates/sounds in
@@ -54,6 +67,18 @@ class Config:
     # docs/development/combat-streaming-plan.md).
     COMBAT_SOCKET_STREAMING = False
 
+    # Per-route latency histograms, per-phase spans and on-demand sampling
+    # captures (src/api/profiling.py). Off by default; when on, the
+    # /api/internal endpoints are served to callers presenting PROFILING_TOKEN
+    # in an X-Profiling-Token header. Without a token they are served to
+    # loopback callers only if PROFILING_TRUST_LOOPBACK is set -- never do that
+    # behind a same-host reverse proxy, where every request is from loopback.
+    REQUEST_PROFILING = False
+    PROFILING_TOKEN = os.environ.get("PROFILING_TOKEN")
+    PROFILING_TRUST_LOOPBACK = os.environ.get(
+        "PROFILING_TRUST_LOOPBACK", "false"
+    ).lower() not in ("0", "false", "no", "")
+
 
 class DevelopmentConfig(Config):
     """Development configuration."""
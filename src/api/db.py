@@ -1,6 +1,11 @@
+import asyncio
+import atexit
 import logging
 import os
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
 import libsql_client
 from dotenv import load_dotenv
 
@@ -8,10 +13,145 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Most queued writes one libsql batch (one round trip, one transaction) carries.
+_DEFAULT_MAX_BATCH = 32
+
+
+class WriteBehindQueue:
+    """Background writer that coalesces and batches queued statements.
+
+    Callers hand :meth:`enqueue` a list of statements and get a Future back
+    straight away; a single writer thread with its own event loop and its own
+    long-lived client commits them:
+
+      * **Last write wins per key.** Enqueueing under a key that is still
+        waiting replaces that entry's statements in place (keeping its place
+        in line), and both callers share its Future. ``key=None`` never
+        coalesces.
+      * **Batched.** Up to ``max_batch`` waiting entries go out as one
+        ``client.batch`` call. If that batch fails, each entry is retried on
+        its own so one bad entry can't sink the others.
+      * **Read-your-writes.** :meth:`future_for` returns the Future of a key's
+        waiting or in-flight entry, so a reader can wait for it first.
+
+    The thread starts on first use and exits once :meth:`close` has drained
+    the queue; ``close`` also runs at interpreter exit.
+    """
+
+    def __init__(self, client_factory, max_batch: int = _DEFAULT_MAX_BATCH):
+        self._client_factory = client_factory
+        self.max_batch = max(1, int(max_batch))
+        self._cond = threading.Condition()
+        # key -> [statements, future]; unkeyed entries get a private key.
+        self._pending: "OrderedDict[object, list]" = OrderedDict()
+        self._in_flight = {}
+        self._thread = None
+        self._closing = False
+        self._counters = {"enqueued": 0, "coalesced": 0, "batches": 0, "statements": 0, "failed": 0}
+
+    def enqueue(self, statements, key=None) -> Future:
+        """Queue ``statements`` to run together in one transaction."""
+        statements = list(statements)
+        with self._cond:
+            if self._closing:
+                raise RuntimeError("write-behind queue is closed")
+            self._counters["enqueued"] += 1
+            entry = self._pending.get(key) if key is not None else None
+            if entry is not None:
+                entry[0] = statements
+                self._counters["coalesced"] += 1
+                return entry[1]
+            future = Future()
+            self._pending[key if key is not None else object()] = [statements, future]
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="db-write-behind", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+            self._cond.notify()
+            return future
+
+    def future_for(self, key):
+        """The Future of ``key``'s waiting or in-flight entry, or None."""
+        with self._cond:
+            entry = self._pending.get(key)
+            if entry is not None:
+                return entry[1]
+            return self._in_flight.get(key)
+
+    def flush(self, timeout=None) -> bool:
+        """Block until everything queued so far is committed (or failed)."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._in_flight, timeout)
+
+    def close(self, timeout=None) -> None:
+        """Drain the queue and stop the writer thread."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {"pending": len(self._pending), "in_flight": len(self._in_flight), **self._counters}
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        client = None
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._pending or self._closing)
+                    if not self._pending:
+                        return
+                    batch = []
+                    while self._pending and len(batch) < self.max_batch:
+                        key, (statements, future) = self._pending.popitem(last=False)
+                        self._in_flight[key] = future
+                        batch.append((key, statements, future))
+                if client is None:
+                    client = self._client_factory()
+                loop.run_until_complete(self._commit(client, batch))
+                with self._cond:
+                    for key, _statements, _future in batch:
+                        self._in_flight.pop(key, None)
+                    self._cond.notify_all()
+        finally:
+            if client is not None:
+                try:
+                    loop.run_until_complete(client.close())
+                except Exception as exc:  # pragma: no cover - defensive cleanup
+                    logger.debug("Failed to close write-behind db client: %s", exc)
+            loop.close()
+
+    async def _commit(self, client, batch):
+        statements = [stmt for _key, entry_statements, _future in batch for stmt in entry_statements]
+        try:
+            results = await client.batch(statements)
+        except Exception as exc:
+            if len(batch) > 1:
+                for entry in batch:
+                    await self._commit(client, [entry])
+                return
+            logger.error("Write-behind write failed; %d statement(s) dropped: %s", len(statements), exc)
+            with self._cond:
+                self._counters["failed"] += 1
+            batch[0][2].set_exception(exc)
+            return
+        with self._cond:
+            self._counters["batches"] += 1
+            self._counters["statements"] += len(statements)
+        offset = 0
+        for _key, entry_statements, future in batch:
+            future.set_result(results[offset:offset + len(entry_statements)])
+            offset += len(entry_statements)
+
 
 class Database:
     _instance = None
     _client = None
+    _write_queue = None
     # Serializes the check-then-create in get_client so concurrent callers
     # (e.g. async routes running on different event loops via asgiref) can't
     # each construct a client and leak the loser of the race (issue #406).
@@ -33,8 +173,6 @@ class Database:
         its transports and there's nothing left to close.
         """
         try:
-            import asyncio
-
             session = getattr(client, "_session", None)
             sess_loop = getattr(session, "loop", None) if session else None
             if sess_loop is not None and not sess_loop.is_closed() and sess_loop.is_running():
@@ -42,8 +180,15 @@ class Database:
         except Exception as exc:  # pragma: no cover - defensive cleanup
             logger.debug("Failed to close superseded db client: %s", exc)
 
+    @staticmethod
+    def _create_client():
+        url = os.getenv("TURSO_DATABASE_URL")
+        auth_token = os.getenv("TURSO_AUTH_TOKEN")
+        if not url:
+            raise ValueError("TURSO_DATABASE_URL is not set")
+        return libsql_client.create_client(url, auth_token=auth_token)
+
     def get_client(self):
-        import asyncio
 
         try:
             loop = asyncio.get_running_loop()
@@ -69,11 +214,7 @@ class Database:
                         self._client = None
 
             if self._client is None:
-                url = os.getenv("TURSO_DATABASE_URL")
-                auth_token = os.getenv("TURSO_AUTH_TOKEN")
-                if not url:
-                    raise ValueError("TURSO_DATABASE_URL is not set")
-                self._client = libsql_client.create_client(url, auth_token=auth_token)
+                self._client = self._create_client()
             client = self._client
 
         # Close the superseded client outside the lock (avoids holding the lock
@@ -90,7 +231,49 @@ class Database:
         client = self.get_client()
         return await client.batch(statements)
 
+    @property
+    def write_behind(self) -> bool:
+        """Whether autosaves go through :meth:`enqueue_write` (``DB_WRITE_BEHIND``)."""
+        return os.getenv("DB_WRITE_BEHIND", "").strip().lower() in ("1", "true", "yes", "on")
+
+    def _writer(self) -> WriteBehindQueue:
+        with self._client_lock:
+            if self._write_queue is None:
+                self._write_queue = WriteBehindQueue(self._create_client)
+            return self._write_queue
+
+    def enqueue_write(self, statements, key=None) -> Future:
+        """Queue ``statements`` for the background writer and return at once.
+
+        Statements are ``(sql, args)`` pairs run together in one transaction.
+        A later call with the same ``key`` replaces one that hasn't been
+        written yet (see :class:`WriteBehindQueue`).
+        """
+        return self._writer().enqueue(statements, key=key)
+
+    async def wait_for_writes(self, key) -> None:
+        """Wait until ``key``'s queued write (if any) has been committed.
+
+        A failed write was already logged by the writer; readers see the
+        last committed state either way, so the error isn't re-raised here.
+        """
+        queue = self._write_queue
+        future = queue.future_for(key) if queue is not None else None
+        if future is not None:
+            try:
+                await asyncio.wrap_future(future)
+            except Exception:
+                pass
+
+    def write_stats(self):
+        """Counters from the background writer, or None if it never started."""
+        queue = self._write_queue
+        return queue.stats() if queue is not None else None
+
     async def close(self):
+        queue, self._write_queue = self._write_queue, None
+        if queue is not None:
+            await asyncio.to_thread(queue.close)
         if self._client:
             await self._client.close()
             self._client = None
@@ -1,6 +1,8 @@
 """Shared session/auth resolution for API routes."""
 
-from flask import current_app, jsonify, request
+from flask import current_app, g, jsonify, request
+
+from src.api.profiling import span
 
 
 def _bearer_token():
@@ -44,7 +46,8 @@ def resolve_session():
             (jsonify({"success": False, "error": "Session manager not initialized"}), 500),
         )
 
-    session = session_manager.get_session(token)
+    with span("session_lookup"):
+        session = session_manager.get_session(token)
     if not session:
         return (
             None,
@@ -76,7 +79,20 @@ def get_session_and_player():
         )
 
     session_manager = current_app.session_manager
-    session = session_manager.get_session(session_id)
+    with span("session_lookup"):
+        # Serialize requests for this session; the app's teardown hook ends
+        # the checkout (see SessionManager.checkout).
+        if g.get("hov_checkout") != session_id:
+            if not session_manager.checkout(session_id):
+                return (
+                    None,
+                    None,
+                    None,
+                    (jsonify({"success": False, "error": "Session is busy with another request"}), 409),
+                )
+            g.hov_checkout = session_id
+        session = session_manager.get_session(session_id)
+        player = session_manager.get_player(session_id) if session else None
     if not session:
         return (
             None,
@@ -85,7 +101,6 @@ def get_session_and_player():
             (jsonify({"success": False, "error": "Invalid or expired session"}), 401),
         )
 
-    player = session_manager.get_player(session_id)
     if not player:
         return (
             None,
@@ -94,4 +109,9 @@ def get_session_and_player():
             (jsonify({"success": False, "error": "Player not found"}), 404),
         )
 
+    # The app's after_request hook checkpoints this session to the shared
+    # session store (when one is configured) once the route has finished with
+    # the player, and answers 409 if the write lost to another worker -- see
+    # SessionManager.release.
+    g.hov_session_id = session_id
     return session_manager, session, player, None
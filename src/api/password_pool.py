@@ -0,0 +1,158 @@
+"""Bounded worker pool for Argon2 password hashing.
+
+``AuthService`` hashes with ``PasswordHasher()``'s defaults (m=65536, t=3):
+tens of milliseconds of CPU and 64 MiB per call, and login runs one even for an
+unknown username (see ``_DUMMY_PASSWORD_HASH``).
+
+Flask runs the ``async def`` auth routes through asgiref's ``async_to_sync``,
+which holds the request thread until the coroutine finishes, so moving the
+hash onto another thread does not by itself free anything: a login still
+occupies one of the worker's request threads for as long as its hash waits and
+runs. What keeps a login burst from stalling gameplay requests in the same
+worker is admission control:
+
+  * **At most ``max_in_flight`` calls are admitted** (waiting plus running).
+    :meth:`PasswordHashPool.submit` raises :class:`PasswordPoolBusy` at once,
+    without queueing, when that many are already in, and the auth routes answer
+    503 with ``Retry-After``. The default is half of ``WEB_THREADS``, the
+    request-thread count the Procfile gives gunicorn, so a burst can never tie
+    up more than half of the worker's threads.
+  * **At most ``max_workers`` hashes run at once**, on threads started on
+    demand that exit as soon as the queue is empty. argon2-cffi releases the
+    GIL while hashing, so this bounds CPU and memory (64 MiB each) rather than
+    serializing the GIL.
+  * **Queue-depth metrics** from :meth:`PasswordHashPool.stats`, reported by
+    ``GET /api/internal/stats``.
+
+Per-process, like ``suggestion_pool.py``: each gunicorn worker has its own pool.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+# Two concurrent hashes keep a login burst to ~128 MiB and leave the rest of
+# the CPU to gameplay.
+_DEFAULT_MAX_WORKERS = 2
+# Matches the Procfile's ``--threads ${WEB_THREADS:-8}``.
+_DEFAULT_WEB_THREADS = 8
+
+
+class PasswordPoolBusy(Exception):
+    """Raised when the password pool already has ``max_in_flight`` calls admitted."""
+
+
+class PasswordHashPool:
+    """Runs password hashing calls in FIFO order on a bounded set of threads."""
+
+    def __init__(self, max_workers: int = _DEFAULT_MAX_WORKERS, max_in_flight: int = _DEFAULT_WEB_THREADS // 2):
+        self.max_workers = max(1, int(max_workers))
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._workers = 0
+        self._running = 0
+        self._peak_pending = 0
+        self._peak_in_flight = 0
+        self._dispatched = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._counters = {"submitted": 0, "rejected": 0, "completed": 0, "raised": 0}
+
+    def submit(self, fn, *args) -> Future:
+        """Queue ``fn(*args)`` and return a Future for its result.
+
+        Raises :class:`PasswordPoolBusy`, and queues nothing, when
+        ``max_in_flight`` calls are already waiting or running.
+        """
+        future = Future()
+        with self._lock:
+            self._counters["submitted"] += 1
+            in_flight = len(self._pending) + self._running
+            if in_flight >= self.max_in_flight:
+                self._counters["rejected"] += 1
+                logger.warning(
+                    "Password hashing pool saturated (%d in flight); rejecting request",
+                    in_flight,
+                )
+                raise PasswordPoolBusy(f"{in_flight} password hashing calls already in flight")
+            self._pending.append((future, fn, args, time.monotonic()))
+            self._peak_pending = max(self._peak_pending, len(self._pending))
+            self._peak_in_flight = max(self._peak_in_flight, in_flight + 1)
+            spawn = self._workers < self.max_workers
+            if spawn:
+                self._workers += 1
+        if spawn:
+            threading.Thread(target=self._work, name="password-hash-worker", daemon=True).start()
+        return future
+
+    async def run(self, fn, *args):
+        """Await ``fn(*args)`` on the pool without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def _work(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._workers -= 1
+                    return
+                future, fn, args, queued_at = self._pending.popleft()
+                waited = time.monotonic() - queued_at
+                self._dispatched += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+                self._running += 1
+            outcome = None
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                    outcome = "completed"
+                except BaseException as exc:  # noqa: BLE001 - handed to the caller
+                    future.set_exception(exc)
+                    outcome = "raised"
+            with self._lock:
+                self._running -= 1
+                if outcome:
+                    self._counters[outcome] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self._workers,
+                "max_workers": self.max_workers,
+                "pending": len(self._pending),
+                "peak_pending": self._peak_pending,
+                "running": self._running,
+                "in_flight": len(self._pending) + self._running,
+                "max_in_flight": self.max_in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "avg_wait_ms": round(1000 * self._wait_total / self._dispatched, 3) if self._dispatched else 0.0,
+                "max_wait_ms": round(1000 * self._wait_max, 3),
+                **self._counters,
+            }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_password_pool() -> PasswordHashPool:
+    """Return the process-wide pool, sized from ``PASSWORD_HASH_WORKERS`` and
+    ``PASSWORD_HASH_MAX_IN_FLIGHT`` (default: half of ``WEB_THREADS``) in the
+    environment on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                web_threads = int(os.environ.get("WEB_THREADS", _DEFAULT_WEB_THREADS))
+                _pool = PasswordHashPool(
+                    max_workers=int(os.environ.get("PASSWORD_HASH_WORKERS", _DEFAULT_MAX_WORKERS)),
+                    max_in_flight=int(os.environ.get("PASSWORD_HASH_MAX_IN_FLIGHT", web_threads // 2)),
+                )
+    return _pool
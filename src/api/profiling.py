@@ -0,0 +1,499 @@
+"""Opt-in request instrumentation: per-route latency and per-phase spans.
+
+Off unless ``REQUEST_PROFILING`` is set (see ``src/api/config.py``); when off,
+:func:`install_profiling` is never called and :func:`span` is a near-free
+no-op, so the hot paths pay one global check and nothing else.
+
+When on, every request records:
+
+  * its total wall time into a per-route log-bucket histogram (route = the
+    matched URL rule plus method, so ``/api/world/tiles/<x>/<y>`` is one
+    series however many tiles are fetched);
+  * the time spent in each named phase — ``session_lookup``,
+    ``game_service``, ``serializer``, ``json_safe`` and ``jsonify`` — both
+    *inclusive* (the outermost span of that name) and *self* (minus any
+    nested phase), so the self times plus ``unattributed`` add up to the
+    request total and answer "where did the time go" without double
+    counting.
+
+Phases are opened with :func:`span`, which callers wrap around the code
+they own (auth middleware, the serializer boundary); ``install_profiling``
+adds the ``game_service`` span by wrapping the app's GameService *instance*
+and the ``jsonify`` span by wrapping the app's JSON provider, so neither
+class changes behaviour when profiling is off.
+
+A session can also be armed for a sampling-profiler capture: its next N
+requests are sampled from a side thread via ``sys._current_frames`` and
+aggregated into collapsed stacks (flamegraph.pl / speedscope input). That
+replaces attaching a debugger in production; sampling only ever touches the
+armed session's requests.
+
+Everything here is per-process. Under several gunicorn workers each worker
+reports its own numbers, the same as ``rate_limiter.py``.
+"""
+
+import bisect
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+
+from flask import g, has_request_context, request
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds, in ms. Roughly logarithmic: API requests
+# span sub-millisecond tile fetches to multi-second combat turns, and a
+# percentile estimate only needs to say which order of magnitude it is in.
+LATENCY_BUCKETS_MS = (
+    0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000,
+)
+
+# Phases whose self time is reported. Any span name works; these are the
+# ones the app opens itself.
+PHASES = (
+    "session_lookup",
+    "game_service",
+    "serializer",
+    "json_safe",
+    "jsonify",
+)
+
+# Sampling-profiler defaults. 5ms keeps the sampler's own cost well under
+# the request's while still catching anything that matters for latency.
+DEFAULT_SAMPLE_INTERVAL = 0.005
+DEFAULT_PROFILE_REQUESTS = 20
+MAX_PROFILE_REQUESTS = 500
+_MAX_STACK_DEPTH = 64
+# Bound on remembered captures/armed sessions, so arming from a script in a
+# loop cannot grow memory without limit.
+_MAX_CAPTURES = 32
+
+# Number of apps in this process with profiling installed. span() checks it
+# before touching flask.g so uninstrumented processes pay nothing else.
+_installed = 0
+
+
+class _RequestTrace:
+    """Span bookkeeping for one request (stored on ``flask.g``)."""
+
+    __slots__ = ("start", "stack", "inclusive", "self_ns")
+
+    def __init__(self):
+        self.start = time.perf_counter_ns()
+        # Each entry: [name, start_ns, child_ns, outermost]
+        self.stack = []
+        self.inclusive = {}
+        self.self_ns = {}
+
+    def enter(self, name):
+        outermost = all(entry[0] != name for entry in self.stack)
+        self.stack.append([name, time.perf_counter_ns(), 0, outermost])
+
+    def exit(self):
+        name, started, child_ns, outermost = self.stack.pop()
+        elapsed = time.perf_counter_ns() - started
+        if self.stack:
+            self.stack[-1][2] += elapsed
+        self.self_ns[name] = self.self_ns.get(name, 0) + elapsed - child_ns
+        if outermost:
+            self.inclusive[name] = self.inclusive.get(name, 0) + elapsed
+
+
+class _Span:
+    __slots__ = ("_trace", "_name")
+
+    def __init__(self, trace, name):
+        self._trace = trace
+        self._name = name
+
+    def __enter__(self):
+        self._trace.enter(self._name)
+        return self
+
+    def __exit__(self, *exc):
+        self._trace.exit()
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name):
+    """Context manager timing ``name`` as a phase of the current request.
+
+    A no-op outside a request, or when no app in this process has profiling
+    installed. Nested spans of the same name only count once towards that
+    phase's inclusive time.
+    """
+    if not _installed or not has_request_context():
+        return _NULL_SPAN
+    trace = g.get("_hov_trace")
+    if trace is None:
+        return _NULL_SPAN
+    return _Span(trace, name)
+
+
+def _wrap_in_span(name, fn):
+    def wrapper(*args, **kwargs):
+        with span(name):
+            return fn(*args, **kwargs)
+
+    wrapper.__name__ = getattr(fn, "__name__", name)
+    wrapper.__doc__ = getattr(fn, "__doc__", None)
+    wrapper.__wrapped__ = fn
+    return wrapper
+
+
+# ---------------------------------------------------------------------------
+# Aggregation
+# ---------------------------------------------------------------------------
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the ``q`` quantile (0-1).
+
+        The overflow bucket reports the observed max instead of infinity.
+        """
+        if not self.count:
+            return None
+        target = max(1, int(q * self.count + 0.999999))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                if i < len(LATENCY_BUCKETS_MS):
+                    return min(float(LATENCY_BUCKETS_MS[i]), round(self.max_ms, 3))
+                return round(self.max_ms, 3)
+        return round(self.max_ms, 3)
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {
+                (f"le_{b:g}" if i < len(LATENCY_BUCKETS_MS) else "overflow"): n
+                for i, (b, n) in enumerate(
+                    zip(LATENCY_BUCKETS_MS + (None,), self.counts)
+                )
+                if n
+            },
+        }
+
+
+class _PhaseTotals:
+    __slots__ = ("requests", "inclusive_ms", "self_ms", "max_ms")
+
+    def __init__(self):
+        self.requests = 0
+        self.inclusive_ms = 0.0
+        self.self_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, inclusive_ms, self_ms):
+        self.requests += 1
+        self.inclusive_ms += inclusive_ms
+        self.self_ms += self_ms
+        if inclusive_ms > self.max_ms:
+            self.max_ms = inclusive_ms
+
+    def snapshot(self, route_total_ms):
+        return {
+            "requests": self.requests,
+            "inclusive_ms": round(self.inclusive_ms, 3),
+            "self_ms": round(self.self_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "share": round(self.self_ms / route_total_ms, 4) if route_total_ms else None,
+        }
+
+
+class RequestStats:
+    """Thread-safe per-route latency histograms and per-phase totals."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+        self._started = time.time()
+
+    def record(self, route, total_ms, inclusive, self_times):
+        unattributed = max(0.0, total_ms - sum(self_times.values()))
+        with self._lock:
+            entry = self._routes.get(route)
+            if entry is None:
+                entry = self._routes[route] = (_Histogram(), {})
+            histogram, phases = entry
+            histogram.add(total_ms)
+            for name, self_ms in self_times.items():
+                phases.setdefault(name, _PhaseTotals()).add(
+                    inclusive.get(name, self_ms), self_ms
+                )
+            phases.setdefault("unattributed", _PhaseTotals()).add(unattributed, unattributed)
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+            self._started = time.time()
+
+    def snapshot(self):
+        with self._lock:
+            routes = {}
+            for route, (histogram, phases) in sorted(self._routes.items()):
+                data = histogram.snapshot()
+                data["phases"] = {
+                    name: totals.snapshot(histogram.total_ms)
+                    for name, totals in sorted(phases.items())
+                }
+                routes[route] = data
+            return {
+                "since": self._started,
+                "uptime_seconds": round(time.time() - self._started, 1),
+                "routes": routes,
+            }
+
+
+# ---------------------------------------------------------------------------
+# Sampling profiler
+# ---------------------------------------------------------------------------
+
+
+def _collapse(frame):
+    """Render ``frame``'s stack root-first as ``file:func;file:func;...``."""
+    parts = []
+    while frame is not None and len(parts) < _MAX_STACK_DEPTH:
+        code = frame.f_code
+        filename = code.co_filename.replace("\\", "/")
+        # Trim to the project-relative path when there is one; site-packages
+        # paths are long and the package name is enough to read them.
+        for marker in ("/src/", "/site-packages/", "/lib/python"):
+            idx = filename.rfind(marker)
+            if idx != -1:
+                filename = filename[idx + 1:]
+                break
+        parts.append(f"{filename}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+class _StackSampler(threading.Thread):
+    """Samples one thread's stack every ``interval`` seconds until stopped."""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(name=f"hov-profiler-{thread_id}", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+            self.stacks[_collapse(frame)] += 1
+            del frame
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return self.stacks
+
+
+class SessionProfiler:
+    """Arms sampling captures for individual sessions and keeps the results."""
+
+    def __init__(self, interval=DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._armed = {}
+        self._captures = {}
+
+    def arm(self, session_id, requests=DEFAULT_PROFILE_REQUESTS):
+        """Sample the next ``requests`` requests made by ``session_id``.
+
+        Re-arming discards any earlier capture for the session.
+        """
+        requests = max(1, min(int(requests), MAX_PROFILE_REQUESTS))
+        with self._lock:
+            self._armed[session_id] = requests
+            self._captures[session_id] = {
+                "armed_at": time.time(),
+                "requests_wanted": requests,
+                "requests": 0,
+                "samples": 0,
+                "routes": Counter(),
+                "stacks": Counter(),
+            }
+            while len(self._captures) > _MAX_CAPTURES:
+                oldest = next(iter(self._captures))
+                self._captures.pop(oldest)
+                self._armed.pop(oldest, None)
+        return requests
+
+    def is_armed(self, session_id):
+        return session_id in self._armed
+
+    def start(self, session_id):
+        """Return a running sampler for this request, or None if not armed."""
+        with self._lock:
+            remaining = self._armed.get(session_id)
+            if not remaining:
+                return None
+            if remaining == 1:
+                del self._armed[session_id]
+            else:
+                self._armed[session_id] = remaining - 1
+        sampler = _StackSampler(threading.get_ident(), self.interval)
+        sampler.start()
+        return sampler
+
+    def finish(self, session_id, route, sampler):
+        stacks = sampler.stop()
+        with self._lock:
+            capture = self._captures.get(session_id)
+            if capture is None:
+                return
+            capture["requests"] += 1
+            capture["samples"] += sum(stacks.values())
+            capture["routes"][route] += 1
+            capture["stacks"].update(stacks)
+
+    def capture(self, session_id, top=50):
+        """Return the capture for ``session_id`` (or None if never armed).
+
+        ``collapsed`` is the full profile in the one-stack-per-line format
+        flamegraph.pl and speedscope read; ``top`` lists the hottest stacks.
+        """
+        with self._lock:
+            capture = self._captures.get(session_id)
+            if capture is None:
+                return None
+            stacks = capture["stacks"]
+            return {
+                "armed_at": capture["armed_at"],
+                "requests_wanted": capture["requests_wanted"],
+                "requests": capture["requests"],
+                "pending": self._armed.get(session_id, 0),
+                "samples": capture["samples"],
+                "interval_ms": self.interval * 1000,
+                "routes": dict(capture["routes"]),
+                "top": [
+                    {"stack": stack, "samples": n}
+                    for stack, n in stacks.most_common(top)
+                ],
+                "collapsed": "\n".join(
+                    f"{stack} {n}" for stack, n in stacks.most_common()
+                ),
+            }
+
+
+# ---------------------------------------------------------------------------
+# Installation
+# ---------------------------------------------------------------------------
+
+
+def _route_key():
+    rule = request.url_rule
+    return f"{request.method} {rule.rule if rule is not None else '<unmatched>'}"
+
+
+def _instrument_game_service(service):
+    """Wrap the public methods of one GameService instance in spans."""
+    if service is None:
+        return
+    for name in dir(type(service)):
+        if name.startswith("_"):
+            continue
+        method = getattr(service, name, None)
+        if not callable(method) or isinstance(method, type):
+            continue
+        setattr(service, name, _wrap_in_span("game_service", method))
+
+
+def install_profiling(app):
+    """Instrument ``app``: request timing hooks, phase spans, stats and profiler.
+
+    Must run before any other ``before_request`` hook is registered so the
+    total covers them too (the CORS preflight hook short-circuits the chain).
+    Attaches ``app.request_stats`` and ``app.session_profiler``.
+    """
+    global _installed
+
+    stats = RequestStats()
+    profiler = SessionProfiler()
+    app.request_stats = stats
+    app.session_profiler = profiler
+
+    _instrument_game_service(getattr(app, "game_service", None))
+
+    # Time jsonify by wrapping this app's provider instance rather than
+    # swapping in a subclass, so its configured options (sort_keys, compact,
+    # mimetype) are kept exactly as they are.
+    provider = app.json
+    provider.response = _wrap_in_span("jsonify", provider.response)
+
+    @app.before_request
+    def _profiling_start():
+        g._hov_trace = _RequestTrace()
+        auth = request.headers.get("Authorization", "")
+        if auth.startswith("Bearer "):
+            session_id = auth[7:]
+            if profiler.is_armed(session_id):
+                g._hov_sampler = (session_id, profiler.start(session_id))
+
+    @app.teardown_request
+    def _profiling_finish(_exc=None):
+        trace = g.pop("_hov_trace", None)
+        if trace is None:
+            return
+        route = _route_key()
+        sampled = g.pop("_hov_sampler", None)
+        if sampled is not None and sampled[1] is not None:
+            profiler.finish(sampled[0], route, sampled[1])
+        # A span left open by an exception still ends at teardown.
+        while trace.stack:
+            trace.exit()
+        total_ms = (time.perf_counter_ns() - trace.start) / 1e6
+        try:
+            stats.record(
+                route,
+                total_ms,
+                {k: v / 1e6 for k, v in trace.inclusive.items()},
+                {k: v / 1e6 for k, v in trace.self_ns.items()},
+            )
+        except Exception:  # noqa: BLE001 - instrumentation must never fail a request
+            logger.warning("request profiling failed for %s", route, exc_info=True)
+
+    _installed += 1
+    logger.info("Request profiling enabled")
+    return stats
@@ -5,6 +5,7 @@ import logging
 from flask import Blueprint, request, jsonify
 from src.api.middleware.auth import resolve_session
 from src.api.rate_limiter import RateLimiter
+from src.api.password_pool import PasswordPoolBusy
 from src.api.services.auth_service import auth_service
 from functools import wraps
 import asyncio
@@ -95,6 +96,21 @@ def _is_config_leak(msg: str) -> bool:
     return any(marker in msg for marker in _CONFIG_LEAK_MARKERS)
 
 
+def _password_pool_busy_response():
+    """503 for a login/registration shed because the password pool is full."""
+    return (
+        jsonify(
+            {
+                "success": False,
+                "error": "service_busy",
+                "message": "The server is busy. Please try again in a moment.",
+            }
+        ),
+        503,
+        {"Retry-After": "1"},
+    )
+
+
 def _establish_session_for_user(session_manager, username, user):
     """Create a session for ``username`` and link it to the DB user record.
 
@@ -105,6 +121,8 @@ def _establish_session_for_user(session_manager, username, user):
     session = session_manager.get_session(session_id)
     session.db_user_id = user["id"]
     session.data["timezone"] = user.get("timezone", "America/New_York")
+    # Persist the linkage so other workers see it (shared session store only).
+    session_manager.save_session(session_id)
     return session_id, player_id
 
 
@@ -263,6 +281,8 @@ async def register():
             201,
         )
 
+    except PasswordPoolBusy:
+        return _password_pool_busy_response()
     except Exception:
         logger.exception("Unhandled error in register")
         return (
@@ -383,6 +403,8 @@ async def login():
             200,
         )
 
+    except PasswordPoolBusy:
+        return _password_pool_busy_response()
     except Exception as e:
         logger.exception("Unhandled error in login")
         msg = str(e)
@@ -4,7 +4,7 @@ import logging
 from flask import Blueprint, request, jsonify
 
 from src.api.middleware.auth import get_session_and_player
-from src.api.services.validators import ensure_dict
+from src.api.services.validators import coerce_optional_index, ensure_dict
 
 logger = logging.getLogger(__name__)
 
@@ -87,7 +87,10 @@ def execute_move():
         {
             "move_type": "attack|defend|cast|item",
             "move_id": str,
-            "target_id": str (optional)
+            "target_id": str (optional),
+            "since_seq": int (optional) — only return log entries after this seq
+            "beat_encoding": "delta" (optional) — send beat_base + beat_deltas
+                instead of full beat_states (see src/api/beat_frames.py)
         }
 
     Returns:
@@ -95,7 +98,8 @@ def execute_move():
             "success": bool,
             "result": str,
             "damage": int (optional),
-            "effects": [...] (optional)
+            "effects": [...] (optional),
+            "log_seq": int — cursor to send as since_seq next time
         }
     """
     try:
@@ -119,6 +123,20 @@ def execute_move():
         move_id = data.get("move_id", data.get("move_name", ""))
         target_id = data.get("target_id")
         direction = data.get("direction")
+        since_seq, seq_error = coerce_optional_index(data.get("since_seq"), "since_seq")
+        if seq_error:
+            return jsonify({"success": False, "error": seq_error}), 400
+        beat_encoding = data.get("beat_encoding")
+        if beat_encoding not in (None, "full", "delta"):
+            return (
+                jsonify(
+                    {
+                        "success": False,
+                        "error": "beat_encoding must be 'full' or 'delta'",
+                    }
+                ),
+                400,
+            )
 
         from flask import current_app
 
@@ -132,6 +150,8 @@ def execute_move():
             direction,
             session_id=session.session_id,
             session_data=session.data,
+            since_seq=since_seq,
+            beat_encoding=beat_encoding,
         )
 
         if "error" in result:
@@ -166,13 +186,19 @@ def get_combat_status():
     Headers:
         Authorization: Bearer <session_id>
 
+    Query parameters:
+        since_seq: int (optional) — only return log entries after this seq
+
     Returns:
         {
             "success": bool,
             "combat_active": bool,
             "combatants": [...],
             "current_turn": int,
-            "log": [...]
+            "log": [...],
+            "log_seq": int,               # cursor to send as since_seq next time
+            "log_truncated": bool,        # with since_seq: older entries were evicted
+            "log_reset": bool             # with since_seq: cursor was from another fight
         }
     """
     try:
@@ -180,12 +206,19 @@ def get_combat_status():
         if error:
             return error
 
+        since_seq, seq_error = coerce_optional_index(request.args.get("since_seq"), "since_seq")
+        if seq_error:
+            return jsonify({"success": False, "error": seq_error}), 400
+
         from flask import current_app
 
         game_service = current_app.game_service
 
         status = game_service.get_combat_status(
-            player, session_id=session.session_id, session_data=session.data
+            player,
+            session_id=session.session_id,
+            session_data=session.data,
+            since_seq=since_seq,
         )
 
         return jsonify({"success": True, **status}), 200
@@ -0,0 +1,80 @@
+"""Internal diagnostics endpoints (request profiling).
+
+Registered ONLY when ``REQUEST_PROFILING`` is on (see create_app and
+``src/api/profiling.py``). Even then every route needs a matching
+``X-Profiling-Token`` header, because the stats reveal traffic shape and a
+capture can target any session id. Loopback callers are let in without one
+only when no token is configured and ``PROFILING_TRUST_LOOPBACK`` is set:
+behind a same-host reverse proxy without ProxyFix (the default, see
+``_apply_proxy_fix``) every external request arrives from 127.0.0.1.
+
+    GET  /api/internal/stats                 per-route latency, phase totals and
+                                             password-hashing queue depth and
+                                             write-behind counters
+    POST /api/internal/stats/reset           start a fresh measurement window
+    POST /api/internal/profile/<session_id>  sample that session's next N requests
+    GET  /api/internal/profile/<session_id>  fetch the capture (collapsed stacks)
+"""
+
+import hmac
+
+from flask import Blueprint, abort, current_app, jsonify, request
+
+from src.api.db import db
+from src.api.password_pool import get_password_pool
+from src.api.profiling import DEFAULT_PROFILE_REQUESTS
+
+internal_bp = Blueprint("internal", __name__)
+
+_LOOPBACK = ("127.0.0.1", "::1")
+
+
+@internal_bp.before_request
+def _require_internal_caller():
+    token = current_app.config.get("PROFILING_TOKEN")
+    if token:
+        supplied = request.headers.get("X-Profiling-Token")
+        if supplied and hmac.compare_digest(token, supplied):
+            return None
+    elif current_app.config.get("PROFILING_TRUST_LOOPBACK") and request.remote_addr in _LOOPBACK:
+        return None
+    # 404 rather than 403: don't advertise that the endpoints exist.
+    abort(404)
+
+
+@internal_bp.route("/stats", methods=["GET"])
+def get_stats():
+    return jsonify({
+        "success": True,
+        **current_app.request_stats.snapshot(),
+        "password_hashing": get_password_pool().stats(),
+        # None until DB_WRITE_BEHIND has queued a write in this process.
+        "db_write_behind": db.write_stats(),
+    })
+
+
+@internal_bp.route("/stats/reset", methods=["POST"])
+def reset_stats():
+    current_app.request_stats.reset()
+    return jsonify({"success": True})
+
+
+@internal_bp.route("/profile/<session_id>", methods=["POST"])
+def arm_profile(session_id):
+    data = request.get_json(silent=True) or {}
+    try:
+        wanted = int(data.get("requests", DEFAULT_PROFILE_REQUESTS))
+    except (TypeError, ValueError):
+        return jsonify({"success": False, "error": "requests must be an integer"}), 400
+    if current_app.session_manager.get_session(session_id) is None:
+        return jsonify({"success": False, "error": "Session not found"}), 404
+    armed = current_app.session_profiler.arm(session_id, wanted)
+    return jsonify({"success": True, "session_id": session_id, "requests": armed}), 202
+
+
+@internal_bp.route("/profile/<session_id>", methods=["GET"])
+def get_profile(session_id):
+    capture = current_app.session_profiler.capture(session_id)
+    if capture is None:
+        return jsonify({"success": False, "error": "No capture for this session"}), 404
+    return jsonify({"success": True, "session_id": session_id, **capture})
@@ -23,6 +23,8 @@ import functools
 import logging
 import math
 
+from src.api.profiling import span
+
 logger = logging.getLogger(__name__)
 
 _MAX_DEPTH = 40
@@ -59,7 +61,12 @@ def _wrap(name, fn):
     @functools.wraps(fn)
     def wrapper(*args, **kwargs):
         try:
-            return json_safe(fn(*args, **kwargs))
+            # Both phases are reported when request profiling is on; the
+            # serializer span includes the json_safe pass over its output.
+            with span("serializer"):
+                result = fn(*args, **kwargs)
+                with span("json_safe"):
+                    return json_safe(result)
         except Exception:  # noqa: BLE001 - contract: a serializer never raises
             # Never propagate, but stay observable: a real serializer regression
             # (vs a merely degraded object) would otherwise silently return an
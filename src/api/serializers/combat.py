@@ -102,28 +102,26 @@ class CombatStateSerializer:
             Dict with full combat state
         """
         allies = allies or []
+        # Each combatant is serialized once: `combatants` is the same dicts as
+        # player + allies + enemies, and serialize_combatant dominates the cost
+        # of a beat snapshot (one per beat of a multi-beat move).
+        serialized_player = CombatantSerializer.serialize_combatant(player)
         serialized_allies = [
             CombatantSerializer.serialize_combatant(a, reference=player) for a in allies
         ]
+        serialized_enemies = [
+            CombatantSerializer.serialize_combatant(e, reference=player)
+            for e in enemies
+        ]
         return {
             "status": "active",
             "round": round_number,
             "current_turn_index": current_turn_index,
-            "player": CombatantSerializer.serialize_combatant(player),
+            "player": serialized_player,
             "allies": serialized_allies,
-            "enemies": [
-                CombatantSerializer.serialize_combatant(e, reference=player)
-                for e in enemies
-            ],
+            "enemies": serialized_enemies,
             "turn_order": CombatStateSerializer._get_turn_order(player, enemies),
-            "combatants": (
-                [CombatantSerializer.serialize_combatant(player)]
-                + serialized_allies
-                + [
-                    CombatantSerializer.serialize_combatant(e, reference=player)
-                    for e in enemies
-                ]
-            ),
+            "combatants": [serialized_player] + serialized_allies + serialized_enemies,
             "suggested_moves": getattr(player, "suggested_moves", []),
             "suggestions_loading": getattr(player, "suggestions_loading", False),
             "last_move_outcome": getattr(player, "last_move_summary", ""),
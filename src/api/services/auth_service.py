@@ -1,9 +1,13 @@
+import logging
 import os
 import uuid
 from argon2 import PasswordHasher
 from cryptography.fernet import Fernet
 from typing import Optional, Dict, Any
 from src.api.db import db
+from src.api.password_pool import PasswordPoolBusy, get_password_pool
+
+logger = logging.getLogger(__name__)
 
 # Static dummy Argon2 hash used to equalize timing when a username lookup
 # misses. Verifying against this constant hash costs roughly the same as
@@ -40,7 +44,7 @@ class AuthService:
             raise ValueError("Password must be at least 16 characters")
 
         user_id = str(uuid.uuid4())
-        password_hash = self.ph.hash(password)
+        password_hash = await get_password_pool().run(self.ph.hash, password)
         email_encrypted = self.fernet.encrypt(email.encode()).decode()
 
         sql = """
@@ -75,8 +79,12 @@ class AuthService:
             # static dummy hash so this path takes comparable time to the
             # "username exists" path below. Without this, response timing
             # alone would let an attacker enumerate valid usernames.
+            # A saturated pool raises PasswordPoolBusy here exactly as it
+            # would for a known username, so a 503 reveals nothing either.
             try:
-                self.ph.verify(_DUMMY_PASSWORD_HASH, password)
+                await get_password_pool().run(self.ph.verify, _DUMMY_PASSWORD_HASH, password)
+            except PasswordPoolBusy:
+                raise
             except Exception:
                 pass
             return None
@@ -85,14 +93,20 @@ class AuthService:
         user_id, uname, p_hash, is_premium, timezone = user
 
         try:
-            self.ph.verify(p_hash, password)
-            # Rehash if needed
+            await get_password_pool().run(self.ph.verify, p_hash, password)
+            # Rehash if needed. Best-effort against a saturated pool: the
+            # password is already verified, so a busy pool must not turn this
+            # login into a 503; the next login retries the upgrade.
             if self.ph.check_needs_rehash(p_hash):
-                new_hash = self.ph.hash(password)
-                await db.execute(
-                    "UPDATE users SET password_hash = ? WHERE id = ?",
-                    [new_hash, user_id],
-                )
+                try:
+                    new_hash = await get_password_pool().run(self.ph.hash, password)
+                except PasswordPoolBusy:
+                    logger.info("Password pool busy; deferring rehash for user %s", user_id)
+                else:
+                    await db.execute(
+                        "UPDATE users SET password_hash = ? WHERE id = ?",
+                        [new_hash, user_id],
+                    )
 
             return {
                 "id": str(user_id),
@@ -100,6 +114,8 @@ class AuthService:
                 "is_premium": bool(is_premium),
                 "timezone": str(timezone) if timezone else "America/New_York",
             }
+        except PasswordPoolBusy:
+            raise
         except Exception:
             return None
 
@@ -1,13 +1,14 @@
 import logging
 import uuid
-import contextlib
 import re
 from collections import Counter
 from typing import TYPE_CHECKING, Dict, Any, Optional, List
-from unittest.mock import patch
 
 from src.api.constants import ITEM_USE_RANGE
+from src.api.beat_frames import apply_beat_encoding
+from src.api.combat_log import apply_log_cursor
 from src.functions import check_for_combat
+from src.headless import headless
 from src.inventory_utils import get_gold
 from src.moves import attacker_accuracy
 from src.narration import capture_narration, narrate
@@ -168,53 +169,6 @@ class GameService:
                 continue
         return result
 
-    def _get_event_target_modules(
-        self, event, include_animations: bool = True
-    ) -> List[str]:
-        modules = [
-            "src.functions",
-            "src.player",
-            "src.interface",
-            "src.items",
-            "src.objects",
-            "src.events",
-            "src.story.effects",
-        ]
-        if include_animations:
-            modules.append("src.animations")
-        if hasattr(event, "__module__"):
-            modules.append(event.__module__)
-        return modules
-
-    def _build_event_patches(self, target_modules) -> List[Any]:
-        """Build patches that neutralize terminal timing/animation during events.
-
-        Engine narrative output flows through the narration sink (captured via
-        ``capture_narration``), and the engine no longer calls ``input()`` on any
-        event/interact-reachable path (the terminal menus were removed), so input
-        is no longer mocked here.  We still suppress terminal pauses
-        (``await_input``), animation playback, and ``time.sleep`` so events resolve
-        instantly without blocking the API request.
-        """
-        patches = [
-            patch("time.sleep", return_value=None),
-        ]
-
-        for mod in set(target_modules):
-            patches.extend(
-                [
-                    patch(f"{mod}.await_input", return_value=None, create=True),
-                    patch(
-                        f"{mod}.animate_to_main_screen",
-                        return_value=None,
-                        create=True,
-                    ),
-                    patch(f"{mod}.time.sleep", return_value=None, create=True),
-                ]
-            )
-
-        return patches
-
     # Prefixes that indicate internal error/diagnostic output — must never reach the UI.
     _ERROR_PREFIXES = (
         "[ERROR]",
@@ -1229,24 +1183,9 @@ class GameService:
             # Try to trigger the event and capture output
             if hasattr(event, "check_conditions"):
                 try:
-                    target_modules = self._get_event_target_modules(
-                        event, include_animations=True
-                    )
-                    patches = self._build_event_patches(target_modules)
-
-                    # Capture structured narration emitted during event processing.
-                    with capture_narration() as _msgs, contextlib.ExitStack() as stack:
-
-                        for p in patches:
-                            try:
-                                stack.enter_context(p)
-                            except (
-                                AttributeError,
-                                ImportError,
-                                TypeError,
-                                ValueError,
-                            ):
-                                pass
+                    # Capture structured narration emitted during event processing;
+                    # headless() skips the engine's pacing sleeps and animations.
+                    with capture_narration() as _msgs, headless():
 
                         # Ensure event has current player and room references
                         event.player = player
@@ -1321,7 +1260,6 @@ class GameService:
         Returns:
             Dictionary with event result and output
         """
-        import contextlib
         from src.api.serializers.event_serializer import EventSerializer
 
         # Validate event exists
@@ -1340,24 +1278,9 @@ class GameService:
         try:
             # Structured choices come through process(user_input=...); the engine
             # no longer calls input() on event-reachable paths.
-            target_modules = self._get_event_target_modules(
-                event, include_animations=False
-            )
-            patches = self._build_event_patches(target_modules)
-
-            # Capture structured narration emitted during event processing.
-            with capture_narration() as _msgs, contextlib.ExitStack() as stack:
-
-                for p in patches:
-                    try:
-                        stack.enter_context(p)
-                    except (
-                        AttributeError,
-                        ImportError,
-                        TypeError,
-                        ValueError,
-                    ):
-                        pass
+            # Capture structured narration emitted during event processing;
+            # headless() skips the engine's pacing sleeps and animations.
+            with capture_narration() as _msgs, headless():
 
                 # Ensure event has current player and room references.
                 # Prefer tile_x/tile_y stored in the pending payload (set when
@@ -1769,7 +1692,6 @@ class GameService:
         Returns:
             Dictionary with interaction result and output text
         """
-        from unittest.mock import patch
         import inspect
         import re
         import uuid
@@ -1872,14 +1794,10 @@ class GameService:
         # Execute action and capture output
         events_triggered = []
         try:
-            # Narrative output is captured via the narration sink; we still
-            # neutralize terminal pauses/timing. Interaction targets no longer
-            # call input() (the terminal item/object menus were removed).
-            with (
-                capture_narration() as _msgs,
-                patch("time.sleep", return_value=None),
-                patch("src.functions.await_input", return_value=None),
-            ):
+            # Narrative output is captured via the narration sink, and
+            # headless() skips terminal pauses/timing. Interaction targets no
+            # longer call input() (the terminal item/object menus were removed).
+            with capture_narration() as _msgs, headless():
 
                 from src.objects import Container, Passageway
                 from src.items import Item
@@ -2232,25 +2150,9 @@ class GameService:
 
             if hasattr(event, method_name):
                 try:
-                    target_modules = self._get_event_target_modules(
-                        event, include_animations=True
-                    )
-                    patches = self._build_event_patches(target_modules)
-
-                    # Capture structured narration emitted during processing.
-                    with capture_narration() as _msgs, contextlib.ExitStack() as stack:
-
-                        for p in patches:
-                            try:
-                                stack.enter_context(p)
-                            except (
-                                AttributeError,
-                                ImportError,
-                                TypeError,
-                                ValueError,
-                                Exception,
-                            ):
-                                pass
+                    # Capture structured narration emitted during processing;
+                    # headless() skips the engine's pacing sleeps and animations.
+                    with capture_narration() as _msgs, headless():
 
                         # Call the appropriate check method
                         getattr(event, method_name)()
@@ -2454,8 +2356,32 @@ class GameService:
         direction: str = None,
         session_id: str = None,
         session_data: Dict = None,
+        since_seq: Optional[int] = None,
+        beat_encoding: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Execute a combat move.
+
+        ``since_seq`` scopes the returned ``log`` to entries the client has not
+        seen yet (see ``src/api/combat_log.py``). ``beat_encoding="delta"``
+        sends the per-beat snapshots as a base frame plus deltas instead of
+        full ``beat_states`` (see ``src/api/beat_frames.py``).
+        """
+        result = self._execute_combat_move(
+            player, move_type, move_id, target_id, direction, session_id, session_data
+        )
+        result = apply_log_cursor(result, player, since_seq)
+        return apply_beat_encoding(result, beat_encoding)
+
+    def _execute_combat_move(
+        self,
+        player: "player_module.Player",
+        move_type: str,
+        move_id: str,
+        target_id: str = None,
+        direction: str = None,
+        session_id: str = None,
+        session_data: Dict = None,
     ) -> Dict[str, Any]:
-        """Execute a combat move."""
 
         # Check if player is in combat
         if not player.in_combat:
@@ -2681,8 +2607,22 @@ class GameService:
         player: "player_module.Player",
         session_id: str = None,
         session_data: Dict = None,
+        since_seq: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Get current combat status.
+
+        ``since_seq`` scopes the returned ``log`` to entries the client has not
+        seen yet, so a poll late in a long fight stays as small as an early one.
+        """
+        status = self._combat_status(player, session_id, session_data)
+        return apply_log_cursor(status, player, since_seq)
+
+    def _combat_status(
+        self,
+        player: "player_module.Player",
+        session_id: str = None,
+        session_data: Dict = None,
     ) -> Dict[str, Any]:
-        """Get current combat status."""
         # If a previous combat initialization was deferred (level-up pending) and the
         # player has now spent all their attribute points, auto-resume the deferred
         # combat. The frontend calls fetchCombatStatus() after every allocation, so the
@@ -3030,8 +2970,8 @@ class GameService:
             round(_MISSING_ATTRIBUTE_DEFAULT if _finesse is None else _finesse)
         )
 
-        stats["resistance"] = getattr(player, "resistance", {})
-        stats["status_resistance"] = getattr(player, "status_resistance", {})
+        stats["resistance"] = dict(getattr(player, "resistance", {}))
+        stats["status_resistance"] = dict(getattr(player, "status_resistance", {}))
         stats["states"] = [
             {"name": state.name, "steps_left": state.steps_left}
             for state in getattr(player, "states", [])
@@ -3353,6 +3293,7 @@ class GameService:
         """
         import uuid
         from src.secure_pickle import serialize_for_save
+        from src.universe import serialize_delta_save
         from src.api.db import db
 
         # GameConfig.autosave_enabled (issue #450): lets autosave be turned off
@@ -3382,10 +3323,16 @@ class GameService:
         # Strip it before serializing; restore immediately after.
         combat_adapter = player.__dict__.pop("_combat_adapter", None)
         try:
-            # serialize_for_save wraps the pickle in the HOVS integrity header
-            # (magic + version + sha256); load_game validates it on the way back
-            # in and still accepts older headerless saves.
-            save_data = serialize_for_save(player)
+            # serialize_for_save compresses the pickle into HOVS version 2
+            # frames, each with a chained sha256; load_game verifies them on
+            # the way back in and still accepts version 1 and headerless saves.
+            universe = getattr(player, "universe", None)
+            if getattr(game_config, "delta_saves", False) is True and universe is not None:
+                # GameConfig.delta_saves: tiles still matching their map JSON
+                # are stored as references and rebuilt from the templates on load.
+                save_data = serialize_delta_save(player, universe)
+            else:
+                save_data = serialize_for_save(player)
         finally:
             if combat_adapter is not None:
                 player._combat_adapter = combat_adapter
@@ -3405,6 +3352,18 @@ class GameService:
             _room_title = "Unknown"
 
         # 2. Hybrid Autosave Logic: UPSERT for the single autosave
+        if is_autosave and getattr(db, "write_behind", False) is True:
+            return await self._enqueue_autosave(
+                db,
+                user_id,
+                [
+                    save_data,
+                    getattr(player, "level", 1),
+                    _map_name,
+                    _room_title,
+                    getattr(player, "time_elapsed", 0),
+                ],
+            )
         if is_autosave:
             # Check if an autosave already exists for this user
             check_sql = "SELECT id FROM saves WHERE user_id = ? AND is_autosave = TRUE"
@@ -3465,6 +3424,52 @@ class GameService:
         await db.execute(sql, params)
         return save_id
 
+    # With DB_WRITE_BEHIND on, the autosave is one UPDATE-or-INSERT pair with
+    # fixed SQL text, so the writer's batches repeat the same two statements.
+    _AUTOSAVE_UPDATE_SQL = (
+        "UPDATE saves SET data = ?, timestamp = CURRENT_TIMESTAMP, level = ?, "
+        "map_name = ?, room_title = ?, playtime = ? "
+        "WHERE user_id = ? AND is_autosave = TRUE"
+    )
+    _AUTOSAVE_INSERT_SQL = (
+        "INSERT INTO saves (id, user_id, name, data, is_autosave, level, map_name, room_title, playtime) "
+        "SELECT ?, ?, 'Autosave', ?, TRUE, ?, ?, ?, ? "
+        "WHERE NOT EXISTS (SELECT 1 FROM saves WHERE user_id = ? AND is_autosave = TRUE)"
+    )
+
+    async def _enqueue_autosave(self, db, user_id: str, fields: list) -> str:
+        """Queue a user's autosave on the write-behind writer and return its ID.
+
+        Only the first autosave of a user in this process reads the database
+        (for the existing row's ID); after that the request path just
+        enqueues. A newer autosave replaces one the writer hasn't committed
+        yet, so a burst of autosaves costs one write.
+        """
+        import uuid
+
+        autosave_ids = self.__dict__.setdefault("_autosave_ids", {})
+        save_id = autosave_ids.get(user_id)
+        if save_id is None:
+            await db.wait_for_writes(("autosave", user_id))
+            check_res = await db.execute(
+                "SELECT id FROM saves WHERE user_id = ? AND is_autosave = TRUE", [user_id]
+            )
+            save_id = check_res.rows[0][0] if check_res.rows else str(uuid.uuid4())
+            autosave_ids[user_id] = save_id
+        db.enqueue_write(
+            [
+                (self._AUTOSAVE_UPDATE_SQL, [*fields, user_id]),
+                (self._AUTOSAVE_INSERT_SQL, [save_id, user_id, *fields, user_id]),
+            ],
+            key=("autosave", user_id),
+        )
+        return save_id
+
+    async def _wait_for_autosave(self, db, user_id: str) -> None:
+        """Let a queued autosave for ``user_id`` land before reading saves."""
+        if getattr(db, "write_behind", False) is True:
+            await db.wait_for_writes(("autosave", user_id))
+
     async def load_game(
         self, save_id: str, user_id: str
     ) -> Optional["player_module.Player"]:
@@ -3479,6 +3484,7 @@ class GameService:
         """
         from src.api.db import db
 
+        await self._wait_for_autosave(db, user_id)
         sql = "SELECT data FROM saves WHERE id = ? AND user_id = ?"
         result = await db.execute(sql, [save_id, user_id])
 
@@ -3577,6 +3583,7 @@ class GameService:
         except Exception:
             user_tz = zoneinfo.ZoneInfo("America/New_York")
 
+        await self._wait_for_autosave(db, user_id)
         sql = """
         SELECT id, name, timestamp, is_autosave, level, map_name, room_title, playtime
         FROM saves
@@ -3634,8 +3641,12 @@ class GameService:
         """
         from src.api.db import db
 
+        # A queued autosave must not land after (and resurrect) its deletion.
+        await self._wait_for_autosave(db, user_id)
         sql = "DELETE FROM saves WHERE id = ? AND user_id = ?"
         result = await db.execute(sql, [save_id, user_id])
+        if self.__dict__.get("_autosave_ids", {}).get(user_id) == save_id:
+            del self._autosave_ids[user_id]
 
         return result.rows_affected > 0
 
@@ -4790,9 +4801,9 @@ class GameService:
                     )
                 }
 
-        # ``item.use`` emits through the narration sink; suppress any dramatic
-        # ``time.sleep`` pauses so the request does not block on real time.
-        with capture_narration() as _msgs, patch("time.sleep", return_value=None):
+        # ``item.use`` emits through the narration sink; headless() skips any
+        # dramatic pauses so the request does not block on real time.
+        with capture_narration() as _msgs, headless():
             item.use(target, user=user)
 
         messages = self._narration_texts(_msgs)
@@ -2,16 +2,49 @@
 
 import os
 import uuid
+import logging
+import threading
+import time
+import weakref
 import configparser
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Tuple, Any
 from src.config_manager import ConfigManager
+from src.combatant import StatBlock
+
+logger = logging.getLogger(__name__)
 
 # Minimum seconds between opportunistic sweeps of expired sessions. Keeps the
 # O(n) cleanup off the hot per-request path while still bounding memory growth.
 _REAP_INTERVAL_SECONDS = 60
 
+# With a shared session store, access-time bumps are written back at most this
+# often per session. Expiry is measured in hours, so a minute of slack costs
+# nothing and keeps read-only polls (e.g. /combat/status) from writing a row on
+# every request.
+_TOUCH_INTERVAL_SECONDS = 60
+
+# How long a request waits for another request on the same session to finish
+# before giving up (see SessionManager.checkout).
+_CHECKOUT_TIMEOUT_SECONDS = 10.0
+
+# Lifetime of a worker's lease on a session in the shared store. Requests
+# finish well inside it; it only matters when a worker dies holding a lease.
+_LEASE_TTL_SECONDS = 30.0
+
+# Pause between attempts to take a lease another worker holds.
+_LEASE_POLL_SECONDS = 0.05
+
+
+class _SessionGate:
+    """Mutex serializing one session's requests within this process."""
+
+    __slots__ = ("lock", "__weakref__")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
 
 class MinimalPlayer:
     """Minimal player object for API testing/initialization."""
@@ -49,7 +82,7 @@ class MinimalPlayer:
         self.awareness = 10
 
         # Resistances (required by refresh_stat_bonuses and game_service)
-        self.resistance = {
+        self.resistance = StatBlock({
             "fire": 1.0,
             "ice": 1.0,
             "shock": 1.0,
@@ -61,8 +94,8 @@ class MinimalPlayer:
             "crushing": 1.0,
             "spiritual": 1.0,
             "pure": 1.0,
-        }
-        self.resistance_base = {
+        })
+        self.resistance_base = StatBlock({
             "fire": 1.0,
             "ice": 1.0,
             "shock": 1.0,
@@ -74,8 +107,8 @@ class MinimalPlayer:
             "crushing": 1.0,
             "spiritual": 1.0,
             "pure": 1.0,
-        }
-        self.status_resistance = {
+        })
+        self.status_resistance = StatBlock({
             "generic": 1.0,
             "stun": 1.0,
             "poison": 1.0,
@@ -98,8 +131,8 @@ class MinimalPlayer:
             "frozen": 1.0,
             "doom": 1.0,
             "death": 1.0,
-        }
-        self.status_resistance_base = {
+        })
+        self.status_resistance_base = StatBlock({
             "generic": 1.0,
             "stun": 1.0,
             "poison": 1.0,
@@ -122,7 +155,7 @@ class MinimalPlayer:
             "frozen": 1.0,
             "doom": 1.0,
             "death": 1.0,
-        }
+        })
 
         self.level = 1
         self.exp = 0
@@ -230,19 +263,43 @@ class Session:
 
 
 class SessionManager:
-    """Manages player sessions (in-memory for Phase 1)."""
+    """Manages player sessions.
 
-    def __init__(self, universe=None):
+    ``sessions``/``players``/``session_to_player`` are always the worker-local
+    working set. With no ``store`` they are also the only copy (single-worker
+    mode). With a shared store (see ``src.api.services.session_store``) they
+    become a version-checked cache: sessions are re-hydrated when another
+    worker has checkpointed a newer version, and every mutation is written back
+    through :meth:`save_session` / :meth:`release`.
+    """
+
+    def __init__(self, universe=None, store=None):
         """Initialize session manager.
 
         Args:
             universe: Optional Universe instance for player positioning
+            store: Optional shared session store; None keeps everything in
+                this process
         """
         self.sessions: Dict[str, Session] = {}
         self.players: Dict[str, object] = {}  # Stores Player or MinimalPlayer objects
         self.session_to_player: Dict[str, str] = {}
         self.universe = universe  # Reference to universe for getting starting positions
         self._last_reap = datetime.now()  # Throttle for opportunistic expired-session reaping
+        self.store = store
+        # Store version each locally cached session was last loaded/written at.
+        self._versions: Dict[str, int] = {}
+        # Sessions whose player was handed out since their last checkpoint.
+        self._checked_out: set = set()
+        self._last_touch: Dict[str, datetime] = {}
+        # Per-session gates for requests in progress (see checkout); an entry
+        # disappears once no request holds or waits on it.
+        self._gates = weakref.WeakValueDictionary()
+        self._gates_guard = threading.Lock()
+        self._held: Dict[str, _SessionGate] = {}
+        # Sessions whose local changes lost a checkpoint race and were dropped.
+        self._conflicts: set = set()
+        self._lease_token = uuid.uuid4().hex
 
         # Load starting position from config file
         self.start_x, self.start_y = 1, 1  # defaults
@@ -782,6 +839,11 @@ class SessionManager:
 
                 # Create isolated universe for this player
                 player.universe = Universe(player)
+                # Lazy maps must be chosen before build() decides how to load them.
+                player.universe.lazy_maps = getattr(self.game_config, "lazy_maps", False)
+                player.universe.max_resident_maps = getattr(
+                    self.game_config, "max_resident_maps", 0
+                )
                 player.universe.build(player)
 
                 # Set starting map — prefer configured name, then universe default, then first available map
@@ -990,6 +1052,9 @@ class SessionManager:
         player = self._create_player_for_session(username)
         self.players[player_id] = player
 
+        if self.store is not None:
+            self._versions[session_id] = self.store.put(session, player)
+
         return session_id, player_id
 
     def start_new_game(self, session_id: str) -> bool:
@@ -1017,6 +1082,7 @@ class SessionManager:
         # tile_modifications) so the new game starts with a clean slate.
         session.data.clear()
 
+        self.save_session(session_id)
         return True
 
     def get_session(self, session_id: str) -> Optional[Session]:
@@ -1032,6 +1098,9 @@ class SessionManager:
         # abandoned tabs/silent logouts don't linger in memory (issue #363).
         self._reap_expired_if_due()
 
+        if self.store is not None:
+            self._sync_from_store(session_id)
+
         if session_id not in self.sessions:
             return None
 
@@ -1044,6 +1113,8 @@ class SessionManager:
 
         # Update access time
         session.update_access_time()
+        if self.store is not None:
+            self._touch_store(session)
         return session
 
     def get_player(self, session_id: str) -> Optional[object]:
@@ -1060,7 +1131,10 @@ class SessionManager:
             return None
 
         player_id = session.player_id
-        return self.players.get(player_id)
+        player = self.players.get(player_id)
+        if player is not None and self.store is not None:
+            self._checked_out.add(session_id)
+        return player
 
     def set_player(self, session_id: str, player: object) -> bool:
         """Associate a player with a session.
@@ -1072,30 +1146,223 @@ class SessionManager:
         Returns:
             True if successful, False if session not found
         """
-        session = self.get_session(session_id)
+        session = self._cached_session(session_id)
         if not session:
             return False
 
         player_id = session.player_id
         self.players[player_id] = player
+        self.save_session(session_id)
         return True
 
     def save_session(self, session_id: str) -> bool:
-        """Save session data (placeholder for Phase 1).
+        """Checkpoint a session's player and data to the shared store.
+
+        A no-op beyond the existence check when no store is configured, since
+        the in-process dicts are then the only copy.
 
         Args:
             session_id: The session ID to save
 
         Returns:
-            True if successful
+            True if successful; False if the session is unknown or another
+            worker checkpointed it first (the local copy is then dropped so the
+            next access re-hydrates the newer state, and :meth:`release`
+            reports the conflict)
         """
-        session = self.get_session(session_id)
+        session = self._cached_session(session_id)
         if not session:
             return False
+        if self.store is None:
+            return True
+
+        self._checked_out.discard(session_id)
+        player = self.players.get(session.player_id)
+        try:
+            new_version = self.store.checkpoint(
+                session, player, self._versions.get(session_id, 0)
+            )
+        except Exception as e:
+            # A checkpoint failure must not fail the request that produced it;
+            # the local copy is still authoritative for this worker.
+            logger.warning("Session checkpoint failed for %s: %s", session_id, e)
+            return False
+        if new_version is None:
+            logger.warning(
+                "Session %s was checkpointed by another worker; discarding the "
+                "stale local copy",
+                session_id,
+            )
+            self._drop_local(session_id)
+            self._conflicts.add(session_id)
+            return False
+        self._versions[session_id] = new_version
+        return True
 
-        # TODO: Persist to database in Phase 2
+    def checkout(self, session_id: str, timeout: float = _CHECKOUT_TIMEOUT_SECONDS) -> bool:
+        """Start a request on ``session_id``, waiting out any other one on it.
+
+        Nothing in the Session/Player graph is locked, so two threads serving
+        the same session at once would interleave their mutations and race
+        each other's checkpoints. A request therefore holds the session from
+        before it is read until :meth:`checkin`. With a shared store it also
+        holds the store's lease on the session, which keeps other workers out
+        for the same span.
+
+        Returns:
+            True once held; False if another request kept it for ``timeout``
+            seconds.
+        """
+        deadline = time.monotonic() + timeout
+        with self._gates_guard:
+            gate = self._gates.get(session_id)
+            if gate is None:
+                gate = self._gates[session_id] = _SessionGate()
+        if not gate.lock.acquire(timeout=timeout):
+            return False
+        if self.store is not None and not self._acquire_lease(session_id, deadline):
+            gate.lock.release()
+            return False
+        self._held[session_id] = gate
+        self._conflicts.discard(session_id)
         return True
 
+    def checkin(self, session_id: str) -> None:
+        """End the request started by :meth:`checkout` (no-op if not held)."""
+        gate = self._held.pop(session_id, None)
+        if gate is None:
+            return
+        if self.store is not None:
+            try:
+                self.store.release_lease(session_id, self._lease_owner())
+            except Exception as e:
+                # The lease runs out on its own; only the next worker waits.
+                logger.warning("Session lease release failed for %s: %s", session_id, e)
+        gate.lock.release()
+
+    def _lease_owner(self) -> str:
+        """Identify this worker's leases; includes the pid so forked workers differ."""
+        return f"{self._lease_token}:{os.getpid()}"
+
+    def _acquire_lease(self, session_id: str, deadline: float) -> bool:
+        """Poll for the store's lease on ``session_id`` until ``deadline``."""
+        owner = self._lease_owner()
+        while True:
+            try:
+                if self.store.acquire_lease(session_id, owner, _LEASE_TTL_SECONDS):
+                    return True
+            except Exception as e:
+                # Without the lease the checkpoint's version check still
+                # catches a concurrent writer, so don't fail the request here.
+                logger.warning("Session lease failed for %s: %s", session_id, e)
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(_LEASE_POLL_SECONDS)
+
+    def release(self, session_id: str) -> bool:
+        """End-of-request hook: checkpoint a session whose player was handed out.
+
+        Routes that mutate state usually call :meth:`save_session` themselves;
+        this catches the rest without writing twice for those that already did.
+
+        Returns:
+            False if this request's changes were discarded because another
+            worker checkpointed the session first, so the caller must not
+            report the request as successful; True otherwise.
+        """
+        if session_id in self._checked_out:
+            self.save_session(session_id)
+        if session_id in self._conflicts:
+            self._conflicts.discard(session_id)
+            return False
+        return True
+
+    def _cached_session(self, session_id: str) -> Optional[Session]:
+        """Get a session for writing without re-syncing a cached copy.
+
+        :meth:`get_session` replaces a local copy with the store's whenever
+        another worker has checkpointed a newer version. Done right before a
+        write, that swaps this worker's unsaved player and data for the newer
+        ones and the checkpoint then succeeds against the refreshed version,
+        silently discarding the request's changes. Writers keep the cached
+        copy (and its version) instead, so the compare-and-swap in
+        :meth:`save_session` reports the conflict. Only a session this worker
+        has never seen is hydrated.
+        """
+        if self.store is None or session_id not in self.sessions:
+            return self.get_session(session_id)
+        session = self.sessions[session_id]
+        if session.is_expired():
+            self.expire_session(session_id)
+            return None
+        session.update_access_time()
+        return session
+
+    def _sync_from_store(self, session_id: str) -> None:
+        """Bring the local cache for ``session_id`` in line with the store."""
+        try:
+            meta = self.store.get_meta(session_id)
+        except Exception as e:
+            logger.warning("Session store lookup failed for %s: %s", session_id, e)
+            return
+        if meta is None:
+            # Expired or logged out through another worker.
+            self._drop_local(session_id)
+            return
+        if session_id in self.sessions and self._versions.get(session_id) == meta["version"]:
+            session = self.sessions[session_id]
+            session.expires_at = max(session.expires_at, meta["expires_at"])
+            return
+        try:
+            loaded = self.store.load(session_id)
+        except Exception as e:
+            logger.warning("Session restore failed for %s: %s", session_id, e)
+            self._drop_local(session_id)
+            return
+        if loaded is None:
+            self._drop_local(session_id)
+            return
+        meta, player, data = loaded
+        session = Session(
+            meta["session_id"], meta["player_id"], meta["username"], meta["created_at"]
+        )
+        session.last_accessed = meta["last_accessed"]
+        session.expires_at = meta["expires_at"]
+        session.data = data
+        if meta.get("db_user_id") is not None:
+            session.db_user_id = meta["db_user_id"]
+        self.sessions[session_id] = session
+        self.session_to_player[session_id] = session.player_id
+        if player is not None:
+            self.players[session.player_id] = player
+        self._versions[session_id] = meta["version"]
+        self._last_touch[session_id] = datetime.now()
+
+    def _touch_store(self, session: Session) -> None:
+        """Write back a session's access time, throttled per session."""
+        now = datetime.now()
+        last = self._last_touch.get(session.session_id)
+        if last is not None and (now - last).total_seconds() < _TOUCH_INTERVAL_SECONDS:
+            return
+        self._last_touch[session.session_id] = now
+        try:
+            self.store.touch(session)
+        except Exception as e:
+            logger.warning("Session touch failed for %s: %s", session.session_id, e)
+
+    def _drop_local(self, session_id: str) -> None:
+        """Forget the worker-local copy of a session (the store is untouched)."""
+        session = self.sessions.pop(session_id, None)
+        player_id = self.session_to_player.pop(session_id, None)
+        if player_id is None and session is not None:
+            player_id = session.player_id
+        if player_id:
+            self.players.pop(player_id, None)
+        self._versions.pop(session_id, None)
+        self._checked_out.discard(session_id)
+        self._last_touch.pop(session_id, None)
+
     def expire_session(self, session_id: str) -> bool:
         """Expire a session.
 
@@ -1105,6 +1372,12 @@ class SessionManager:
         Returns:
             True if session was expired, False if not found
         """
+        if self.store is not None:
+            try:
+                self.store.delete(session_id)
+            except Exception as e:
+                logger.warning("Session store delete failed for %s: %s", session_id, e)
+
         if session_id not in self.sessions:
             return False
 
@@ -1116,6 +1389,9 @@ class SessionManager:
             del self.session_to_player[session_id]
         if player_id and player_id in self.players:
             del self.players[player_id]
+        self._versions.pop(session_id, None)
+        self._checked_out.discard(session_id)
+        self._last_touch.pop(session_id, None)
 
         return True
 
@@ -1156,13 +1432,32 @@ class SessionManager:
         for session_id in expired_ids:
             self.expire_session(session_id)
 
+        if self.store is not None:
+            # Sessions other workers created and abandoned never enter this
+            # worker's dicts, so sweep the store directly as well.
+            return len(expired_ids) + self.store.delete_expired(datetime.now())
         return len(expired_ids)
 
     def get_active_session_count(self) -> int:
         """Get count of active (non-expired) sessions."""
+        if self.store is not None:
+            return self.store.count_active(datetime.now())
         return len([s for s in self.sessions.values() if not s.is_expired()])
 
     def get_all_sessions(self) -> list:
         """Get all active sessions (for debugging/admin)."""
         self.cleanup_expired()
+        if self.store is not None:
+            return [
+                {
+                    "session_id": m["session_id"],
+                    "player_id": m["player_id"],
+                    "username": m["username"],
+                    "created_at": m["created_at"].isoformat(),
+                    "last_accessed": m["last_accessed"].isoformat(),
+                    "expires_at": m["expires_at"].isoformat(),
+                    "data": {},
+                }
+                for m in self.store.list_meta(datetime.now())
+            ]
         return [s.to_dict() for s in self.sessions.values()]
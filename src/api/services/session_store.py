@@ -0,0 +1,338 @@
+"""Pluggable backing stores for :class:`SessionManager` state.
+
+The API originally kept every session and its Player graph in plain
+in-process dicts, which is why the Procfile pins gunicorn to ``-w 1``: a
+second worker would never see the first worker's players. The stores here
+move the *authoritative* copy of each session out of the worker so N
+shared-nothing workers can serve the same player.
+
+Two backends exist:
+
+  * ``None`` / ``memory`` -- no store at all. SessionManager keeps using its
+    own dicts exactly as before; this is the default and what the test suite
+    exercises.
+  * ``sqlite:///path/to/file.db`` -- :class:`SqliteSessionStore`, a single
+    SQLite file (WAL mode) shared by every worker on the box. Each session row
+    holds its metadata plus a checkpoint of ``{player, data}`` pickled through
+    :func:`src.secure_pickle.serialize_for_save`, and a monotonically
+    increasing ``version``.
+
+Workers still cache the live Player locally; the version column is what keeps
+the caches honest. A worker re-hydrates a session whenever the stored version
+is newer than the one it last saw, and checkpoints use compare-and-swap on the
+version so two workers can never silently overwrite each other's turn.
+
+Requests on one session are also serialized across workers: the worker serving
+a request holds a short lease on the session (``api_session_leases``) from the
+moment it reads the session until it has checkpointed it, so a second worker
+waits for the newer state instead of working on a stale copy. Leases expire on
+their own, so a worker that dies mid-request only blocks its sessions briefly.
+"""
+
+import io
+import os
+import sqlite3
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Transient attributes that hold closures, locks or sockets and therefore can't
+# be pickled. They are stripped for the checkpoint and restored on the live
+# object afterwards -- the same treatment GameService.save_game gives the
+# combat adapter. A worker that re-hydrates a mid-combat player gets no adapter
+# and rebuilds one on the next combat request (see GameService.execute_move).
+_TRANSIENT_PLAYER_ATTRS = ("_combat_adapter",)
+
+# SQLite busy timeout (seconds). Checkpoints are single-row writes, so waiting
+# briefly on another worker's write is far cheaper than failing the request.
+_BUSY_TIMEOUT_SECONDS = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS api_sessions (
+    session_id    TEXT PRIMARY KEY,
+    player_id     TEXT NOT NULL,
+    username      TEXT NOT NULL,
+    db_user_id    TEXT,
+    created_at    TEXT NOT NULL,
+    last_accessed TEXT NOT NULL,
+    expires_at    TEXT NOT NULL,
+    version       INTEGER NOT NULL,
+    state         BLOB
+)
+"""
+
+_LEASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS api_session_leases (
+    session_id TEXT PRIMARY KEY,
+    owner      TEXT NOT NULL,
+    expires    REAL NOT NULL
+)
+"""
+
+
+class SessionStoreError(Exception):
+    """Raised when a session store URL is malformed or the backend is unusable."""
+
+
+def dump_state(player, data) -> bytes:
+    """Pickle a session's ``player`` and ``data`` together into one checkpoint.
+
+    They share one pickle on purpose: ``session.data["pending_events"]`` holds
+    live Event objects whose ``player``/``tile`` attributes must keep pointing
+    at the very same Player and tiles after a restore.
+    """
+    from src.secure_pickle import serialize_for_save
+
+    stripped = {}
+    if player is not None and hasattr(player, "__dict__"):
+        for attr in _TRANSIENT_PLAYER_ATTRS:
+            if attr in player.__dict__:
+                stripped[attr] = player.__dict__.pop(attr)
+    try:
+        return serialize_for_save({"player": player, "data": data})
+    finally:
+        for attr, value in stripped.items():
+            setattr(player, attr, value)
+
+
+def load_state(blob: bytes) -> Tuple[Any, Dict[str, Any]]:
+    """Inverse of :func:`dump_state`; returns ``(player, data)``.
+
+    Checkpoints are written by this server, so the save size cap is lifted,
+    but the allow-list / strict-mode gating of ``safe_pickle_load`` still
+    applies.
+    """
+    from src.secure_pickle import safe_pickle_load
+
+    state = safe_pickle_load(io.BytesIO(blob), max_bytes=None)
+    return state.get("player"), state.get("data") or {}
+
+
+class SqliteSessionStore:
+    """Session store backed by a single SQLite file shared across workers."""
+
+    shared = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        conn = self._connect()
+        conn.execute(_SCHEMA)
+        conn.execute(_LEASE_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, reopening it after a fork.
+
+        sqlite3 connections must not cross threads or processes; gunicorn may
+        fork after the app (and this store) was created, so the owning pid is
+        part of the cache key.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and getattr(self._local, "pid", None) == os.getpid():
+            return conn
+        conn = sqlite3.connect(
+            self.path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    # -- metadata ---------------------------------------------------------
+
+    def get_meta(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return the session's metadata row (no state blob), or None."""
+        row = self._connect().execute(
+            "SELECT session_id, player_id, username, db_user_id, created_at, "
+            "last_accessed, expires_at, version FROM api_sessions "
+            "WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "session_id": row[0],
+            "player_id": row[1],
+            "username": row[2],
+            "db_user_id": row[3],
+            "created_at": datetime.fromisoformat(row[4]),
+            "last_accessed": datetime.fromisoformat(row[5]),
+            "expires_at": datetime.fromisoformat(row[6]),
+            "version": row[7],
+        }
+
+    def touch(self, session) -> None:
+        """Persist a session's access/expiry times without rewriting its state."""
+        self._connect().execute(
+            "UPDATE api_sessions SET last_accessed = ?, expires_at = ? "
+            "WHERE session_id = ?",
+            (
+                session.last_accessed.isoformat(),
+                session.expires_at.isoformat(),
+                session.session_id,
+            ),
+        )
+
+    # -- leases -----------------------------------------------------------
+
+    def acquire_lease(self, session_id: str, owner: str, ttl: float) -> bool:
+        """Take (or renew) ``owner``'s lease on a session for ``ttl`` seconds.
+
+        Returns False while another owner holds an unexpired lease.
+        """
+        now = time.time()
+        cur = self._connect().execute(
+            "INSERT INTO api_session_leases (session_id, owner, expires) "
+            "VALUES (?, ?, ?) ON CONFLICT(session_id) DO UPDATE SET "
+            "owner = excluded.owner, expires = excluded.expires "
+            "WHERE api_session_leases.owner = excluded.owner "
+            "OR api_session_leases.expires < ?",
+            (session_id, owner, now + ttl, now),
+        )
+        return cur.rowcount == 1
+
+    def release_lease(self, session_id: str, owner: str) -> None:
+        """Drop ``owner``'s lease on a session (no-op if it holds none)."""
+        self._connect().execute(
+            "DELETE FROM api_session_leases WHERE session_id = ? AND owner = ?",
+            (session_id, owner),
+        )
+
+    # -- state ------------------------------------------------------------
+
+    def put(self, session, player) -> int:
+        """Insert (or replace) a session with a fresh checkpoint; returns its version."""
+        blob = dump_state(player, session.data)
+        conn = self._connect()
+        # BEGIN IMMEDIATE takes the write lock up front so the version read and
+        # the replace are atomic with respect to other workers.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT version FROM api_sessions WHERE session_id = ?",
+                (session.session_id,),
+            ).fetchone()
+            version = (row[0] + 1) if row else 1
+            conn.execute(
+                "INSERT OR REPLACE INTO api_sessions (session_id, player_id, "
+                "username, db_user_id, created_at, last_accessed, expires_at, "
+                "version, state) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    session.session_id,
+                    session.player_id,
+                    session.username,
+                    getattr(session, "db_user_id", None),
+                    session.created_at.isoformat(),
+                    session.last_accessed.isoformat(),
+                    session.expires_at.isoformat(),
+                    version,
+                    sqlite3.Binary(blob),
+                ),
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return version
+
+    def checkpoint(self, session, player, expected_version: int) -> Optional[int]:
+        """Compare-and-swap a new checkpoint over ``expected_version``.
+
+        Returns the new version, or None when another worker has written the
+        session since ``expected_version`` (or deleted it) -- the caller's copy
+        is stale and must not overwrite the newer one.
+        """
+        blob = dump_state(player, session.data)
+        cur = self._connect().execute(
+            "UPDATE api_sessions SET state = ?, version = version + 1, "
+            "db_user_id = ?, last_accessed = ?, expires_at = ? "
+            "WHERE session_id = ? AND version = ?",
+            (
+                sqlite3.Binary(blob),
+                getattr(session, "db_user_id", None),
+                session.last_accessed.isoformat(),
+                session.expires_at.isoformat(),
+                session.session_id,
+                expected_version,
+            ),
+        )
+        if cur.rowcount != 1:
+            return None
+        return expected_version + 1
+
+    def load(self, session_id: str) -> Optional[Tuple[Dict[str, Any], Any, Dict]]:
+        """Return ``(meta, player, data)`` for a session, or None if absent."""
+        meta = self.get_meta(session_id)
+        if meta is None:
+            return None
+        row = self._connect().execute(
+            "SELECT state, version FROM api_sessions WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        # Re-read the version alongside the blob so meta and state agree even
+        # if another worker checkpointed between the two SELECTs.
+        meta["version"] = row[1]
+        player, data = load_state(bytes(row[0])) if row[0] else (None, {})
+        return meta, player, data
+
+    def delete(self, session_id: str) -> None:
+        self._connect().execute(
+            "DELETE FROM api_sessions WHERE session_id = ?", (session_id,)
+        )
+
+    def delete_expired(self, now: datetime) -> int:
+        conn = self._connect()
+        cur = conn.execute(
+            "DELETE FROM api_sessions WHERE expires_at < ?", (now.isoformat(),)
+        )
+        conn.execute("DELETE FROM api_session_leases WHERE expires < ?", (time.time(),))
+        return cur.rowcount
+
+    def count_active(self, now: datetime) -> int:
+        row = self._connect().execute(
+            "SELECT COUNT(*) FROM api_sessions WHERE expires_at >= ?",
+            (now.isoformat(),),
+        ).fetchone()
+        return row[0]
+
+    def list_meta(self, now: datetime) -> List[Dict[str, Any]]:
+        rows = self._connect().execute(
+            "SELECT session_id FROM api_sessions WHERE expires_at >= ?",
+            (now.isoformat(),),
+        ).fetchall()
+        metas = (self.get_meta(r[0]) for r in rows)
+        return [m for m in metas if m is not None]
+
+
+def create_session_store(url: Optional[str]):
+    """Build a session store from a ``SESSION_STORE_URL``-style string.
+
+    ``None``, ``""`` and ``"memory"`` return None (in-process dicts only).
+    ``sqlite:///abs/path.db`` and ``sqlite:relative/path.db`` return a
+    :class:`SqliteSessionStore`.
+
+    Raises:
+        SessionStoreError: The URL names an unknown backend.
+    """
+    if not url or url.strip().lower() == "memory":
+        return None
+    url = url.strip()
+    if url.startswith("sqlite:"):
+        path = url[len("sqlite:"):]
+        if path.startswith("///"):
+            path = path[2:]  # sqlite:///abs/path -> /abs/path
+        elif path.startswith("//"):
+            path = path[2:]
+        if not path:
+            raise SessionStoreError("sqlite session store URL has no path")
+        return SqliteSessionStore(path)
+    raise SessionStoreError(f"Unsupported session store URL: {url!r}")
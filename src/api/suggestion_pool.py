@@ -0,0 +1,131 @@
+"""Bounded, coalescing worker pool for combat suggestion fetches.
+
+``ApiCombatAdapter.refresh_suggestions`` runs after every beat that hands
+control back to the player, and each fetch may block on an LLM round trip for
+seconds. Starting a thread per refresh let a burst of beats pile up one thread
+(and one HTTP connection) per beat, each computing a result that the
+generation check then threw away. This pool bounds that:
+
+  * **One queued job per key** (the combat session). Submitting again while a
+    job for the same key is still waiting *replaces* it, so a superseded
+    generation is dropped before it is dispatched rather than after its LLM
+    call returns.
+  * **One running job per key.** A key's next job waits for the running one
+    instead of racing it to the strategist.
+  * **At most ``max_workers`` threads** across all sessions, started on demand
+    and exiting as soon as the queue is empty, so an idle server holds none.
+  * **Backpressure.** Once ``max_pending`` keys are waiting (the LLM is slower
+    than beats arrive), :meth:`SuggestionPool.submit` refuses new keys and
+    returns False; the caller skips suggestions for that beat instead of
+    queueing without bound.
+
+Per-process, like ``rate_limiter.py``: each gunicorn worker has its own pool.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# A handful of concurrent LLM calls is plenty for suggestions: they are
+# advisory, and a slow provider should be absorbed by coalescing rather than
+# by opening more connections to it.
+_DEFAULT_MAX_WORKERS = 4
+_DEFAULT_MAX_PENDING = 64
+
+
+class SuggestionPool:
+    """Runs at most one job per key, coalescing queued jobs, on bounded threads."""
+
+    def __init__(self, max_workers: int = _DEFAULT_MAX_WORKERS, max_pending: int = _DEFAULT_MAX_PENDING):
+        self.max_workers = max(1, int(max_workers))
+        self.max_pending = max(1, int(max_pending))
+        self._lock = threading.Lock()
+        # key -> job, in arrival order of the key (a replaced job keeps its
+        # key's place so a busy session isn't starved by resubmitting).
+        self._pending: "OrderedDict[object, object]" = OrderedDict()
+        self._running = set()
+        self._workers = 0
+        self._counters = {"submitted": 0, "coalesced": 0, "rejected": 0, "completed": 0, "failed": 0}
+
+    def submit(self, key, job) -> bool:
+        """Queue ``job`` (a no-argument callable) for ``key``.
+
+        Replaces any job still waiting for the same key. Returns False, and
+        queues nothing, when ``max_pending`` other keys are already waiting.
+        """
+        with self._lock:
+            self._counters["submitted"] += 1
+            if key in self._pending:
+                self._pending[key] = job
+                self._counters["coalesced"] += 1
+            elif len(self._pending) >= self.max_pending:
+                self._counters["rejected"] += 1
+                logger.warning(
+                    "Suggestion pool saturated (%d waiting); dropping request for %r",
+                    len(self._pending), key,
+                )
+                return False
+            else:
+                self._pending[key] = job
+            spawn = self._workers < self.max_workers and self._next_key_locked() is not None
+            if spawn:
+                self._workers += 1
+        if spawn:
+            threading.Thread(target=self._work, name="suggestion-worker", daemon=True).start()
+        return True
+
+    def _next_key_locked(self):
+        for key in self._pending:
+            if key not in self._running:
+                return key
+        return None
+
+    def _work(self):
+        while True:
+            with self._lock:
+                key = self._next_key_locked()
+                if key is None:
+                    self._workers -= 1
+                    return
+                job = self._pending.pop(key)
+                self._running.add(key)
+            try:
+                job()
+                outcome = "completed"
+            except Exception:  # noqa: BLE001 - one bad job must not kill the worker
+                logger.exception("Suggestion job for %r failed", key)
+                outcome = "failed"
+            with self._lock:
+                self._running.discard(key)
+                self._counters[outcome] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self._workers,
+                "max_workers": self.max_workers,
+                "pending": len(self._pending),
+                "running": len(self._running),
+                **self._counters,
+            }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_suggestion_pool() -> SuggestionPool:
+    """Return the process-wide pool, sized from ``SUGGESTION_WORKERS`` /
+    ``SUGGESTION_MAX_PENDING`` in the environment on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SuggestionPool(
+                    max_workers=int(os.environ.get("SUGGESTION_WORKERS", _DEFAULT_MAX_WORKERS)),
+                    max_pending=int(os.environ.get("SUGGESTION_MAX_PENDING", _DEFAULT_MAX_PENDING)),
+                )
+    return _pool
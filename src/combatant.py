@@ -2,8 +2,9 @@
 Shared base class for all combat participants (Player, NPC).
 
 Provides:
-  - _init_resistances(): initialises resistance and status-resistance dicts from
+  - _init_resistances(): initialises resistance and status-resistance maps from
     a single canonical definition so the values never drift between classes.
+  - StatBlock: the compact float mapping those resistance maps are stored in.
   - is_alive(), cycle_states(), get_equipped_items(): methods whose logic is
     identical across Player and NPC.
   - exp_needed_for_level(): the single leveling curve shared by the Player and
@@ -15,6 +16,8 @@ Usage (in each subclass __init__):
 
 
 import math
+from array import array
+from collections.abc import Mapping, MutableMapping
 
 # Move stages, in the order Move.advance walks them. 0/1 are "not resolved
 # yet" (the move's effect is still coming); 2/3 are aftermath.
@@ -98,15 +101,214 @@ _DEFAULT_STATUS_RESISTANCE = {
 }
 
 
+class _StatLayout:
+    """The fixed key order shared by every StatBlock with the same keys."""
+
+    __slots__ = ("keys", "index")
+
+    _interned = {}
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.index = {key: i for i, key in enumerate(keys)}
+
+    @classmethod
+    def for_keys(cls, keys):
+        keys = tuple(keys)
+        layout = cls._interned.get(keys)
+        if layout is None:
+            layout = cls._interned[keys] = cls(keys)
+        return layout
+
+
+# Pickled StatBlock states, interned so equal blocks share one memo entry.
+_SHARED_STATES = {}
+_SHARED_STATES_MAX = 4096
+
+
+class StatBlock(MutableMapping):
+    """A resistance-style ``{key: float}`` mapping stored in one ``array('d')``.
+
+    Behaves like the dict it replaces (indexing, ``get``, ``items``, ``update``,
+    ``clear``, equality with plain dicts), but every block built from the same
+    keys shares one key layout, so a combatant's four resistance maps cost a
+    couple of small arrays instead of four dicts, and resetting or comparing
+    two blocks is a C-level copy or compare instead of a per-key loop.
+
+    Numbers are stored as floats (``1`` reads back as ``1.0``). Keys outside
+    the layout and non-numeric values still work; they live in a small
+    overflow dict.
+    """
+
+    __slots__ = ("_layout", "_values", "_present", "_extra")
+
+    def __init__(self, data=(), layout=None):
+        if layout is None:
+            keys = data.keys() if isinstance(data, Mapping) else dict(data).keys()
+            layout = _StatLayout.for_keys(keys)
+        self._layout = layout
+        self._values = array("d", bytes(8 * len(layout.keys)))
+        self._present = bytearray(len(layout.keys))
+        self._extra = None
+        self.update(data)
+
+    # ── Mapping protocol ──────────────────────────────────────────────────────
+
+    def __getitem__(self, key):
+        i = self._layout.index.get(key)
+        if i is not None and self._present[i]:
+            return self._values[i]
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        i = self._layout.index.get(key)
+        if i is not None and type(value) in (float, int):
+            self._values[i] = value
+            self._present[i] = 1
+            if self._extra:
+                self._extra.pop(key, None)
+            return
+        if i is not None:
+            self._values[i] = 0.0
+            self._present[i] = 0
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __delitem__(self, key):
+        i = self._layout.index.get(key)
+        if i is not None and self._present[i]:
+            self._values[i] = 0.0
+            self._present[i] = 0
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        present = self._present
+        for i, key in enumerate(self._layout.keys):
+            if present[i]:
+                yield key
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self):
+        return self._present.count(1) + (len(self._extra) if self._extra else 0)
+
+    def __contains__(self, key):
+        i = self._layout.index.get(key)
+        if i is not None and self._present[i]:
+            return True
+        return bool(self._extra) and key in self._extra
+
+    def get(self, key, default=None):
+        i = self._layout.index.get(key)
+        if i is not None and self._present[i]:
+            return self._values[i]
+        if self._extra:
+            return self._extra.get(key, default)
+        return default
+
+    def clear(self):
+        n = len(self._layout.keys)
+        self._values[:] = array("d", bytes(8 * n))
+        self._present[:] = bytes(n)
+        self._extra = None
+
+    def __eq__(self, other):
+        if type(other) is StatBlock and other._layout is self._layout:
+            # Identical bytes are equal without boxing 24 floats; only a
+            # real difference (or 0.0 vs -0.0) needs the numeric compare.
+            values, other_values = self._values, other._values
+            return (
+                self._present == other._present
+                and (values.tobytes() == other_values.tobytes() or values == other_values)
+                and (self._extra or None) == (other._extra or None)
+            )
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    # ── Bulk operations ───────────────────────────────────────────────────────
+
+    def copy(self):
+        clone = StatBlock.__new__(StatBlock)
+        clone._layout = self._layout
+        clone._values = self._values[:]
+        clone._present = self._present[:]
+        clone._extra = dict(self._extra) if self._extra else None
+        return clone
+
+    def reset_to(self, other):
+        """Make this block hold exactly ``other``'s items (``clear`` + ``update``)."""
+        if type(other) is StatBlock and other._layout is self._layout:
+            self._values[:] = other._values
+            self._present[:] = other._present
+            self._extra = dict(other._extra) if other._extra else None
+        else:
+            self.clear()
+            self.update(other)
+
+    def clamp_min(self, floor):
+        """Raise every numeric value below ``floor`` to ``floor``."""
+        values, present = self._values, self._present
+        for i, value in enumerate(values):
+            if value < floor and present[i]:
+                values[i] = floor
+        if self._extra:
+            for key, value in list(self._extra.items()):
+                if isinstance(value, (int, float)) and value < floor:
+                    self[key] = floor
+
+    # ── Pickling ──────────────────────────────────────────────────────────────
+    # Absent slots are stored as None. Equal states are handed to pickle as the
+    # same tuple object (a base map and its live copy, every Slime's defaults),
+    # so pickle's memo writes each distinct state once per save.
+
+    def __reduce__(self):
+        present = self._present
+        values = tuple(v if present[i] else None for i, v in enumerate(self._values))
+        if self._extra:
+            return (StatBlock, (), (self._layout.keys, values, self._extra))
+        state = (self._layout.keys, values, None)
+        shared = _SHARED_STATES.get(state)
+        if shared is None:
+            if len(_SHARED_STATES) >= _SHARED_STATES_MAX:
+                _SHARED_STATES.clear()
+            shared = _SHARED_STATES[state] = state
+        return (StatBlock, (), shared)
+
+    def __setstate__(self, state):
+        keys, values, extra = state
+        self._layout = _StatLayout.for_keys(keys)
+        self._values = array("d", (0.0 if v is None else v for v in values))
+        self._present = bytearray(v is not None for v in values)
+        self._extra = dict(extra) if extra else None
+
+
+_RESISTANCE_LAYOUT = _StatLayout.for_keys(_DEFAULT_RESISTANCE)
+_STATUS_RESISTANCE_LAYOUT = _StatLayout.for_keys(_DEFAULT_STATUS_RESISTANCE)
+_RESISTANCE_DEFAULTS = StatBlock(_DEFAULT_RESISTANCE, _RESISTANCE_LAYOUT)
+_STATUS_RESISTANCE_DEFAULTS = StatBlock(_DEFAULT_STATUS_RESISTANCE, _STATUS_RESISTANCE_LAYOUT)
+
+_RESISTANCE_ATTRS = ("resistance", "resistance_base", "status_resistance", "status_resistance_base")
+
+
 class Combatant:
     """Base class for Player and NPC.  Do not instantiate directly."""
 
     def _init_resistances(self):
-        """Initialise resistance and status-resistance dicts to canonical defaults."""
-        self.resistance = dict(_DEFAULT_RESISTANCE)
-        self.resistance_base = dict(_DEFAULT_RESISTANCE)
-        self.status_resistance = dict(_DEFAULT_STATUS_RESISTANCE)
-        self.status_resistance_base = dict(_DEFAULT_STATUS_RESISTANCE)
+        """Initialise resistance and status-resistance maps to canonical defaults."""
+        self.resistance = _RESISTANCE_DEFAULTS.copy()
+        self.resistance_base = _RESISTANCE_DEFAULTS.copy()
+        self.status_resistance = _STATUS_RESISTANCE_DEFAULTS.copy()
+        self.status_resistance_base = _STATUS_RESISTANCE_DEFAULTS.copy()
 
     def _set_status_resistance(self, key, value):
         """Override a status-resistance value on both the base and live dicts.
@@ -121,6 +323,25 @@ class Combatant:
         self.status_resistance_base[key] = value
         self.status_resistance[key] = value
 
+    def __getstate__(self):
+        """Pickle/copy state without the refresh_stat_bonuses() cache.
+
+        The cache (see ``functions.ensure_stat_bonuses``) holds references to
+        the states and equipped items it was computed from; a loaded or copied
+        combatant simply recomputes on its first refresh.
+        """
+        state = self.__dict__.copy()
+        state.pop("_stat_bonus_cache", None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore pickled state, packing older saves' plain resistance dicts."""
+        self.__dict__.update(state)
+        for attr in _RESISTANCE_ATTRS:
+            value = state.get(attr)
+            if type(value) is dict:
+                setattr(self, attr, StatBlock(value))
+
     # ── Shared methods ────────────────────────────────────────────────────────
 
     def is_alive(self):
@@ -98,6 +98,9 @@ class GameConfig:
     # the existing de facto behavior or every player without an explicit
     # `autosave_enabled = true` in their config would silently lose autosave.
     autosave_enabled: bool = True
+    # delta_saves writes tiles that still match their map JSON as references
+    # instead of pickling them (see src.universe.serialize_delta_save).
+    delta_saves: bool = False
     allow_quicksave: bool = True
     auto_load_latest: bool = False
     learn_all_skills: bool = False
@@ -138,6 +141,13 @@ class GameConfig:
     monitor_bps: bool = False
     log_performance: bool = False
     show_full_grid: bool = False
+
+    # === [game] section: Map loading ===
+    # lazy_maps builds each map's tiles on first entry instead of building
+    # every shipped map per session; max_resident_maps > 0 then pages the
+    # least recently entered maps beyond that count out to compressed pickles.
+    lazy_maps: bool = False
+    max_resident_maps: int = 0
     grid_display_interval: int = 1
     show_coordinate_display: bool = True
 
@@ -349,6 +359,7 @@ class ConfigManager:
         self.config.autosave_enabled = _safe_getboolean(
             section, "autosave_enabled", True
         )
+        self.config.delta_saves = _safe_getboolean(section, "delta_saves", False)
         self.config.allow_quicksave = _safe_getboolean(section, "allow_quicksave", True)
         self.config.auto_load_latest = _safe_getboolean(
             section, "auto_load_latest", False
@@ -410,6 +421,12 @@ class ConfigManager:
             section, "show_coordinate_display", True
         )
 
+        # Map loading
+        self.config.lazy_maps = _safe_getboolean(section, "lazy_maps", False)
+        self.config.max_resident_maps = max(
+            0, _safe_getint(section, "max_resident_maps", 0)
+        )
+
     def _parse_development_section(self) -> None:
         """Parse [development] section settings."""
         if not self.parser.has_section("development"):
@@ -5,6 +5,7 @@ import re
 import random
 import importlib
 import pkgutil
+from collections.abc import Mapping
 
 from typing import Any
 from typing import TYPE_CHECKING
@@ -13,6 +14,7 @@ if TYPE_CHECKING:  # only for type hints; avoids runtime circular imports
     from src.items import Item
     from src.player import Player
 
+from src.combatant import StatBlock
 from src.narration import colored, cprint, narrate
 
 """
@@ -253,8 +255,8 @@ def refresh_stat_bonuses(
     }
 
     # Dynamically mirror current base resistance categories (these can evolve elsewhere)
-    resistance_keys = list(target.resistance_base.keys())
-    status_resistance_keys = list(target.status_resistance_base.keys())
+    resistance_keys = target.resistance_base
+    status_resistance_keys = target.status_resistance_base
 
     # Collect candidate adders (equipped items + states with at least one bonus attr)
     adder_group = []
@@ -290,8 +292,8 @@ def refresh_stat_bonuses(
             bonus_value = get_attr(adder, bonus_attr)
             if target_field == "_resistance_dict" and isinstance(bonus_value, dict):
                 # Merge only known resistance keys
-                for k in resistance_keys:
-                    if k in bonus_value:
+                for k in bonus_value:
+                    if k in resistance_keys:
                         try:
                             target.resistance[k] += float(bonus_value[k])
                         except Exception:
@@ -299,8 +301,8 @@ def refresh_stat_bonuses(
             elif target_field == "_status_resistance_dict" and isinstance(
                 bonus_value, dict
             ):
-                for k in status_resistance_keys:
-                    if k in bonus_value:
+                for k in bonus_value:
+                    if k in status_resistance_keys:
                         try:
                             target.status_resistance[k] += float(bonus_value[k])
                         except Exception:
@@ -317,9 +319,12 @@ def refresh_stat_bonuses(
                     continue
 
     # Clamp negative status resistances to 0
-    for k, v in list(target.status_resistance.items()):
-        if v < 0:
-            target.status_resistance[k] = 0
+    if type(target.status_resistance) is StatBlock:
+        target.status_resistance.clamp_min(0.0)
+    else:
+        for k, v in list(target.status_resistance.items()):
+            if v < 0:
+                target.status_resistance[k] = 0
 
     # Clamp negative primary stats to 0 (stacked debuffs should never invert sign,
     # which would otherwise inflate downstream calculations like hit_chance)
@@ -405,6 +410,11 @@ def refresh_stat_bonuses(
             except Exception:
                 continue
 
+    _clamp_fatigue(target)
+    _remember_stat_bonuses(target)
+
+
+def _clamp_fatigue(target):
     # Ensure all fatigue values are rounded up to the nearest integer and clamped
     if hasattr(target, "fatigue") and hasattr(target, "maxfatigue"):
         target.maxfatigue = int(math.ceil(target.maxfatigue))
@@ -413,6 +423,118 @@ def refresh_stat_bonuses(
             target.fatigue = target.maxfatigue
 
 
+# What a full refresh_stat_bonuses() reads besides the equipped items and
+# states themselves, and what it writes. Together they let ensure_stat_bonuses()
+# prove a per-beat refresh would change nothing.
+_STAT_INPUT_FIELDS = tuple(f"{f}_base" for f in PRIMARY_STAT_FIELDS) + (
+    "maxhp_base",
+    "maxfatigue_base",
+    "weight_tolerance_base",
+    "protection_base",
+    "level",
+    "name",
+)
+_STAT_OUTPUT_FIELDS = PRIMARY_STAT_FIELDS + (
+    "maxhp",
+    "maxfatigue",
+    "weight_tolerance",
+    "protection",
+)
+
+# Attribute holding the last full refresh's inputs and results. Dropped from
+# pickles and copies by Combatant.__getstate__: it holds live item/state refs.
+STAT_BONUS_CACHE_ATTR = "_stat_bonus_cache"
+
+
+def _stat_bonus_inputs(target):
+    """Everything refresh_stat_bonuses() derives the target's stats from.
+
+    Equipped items and states are compared by identity (no engine class
+    defines ``__eq__``), so equipping, unequipping, applying or removing a
+    state -- by any code path, including a bare ``states.append`` -- changes
+    the key. Jean's fatigue cap also depends on carried weight, so his
+    inventory and stack counts are part of his key.
+    """
+    # Read straight from the instance dict: none of these are properties, and
+    # getattr's miss path (NPCs have no weight_tolerance) dominated the check.
+    attrs = vars(target)
+    inv = attrs.get("inventory")
+    inv = inv if isinstance(inv, list) else []
+    key = (
+        tuple(attrs.get("states") or ()),
+        tuple(item for item in inv if getattr(item, "isequipped", False)),
+        tuple(attrs.get(f) for f in _STAT_INPUT_FIELDS),
+    )
+    if attrs.get("name") == "Jean":
+        key += (tuple((item, getattr(item, "count", None)) for item in inv),)
+    return key
+
+
+def _stat_map_snapshot(stat_map):
+    # A StatBlock copy compares against the live block with one array compare.
+    return stat_map.copy() if type(stat_map) is StatBlock else dict(stat_map)
+
+
+def _remember_stat_bonuses(target):
+    try:
+        setattr(
+            target,
+            STAT_BONUS_CACHE_ATTR,
+            (
+                _stat_bonus_inputs(target),
+                _stat_bonus_outputs(target),
+                # Resistance inputs and outputs are copied; the live maps are
+                # mutated in place by reset_stats() and by engine effects.
+                _stat_map_snapshot(target.resistance_base),
+                _stat_map_snapshot(target.status_resistance_base),
+                _stat_map_snapshot(target.resistance),
+                _stat_map_snapshot(target.status_resistance),
+            ),
+        )
+    except Exception:
+        target.__dict__.pop(STAT_BONUS_CACHE_ATTR, None)
+
+
+def _stat_bonus_outputs(target):
+    attrs = vars(target)
+    return tuple(attrs.get(f) for f in _STAT_OUTPUT_FIELDS)
+
+
+def _stat_bonuses_current(target, cached):
+    inputs, outputs, res_base, status_base, res, status = cached
+    return (
+        outputs == _stat_bonus_outputs(target)
+        and inputs == _stat_bonus_inputs(target)
+        and res == target.resistance
+        and status == target.status_resistance
+        and res_base == target.resistance_base
+        and status_base == target.status_resistance_base
+    )
+
+
+def ensure_stat_bonuses(target):
+    """refresh_stat_bonuses(), skipped when nothing it depends on has changed.
+
+    For per-beat callers (the combat loop refreshes every ally and enemy every
+    beat). The result is reused only when the inputs match the last full
+    refresh -- same states, same equipped items, same base stats -- *and* the
+    stats still hold the values that refresh produced, so a stray direct write
+    to a derived stat is still reset exactly as a full refresh would. Bonus
+    values edited in place on an already-applied state or item are not
+    detected; the code that does that (e.g. ``State.compound``) calls
+    refresh_stat_bonuses() itself, which recomputes and re-records.
+    """
+    cached = getattr(target, STAT_BONUS_CACHE_ATTR, None)
+    try:
+        fresh = cached is not None and _stat_bonuses_current(target, cached)
+    except Exception:
+        fresh = False
+    if not fresh:
+        refresh_stat_bonuses(target)
+        return
+    _clamp_fatigue(target)
+
+
 def check_parry(target):
     states = getattr(target, "states", []) or []
     for s in states:
@@ -432,6 +554,14 @@ def is_input_integer(
         return False
 
 
+def _reset_stat_map(live, base):
+    if type(live) is StatBlock:
+        live.reset_to(base)
+    else:
+        live.clear()
+        live.update({k: v for k, v in base.items()})
+
+
 def reset_stats(target):  # resets all stats to base level
     # Map target attrs to their corresponding base attrs to avoid repetitive code
     stat_pairs = tuple((f, f"{f}_base") for f in PRIMARY_STAT_FIELDS) + (
@@ -447,26 +577,16 @@ def reset_stats(target):  # resets all stats to base level
                 # Fail-safe: skip malformed attributes
                 pass
 
-    # Reset resistance dictionaries in a safe, efficient way
-    try:
-        if hasattr(target, "resistance") and hasattr(target, "resistance_base"):
-            target.resistance.clear()
-            target.resistance.update(
-                {k: v for k, v in getattr(target, "resistance_base", {}).items()}
-            )
-    except Exception:
-        pass
-
-    try:
-        if hasattr(target, "status_resistance") and hasattr(
-            target, "status_resistance_base"
-        ):
-            target.status_resistance.clear()
-            target.status_resistance.update(
-                {k: v for k, v in getattr(target, "status_resistance_base", {}).items()}
-            )
-    except Exception:
-        pass
+    # Reset resistance maps in place (a single array copy for StatBlocks)
+    for attr, base_attr in (
+        ("resistance", "resistance_base"),
+        ("status_resistance", "status_resistance_base"),
+    ):
+        try:
+            if hasattr(target, attr) and hasattr(target, base_attr):
+                _reset_stat_map(getattr(target, attr), getattr(target, base_attr))
+        except Exception:
+            pass
 
     # Preserve compatibility for weight_tolerance if present
     if hasattr(target, "weight_tolerance") and hasattr(target, "weight_tolerance_base"):
@@ -618,10 +738,14 @@ def _patch_player_integrity(obj: Any):
 
 
 def _safe_pickle_load(fp):
+    # Local import: src.universe imports this module.
+    from src.universe import DeltaSaveUnpickler
+
     try:
         # safe_pickle_load enforces the size cap and applies the allow-list /
-        # strict-mode gating from src.secure_pickle before unpickling.
-        data = safe_pickle_load(fp)
+        # strict-mode gating from src.secure_pickle before unpickling. The
+        # delta-aware unpickler reads full and delta saves alike.
+        data = safe_pickle_load(fp, unpickler=DeltaSaveUnpickler)
 
         # Attempt recursive patch for Player objects nested in simple containers
         def _walk(o):
@@ -711,7 +835,8 @@ def await_input():
     """No-op retained for compatibility.
 
     There is no blocking "press Enter" pause in the web client; pacing between
-    narrative beats is handled by the frontend.
+    narrative beats is handled by the frontend. Timed pauses go through
+    ``src.headless.pause`` instead, which honours headless mode.
     """
     return None
 
@@ -780,12 +905,44 @@ def inflict(state, target, chance=1.0, force=False, min_chance=0.0):
     return state
 
 
+_ENCHANTMENT_GROUPS = ("Prefix", "Suffix")
+_enchantment_index: dict[tuple[int, str], tuple[type, ...]] | None = None
+
+
+def _enchantments_by_tier_and_group() -> dict[tuple[int, str], tuple[type, ...]]:
+    """``{(tier, group): classes}`` for `enchant_tables`, built on first use.
+
+    An enchantment's group is set by its constructor, so each class is built
+    once against a placeholder item to read it. A class whose group cannot be
+    read that way is filed under both groups; add_random_enchantments still
+    checks the group of the instance it actually builds.
+    """
+    global _enchantment_index
+    if _enchantment_index is None:
+        import src.enchant_tables as _enchant_tables
+
+        index: dict[tuple[int, str], tuple[type, ...]] = {}
+        for _, cls in inspect.getmembers(_enchant_tables, inspect.isclass):
+            if not hasattr(cls, "tier"):
+                continue
+            try:
+                groups = (cls(None).group,)
+            except Exception:
+                groups = _ENCHANTMENT_GROUPS
+            for group in groups:
+                key = (int(cls.tier), group)
+                index[key] = index.get(key, ()) + (cls,)
+        _enchantment_index = index
+    return _enchantment_index
+
+
 def add_random_enchantments(item: "Item", count: int) -> None:
     """
     Add up to `count` random enchantments to `item`.
 
     The function:
-      - Caches enchantment classes from `enchant_tables` by their `tier` attribute.
+      - Looks enchantment classes up by `tier` and group in an index of
+        `enchant_tables` built once per process.
       - Performs `count` enchantment rolls, choosing between prefix (0) and suffix (1)
         groups and incrementing that group's tier each time it is selected.
       - Instantiates candidate enchantments for the computed tier and filters them
@@ -805,25 +962,16 @@ def add_random_enchantments(item: "Item", count: int) -> None:
     enchantment_level: list[int] = [0, 0]
     enchantments: list[Any] = [None, None]
 
-    # Local import (deferred) to reduce initial import cost & circular risks
-    import src.enchant_tables as _enchant_tables
-
-    # Cache enchantment classes by tier to avoid repeated reflection/lookup
-    class_by_tier: dict[int, list[type]] = {}
-    for _, cls in inspect.getmembers(_enchant_tables, inspect.isclass):
-        if hasattr(cls, "tier"):
-            class_by_tier.setdefault(int(cls.tier), []).append(cls)
-
-    group_names = {0: "Prefix", 1: "Suffix"}
+    class_index = _enchantments_by_tier_and_group()
 
     while ench_pool > 0:
         group = random.randrange(2)  # 0 = "Prefix", 1 = "Suffix"
-        expected_group = group_names[group]
+        expected_group = _ENCHANTMENT_GROUPS[group]
         enchantment_level[group] += 1
         tier = enchantment_level[group]
 
         candidates: list[Any] = []
-        for cls in class_by_tier.get(tier, ()):
+        for cls in class_index.get((tier, expected_group), ()):
             try:
                 ench = cls(item)
                 # Only consider enchantments belonging to this slot's group
@@ -1038,7 +1186,7 @@ def learn_all_skills_from_skilltree(player: "Player"):
     Learn all skills from the skill tree for the player.
     This is useful for testing and development when learn_all_skills config is enabled.
     """
-    from src.skilltree import Skilltree  # type: ignore
+    from src.skilltree import Skilltree, bind  # type: ignore
 
     skilltree = Skilltree(player)
     learned_count = 0
@@ -1046,7 +1194,7 @@ def learn_all_skills_from_skilltree(player: "Player"):
     # Iterate through all skill categories
     for category, skills_dict in skilltree.subtypes.items():
         for skill_move in skills_dict.keys():
-            # skill_move is already an instantiated move object from skilltree
+            # skill_move is a shared prototype; the player gets their own instance
             # Check if player already knows a move with this name
             already_known = False
             for known_move in player.known_moves:
@@ -1056,7 +1204,7 @@ def learn_all_skills_from_skilltree(player: "Player"):
 
             # Add the skill if not already known
             if not already_known:
-                player.known_moves.append(skill_move)
+                player.known_moves.append(bind(skill_move, player))
                 learned_count += 1
 
     if learned_count > 0:
@@ -1078,11 +1226,11 @@ def combat_resistance(target, damage_type, default=1.0):
     yields `default`) so it never raises in the combat loop.
     """
     resist = getattr(target, "resistance", None)
-    if isinstance(resist, dict) and damage_type in resist:
+    if isinstance(resist, Mapping) and damage_type in resist:
         value = resist[damage_type]
     else:
         base = getattr(target, "resistance_base", None)
-        if isinstance(base, dict) and damage_type in base:
+        if isinstance(base, Mapping) and damage_type in base:
             value = base[damage_type]
         else:
             return float(default)
@@ -1104,7 +1252,7 @@ def combat_status_resistance(target, status_type, default=0.0):
     sane. Tolerates degraded/mock targets without raising.
     """
     resist = getattr(target, "status_resistance", None)
-    if isinstance(resist, dict) and status_type in resist:
+    if isinstance(resist, Mapping) and status_type in resist:
         value = resist[status_type]
     else:
         value = default
@@ -0,0 +1,53 @@
+"""Headless execution mode — engine pacing that the web API must not wait on.
+
+The engine was written for a terminal: story beats ``time.sleep`` between lines
+for dramatic timing and play asciimatics animations. Under the web API none of
+that may block a request — the frontend paces narration itself — so the API
+runs engine code inside :func:`headless`, and the engine's pacing points
+consult the flag instead of being monkeypatched:
+
+  * :func:`pause` (the engine's replacement for ``time.sleep``) returns at once;
+  * ``animations.animate_to_main_screen`` skips playback;
+  * ``functions.await_input`` is already a no-op everywhere.
+
+The flag is a :mod:`contextvars` variable, like the narration buffer in
+``src/narration.py``, so it is local to the thread (and asyncio task) that set
+it: one request running headless never silences another thread's sleeps, which
+the old ``unittest.mock.patch`` of the global ``time.sleep`` did.
+"""
+
+import contextlib
+import contextvars
+import time
+
+_headless: "contextvars.ContextVar[bool]" = contextvars.ContextVar(
+    "engine_headless", default=False
+)
+
+
+def is_headless() -> bool:
+    """Return True while the current context runs the engine headless."""
+    return _headless.get()
+
+
+@contextlib.contextmanager
+def headless():
+    """Run the enclosed engine code with pacing and animations suppressed.
+
+    Usage::
+
+        with capture_narration() as messages, headless():
+            event.check_conditions()
+    """
+    token = _headless.set(True)
+    try:
+        yield
+    finally:
+        _headless.reset(token)
+
+
+def pause(seconds):
+    """Sleep for ``seconds`` of dramatic pacing, unless running headless."""
+    if _headless.get():
+        return
+    time.sleep(seconds)
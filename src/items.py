@@ -4,6 +4,7 @@ import importlib
 import random
 import math
 from src.narration import colored, cprint, narrate
+from src.headless import pause
 import src.functions as functions
 from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
@@ -3636,8 +3637,6 @@ class DriedCrystalSap(Consumable):
             )
 
     def use(self, player: "Player", user=None) -> None:  # type: ignore[override]
-        import time as _time
-
         _user = user if user is not None else player
         heal = min(self.power, player.maxhp - player.hp)
         if heal <= 0:
@@ -3647,7 +3646,7 @@ class DriedCrystalSap(Consumable):
             f"{player.name} bites into the waxy lump. "
             "The ozone smell sharpens for a moment."
         )
-        _time.sleep(1)
+        pause(1)
         player.hp += heal
         cprint("{} recovered {} HP!".format(player.name, heal), "green")
         self.count -= 1
@@ -4181,3 +4180,60 @@ class MerchantJournalFragment(Book):
         )
         self.interactions = ["read", "examine", "drop"]
         self.announce = "Pages from a worn journal lie here."
+
+
+# ---------------------------------------------------------------------------
+# Class registry
+# ---------------------------------------------------------------------------
+# Loot drops, merchant restocks and shop conditions all need "every item
+# class" (optionally narrowed to one level or one base class). Walking
+# inspect.getmembers() over this module for that -- 100+ members, sorted by
+# name -- on every drop or restock is wasted work: the class set is fixed once
+# the module has been imported, so it is indexed a single time instead.
+
+
+class ItemRegistry:
+    """Index of the :class:`Item` subclasses among ``(name, object)`` members.
+
+    Members that are not Item subclasses (or are Item itself) are dropped;
+    the rest keep the order they were given in, which for the module registry
+    is ``inspect.getmembers`` order (sorted by name), so seeded draws over it
+    pick the same classes as the old reflection did.
+    """
+
+    def __init__(self, members) -> None:
+        self.classes: Tuple[Tuple[str, type], ...] = tuple(
+            (name, obj)
+            for name, obj in members
+            if isinstance(obj, type) and issubclass(obj, Item) and obj is not Item
+        )
+        self._by_level: Dict[Any, Tuple[str, ...]] = {}
+        for name, cls in self.classes:
+            level = getattr(cls, "level", None)
+            if level is not None:
+                self._by_level[level] = self._by_level.get(level, ()) + (name,)
+        self._by_base: Dict[type, Tuple[type, ...]] = {}
+
+    def names_at_level(self, level: Any) -> Tuple[str, ...]:
+        """Attribute names of the classes whose ``level`` equals ``level``."""
+        return self._by_level.get(level, ())
+
+    def subclasses_of(self, base: type = Item) -> Tuple[type, ...]:
+        """Registered classes that are ``base`` or derive from it (memoized)."""
+        found = self._by_base.get(base)
+        if found is None:
+            found = self._by_base[base] = tuple(
+                cls for _, cls in self.classes if issubclass(cls, base)
+            )
+        return found
+
+
+_registry: Optional[ItemRegistry] = None
+
+
+def item_registry() -> ItemRegistry:
+    """The :class:`ItemRegistry` for this module, built on first use."""
+    global _registry
+    if _registry is None:
+        _registry = ItemRegistry(sorted(globals().items(), key=lambda member: member[0]))
+    return _registry
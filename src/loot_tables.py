@@ -2,7 +2,6 @@
 All the loot tables for NPCs can be found here. These are called from the npc module.
 """
 
-import inspect
 import random
 import src.items as items
 import src.functions as functions
@@ -28,13 +27,7 @@ class Loot:
 
     @staticmethod
     def random_equipment(tile, level, enchantment):
-        candidates = []
-        eq_level = int(level)
-        for name, obj in inspect.getmembers(items):
-            if inspect.isclass(obj):
-                if hasattr(obj, "level"):
-                    if eq_level == obj.level:
-                        candidates.append(name)
+        candidates = items.item_registry().names_at_level(int(level))
         select = random.randint(0, len(candidates) - 1)
         drop = tile.spawn_item(candidates[select], amt=1, hidden=False, hfactor=0)
         try:
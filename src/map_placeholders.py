@@ -41,6 +41,7 @@ module, so they can't silently diverge on which classes are trusted.
 import importlib
 import inspect
 import logging
+from collections.abc import Mapping
 from typing import Final
 
 import src.functions as functions
@@ -200,12 +201,24 @@ def is_class_type_marker(payload):
     return isinstance(payload, dict) and "__class_type__" in payload and len(payload) == 1
 
 
+# ``inspect.signature`` is by far the most expensive step of instantiating a
+# map object, and every session builds the same few dozen classes hundreds of
+# times, so the parameter names are memoized per class.
+_INIT_PARAM_NAMES = {}
+
+
 def _init_param_names(cls):
+    cached = _INIT_PARAM_NAMES.get(cls)
+    if cached is not None and cached[0] is cls.__init__:
+        return cached[1]
     try:
         sig = inspect.signature(cls.__init__)
     except (TypeError, ValueError):
-        return frozenset()
-    return frozenset(p.name for p in sig.parameters.values() if p.name != "self")
+        names = frozenset()
+    else:
+        names = frozenset(p.name for p in sig.parameters.values() if p.name != "self")
+    _INIT_PARAM_NAMES[cls] = (cls.__init__, names)
+    return names
 
 
 # ---------------------------------------------------------------------------
@@ -326,7 +339,9 @@ def _serialize_value(value, *, nested_fallback=None):
         return {"__class_type__": f"{bare_module_name(value.__module__)}:{value.__name__}"}
     if isinstance(value, (list, tuple)):
         return [_serialize_value(v, nested_fallback=nested_fallback) for v in value]
-    if isinstance(value, dict):
+    if isinstance(value, Mapping):
+        # Any mapping (e.g. a combatant's StatBlock resistances) is authored
+        # as a plain object; instantiate_placeholder restores the type.
         return {
             k: _serialize_value(v, nested_fallback=nested_fallback)
             for k, v in value.items()
@@ -410,7 +425,12 @@ def instantiate_placeholder(payload, *, player=None, tile=None, _depth=0):
         if key not in allowed_overrides:
             continue
         try:
-            setattr(inst, key, resolve_nested(value))
+            value = resolve_nested(value)
+            current = getattr(inst, key, None)
+            if isinstance(value, dict) and isinstance(current, Mapping) and not isinstance(current, dict):
+                # Keep the attribute's own mapping type (StatBlock resistances).
+                value = type(current)(value)
+            setattr(inst, key, value)
         except Exception as e:
             logger.debug(
                 "instantiate_placeholder: setattr(%s, %r, ...) override failed (%s)",
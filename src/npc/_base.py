@@ -115,7 +115,7 @@ class NPC(NPCCombatMixin, NPCLootMixin, Combatant):
         )
         for _stype in self.status_resistance_base:
             self.status_resistance_base[_stype] = _status_baseline
-        self.status_resistance = dict(self.status_resistance_base)
+        self.status_resistance = self.status_resistance_base.copy()
         self.awareness = awareness  # used when a player enters the room to see if npc spots the player
         self.aggro = aggro
         self.exp_award = exp_award
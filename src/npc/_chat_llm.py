@@ -29,7 +29,7 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ._llm import _load_llm_client_module
 from src.narration import narrate
@@ -752,7 +752,12 @@ class ConversationalNPCMixin:
         return validated
 
     def _generate_turn(
-        self, adapter, system: str, is_opening: bool, jean_text: Optional[str]
+        self,
+        adapter,
+        system: str,
+        is_opening: bool,
+        jean_text: Optional[str],
+        on_npc_text: Optional[Callable[[str], None]] = None,
     ) -> Optional[Dict[str, Any]]:
         """Dispatch one raw NPC turn to the adapter.
 
@@ -764,13 +769,17 @@ class ConversationalNPCMixin:
         reputation_delta, loquacity_delta (None if the adapter did not supply
         one), and raw_options (the combined call's options list, or None when the
         adapter produces options via a separate call). Returns None on failure.
+
+        ``on_npc_text`` is handed to the combined call only, and only when set,
+        so adapters that predate streaming keep working unchanged.
         """
         if hasattr(adapter, "generate_turn"):
+            stream = {"on_npc_text": on_npc_text} if on_npc_text is not None else {}
             if is_opening:
-                res = adapter.generate_turn(system, self._chat_history, is_opening=True)
+                res = adapter.generate_turn(system, self._chat_history, is_opening=True, **stream)
             else:
                 res = adapter.generate_turn(
-                    system, self._chat_history, is_opening=False, jean_text=jean_text
+                    system, self._chat_history, is_opening=False, jean_text=jean_text, **stream
                 )
             if not res or not res.get("npc_text"):
                 return None
@@ -800,7 +809,13 @@ class ConversationalNPCMixin:
         }
 
     def _run_npc_turn(
-        self, adapter, system: str, llm_available: bool, is_opening: bool, jean_text
+        self,
+        adapter,
+        system: str,
+        llm_available: bool,
+        is_opening: bool,
+        jean_text,
+        on_npc_text: Optional[Callable[[str], None]] = None,
     ) -> Optional[Dict[str, Any]]:
         """Produce a QC'd NPC turn, or None if the caller should fall back.
 
@@ -812,12 +827,15 @@ class ConversationalNPCMixin:
         round trip only on the QC-failure path — successful calls are still a
         single round trip — and is worth it to avoid the repeated-fallback
         experience.
+
+        ``on_npc_text`` sees each attempt's line as it streams; a retry starts
+        the text over, so consumers should replace, not append.
         """
         if not llm_available or adapter is None:
             return None
         max_attempts = 2
         for _ in range(max_attempts):
-            turn = self._generate_turn(adapter, system, is_opening, jean_text)
+            turn = self._generate_turn(adapter, system, is_opening, jean_text, on_npc_text)
             if turn and turn.get("npc_text"):
                 cleaned = self._qc_npc_text(turn["npc_text"], self._chat_history)
                 if cleaned:
@@ -866,8 +884,12 @@ class ConversationalNPCMixin:
         else:
             narrate(self._display_name() + " has nothing to say.")
 
-    def chat_open(self, player) -> Dict[str, Any]:
-        """Start conversation. Returns opening line + 3 Jean options."""
+    def chat_open(self, player, on_npc_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Start conversation. Returns opening line + 3 Jean options.
+
+        ``on_npc_text(text_so_far)`` is called while the opening line streams
+        in, before QC; the returned ``npc_opening`` is the final word.
+        """
         try:
             self._compute_loquacity(player)
             npc_key = self._get_npc_key(player)
@@ -898,7 +920,8 @@ class ConversationalNPCMixin:
             # Generate the NPC opening (and, on a combined adapter, Jean's options
             # in the same call). Opening lines never drain loquacity.
             turn = self._run_npc_turn(
-                adapter, system, llm_available, is_opening=True, jean_text=None
+                adapter, system, llm_available, is_opening=True, jean_text=None,
+                on_npc_text=on_npc_text,
             )
             if turn is not None:
                 npc_opening = turn["npc_text"]
@@ -931,8 +954,17 @@ class ConversationalNPCMixin:
             logger.error(f"ConversationalNPCMixin.chat_open error: {e}")
             return {"success": False, "error": str(e)}
 
-    def chat_respond(self, player, jean_text: str, jean_tone: str) -> Dict[str, Any]:
-        """Process Jean's response. Returns NPC reply + 3 new Jean options."""
+    def chat_respond(
+        self,
+        player,
+        jean_text: str,
+        jean_tone: str,
+        on_npc_text: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
+        """Process Jean's response. Returns NPC reply + 3 new Jean options.
+
+        ``on_npc_text`` streams the reply as for :meth:`chat_open`.
+        """
         try:
             self._compute_loquacity(player)
             npc_key = self._get_npc_key(player)
@@ -962,7 +994,8 @@ class ConversationalNPCMixin:
 
             # Generate NPC response (combined adapters also return Jean's options)
             turn = self._run_npc_turn(
-                adapter, system, llm_available, is_opening=False, jean_text=jean_text
+                adapter, system, llm_available, is_opening=False, jean_text=jean_text,
+                on_npc_text=on_npc_text,
             )
             conversation_quality = "neutral"
             reputation_delta = 0
@@ -17,10 +17,55 @@ Attributes expected on the host class (provided by NPC.__init__):
 """
 
 import random
+from bisect import bisect_right
+from contextlib import nullcontext
+from itertools import accumulate
 
 import src.moves as moves  # type: ignore
 
 
+class MoveTable:
+    """A weighted move pool sampled by bisecting cumulative weights.
+
+    Replaces the list that repeated each move ``weight`` times. ``pick()``
+    draws ``random.randint(0, total - 1)`` exactly as indexing that list did,
+    so a seeded fight picks the same moves -- without allocating O(sum of
+    weights) entries per NPC per beat.
+    """
+
+    __slots__ = ("moves", "weights", "cumulative", "total")
+
+    def __init__(self, moves_, weights):
+        self.moves = list(moves_)
+        self.weights = list(weights)
+        self.cumulative = list(accumulate(self.weights))
+        self.total = self.cumulative[-1] if self.cumulative else 0
+
+    def __bool__(self):
+        return self.total > 0
+
+    def pick(self):
+        return self.moves[bisect_right(self.cumulative, random.randint(0, self.total - 1))]
+
+
+def ai_bonus_scope(npc):
+    """Context for weighing all of ``npc``'s moves against its AI config.
+
+    A real NPCAIConfig works out the NPC's situation once for the whole pass
+    (see ``NPCAIConfig.move_selection``); anything else gets a no-op scope.
+    """
+    config = getattr(npc, "ai_config", None)
+    if config is None:
+        return nullcontext()
+    try:
+        from src.npc_ai_config import NPCAIConfig
+    except ImportError:
+        return nullcontext()
+    if isinstance(config, NPCAIConfig):
+        return config.move_selection(npc)
+    return nullcontext()
+
+
 class NPCCombatMixin:
     """Combat AI and engagement behaviour for NPC."""
 
@@ -63,18 +108,17 @@ class NPCCombatMixin:
                 pass
 
         #  simple random selection; if you want something more complex, overwrite this for the specific NPC
-        weighted_moves = []
-        for move in available_moves:
-            # Calculate tactical weight modifications
-            weight = move.weight
-            if hasattr(self, "ai_config") and self.ai_config:
-                weight += self.ai_config.get_weighted_move_bonus(self, move.name)
-
-            # Ensure at least 1 weight for viable moves
-            weight = max(1, weight)
-
-            for _ in range(weight):
-                weighted_moves.append(move)
+        weights = []
+        with ai_bonus_scope(self):
+            for move in available_moves:
+                # Calculate tactical weight modifications
+                weight = move.weight
+                if hasattr(self, "ai_config") and self.ai_config:
+                    weight += self.ai_config.get_weighted_move_bonus(self, move.name)
+
+                # Ensure at least 1 weight for viable moves
+                weights.append(max(1, weight))
+        weighted_moves = MoveTable(available_moves, weights)
 
         if not weighted_moves:
             # Fallback if no moves generated
@@ -83,8 +127,8 @@ class NPCCombatMixin:
         # If no offensive move is both affordable and viable, rest to recover fatigue.
         # This prevents the NPC from idling forever when the preferred attack costs more
         # fatigue than is currently available (e.g. after 2+ attacks drain the pool).
-        # Use available_moves (deduplicated) rather than weighted_moves to avoid calling
-        # viable() multiple times on the same object due to weight expansion.
+        # Use available_moves rather than sampling weighted_moves so each move's
+        # viable() is checked once.
         # Use getattr in case a move was created via __new__ without calling Move.__init__.
         can_attack = any(
             getattr(m, "category", "") == "Offensive"
@@ -113,18 +157,14 @@ class NPCCombatMixin:
                 self.current_move = moves.NpcRest(self)
                 return
 
-        num_choices = len(weighted_moves) - 1
         max_attempts = 20  # Prevent infinite loops
         attempts = 0
-        choice = 0
 
         while self.current_move is None and attempts < max_attempts:
             attempts += 1
-            choice = random.randint(0, num_choices)
-            if (weighted_moves[choice].fatigue_cost <= self.fatigue) and weighted_moves[
-                choice
-            ].viable():
-                self.current_move = weighted_moves[choice]
+            candidate = weighted_moves.pick()
+            if candidate.fatigue_cost <= self.fatigue and candidate.viable():
+                self.current_move = candidate
 
         # Hard fallback: if all 20 random attempts failed, rest rather than doing nothing.
         if self.current_move is None:
@@ -150,7 +190,7 @@ class NPCCombatMixin:
                         f"Selected {self.current_move.name}",
                         {
                             "fatigue_cost": self.current_move.fatigue_cost,
-                            "original_weight": weighted_moves[choice].weight,
+                            "original_weight": self.current_move.weight,
                             "ai_bonus": flank_bonus,
                             "retreat_priority": retreat_prio,
                         },
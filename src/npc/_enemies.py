@@ -12,6 +12,7 @@ import src.genericng as genericng  # type: ignore
 import src.moves as moves  # type: ignore
 
 from ._base import NPC
+from ._combat import MoveTable, ai_bonus_scope
 from ._loot import loot
 
 
@@ -317,7 +318,6 @@ class TalusHound(NPC):
 
     def select_move(self):
         """Pack-aware move selection. Behavior adapts based on number of nearby pack members."""
-        import random
 
         available_moves = self.refresh_moves()
 
@@ -337,51 +337,50 @@ class TalusHound(NPC):
                 pass
 
         # Build weighted move pool with pack-aware adjustments
-        weighted_moves = []
-        for move in available_moves:
-            weight = move.weight
-
-            # Pack-aware tactics: prioritize different moves based on pack size
-            if pack_size >= 2:
-                # Large pack: emphasize flanking and coordinated attacks
-                if move.name == "Flanking Maneuver":
-                    weight += 6  # Significantly boost flanking when pack is present
-                elif move.name == "Advance":
-                    weight += 3  # Position for coordinated strikes
-                elif move.name == "NPC_Attack":
-                    weight += 2  # Basic attacks with pack support
-                elif move.name == "Withdraw":
-                    weight -= 2  # Less need to retreat with backup
-            elif pack_size == 1:
-                # Small pack: hit-and-run tactics with occasional flanking
-                if move.name == "Withdraw":
-                    weight += 4  # Emphasize tactical retreat and reset
-                elif move.name == "Advance":
-                    weight += 2  # Advance after opponent recovers from hits
-                elif move.name == "Flanking Maneuver":
-                    weight += 2  # Single ally helps with flanking attempts
-                elif move.name == "Dodge":
-                    weight += 1  # Evasion important when outnumbered
-            else:
-                # Solo: aggressive hit-and-run, evasion, and lone wolf tactics
-                if move.name == "Withdraw":
-                    weight += 5  # Heavy emphasis on tactical retreat when alone
-                elif move.name == "Dodge":
-                    weight += 3  # Solo hounds rely on evasion
-                elif move.name == "Advance":
-                    weight += 1  # Less predictable advance patterns
-                if move.name == "Flanking Maneuver":
-                    weight -= 3  # Flanking less useful without allies
-
-            # Apply AI config bonuses if available
-            if hasattr(self, "ai_config") and self.ai_config:
-                weight += self.ai_config.get_weighted_move_bonus(self, move.name)
-
-            # Ensure at least 1 weight for viable moves
-            weight = max(1, weight)
-
-            for _ in range(weight):
-                weighted_moves.append(move)
+        weights = []
+        with ai_bonus_scope(self):
+            for move in available_moves:
+                weight = move.weight
+
+                # Pack-aware tactics: prioritize different moves based on pack size
+                if pack_size >= 2:
+                    # Large pack: emphasize flanking and coordinated attacks
+                    if move.name == "Flanking Maneuver":
+                        weight += 6  # Significantly boost flanking when pack is present
+                    elif move.name == "Advance":
+                        weight += 3  # Position for coordinated strikes
+                    elif move.name == "NPC_Attack":
+                        weight += 2  # Basic attacks with pack support
+                    elif move.name == "Withdraw":
+                        weight -= 2  # Less need to retreat with backup
+                elif pack_size == 1:
+                    # Small pack: hit-and-run tactics with occasional flanking
+                    if move.name == "Withdraw":
+                        weight += 4  # Emphasize tactical retreat and reset
+                    elif move.name == "Advance":
+                        weight += 2  # Advance after opponent recovers from hits
+                    elif move.name == "Flanking Maneuver":
+                        weight += 2  # Single ally helps with flanking attempts
+                    elif move.name == "Dodge":
+                        weight += 1  # Evasion important when outnumbered
+                else:
+                    # Solo: aggressive hit-and-run, evasion, and lone wolf tactics
+                    if move.name == "Withdraw":
+                        weight += 5  # Heavy emphasis on tactical retreat when alone
+                    elif move.name == "Dodge":
+                        weight += 3  # Solo hounds rely on evasion
+                    elif move.name == "Advance":
+                        weight += 1  # Less predictable advance patterns
+                    if move.name == "Flanking Maneuver":
+                        weight -= 3  # Flanking less useful without allies
+
+                # Apply AI config bonuses if available
+                if hasattr(self, "ai_config") and self.ai_config:
+                    weight += self.ai_config.get_weighted_move_bonus(self, move.name)
+
+                # Ensure at least 1 weight for viable moves
+                weights.append(max(1, weight))
+        weighted_moves = MoveTable(available_moves, weights)
 
         if not weighted_moves:
             return
@@ -413,18 +412,14 @@ class TalusHound(NPC):
                 self.current_move = moves.NpcRest(self)
                 return
 
-        num_choices = len(weighted_moves) - 1
         max_attempts = 20
         attempts = 0
-        choice = 0
 
         while self.current_move is None and attempts < max_attempts:
             attempts += 1
-            choice = random.randint(0, num_choices)
-            if (weighted_moves[choice].fatigue_cost <= self.fatigue) and weighted_moves[
-                choice
-            ].viable():
-                self.current_move = weighted_moves[choice]
+            candidate = weighted_moves.pick()
+            if candidate.fatigue_cost <= self.fatigue and candidate.viable():
+                self.current_move = candidate
 
         # Hard fallback
         if self.current_move is None:
@@ -13,7 +13,9 @@ import src.functions as functions  # type: ignore
 import src.genericng as genericng  # type: ignore
 import src.moves as moves  # type: ignore
 from src.narration import colored, narrate  # type: ignore
+from src.headless import pause
 from ._base import Friend, NonCombatantMixin
+from ._combat import MoveTable, ai_bonus_scope
 from ._chat_llm import ConversationalNPCMixin
 from ._llm import MynxLLMMixin
 
@@ -521,7 +523,6 @@ class GronditeConclaveElder(Friend):
         self._init_idle_moves()
 
     def talk(self, player):
-        import time
 
         # Check if intro has already fired this session
         story = getattr(getattr(player, "universe", None), "story", {})
@@ -532,38 +533,38 @@ class GronditeConclaveElder(Friend):
                 "\nThe Elder turns before Jean says anything. He had already turned — "
                 "waiting — before he reached the plinth."
             )
-            time.sleep(1.5)
+            pause(1.5)
             narrate(
                 "He studies Jean. Then he reaches into the folds of his stone-mantle and "
                 "produces something: a small disc, cracked cleanly in half, one piece "
                 "missing. He holds it out toward Jean."
             )
-            time.sleep(1.5)
+            pause(1.5)
             narrate(
                 "He makes a sound: low, deliberate, with a rising inflection at the end. "
                 "The sound of a question."
             )
-            time.sleep(1)
+            pause(1)
             narrate(
                 "Jean doesn't know what he is asking. But the broken disc is clearly "
                 "meant to show him — and the Elder's eyes, fixed on Jean's face, are "
                 "reading something there. Jean's hands. His posture. The weight in him "
                 "that he hasn't put down."
             )
-            time.sleep(1.5)
+            pause(1.5)
             narrate(
                 "Whatever he finds, it is not the answer he was hoping for. He doesn't "
                 "react to that — his expression doesn't change — but the disc lowers "
                 "slightly. He makes one short sound: not a dismissal. More like a comma."
             )
-            time.sleep(1.5)
+            pause(1.5)
             narrate(
                 "He holds Jean's gaze a moment longer than comfort requires. Then, "
                 "carefully, he folds the broken disc back into his mantle. He turns "
                 "to face the plinth. His back is not a rejection; it is simply where "
                 "he was before Jean arrived."
             )
-            time.sleep(1)
+            pause(1)
             narrate(
                 "Jean has the distinct sense that the question is still open. That the "
                 "Elder expects him to come back."
@@ -801,45 +802,45 @@ class Mara(ConversationalNPCMixin, Friend):
                 pass
 
         # Mara favors tactical positioning over raw aggression
-        weighted_moves = []
-        for move in available_moves:
-            weight = move.weight
-
-            # Core tactical moves that apply to both bow and dagger modes
-            if move.name == "Dodge":
-                weight += 3  # High finesse means constant opportunistic evasion
-            elif move.name == "Flanking Maneuver":
-                weight += 2  # Seeks advantageous angles
-
-            # Weapon-specific positioning
-            if optimal_range == "bow":
-                # Bow mode: maintain distance, retreat if enemies close in
-                if move.name == "Withdraw":
-                    weight += 4  # Actively maintain bow range
-                elif move.name == "Advance":
-                    weight -= 2  # Don't advance in bow mode unless necessary
-                elif move.name == "NPC_Attack":
-                    weight += 1  # Bow strikes when at optimal range
-                elif move.name == "Parry":
-                    weight -= 1  # Less relevant when staying at range
-            elif optimal_range == "dagger":
-                # Dagger mode: close quarters, precision, evasion
-                if move.name == "Advance":
-                    weight += 3  # Close the distance for dagger work
-                elif move.name == "Withdraw":
-                    weight += 1  # Tactical retreat to dodge and reset
-                elif move.name == "NPC_Attack":
-                    weight += 3  # Aggressive dagger strikes at close range
-                elif move.name == "Parry":
-                    weight += 2  # Parrying matters in close quarters
-
-            # Apply AI config bonuses
-            if hasattr(self, "ai_config") and self.ai_config:
-                weight += self.ai_config.get_weighted_move_bonus(self, move.name)
-
-            weight = max(1, weight)
-            for _ in range(weight):
-                weighted_moves.append(move)
+        weights = []
+        with ai_bonus_scope(self):
+            for move in available_moves:
+                weight = move.weight
+
+                # Core tactical moves that apply to both bow and dagger modes
+                if move.name == "Dodge":
+                    weight += 3  # High finesse means constant opportunistic evasion
+                elif move.name == "Flanking Maneuver":
+                    weight += 2  # Seeks advantageous angles
+
+                # Weapon-specific positioning
+                if optimal_range == "bow":
+                    # Bow mode: maintain distance, retreat if enemies close in
+                    if move.name == "Withdraw":
+                        weight += 4  # Actively maintain bow range
+                    elif move.name == "Advance":
+                        weight -= 2  # Don't advance in bow mode unless necessary
+                    elif move.name == "NPC_Attack":
+                        weight += 1  # Bow strikes when at optimal range
+                    elif move.name == "Parry":
+                        weight -= 1  # Less relevant when staying at range
+                elif optimal_range == "dagger":
+                    # Dagger mode: close quarters, precision, evasion
+                    if move.name == "Advance":
+                        weight += 3  # Close the distance for dagger work
+                    elif move.name == "Withdraw":
+                        weight += 1  # Tactical retreat to dodge and reset
+                    elif move.name == "NPC_Attack":
+                        weight += 3  # Aggressive dagger strikes at close range
+                    elif move.name == "Parry":
+                        weight += 2  # Parrying matters in close quarters
+
+                # Apply AI config bonuses
+                if hasattr(self, "ai_config") and self.ai_config:
+                    weight += self.ai_config.get_weighted_move_bonus(self, move.name)
+
+                weights.append(max(1, weight))
+        weighted_moves = MoveTable(available_moves, weights)
 
         if not weighted_moves:
             return
@@ -871,18 +872,14 @@ class Mara(ConversationalNPCMixin, Friend):
                 self.current_move = moves.NpcRest(self)
                 return
 
-        num_choices = len(weighted_moves) - 1
         max_attempts = 20
         attempts = 0
-        choice = 0
 
         while self.current_move is None and attempts < max_attempts:
             attempts += 1
-            choice = random.randint(0, num_choices)
-            if (weighted_moves[choice].fatigue_cost <= self.fatigue) and weighted_moves[
-                choice
-            ].viable():
-                self.current_move = weighted_moves[choice]
+            candidate = weighted_moves.pick()
+            if candidate.fatigue_cost <= self.fatigue and candidate.viable():
+                self.current_move = candidate
 
         # Hard fallback
         if self.current_move is None:
@@ -23,8 +23,8 @@ import os
 import random
 import re
 import sys
-import time
 from pathlib import Path
+from src.headless import pause
 from src.narration import narrate
 
 
@@ -801,7 +801,7 @@ class MynxLLMMixin:
             delay = 1.5
         if delay > 0:
             try:
-                time.sleep(delay)
+                pause(delay)
             except Exception:
                 pass
         return text
@@ -21,9 +21,9 @@ Attributes expected on the host class (provided by Merchant.__init__):
     self.name               str
 """
 
-import inspect
 import random
-import time
+from bisect import bisect_left
+from itertools import accumulate
 
 import src.functions as functions  # type: ignore
 import src.items as items_module  # type: ignore
@@ -46,6 +46,7 @@ from src.items import (
 )
 from src.objects import Container  # type: ignore
 from src.narration import narrate
+from src.headless import pause
 from src.shop_conditions import (  # type: ignore
     ValueModifierCondition,
     RestockWeightBoostCondition,
@@ -55,6 +56,42 @@ from src.shop_conditions import (  # type: ignore
 )
 
 
+class _RestockTable:
+    """Cumulative restock weights over candidate classes, built once per restock.
+
+    :meth:`draw` maps one ``random.uniform(0, total)`` roll onto the first class
+    whose running weight reaches it -- the same class the old per-item linear
+    walk picked for that roll -- by bisection instead of re-summing and
+    re-walking the weight map for every item.
+    """
+
+    __slots__ = ("classes", "cumulative", "total")
+
+    def __init__(self, weight_map: "dict[type[Item], float]"):
+        self.classes = list(weight_map)
+        self.cumulative = list(accumulate(weight_map.values()))
+        self.total = sum(weight_map.values())
+
+    def draw(self) -> "type[Item] | None":
+        if self.total <= 0:
+            return None
+        i = bisect_left(self.cumulative, random.uniform(0, self.total))
+        return self.classes[i] if i < len(self.classes) else None
+
+
+def _new_merchandise(cls: "type[Item]") -> "Item | None":
+    """Build one shop copy of ``cls`` the way Tile.spawn_item does, minus the room."""
+    try:
+        item = cls()
+    except Exception:
+        return None
+    if hasattr(item, "merchandise"):
+        item.merchandise = True
+    if hasattr(item, "count"):
+        item.count = 1
+    return item
+
+
 class MerchantShopMixin:
     """Shop inventory management mixin for Merchant NPCs."""
 
@@ -132,10 +169,10 @@ class MerchantShopMixin:
                 collected_messages.append(msg)
                 if not silent:
                     narrate(msg)
-                    time.sleep(0.15)
+                    pause(0.15)
                 took_any = True
         if took_any and not silent:
-            time.sleep(0.25)
+            pause(0.25)
         return collected_messages
 
     # ── Shop initialisation ────────────────────────────────────────────────────
@@ -356,7 +393,7 @@ class MerchantShopMixin:
         - Specialty subclasses receive 3× weight.
         - RestockWeightBoostConditions further scale weights.
         - Unique-factory classes are excluded.
-        - Safety cap of 1 000 iterations prevents infinite loops.
+        - Safety cap of 1 000 draws prevents infinite loops.
         """
         if not self.current_room:
             return
@@ -401,16 +438,11 @@ class MerchantShopMixin:
             # stock, and its value=0 would make it sell for free anyway.
             Relic,
         }
-        candidates: list[type[Item]] = []
-        for _nm, obj in inspect.getmembers(items_module, inspect.isclass):
-            try:
-                if obj is Item or not issubclass(obj, Item):
-                    continue
-                if obj in unique_factories or obj in disallowed_classes:
-                    continue
-                candidates.append(obj)
-            except Exception:
-                continue
+        candidates: list[type[Item]] = [
+            cls
+            for cls in items_module.item_registry().subclasses_of(Item)
+            if cls not in unique_factories and cls not in disallowed_classes
+        ]
         if not candidates:
             return
 
@@ -437,61 +469,67 @@ class MerchantShopMixin:
         if not weight_map:
             return
 
-        def weighted_choice() -> type[Item] | None:
-            total = sum(weight_map.values())
-            if total <= 0:
-                return None
-            r = random.uniform(0, total)
-            acc = 0.0
-            for cls, w in weight_map.items():
-                acc += w
-                if r <= acc:
-                    return cls
-            return None
+        table = _RestockTable(weight_map)
 
-        def eligible_containers_for(item: Item) -> list[Container]:
-            elig: list[Container] = []
-            for ct in containers:
-                if container_slots_remaining(ct) <= 0:
-                    continue
-                allowed = getattr(ct, "allowed_item_types", None)
-                if not allowed:
-                    continue
-                try:
-                    for t in allowed:
-                        if isinstance(item, t):
+        eligible_cache: dict[type[Item], list[Container]] = {}
+
+        def eligible_containers_for(cls: type[Item]) -> list[Container]:
+            elig = eligible_cache.get(cls)
+            if elig is None:
+                elig = []
+                for ct in containers:
+                    allowed = getattr(ct, "allowed_item_types", None)
+                    if not allowed:
+                        continue
+                    try:
+                        if any(issubclass(cls, t) for t in allowed):
                             elig.append(ct)
-                            break
-                except Exception:
-                    continue
+                    except Exception:
+                        continue
+                eligible_cache[cls] = elig
             return elig
 
-        safety = 0
-        while not all_full() and safety < 1000:
-            safety += 1
-            cls = weighted_choice()
-            if cls is None:
+        # A container no candidate fits can never be filled; counting its
+        # slots as open would spend every draw on it.
+        fillable = {id(ct) for cls in weight_map for ct in eligible_containers_for(cls)}
+        containers = [ct for ct in containers if id(ct) in fillable]
+
+        # Draw a whole round of stock against the free slots, then build and
+        # shelve it in one pass. Nothing is spawned into the room, so nothing
+        # has to be fished back out of it. A class whose constructor fails
+        # leaves its slot open for the next round.
+        draws = 0
+        while not all_full() and draws < 1000:
+            merchant_free = merchant_slots_remaining()
+            container_free = {ct: container_slots_remaining(ct) for ct in containers}
+            plan: list[tuple[type[Item], Container | None]] = []
+            while (merchant_free > 0 or any(n > 0 for n in container_free.values())) and draws < 1000:
+                draws += 1
+                cls = table.draw()
+                if cls is None:
+                    break
+                elig = [ct for ct in eligible_containers_for(cls) if container_free[ct] > 0]
+                if elig:
+                    target = random.choice(elig)
+                    container_free[target] -= 1
+                    plan.append((cls, target))
+                elif merchant_free > 0:
+                    merchant_free -= 1
+                    plan.append((cls, None))
+            if not plan:
                 break
-            try:
-                spawned = self.current_room.spawn_item(cls.__name__, merchandise=True)
-            except Exception:
-                spawned = None
-            if not spawned:
-                continue
-            self._maybe_enchant(spawned)
-            if not hasattr(spawned, "base_value"):
-                try:
-                    setattr(spawned, "base_value", spawned.value)
-                except Exception:
-                    pass
-            elig = eligible_containers_for(spawned)
-            if elig:
-                random.choice(elig).inventory.append(spawned)
-            elif merchant_slots_remaining() > 0:
-                self.inventory.append(spawned)
-            else:
-                continue
-            self._remove_placed_item_from_room(spawned)
+
+            for cls, target in plan:
+                item = _new_merchandise(cls)
+                if item is None:
+                    continue
+                self._maybe_enchant(item)
+                if not hasattr(item, "base_value"):
+                    try:
+                        setattr(item, "base_value", item.value)
+                    except Exception:
+                        pass
+                (target.inventory if target is not None else self.inventory).append(item)
 
     # ── Shop conditions ────────────────────────────────────────────────────────
 
@@ -4,10 +4,32 @@ Manages tactical behavior flags for NPCs, including flanking, retreat, and posit
 Provides decision framework that integrates with combat.py AI decision-making.
 """
 
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Tuple, Optional, List
 
 from src import positions
 
+_RETREAT_MOVES = ("withdraw", "dodge", "parry", "npc_rest")
+_REPOSITION_MOVES = ("advance", "tactical positioning")
+_PROXIMITY_FLANK_MOVES = ("advance", "npc_attack", "tactical positioning")
+
+
+@lru_cache(maxsize=32)
+def _parse_distance_range(range_str) -> Optional[Tuple[float, float]]:
+    """Parse a "min to max" flanking range; None when malformed.
+
+    Cached by the string itself: the setting only changes when the player edits
+    it, but it was re-parsed for every move of every NPC on every beat.
+    """
+    try:
+        parts = range_str.split("to")
+        if len(parts) == 2:
+            return (float(parts[0].strip()), float(parts[1].strip()))
+    except (ValueError, AttributeError):
+        pass
+    return None
+
 
 class NPCAIConfig:
     """Manages NPC AI behavior configuration from GameConfig."""
@@ -19,6 +41,8 @@ class NPCAIConfig:
             player: Player object with game_config
         """
         self.player = player
+        # (npc, situation) while that NPC is choosing a move; see move_selection.
+        self._selection = None
 
     def is_flanking_enabled(self) -> bool:
         """Check if NPC flanking behavior is enabled.
@@ -68,15 +92,12 @@ class NPCAIConfig:
         """
         if hasattr(self.player, "game_config") and self.player.game_config:
             range_str = self.player.game_config.npc_flanking_distance_range
-            # Parse "min to max" format
             try:
-                parts = range_str.split("to")
-                if len(parts) == 2:
-                    min_dist = float(parts[0].strip())
-                    max_dist = float(parts[1].strip())
-                    return (min_dist, max_dist)
-            except (ValueError, AttributeError):
-                pass
+                parsed = _parse_distance_range(range_str)
+            except TypeError:  # unhashable junk value
+                parsed = None
+            if parsed is not None:
+                return parsed
         return (20.0, 40.0)  # Default range
 
     def should_attempt_flank(self, npc, allies: list, enemies: list) -> bool:
@@ -274,26 +295,41 @@ class NPCAIConfig:
                 return getattr(move, "category", "") == "Offensive"
         return move_l in ("npc_attack", "attack")
 
-    def get_weighted_move_bonus(self, npc, move_name: str) -> int:
-        """Get bonus weight for a move based on AI config.
-
-        Args:
-            npc: The NPC selecting the move
-            move_name: Name of the move being considered
+    @contextmanager
+    def move_selection(self, npc):
+        """Scope one NPC's move selection.
 
-        Returns:
-            Weight bonus (0 = no change, positive = increase weight, negative = decrease)
+        Everything ``get_weighted_move_bonus`` looks at except the move name --
+        the NPC's health, its target's facing, the flanking range -- is the
+        same for every move the NPC weighs, so inside this scope it is worked
+        out once instead of once per move. Outside the scope every call
+        computes afresh.
         """
-        bonus = 0
-
-        move_l = move_name.lower()
+        previous = getattr(self, "_selection", None)
+        self._selection = (npc, None)
+        try:
+            yield self
+        finally:
+            self._selection = previous
 
-        # Bonus for retreat moves when health is low
-        if self.should_attempt_retreat(npc):
-            if move_l in ["withdraw", "dodge", "parry", "npc_rest"]:
-                bonus += 3
+    def _bonus_situation(self, npc) -> Tuple[bool, Optional[str]]:
+        """The move-independent part of the bonus: (retreating, flank mode).
 
-        # Bonus for flanking moves when conditions are right
+        Flank mode is ``"press"`` (already on the target's flank),
+        ``"reposition"`` (facing it head-on, flanking worthwhile),
+        ``"proximity"`` (no coordinates; use the distance-band heuristic) or
+        None.
+        """
+        selection = getattr(self, "_selection", None)
+        if selection is not None and selection[0] is npc:
+            if selection[1] is None:
+                self._selection = (npc, self._compute_bonus_situation(npc))
+            return self._selection[1]
+        return self._compute_bonus_situation(npc)
+
+    def _compute_bonus_situation(self, npc) -> Tuple[bool, Optional[str]]:
+        retreating = self.should_attempt_retreat(npc)
+        flank = None
         if self.is_flanking_enabled() and getattr(npc, "target", None):
             target = npc.target
             angle_diff = self.get_current_angle_diff(npc, target)
@@ -301,31 +337,61 @@ class NPCAIConfig:
             if angle_diff is not None:
                 # Real positional data: steer the NPC by the target's true facing.
                 if angle_diff > self.get_flanking_threshold():
-                    # Already on the target's flank/rear — press the attack to
-                    # cash in the positional damage/accuracy bonus.
-                    if self._move_is_offensive(npc, move_name):
-                        bonus += 2
+                    flank = "press"
                 else:
-                    # Facing the target head-on. If flanking is worthwhile, reward
-                    # the moves that actually reposition to the target's blind side.
                     allies, enemies = self._derive_combat_sides(npc)
                     if self.should_attempt_flank(npc, allies, enemies):
-                        if move_l == "flanking maneuver":
-                            bonus += 3
-                        elif move_l in ["advance", "tactical positioning"]:
-                            bonus += 2
+                        flank = "reposition"
             else:
                 # No coordinate data (legacy proximity-only combat): fall back to
-                # the distance-band heuristic.
-                if move_l in ["advance", "npc_attack", "tactical positioning"]:
-                    if (
-                        hasattr(npc, "combat_proximity")
-                        and target in npc.combat_proximity
-                    ):
-                        distance = npc.combat_proximity[target]
-                        min_range, max_range = self.get_flanking_distance_range()
-                        if min_range <= distance <= max_range:
-                            bonus += 2
+                # the distance-band heuristic, checked per move below.
+                flank = "proximity"
+        return retreating, flank
+
+    def _in_flanking_band(self, npc) -> bool:
+        target = npc.target
+        if hasattr(npc, "combat_proximity") and target in npc.combat_proximity:
+            distance = npc.combat_proximity[target]
+            min_range, max_range = self.get_flanking_distance_range()
+            return min_range <= distance <= max_range
+        return False
+
+    def get_weighted_move_bonus(self, npc, move_name: str) -> int:
+        """Get bonus weight for a move based on AI config.
+
+        Args:
+            npc: The NPC selecting the move
+            move_name: Name of the move being considered
+
+        Returns:
+            Weight bonus (0 = no change, positive = increase weight, negative = decrease)
+        """
+        bonus = 0
+        move_l = move_name.lower()
+        retreating, flank = self._bonus_situation(npc)
+
+        # Bonus for retreat moves when health is low
+        if retreating and move_l in _RETREAT_MOVES:
+            bonus += 3
+
+        if flank == "press":
+            # Already on the target's flank/rear — press the attack to
+            # cash in the positional damage/accuracy bonus.
+            if self._move_is_offensive(npc, move_name):
+                bonus += 2
+        elif flank == "reposition":
+            # Facing the target head-on and flanking is worthwhile: reward
+            # the moves that actually reposition to the target's blind side.
+            if move_l == "flanking maneuver":
+                bonus += 3
+            elif move_l in _REPOSITION_MOVES:
+                bonus += 2
+        elif (
+            flank == "proximity"
+            and move_l in _PROXIMITY_FLANK_MOVES
+            and self._in_flanking_band(npc)
+        ):
+            bonus += 2
 
         return bonus
 
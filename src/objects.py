@@ -1,8 +1,8 @@
 from __future__ import annotations
 import random
-import time
 import src.states as states
 from src.narration import colored, cprint, narrate
+from src.headless import pause
 
 import src.functions as functions
 from src.player import Player
@@ -204,7 +204,7 @@ class WallSwitch(Object):
 
     def press(self):
         narrate("Jean hears a faint 'click.'")
-        time.sleep(0.5)
+        pause(0.5)
         if not self.position:
             self.position = True
             if self.event_on is not None:
@@ -477,7 +477,7 @@ class Container(Object):
 
         if self.state == "closed":
             narrate(f"The {self.nickname} creaks eerily.")
-            time.sleep(0.5)
+            pause(0.5)
             narrate("The lid lifts back on the hinge, revealing the contents inside.")
             self.revealed = True
             self.state = "opened"
@@ -688,14 +688,14 @@ class Shrine(Object):
 
     def pray(self, player):
         narrate("Jean kneels down and begins to pray for intercession.")
-        time.sleep(random.randint(3, 10))
+        pause(random.randint(3, 10))
 
         # Robustly handle missing prayer_msg
         prayer_messages = getattr(player, "prayer_msg", ["Jean prays silently."])
         selection = random.randint(0, len(prayer_messages) - 1)
         narrate(prayer_messages[selection])
         if getattr(self, "event", None) is not None:
-            time.sleep(random.randint(3, 10))
+            pause(random.randint(3, 10))
             self.event.process()
             self.event = None
         functions.await_input()
@@ -736,13 +736,13 @@ class HealingSpring(Object):
         narrate(
             "Jean bends down to the water and, cupping it in his hands, begins to sip eagerly."
         )
-        time.sleep(2)
+        pause(2)
         narrate("The water is cool and refreshing as it goes down his throat.")
-        time.sleep(1)
+        pause(1)
         cprint("HP restored!", "green")
         player.hp = player.maxhp
         if self.event is not None:
-            time.sleep(2)
+            pause(2)
             self.event.process()
             self.event = None
         functions.await_input()
@@ -750,11 +750,11 @@ class HealingSpring(Object):
     @staticmethod
     def clean(player):
         narrate("Jean summarily begins washing himself in the cool water of the spring.")
-        time.sleep(2)
+        pause(2)
         narrate(
             "Jean closes his eyes for a moment, enjoying the feeling of simple cleanliness."
         )
-        time.sleep(1)
+        pause(1)
         cprint("Jean now has Clean status!", "green")
         player.apply_state(states.Clean(player))
 
@@ -835,7 +835,7 @@ class Passageway(Object):
         if self.teleport_map and self.teleport_tile:
             _ref = self.build_article_phrase(self.name)
             narrate(f"Jean steps through {_ref}...")
-            time.sleep(0.5)
+            pause(0.5)
             self._commit_teleport(player)
         else:
             narrate(
@@ -902,13 +902,13 @@ class MarketBell(Object):
     def ring(self):
         """Player rings the bell. If an event is attached, process it. Otherwise provide a simple cue."""
         cprint("Jean reaches up and rings the bell.", color="cyan")
-        time.sleep(0.4)
+        pause(0.4)
         narrate(
             "A clear, bright tone rings through the arcade, briefly carrying above the market din."
         )
         if self.event is not None:
             # process and clear non-repeat events; instantiate_event handles repeat flag behavior
-            time.sleep(0.6)
+            pause(0.6)
             self.event.process()
             # if the event was non-repeat it will typically be consumed; mirror Shrine behavior by clearing
             try:
@@ -950,9 +950,9 @@ class Fountain(Object):
             "Jean cups some water from the fountain and takes a cool sip.",
             "cyan",
         )
-        time.sleep(0.5)
+        pause(0.5)
         if self.event:
-            time.sleep(0.5)
+            pause(0.5)
             self.event.process()
             if not getattr(self.event, "repeat", False):
                 self.event = None
@@ -1093,7 +1093,7 @@ class NoticeBoard(Object):
         for note in self.notes:
             narrate(f"  - {note}")
         if self.event and (not self._read_once or getattr(self.event, "repeat", False)):
-            time.sleep(0.3)
+            pause(0.3)
             self.event.process()
             if not getattr(self.event, "repeat", False):
                 self._read_once = True
@@ -1139,11 +1139,11 @@ class PrayerCandleRack(Object):
 
     def pray(self):
         narrate("Jean bows his head silently before the little flames.")
-        time.sleep(5)
+        pause(5)
         narrate(
             "A strange feeling fills his chest, as if there's a tune he can't quite remember."
         )
-        time.sleep(0.5)
+        pause(0.5)
         if getattr(self, "event", None):
             self.event.process()
             if not getattr(self.event, "repeat", False):
@@ -1177,14 +1177,14 @@ class MarketGong(Object):
             "Jean swings the mallet into the gong with a resonant BOOOONG...",
             "cyan",
         )
-        time.sleep(0.7)
+        pause(0.7)
         narrate("The deep tone rolls outward and slowly fades.")
-        time.sleep(1)
+        pause(1)
         narrate(
             "Some nearby shoppers glance over, momentarily distracted. More than a few wear a confused expression."
         )
         if self.event:
-            time.sleep(0.4)
+            pause(0.4)
             self.event.process()
             if not getattr(self.event, "repeat", False):
                 self.event = None
@@ -1258,20 +1258,20 @@ class GeminateGeode(Object):
         narrate(
             "\nJean places the blue crystal in the first depression. The vein above it pulses."
         )
-        time.sleep(1)
+        pause(1)
         narrate(
             "The amber stone settles into the second. A harmonic hum begins, low and resonant."
         )
-        time.sleep(1)
+        pause(1)
         narrate("The pale grey fragment locks into the third.")
-        time.sleep(0.5)
+        pause(0.5)
         narrate("\nA sound like a struck bell fills the chamber — the geode cracks open.")
-        time.sleep(1)
+        pause(1)
         narrate(
             "Inside: a stone pauldron, inlaid with the same tricolor veins as the walls. "
             "Still luminous."
         )
-        time.sleep(1)
+        pause(1)
         for cls, _name in self._INGREDIENT_DEFS:
             self._remove_ingredient(cls)
         if self.tile:
@@ -376,6 +376,8 @@ maintenant et à l'heure de notre mort. Amen.""",
         state.pop("_combat_adapter", None)
         # Transient API-layer suggestion state — regenerated each session, not part of the save
         state.pop("suggestions_paused", None)
+        # Derived refresh_stat_bonuses() cache (see Combatant.__getstate__)
+        state.pop("_stat_bonus_cache", None)
         return state
 
     def get_hp_pcnt(self):
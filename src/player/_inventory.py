@@ -1,13 +1,13 @@
 """Inventory mixin for Player — item management, equipping, and weight tracking."""
 
 import random
-import time
 
 import src.items as items  # type: ignore
 import src.functions as functions  # type: ignore
 from src.functions import stack_inv_items
 from src.universe import tile_exists as tile_exists
 from src.narration import cprint, narrate
+from src.headless import pause
 
 
 class PlayerInventoryMixin:
@@ -68,11 +68,11 @@ class PlayerInventoryMixin:
                     item=getattr(item, "name", str(item))
                 )
                 narrate(msg)
-                time.sleep(0.15)
+                pause(0.15)
                 dropped = True
         if dropped:
             # brief pause after dropping sequence for readability
-            time.sleep(0.25)
+            pause(0.25)
 
     def equip_item(self, phrase="", item_object=None):
         """Equip an item by phrase match or a direct item object.
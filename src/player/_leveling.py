@@ -2,6 +2,7 @@
 
 import random
 
+import src.skilltree as skilltree  # type: ignore
 from src.combatant import exp_needed_for_level  # type: ignore
 from src.narration import cprint
 
@@ -103,7 +104,11 @@ class PlayerLevelingMixin:
         }
 
     def learn_skill(self, skill):
-        """Add skill to known_moves if not already known. Returns the skill."""
+        """Add skill to known_moves if not already known. Returns the skill.
+
+        A skill-tree entry is a prototype shared by every player, so Jean
+        learns his own instance of it instead.
+        """
         success = True
         for move in self.known_moves:
             if move.name == skill.name:
@@ -111,6 +116,7 @@ class PlayerLevelingMixin:
                 break
         if success:
             cprint("Jean learned {}!".format(skill.name), "magenta")
+            skill = skilltree.bind(skill, self)
             self.known_moves.append(skill)
         return skill
         # if not success, Jean already knows the skill so no need to do anything!
@@ -32,6 +32,11 @@ class PlayerMovementMixin:
                 tile = tile_exists(area, x, y)
                 if tile:
                     self.map = area
+                    # Lazy universes track which maps are in use so the ones
+                    # left behind can be paged out (no-op for eager maps).
+                    touch_map = getattr(self.universe, "touch_map", None)
+                    if callable(touch_map):
+                        touch_map(area)
                     self.universe.game_tick += 1
                     self.location_x = x
                     self.location_y = y
@@ -1,8 +1,8 @@
 """World-admin mixin for Player — merchant refresh and shop management."""
 
-import time
 
 from src.narration import cprint
+from src.headless import pause
 
 
 class PlayerWorldMixin:
@@ -40,6 +40,11 @@ class PlayerWorldMixin:
         for game_map in getattr(self.universe, "maps", []):  # each map is a dict
             if not isinstance(game_map, dict):
                 continue
+            # Skip lazy maps that aren't built or are paged out: building them
+            # just to restock would defeat lazy loading, and a never-built map
+            # gets fresh stock when it is first entered anyway.
+            if not getattr(game_map, "resident", True):
+                continue
             for coord, tile in game_map.items():
                 if coord == "name":
                     continue
@@ -103,4 +108,4 @@ class PlayerWorldMixin:
             for name, err in failures[:10]:
                 cprint(f" - {name}: {err}", "red")
         # Small pause for readability in interactive sessions
-        time.sleep(0.1)
+        pause(0.1)
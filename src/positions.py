@@ -809,6 +809,92 @@ def recalculate_proximity_dict(unit: Any, all_combatants: List[Any]) -> Dict[Any
     return proximity
 
 
+_ROUNDED_ROOTS: Dict[int, int] = {}
+
+
+def _rounded_distance(dx: int, dy: int) -> int:
+    """``distance_from_coords`` for a coordinate delta, memoized by dx² + dy².
+
+    Grid coordinates are integers, so on a 100×100 grid there are at most
+    ~20k distinct squared distances; each is rooted once per process.
+    """
+    d2 = dx * dx + dy * dy
+    d = _ROUNDED_ROOTS.get(d2)
+    if d is None:
+        d = _ROUNDED_ROOTS[d2] = int(round(math.sqrt(d2)))
+    return d
+
+
+class SpatialIndex:
+    """Index of combatant positions with cached pairwise distances.
+
+    Rebuilding every ``combat_proximity`` dict from scratch at the start of
+    every beat is O(n²) square roots even though a beat typically moves one
+    or two units. The index remembers where each unit was at the last
+    :meth:`sync`; only units whose coordinates changed -- whether their
+    ``combat_position`` was replaced (``move_toward`` and friends return new
+    positions) or edited in place (Swap Places) -- have their row and column
+    of the distance table recomputed.
+    """
+
+    def __init__(self):
+        self._where: Dict[Any, Tuple[int, int]] = {}
+        self._rows: Dict[Any, Dict[Any, int]] = {}
+        self._roster: Tuple[Any, ...] = ()
+
+    def sync(self, units: List[Any]) -> List[Any]:
+        """Bring the index up to date with ``units``; return the units that moved.
+
+        Units without a ``combat_position`` are ignored (and dropped if they
+        had one before). A change of roster -- a unit joining, leaving or the
+        order changing -- rebuilds every row so each row keeps the roster's
+        order, exactly as :func:`recalculate_proximity_dict` produces it.
+        """
+        roster = []
+        moved = []
+        for unit in units:
+            pos = getattr(unit, "combat_position", None)
+            if pos is None:
+                continue
+            roster.append(unit)
+            xy = (pos.x, pos.y)
+            if self._where.get(unit) != xy:
+                self._where[unit] = xy
+                moved.append(unit)
+        roster = tuple(roster)
+
+        if roster != self._roster:
+            present = set(roster)
+            for unit in [u for u in self._where if u not in present]:
+                del self._where[unit]
+            self._roster = roster
+            self._rows = {}
+            for unit in roster:
+                x, y = self._where[unit]
+                row = self._rows[unit] = {}
+                for other in roster:
+                    if other is not unit:
+                        ox, oy = self._where[other]
+                        row[other] = _rounded_distance(x - ox, y - oy)
+            return list(roster)
+
+        for unit in moved:
+            x, y = self._where[unit]
+            row = self._rows[unit]
+            for other in row:
+                ox, oy = self._where[other]
+                row[other] = self._rows[other][unit] = _rounded_distance(x - ox, y - oy)
+        return moved
+
+    def proximity(self, unit: Any) -> Dict[Any, int]:
+        """A fresh ``combat_proximity`` dict for ``unit`` (empty if unindexed)."""
+        return dict(self._rows.get(unit, {}))
+
+    def distance(self, a: Any, b: Any) -> Optional[int]:
+        """Cached distance between two indexed units, or None."""
+        return self._rows.get(a, {}).get(b)
+
+
 # ============================================================================
 # Combat Initialization
 # ============================================================================
@@ -901,8 +987,11 @@ def initialize_combat_positions(
 
     # Update proximity dicts for backward compatibility
     all_combatants = allies + enemies
+    index = SpatialIndex()
+    index.sync(all_combatants)
     for unit in all_combatants:
-        unit.combat_proximity = recalculate_proximity_dict(unit, all_combatants)
+        if unit.combat_position is not None:
+            unit.combat_proximity = index.proximity(unit)
 
 
 def _spawn_units_in_zone(
@@ -1117,5 +1206,6 @@ __all__ = [
     "nearest_flank_bearing",
     "turn_toward",
     "recalculate_proximity_dict",
+    "SpatialIndex",
     "initialize_combat_positions",
 ]
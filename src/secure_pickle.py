@@ -35,9 +35,12 @@ import os
 import types
 import struct
 import hashlib
+import lzma
+import zlib
 import pickle
 import logging
 import importlib
+import threading
 import pkgutil
 from collections import Counter
 
@@ -63,6 +66,27 @@ HEADER_VERSION = 1
 _HEADER_STRUCT = struct.Struct(">4sB32s")  # magic, version, sha256 digest
 HEADER_SIZE = _HEADER_STRUCT.size  # 37 bytes
 
+# Version 2 is compressed and chunked so neither side ever holds the pickle,
+# its compressed form and a verified copy all at once:
+#   [4 magic][1 version=2][1 codec][8 pickle length]
+#   then frames of [4 size][32 digest][size bytes of compressed stream],
+#   ending with a size-0 frame. Each digest is sha256(previous digest + frame
+#   bytes), seeded from the header, so frames can't be dropped, reordered or
+#   spliced in from another save; the end frame hashes in the pickle length.
+# The loader verifies each frame before the unpickler sees a byte of it, and
+# refuses a save whose declared length is over the size cap before any opcode
+# runs. Version 1 and headerless saves still load.
+CHUNKED_HEADER_VERSION = 2
+_CHUNKED_HEADER_STRUCT = struct.Struct(">4sBBQ")  # magic, version, codec, pickle length
+_FRAME_STRUCT = struct.Struct(">I32s")  # compressed size, chained sha256
+SAVE_CHUNK_SIZE = 64 * 1024  # compressed bytes per frame
+SAVE_CODECS = {"zlib": 1, "lzma": 2}
+DEFAULT_SAVE_CODEC = "zlib"
+# zlib level 1 shrinks a full-game save about 3.4x for a third of the CPU of
+# the default level 6, which only gets it to 4x; lzma gets 5x but costs more
+# than the pickling itself.
+_ZLIB_LEVEL = 1
+
 
 class RestrictedUnpicklingError(pickle.UnpicklingError):
     """Raised in strict mode when a class is not on the allow-list."""
@@ -89,8 +113,8 @@ LEGACY_BARE_MODULES = frozenset({
     "_unpickle_worker",
     "actions", "animations", "combat_event_config", "combatant",
     "config_manager", "coordinate_config", "enchant_tables", "events",
-    "functions", "genericng", "interface", "inventory_utils", "items",
-    "loot_tables", "map_placeholders", "moves", "narration", "npc",
+    "functions", "genericng", "headless", "interface", "inventory_utils",
+    "items", "loot_tables", "map_placeholders", "moves", "narration", "npc",
     "npc_ai_config", "objects", "positions", "save_format",
     "secure_pickle", "shop_conditions", "skilltree", "states", "story",
     "tiles", "tilesets", "universe", "player",
@@ -419,44 +443,209 @@ def has_integrity_header(data):
     return len(data) >= 4 and data[:4] == HEADER_MAGIC
 
 
+def _is_chunked(data):
+    return has_integrity_header(data) and len(data) > 4 and data[4] == CHUNKED_HEADER_VERSION
+
+
+def _v1_payload_offset(data):
+    """Validate the version 1 header on ``data``; return where the pickle starts."""
+    if len(data) < HEADER_SIZE:
+        raise SaveIntegrityError("Save header is truncated")
+    _magic, version, digest = _HEADER_STRUCT.unpack_from(data)
+    if version != HEADER_VERSION:
+        raise SaveIntegrityError(
+            f"Unsupported save header version {version} "
+            f"(expected {HEADER_VERSION} or {CHUNKED_HEADER_VERSION})"
+        )
+    if hashlib.sha256(memoryview(data)[HEADER_SIZE:]).digest() != digest:
+        raise SaveIntegrityError("Save checksum mismatch (file tampered or corrupt)")
+    return HEADER_SIZE
+
+
 def verify_and_strip_header(data):
     """Return the pickle payload from ``data``, validating the header if present.
 
     Headerless data (legacy saves) is returned unchanged. When the magic is
-    present the version and sha256 digest are checked; a mismatch or truncated
-    header raises :class:`SaveIntegrityError`.
+    present the version and sha256 digest(s) are checked, and a version 2 save
+    is decompressed; a mismatch or truncated header raises
+    :class:`SaveIntegrityError`.
     """
     if not has_integrity_header(data):
         return data  # legacy headerless save
-    if len(data) < HEADER_SIZE:
-        raise SaveIntegrityError("Save header is truncated")
-    _magic, version, digest = _HEADER_STRUCT.unpack(data[:HEADER_SIZE])
-    if version != HEADER_VERSION:
-        raise SaveIntegrityError(
-            f"Unsupported save header version {version} (expected {HEADER_VERSION})"
+    if _is_chunked(data):
+        fp = io.BytesIO(data)
+        reader = _open_chunked(fp, b"", None)
+        payload = reader.readall()
+        reader.finish()
+        return payload
+    return data[_v1_payload_offset(data):]
+
+
+class ChunkedSaveWriter:
+    """Write-only stream that packs a pickle into a version 2 save.
+
+    Hand it to a ``pickle.Pickler`` and call :meth:`finish` once the dump is
+    complete. The pickle is compressed as it is written, so only its
+    compressed form is ever held in memory.
+    """
+
+    def __init__(self, codec=DEFAULT_SAVE_CODEC):
+        if codec not in SAVE_CODECS:
+            raise ValueError(
+                f"Unknown save codec {codec!r} (expected one of {sorted(SAVE_CODECS)})"
+            )
+        self._codec = SAVE_CODECS[codec]
+        self._compressor = zlib.compressobj(_ZLIB_LEVEL) if codec == "zlib" else lzma.LZMACompressor()
+        self._compressed = bytearray()
+        self._length = 0
+
+    def write(self, data):
+        self._length += len(data)
+        self._compressed += self._compressor.compress(data)
+        return len(data)
+
+    def finish(self):
+        """Close the stream and return the framed save bytes."""
+        self._compressed += self._compressor.flush()
+        header = _CHUNKED_HEADER_STRUCT.pack(
+            HEADER_MAGIC, CHUNKED_HEADER_VERSION, self._codec, self._length
         )
-    payload = data[HEADER_SIZE:]
-    if hashlib.sha256(payload).digest() != digest:
-        raise SaveIntegrityError("Save checksum mismatch (file tampered or corrupt)")
-    return payload
+        parts = [header]
+        chain = hashlib.sha256(header).digest()
+        compressed = memoryview(self._compressed)
+        for start in range(0, len(compressed), SAVE_CHUNK_SIZE):
+            frame = compressed[start:start + SAVE_CHUNK_SIZE]
+            chain = hashlib.sha256(chain + frame).digest()
+            parts.append(_FRAME_STRUCT.pack(len(frame), chain))
+            parts.append(frame)
+        chain = hashlib.sha256(chain + self._length.to_bytes(8, "big")).digest()
+        parts.append(_FRAME_STRUCT.pack(0, chain))
+        return b"".join(parts)
+
+
+class _ChunkedSaveReader(io.RawIOBase):
+    """Readable stream of the pickle inside a version 2 save.
+
+    Frames are read from the save one at a time and each is checked against
+    its chained digest before it is decompressed, so corrupt bytes never reach
+    the unpickler. Call :meth:`finish` once unpickling is done to verify the
+    rest of the save.
+    """
+
+    def __init__(self, fp, header, max_bytes):
+        super().__init__()
+        _magic, _version, codec, length = _CHUNKED_HEADER_STRUCT.unpack(header)
+        if codec == SAVE_CODECS["zlib"]:
+            self._decompressor = zlib.decompressobj()
+        elif codec == SAVE_CODECS["lzma"]:
+            self._decompressor = lzma.LZMADecompressor()
+        else:
+            raise SaveIntegrityError(f"Unsupported save codec {codec} in a v2 header")
+        if max_bytes is not None and length > max_bytes:
+            raise SaveTooLargeError(
+                f"Save payload of {length} bytes exceeds the {max_bytes}-byte cap"
+            )
+        self._fp = fp
+        self._max_bytes = max_bytes
+        self._stored = len(header)
+        self._length = length
+        self._remaining = length
+        self._chain = hashlib.sha256(header).digest()
+        self._buffer = memoryview(b"")
+        self._done = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            if self._done:
+                return 0
+            self._buffer = memoryview(self._next_frame())
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def finish(self):
+        """Verify the frames the unpickler didn't need, then the end of the save."""
+        while not self._done:
+            self._next_frame()
+        if self._fp.read(1):
+            raise SaveIntegrityError("Save has trailing data after its end frame")
+
+    def _read_exact(self, size):
+        data = self._fp.read(size)
+        if len(data) != size:
+            raise SaveIntegrityError("Save is truncated")
+        self._stored += size
+        if self._max_bytes is not None and self._stored > self._max_bytes:
+            raise SaveTooLargeError(
+                f"Save of more than {self._max_bytes} bytes exceeds the size cap"
+            )
+        return data
+
+    def _next_frame(self):
+        size, digest = _FRAME_STRUCT.unpack(self._read_exact(_FRAME_STRUCT.size))
+        if size > SAVE_CHUNK_SIZE:
+            raise SaveIntegrityError(f"Save frame of {size} bytes is oversized")
+        data = self._read_exact(size) if size else self._length.to_bytes(8, "big")
+        chain = hashlib.sha256(self._chain + data).digest()
+        if chain != digest:
+            raise SaveIntegrityError("Save checksum mismatch (file tampered or corrupt)")
+        self._chain = chain
+        if not size:
+            if self._remaining or not self._decompressor.eof or self._decompressor.unused_data:
+                raise SaveIntegrityError("Save payload does not match its declared length")
+            self._done = True
+            return b""
+        try:
+            out = self._decompressor.decompress(data, self._remaining + 1)
+        except (zlib.error, lzma.LZMAError, EOFError) as exc:
+            raise SaveIntegrityError(f"Save payload failed to decompress: {exc}") from exc
+        if len(out) > self._remaining:
+            raise SaveIntegrityError("Save payload is longer than its header declares")
+        self._remaining -= len(out)
+        return out
+
+
+def _open_chunked(fp, prefix, max_bytes):
+    """Read the rest of a version 2 header from ``fp`` and return its reader."""
+    header = prefix + fp.read(_CHUNKED_HEADER_STRUCT.size - len(prefix))
+    if len(header) < _CHUNKED_HEADER_STRUCT.size:
+        raise SaveIntegrityError("Save header is truncated")
+    return _ChunkedSaveReader(fp, header, max_bytes)
 
 
-def serialize_for_save(obj, *, protocol=pickle.HIGHEST_PROTOCOL):
-    """Pickle ``obj`` and wrap it in the integrity header for a new save."""
-    return add_integrity_header(pickle.dumps(obj, protocol))
+def serialize_for_save(obj, *, protocol=pickle.HIGHEST_PROTOCOL, codec=DEFAULT_SAVE_CODEC):
+    """Pickle ``obj`` into a new save.
+
+    Writes a compressed version 2 save, or a version 1 save (header + plain
+    pickle) when ``codec`` is None.
+    """
+    if codec is None:
+        return add_integrity_header(pickle.dumps(obj, protocol))
+    writer = ChunkedSaveWriter(codec)
+    pickle.Pickler(writer, protocol).dump(obj)
+    return writer.finish()
 
 
 def safe_pickle_load(fp, *, strict=None, max_bytes=DEFAULT_MAX_SAVE_BYTES,
-                     events=None):
+                     events=None, unpickler=None):
     """Deserialize a save payload with size capping and gated class resolution.
 
-    Accepts both new header-wrapped saves and legacy headerless pickles.
+    Accepts version 2 (compressed, chunked) and version 1 header-wrapped saves
+    as well as legacy headerless pickles. A version 2 save is verified and
+    decompressed frame by frame as the unpickler reads it, never whole.
 
     Args:
         fp: A binary file-like object positioned at the start of the payload.
         strict: Force strict mode on/off; ``None`` resolves from the env var.
         max_bytes: Reject payloads larger than this (``None`` disables the cap).
+            For version 2 saves this bounds the decompressed pickle too.
         events: Optional list to collect structured diagnostics onto.
+        unpickler: SafeUnpickler subclass to load with (default SafeUnpickler),
+            e.g. ``src.universe.DeltaSaveUnpickler`` for delta saves.
 
     Raises:
         SaveTooLargeError: The payload exceeds ``max_bytes``.
@@ -464,13 +653,24 @@ def safe_pickle_load(fp, *, strict=None, max_bytes=DEFAULT_MAX_SAVE_BYTES,
         RestrictedUnpicklingError: Strict mode rejected a class.
         pickle.UnpicklingError / EOFError: Corrupt payload.
     """
-    raw = fp.read()
+    unpickler = unpickler or SafeUnpickler
+    prefix = fp.read(5)
+    if _is_chunked(prefix):
+        reader = _open_chunked(fp, prefix, max_bytes)
+        obj = unpickler(io.BufferedReader(reader, SAVE_CHUNK_SIZE),
+                        strict=strict, events=events).load()
+        reader.finish()
+        return obj
+    raw = prefix + fp.read()
     if max_bytes is not None and len(raw) > max_bytes:
         raise SaveTooLargeError(
             f"Save payload of {len(raw)} bytes exceeds the {max_bytes}-byte cap"
         )
-    payload = verify_and_strip_header(raw)
-    return SafeUnpickler(io.BytesIO(payload), strict=strict, events=events).load()
+    # Unpickle in place past the header rather than slicing off a copy.
+    payload = io.BytesIO(raw)
+    if has_integrity_header(raw):
+        payload.seek(_v1_payload_offset(raw))
+    return unpickler(payload, strict=strict, events=events).load()
 
 
 # ---------------------------------------------------------------------------
@@ -502,8 +702,222 @@ def _rlimit_preexec(memory_bytes):
     return _apply
 
 
+def _project_root():
+    # This file is at <root>/src/secure_pickle.py; running the worker from the
+    # root lets `-m src._unpickle_worker` resolve regardless of the parent's cwd.
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Framing between SandboxPool and ``src._unpickle_worker --serve``: a ready byte
+# once the worker has imported the engine, then per job a (strict, length)
+# header + save bytes in, and a (status, length) header + body out.
+SANDBOX_READY = b"R"
+SANDBOX_JOB = struct.Struct(">?I")
+SANDBOX_REPLY = struct.Struct(">cI")
+SANDBOX_REPLY_OK = b"O"
+SANDBOX_REPLY_ERROR = b"E"
+
+# Warm workers kept ready per pool, and loads a worker serves before it is
+# replaced. One load per worker keeps the one-process-per-save isolation of the
+# one-shot path (nothing a hostile save does can reach a later load); the pool
+# only moves interpreter start-up and engine import off the critical path.
+DEFAULT_SANDBOX_POOL_SIZE = 1
+DEFAULT_SANDBOX_MAX_JOBS = 1
+
+
+class _SandboxWorker:
+    """One ``--serve`` worker process, used by one load at a time."""
+
+    def __init__(self, memory_bytes):
+        import sys
+        import subprocess
+
+        env = dict(os.environ)
+        env.pop(STRICT_ENV_VAR, None)  # strictness is sent with each job
+        preexec = None
+        if memory_bytes is not None:
+            preexec = _rlimit_preexec(memory_bytes)
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "src._unpickle_worker", "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+            env=env,
+            cwd=_project_root(),
+            preexec_fn=preexec,
+        )
+        self.ready = False
+        self.jobs = 0
+
+    def _read(self, size, deadline):
+        """Read exactly ``size`` bytes before ``deadline``; b"" if the worker died."""
+        import time
+        import selectors
+
+        fd = self.proc.stdout.fileno()
+        chunks = []
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    raise TimeoutError
+                chunk = os.read(fd, size)
+                if not chunk:
+                    return b""
+                chunks.append(chunk)
+                size -= len(chunk)
+        return b"".join(chunks)
+
+    def run(self, data, strict, deadline):
+        """Send one job and return ``(status, body)``.
+
+        Raises TimeoutError past ``deadline`` (including time spent waiting for
+        a worker that is still importing) and SandboxError if the worker dies.
+        """
+        if not self.ready:
+            if self._read(len(SANDBOX_READY), deadline) != SANDBOX_READY:
+                raise self._died()
+            self.ready = True
+        self.jobs += 1
+        try:
+            self.proc.stdin.write(SANDBOX_JOB.pack(bool(strict), len(data)))
+            self.proc.stdin.write(data)
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError) as exc:
+            raise self._died() from exc
+        header = self._read(SANDBOX_REPLY.size, deadline)
+        if not header:
+            raise self._died()
+        status, size = SANDBOX_REPLY.unpack(header)
+        body = self._read(size, deadline) if size else b""
+        if len(body) != size:
+            raise self._died()
+        return status, body
+
+    def _died(self):
+        self.kill()
+        return SandboxError(
+            f"Sandboxed unpickle worker failed (exit {self.proc.returncode}): "
+            "worker exited without replying"
+        )
+
+    def kill(self):
+        if self.proc.poll() is None:
+            self.proc.kill()
+        self.proc.wait()
+        for stream in (self.proc.stdin, self.proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class SandboxPool:
+    """Warm, pre-imported workers for :func:`load_in_subprocess` (POSIX only).
+
+    A one-shot sandbox load pays interpreter start-up plus an import of the
+    whole engine before it unpickles a byte. The pool starts ``size`` workers
+    ahead of time (``python -m src._unpickle_worker --serve``), each already
+    capped to ``memory_bytes`` of address space, so a load only pays for the
+    unpickle itself. A worker is retired after ``max_jobs`` loads, on any
+    failure, or on timeout (it is killed), and a replacement starts warming
+    straight away. Safe to share between threads.
+    """
+
+    def __init__(self, size=DEFAULT_SANDBOX_POOL_SIZE, *,
+                 max_jobs=DEFAULT_SANDBOX_MAX_JOBS,
+                 memory_bytes=DEFAULT_SANDBOX_MEMORY_BYTES):
+        if size < 1 or max_jobs < 1:
+            raise ValueError("SandboxPool needs size >= 1 and max_jobs >= 1")
+        self.size = size
+        self.max_jobs = max_jobs
+        self.memory_bytes = memory_bytes
+        self._idle = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.warm()
+
+    def warm(self):
+        """Start workers until ``size`` are idle."""
+        with self._lock:
+            while not self._closed and len(self._idle) < self.size:
+                self._idle.append(_SandboxWorker(self.memory_bytes))
+
+    def load(self, data, *, timeout=DEFAULT_SANDBOX_TIMEOUT, strict=True):
+        """Unpickle ``data`` in a pooled worker; same contract as load_in_subprocess."""
+        import json
+        import time
+
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            if self._closed:
+                raise SandboxError("Sandbox pool is closed")
+            worker = self._idle.pop(0) if self._idle else None
+        if worker is None:
+            worker = _SandboxWorker(self.memory_bytes)
+        try:
+            status, body = worker.run(data, strict, deadline)
+        except TimeoutError as exc:
+            worker.kill()
+            self.warm()
+            raise SandboxError(
+                f"Sandboxed unpickle exceeded {timeout}s and was terminated"
+            ) from exc
+        except SandboxError:
+            self.warm()
+            raise
+
+        if status == SANDBOX_REPLY_OK and worker.jobs < self.max_jobs:
+            with self._lock:
+                if not self._closed:
+                    self._idle.append(worker)
+                    worker = None
+        if worker is not None:
+            worker.kill()
+        self.warm()
+
+        text = body.decode("utf-8", "replace").strip()
+        if status != SANDBOX_REPLY_OK:
+            raise SandboxError(f"Sandboxed unpickle worker failed: {text}")
+        if not text:
+            raise SandboxError("Sandboxed unpickle worker produced no output")
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as exc:
+            raise SandboxError("Sandboxed unpickle worker returned invalid JSON") from exc
+
+    def close(self):
+        """Stop every idle worker; loads in flight finish and are not pooled."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.kill()
+
+
+_sandbox_pools = {}
+_sandbox_pools_lock = threading.Lock()
+
+
+def sandbox_pool(memory_bytes=DEFAULT_SANDBOX_MEMORY_BYTES):
+    """The process-wide SandboxPool for ``memory_bytes``, started on first use.
+
+    Call it at start-up to have a warm worker ready before the first load.
+    """
+    import atexit
+
+    with _sandbox_pools_lock:
+        pool = _sandbox_pools.get(memory_bytes)
+        if pool is None:
+            pool = _sandbox_pools[memory_bytes] = SandboxPool(memory_bytes=memory_bytes)
+            atexit.register(pool.close)
+        return pool
+
+
 def load_in_subprocess(data, *, timeout=DEFAULT_SANDBOX_TIMEOUT, strict=True,
-                       memory_bytes=DEFAULT_SANDBOX_MEMORY_BYTES):
+                       memory_bytes=DEFAULT_SANDBOX_MEMORY_BYTES, pooled=True):
     """Unpickle ``data`` in an isolated child process and return v2 data.
 
     The child (``src._unpickle_worker``) does the actual unpickling, so any code
@@ -519,6 +933,8 @@ def load_in_subprocess(data, *, timeout=DEFAULT_SANDBOX_TIMEOUT, strict=True,
             since this path exists for untrusted input).
         memory_bytes: Child address-space cap in bytes (POSIX only; ``None``
             disables the cap).
+        pooled: On POSIX, run in a warm :func:`sandbox_pool` worker instead
+            of starting a fresh interpreter for this one load.
 
     Returns:
         The data-only (v2) dict produced by the worker.
@@ -530,6 +946,9 @@ def load_in_subprocess(data, *, timeout=DEFAULT_SANDBOX_TIMEOUT, strict=True,
     import json
     import subprocess
 
+    if pooled and os.name == "posix":
+        return sandbox_pool(memory_bytes).load(data, timeout=timeout, strict=strict)
+
     env = dict(os.environ)
     if strict:
         env[STRICT_ENV_VAR] = "1"
@@ -541,9 +960,7 @@ def load_in_subprocess(data, *, timeout=DEFAULT_SANDBOX_TIMEOUT, strict=True,
     if memory_bytes is not None and os.name == "posix":
         preexec = _rlimit_preexec(memory_bytes)
 
-    # Run from the project root so `-m src._unpickle_worker` resolves regardless
-    # of the parent's cwd (this file is at <root>/src/secure_pickle.py).
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    project_root = _project_root()
     try:
         proc = subprocess.run(
             [sys.executable, "-m", "src._unpickle_worker"],
@@ -34,7 +34,6 @@ subclass.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-import inspect
 import logging
 import random
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Type
@@ -166,14 +165,9 @@ class ShopCondition:
             try:
                 import src.items as items_module  # local import to avoid cycles
 
-                subclasses: List[Type[Item]] = []
-                for _, obj in inspect.getmembers(items_module, inspect.isclass):
-                    if (
-                        obj is not Item
-                        and isinstance(obj, type)
-                        and issubclass(obj, Item)
-                    ):
-                        subclasses.append(obj)
+                subclasses: List[Type[Item]] = list(
+                    items_module.item_registry().subclasses_of(Item)
+                )
             except Exception:  # pragma: no cover - reflection failure fallback
                 subclasses = []
         else:
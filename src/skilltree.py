@@ -1,5 +1,236 @@
+import random
+
 import src.moves as moves
 
+# Learnable skills per category, as move class: exp required. A class can be
+# offered in several categories at different prices (QuickSwap, BullCharge...).
+SKILL_COSTS = {  # todo add more skills
+    "Basic": {  # Basic class skills always gain exp along with the player and
+        # don't need to be called out in an ability
+        moves.Dodge: 100,
+        moves.TacticalPositioning: 1000,
+        moves.StrategicInsight: 500,
+        moves.MasterTactician: 1500,
+        # Mastery skills — require the linked stat > 30 and highest (learnable_when gate)
+        moves.Pulverize: 2500,
+        moves.KillingPrecision: 2500,
+        moves.LightningAssault: 2500,
+        moves.Ironhide: 2500,
+        moves.WarCry: 2500,
+        moves.SecretPlans: 2500,
+        moves.BloodOfMartyrs: 2500,
+        # Note: Turn, Advance, Withdraw are available by default (not in skilltree)
+        # moves.AggressiveStance: 150  # Shift to an aggressive fighting stance; ++str, spd; -fin, end
+        # moves.DefensiveStance: 150  # ++fin, end, -str, fth, cha
+    },
+    "Dagger": {
+        moves.Slash: 15,  # 150
+        moves.QuietMovement: 350,
+        moves.FeintAndPivot: 600,  # HV-1: Attack and reposition behind target (specialized for dual-position attacks)
+        moves.QuickSwap: 450,  # HV-1 Tier 2: Swap with ally (precision timing)
+        moves.Backstab: 300,  # positional bonus damage from flank/behind
+        moves.ShadowStep: 400,  # passive: silent approach
+    },
+    "Bow": {
+        moves.Hawkeye: 450,  # Quick-cast, long-cooldown burst: +40% ranged hit chance for
+        # 30 beats (states.Hawkeye). Priced/costed against AimedShot (500 exp,
+        # +15 flat acc, 25-beat commitment per use) — a 1.4x multiplier is a
+        # stronger effect, so it's gated behind a 60-beat cooldown instead of a
+        # slow cast (see issue #476).
+        moves.TacticalPositioning: 300,  # cheaper than Basic (300 vs 1000): repositioning is the core loop for archers
+        moves.TacticalRetreat: 550,  # HV-1: Move away while maintaining ranged angle (core ranged tactic)
+        moves.FlankingManeuver: 700,  # HV-1: Move to the side of the target to gain advantage (advanced ranged tactic)
+        moves.QuickSwap: 500,  # HV-1 Tier 2: Swap with ally (tactical coordination)
+        moves.EagleEye: 350,  # passive: accuracy at range
+    },
+    "Unarmed": {
+        moves.Jab: 100,  # quick unarmed attack that causes little damage but has a
+        # very low fatigue cost and zero cooldown
+        moves.WhirlAttack: 600,  # HV-1: Spin strike hitting nearby enemies — cheaper than Axe/Bludgeon (no weapon weight to manage)
+        moves.BullCharge: 500,  # HV-1: Charge with momentum (aggressive unarmed style)
+        moves.QuickSwap: 400,  # HV-1 Tier 2: Swap with ally (team-based fighting)
+        moves.IronFist: 450,  # passive: increased unarmed damage — core investment for fists-as-weapons
+        # moves.Kick: 150  # quick leg attack; more damaging than a jab with a higher
+        # fatigue cost and small cooldown
+        # moves.Haymaker: 250  # strong unarmed attack that causes significant damage but has
+        # a high fatigue and cooldown cost, slower cast
+        # moves.Trip: 250  # sweeping leg attack with a 25% chance to trip
+        # humanoid opponents, stunning them
+        # moves.Throw: 250  # unarmed; attempt to toss an opponent, causing moderate damage and
+        # increasing their distance from the player
+        # moves.Combo: 250  # arrange a succession of unarmed attacks against a target.
+        # Each successful hit boosts Heat. A miss or parry breaks the combo.
+        # moves.Disarm: 500  # attempt to disarm the target, causing it to drop its weapon to the ground
+        # moves.Takedown: 500  # instead of a normal parry, this will throw your attacker to the ground,
+        # stunning them
+        # moves.Callous: 250  # while unarmed, glancing blows cause half their normal damage to the player
+        # moves.Footwork: 500  # while unarmed, 15% increased chance for an incoming hit to be
+        # a glancing blow
+        # moves.Attentive: 250  # while using an unarmed attack, you have a 20% chance to
+        # follow it up with an immediate Jab
+        # moves.Spinkick: 350  # hit all enemies within 5 distance, knocking them back and
+        # causing light damage
+    },
+    "Scythe": {
+        moves.PommelStrike: 125,  # quick close-range pommel attack
+        moves.Reap: 250,  # frontal arc hitting all enemies in range
+        moves.ReapersMark: 400,  # mark target for +25% damage on next hit
+        moves.DeathsHarvest: 650,  # draining strike; heals 30% of damage dealt
+        moves.GrimPersistence: 300,  # passive: bonus damage vs targets below 35% HP
+        moves.HauntingPresence: 350,  # passive: unsettling aura
+    },
+    "Axe": {
+        moves.Slash: 50,
+        moves.Parry: 100,
+        moves.BullCharge: 350,  # HV-1: Charge with momentum — axe is lighter than bludgeon, charge flows naturally
+        moves.WhirlAttack: 650,  # HV-1: Spin strike hitting nearby enemies
+        moves.VertigoSpin: 750,  # HV-1: Attack with knockback and rotation
+        moves.QuickSwap: 520,  # HV-1 Tier 2: Swap with ally (defensive formation)
+        moves.CleaveInstinct: 350,  # passive: reduced prep after a kill
+    },
+    "Halberd": {
+        # Essentially an axe on a pole (see items.Halberd) — mirrors the Axe
+        # tree; the extra reach comes from the weapon's own wpnrange, not a
+        # dedicated mastery.
+        moves.Slash: 50,
+        moves.Parry: 100,
+        moves.BullCharge: 350,  # HV-1: Charge with momentum
+        moves.WhirlAttack: 650,  # HV-1: Spin strike hitting nearby enemies
+        moves.VertigoSpin: 750,  # HV-1: Attack with knockback and rotation
+        moves.QuickSwap: 520,  # HV-1 Tier 2: Swap with ally (defensive formation)
+        moves.CleaveInstinct: 350,  # passive: reduced prep after a kill
+    },
+    "Bludgeon": {
+        moves.Parry: 150,  # harder to parry with a heavy weapon than with an axe or sword
+        moves.PowerStrike: 1,
+        moves.BullCharge: 400,  # HV-1: Charge with momentum — managing inertia costs more than with a lighter axe
+        moves.VertigoSpin: 700,  # HV-1: Knockback-heavy positioning move
+        moves.WhirlAttack: 750,  # HV-1: Spin strike — most expensive of the three types (heaviest weapon)
+        moves.QuickSwap: 550,  # HV-1 Tier 2: Swap with ally (heavy tank coordination)
+        moves.HeavyHanded: 350,  # passive: increased stagger on bludgeon hits
+    },
+    "Sword": {
+        moves.Slash: 50,  # basic slashing attack (viable() already covers Sword)
+        moves.Parry: 50,  # foundational to the duelist — cheaper than Axe or Bludgeon
+        moves.Thrust: 250,  # fast piercing attack, lower power, quicker prep
+        moves.DisarmingSlash: 350,  # rattles target; applies Disoriented on hit
+        moves.Riposte: 550,  # counter while Parrying — heat-boosted
+        moves.BladeMastery: 300,  # passive: reduced fatigue on sword attacks
+        moves.CounterGuard: 450,  # passive: reduced fatigue for parrying
+    },
+    "Spear": {
+        moves.Thrust: 50,  # fast piercing thrust (longer range on Spear by weapon stats)
+        moves.PommelStrike: 150,  # close-range fallback
+        moves.KeepAway: 400,  # minor damage + push target back
+        moves.Lunge: 300,  # step-forward + pierce, closes short gaps
+        moves.Impale: 650,  # penetrating thrust ignoring 60% of protection
+        moves.SentinelsVigil: 500,  # passive: range-denial discipline
+    },
+    "Pick": {
+        moves.PommelStrike: 125,  # versatile quick attack
+        moves.ArmorPierce: 250,  # zeroes all protection — powerful enough to cost more than a basic attack
+        moves.ChipAway: 350,  # 3 independent light strikes
+        moves.ExploitWeakness: 450,  # hit + Disoriented state
+        moves.Stupefy: 600,  # heavy pommel; always Disorients on hit
+        moves.WorkTheGap: 350,  # passive: signature pick ability — stacking protection reduction
+    },
+    "Crossbow": {
+        moves.BroadheadBolt: 400,  # heavy bolt, +25 base power
+        moves.AimedShot: 500,  # 25-beat aim, +50% power, +15 accuracy
+        moves.PinningBolt: 600,  # damage + Disoriented on hit
+        moves.QuickReload: 400,  # passive: faster reload — addresses the crossbow's primary weakness, worth the investment
+        moves.MarksmanEye: 250,  # passive: accuracy at range
+    },
+    "Polearm": {
+        moves.OverheadSmash: 250,  # heavy vertical strike, high recoil — stronger opener, priced above basic area attacks
+        moves.Sweep: 300,  # horizontal arc, all enemies in frontal range
+        moves.BullCharge: 350,  # aggressive charge
+        moves.BracePosition: 500,  # defensive polearm stance (Parrying state)
+        moves.HalberdSpin: 700,  # full 360° spin at polearm range
+        moves.ReachMastery: 300,  # passive: range extension
+    },
+}
+
+# One shared, user-less instance per skill class, built on first use. The skill
+# menu only reads a skill's name, description and learnable_when(), none of
+# which depend on who owns the tree, so every Skilltree shares these instead of
+# constructing ~85 moves per player.
+_prototypes = None
+_shared_subtypes = None
+
+
+class _PrototypeOwner:
+    """Stand-in user the shared prototypes are built against.
+
+    Move constructors read a handful of the user's stats and equipment; this
+    carries what a fresh Player starts with, without the inventory, skill tree
+    and world a real Player drags in, and is thrown away once the prototypes
+    are detached from it.
+    """
+
+    name = "Jean"
+    pronouns = {
+        "personal": "he",
+        "possessive": "his",
+        "reflexive": "himself",
+        "intensive": "himself",
+    }
+    strength = finesse = speed = endurance = 10
+    charisma = intelligence = faith = 10
+    weight_tolerance = 20.00
+    weight_current = 0.00
+
+    def __init__(self):
+        import src.items as items  # type: ignore
+
+        self.eq_weapon = items.Fists()
+
+
+def _build_prototypes():
+    global _prototypes, _shared_subtypes
+    prototypes = {}
+    owner = _PrototypeOwner()
+    # Everything a constructor may have copied off the owner (user, target,
+    # the weapon Jab and PowerStrike keep) is cleared again afterwards.
+    owned = {id(owner)} | {id(value) for value in vars(owner).values()}
+    # Some constructors roll dice; building the shared table must not shift the
+    # random stream of whichever game happened to create the first player.
+    rng_state = random.getstate()
+    try:
+        for skills in SKILL_COSTS.values():
+            for move_class in skills:
+                if move_class not in prototypes:
+                    prototype = move_class(owner)
+                    for attr, value in vars(prototype).items():
+                        if id(value) in owned:
+                            setattr(prototype, attr, None)
+                    prototypes[move_class] = prototype
+    finally:
+        random.setstate(rng_state)
+    _shared_subtypes = {
+        category: {prototypes[move_class]: exp for move_class, exp in skills.items()}
+        for category, skills in SKILL_COSTS.items()
+    }
+    _prototypes = prototypes
+
+
+def _subtypes_for():
+    if _shared_subtypes is None:
+        _build_prototypes()
+    return {category: dict(skills) for category, skills in _shared_subtypes.items()}
+
+
+def is_prototype(skill):
+    """True if ``skill`` is one of the shared skill-tree entries rather than an owned move."""
+    return _prototypes is not None and _prototypes.get(type(skill)) is skill
+
+
+def bind(skill, user):
+    """Return ``skill`` as a move ``user`` can own: a fresh instance if it is a shared prototype."""
+    if is_prototype(skill):
+        return type(skill)(user)
+    return skill
+
 
 class Skilltree:
     def __init__(self, user):
@@ -7,227 +238,19 @@ class Skilltree:
         List all learnable skills. When the player gains exp from a specific action, like attacking with a weapon,
         that exp goes into a pool.
         When the player has earned enough exp to learn a skill, he may "buy" the skill from the skill menu.
-        Skills are represented in this format: "Skill_name": exp_required
+        Skills are represented in this format: skill: exp_required, where each skill is a shared prototype
+        move (see SKILL_COSTS); learning one gives the player their own instance via bind().
         """
-        self.subtypes = {  # todo add more skills
-            "Basic": {  # Basic class skills always gain exp along with the player and
-                # don't need to be called out in an ability
-                moves.Dodge(user): 100,
-                moves.TacticalPositioning(user): 1000,
-                moves.StrategicInsight(user): 500,
-                moves.MasterTactician(user): 1500,
-                # Mastery skills — require the linked stat > 30 and highest (learnable_when gate)
-                moves.Pulverize(user): 2500,
-                moves.KillingPrecision(user): 2500,
-                moves.LightningAssault(user): 2500,
-                moves.Ironhide(user): 2500,
-                moves.WarCry(user): 2500,
-                moves.SecretPlans(user): 2500,
-                moves.BloodOfMartyrs(user): 2500,
-                # Note: Turn, Advance, Withdraw are available by default (not in skilltree)
-                # moves.AggressiveStance(user): 150  # Shift to an aggressive fighting stance; ++str, spd; -fin, end
-                # moves.DefensiveStance(user): 150  # ++fin, end, -str, fth, cha
-            },
-            "Dagger": {
-                moves.Slash(user): 15,  # 150
-                moves.QuietMovement(user): 350,
-                moves.FeintAndPivot(
-                    user
-                ): 600,  # HV-1: Attack and reposition behind target (specialized for dual-position attacks)
-                moves.QuickSwap(
-                    user
-                ): 450,  # HV-1 Tier 2: Swap with ally (precision timing)
-                moves.Backstab(user): 300,  # positional bonus damage from flank/behind
-                moves.ShadowStep(user): 400,  # passive: silent approach
-            },
-            "Bow": {
-                moves.Hawkeye(
-                    user
-                ): 450,  # Quick-cast, long-cooldown burst: +40% ranged hit chance for
-                # 30 beats (states.Hawkeye). Priced/costed against AimedShot (500 exp,
-                # +15 flat acc, 25-beat commitment per use) — a 1.4x multiplier is a
-                # stronger effect, so it's gated behind a 60-beat cooldown instead of a
-                # slow cast (see issue #476).
-                moves.TacticalPositioning(
-                    user
-                ): 300,  # cheaper than Basic (300 vs 1000): repositioning is the core loop for archers
-                moves.TacticalRetreat(
-                    user
-                ): 550,  # HV-1: Move away while maintaining ranged angle (core ranged tactic)
-                moves.FlankingManeuver(
-                    user
-                ): 700,  # HV-1: Move to the side of the target to gain advantage (advanced ranged tactic)
-                moves.QuickSwap(
-                    user
-                ): 500,  # HV-1 Tier 2: Swap with ally (tactical coordination)
-                moves.EagleEye(user): 350,  # passive: accuracy at range
-            },
-            "Unarmed": {
-                moves.Jab(
-                    user
-                ): 100,  # quick unarmed attack that causes little damage but has a
-                # very low fatigue cost and zero cooldown
-                moves.WhirlAttack(
-                    user
-                ): 600,  # HV-1: Spin strike hitting nearby enemies — cheaper than Axe/Bludgeon (no weapon weight to manage)
-                moves.BullCharge(
-                    user
-                ): 500,  # HV-1: Charge with momentum (aggressive unarmed style)
-                moves.QuickSwap(
-                    user
-                ): 400,  # HV-1 Tier 2: Swap with ally (team-based fighting)
-                moves.IronFist(
-                    user
-                ): 450,  # passive: increased unarmed damage — core investment for fists-as-weapons
-                # moves.Kick(user): 150  # quick leg attack; more damaging than a jab with a higher
-                # fatigue cost and small cooldown
-                # moves.Haymaker(user): 250  # strong unarmed attack that causes significant damage but has
-                # a high fatigue and cooldown cost, slower cast
-                # moves.Trip(user): 250  # sweeping leg attack with a 25% chance to trip
-                # humanoid opponents, stunning them
-                # moves.Throw(user): 250  # unarmed; attempt to toss an opponent, causing moderate damage and
-                # increasing their distance from the player
-                # moves.Combo(user): 250  # arrange a succession of unarmed attacks against a target.
-                # Each successful hit boosts Heat. A miss or parry breaks the combo.
-                # moves.Disarm(user): 500  # attempt to disarm the target, causing it to drop its weapon to the ground
-                # moves.Takedown(user): 500  # instead of a normal parry, this will throw your attacker to the ground,
-                # stunning them
-                # moves.Callous(user): 250  # while unarmed, glancing blows cause half their normal damage to the player
-                # moves.Footwork(user): 500  # while unarmed, 15% increased chance for an incoming hit to be
-                # a glancing blow
-                # moves.Attentive(user): 250  # while using an unarmed attack, you have a 20% chance to
-                # follow it up with an immediate Jab
-                # moves.Spinkick(user): 350  # hit all enemies within 5 distance, knocking them back and
-                # causing light damage
-            },
-            "Scythe": {
-                moves.PommelStrike(user): 125,  # quick close-range pommel attack
-                moves.Reap(user): 250,  # frontal arc hitting all enemies in range
-                moves.ReapersMark(user): 400,  # mark target for +25% damage on next hit
-                moves.DeathsHarvest(
-                    user
-                ): 650,  # draining strike; heals 30% of damage dealt
-                moves.GrimPersistence(
-                    user
-                ): 300,  # passive: bonus damage vs targets below 35% HP
-                moves.HauntingPresence(user): 350,  # passive: unsettling aura
-            },
-            "Axe": {
-                moves.Slash(user): 50,
-                moves.Parry(user): 100,
-                moves.BullCharge(
-                    user
-                ): 350,  # HV-1: Charge with momentum — axe is lighter than bludgeon, charge flows naturally
-                moves.WhirlAttack(
-                    user
-                ): 650,  # HV-1: Spin strike hitting nearby enemies
-                moves.VertigoSpin(
-                    user
-                ): 750,  # HV-1: Attack with knockback and rotation
-                moves.QuickSwap(
-                    user
-                ): 520,  # HV-1 Tier 2: Swap with ally (defensive formation)
-                moves.CleaveInstinct(user): 350,  # passive: reduced prep after a kill
-            },
-            "Halberd": {
-                # Essentially an axe on a pole (see items.Halberd) — mirrors the Axe
-                # tree; the extra reach comes from the weapon's own wpnrange, not a
-                # dedicated mastery.
-                moves.Slash(user): 50,
-                moves.Parry(user): 100,
-                moves.BullCharge(user): 350,  # HV-1: Charge with momentum
-                moves.WhirlAttack(
-                    user
-                ): 650,  # HV-1: Spin strike hitting nearby enemies
-                moves.VertigoSpin(
-                    user
-                ): 750,  # HV-1: Attack with knockback and rotation
-                moves.QuickSwap(
-                    user
-                ): 520,  # HV-1 Tier 2: Swap with ally (defensive formation)
-                moves.CleaveInstinct(user): 350,  # passive: reduced prep after a kill
-            },
-            "Bludgeon": {
-                moves.Parry(
-                    user
-                ): 150,  # harder to parry with a heavy weapon than with an axe or sword
-                moves.PowerStrike(user): 1,
-                moves.BullCharge(
-                    user
-                ): 400,  # HV-1: Charge with momentum — managing inertia costs more than with a lighter axe
-                moves.VertigoSpin(user): 700,  # HV-1: Knockback-heavy positioning move
-                moves.WhirlAttack(
-                    user
-                ): 750,  # HV-1: Spin strike — most expensive of the three types (heaviest weapon)
-                moves.QuickSwap(
-                    user
-                ): 550,  # HV-1 Tier 2: Swap with ally (heavy tank coordination)
-                moves.HeavyHanded(
-                    user
-                ): 350,  # passive: increased stagger on bludgeon hits
-            },
-            "Sword": {
-                moves.Slash(
-                    user
-                ): 50,  # basic slashing attack (viable() already covers Sword)
-                moves.Parry(
-                    user
-                ): 50,  # foundational to the duelist — cheaper than Axe or Bludgeon
-                moves.Thrust(
-                    user
-                ): 250,  # fast piercing attack, lower power, quicker prep
-                moves.DisarmingSlash(
-                    user
-                ): 350,  # rattles target; applies Disoriented on hit
-                moves.Riposte(user): 550,  # counter while Parrying — heat-boosted
-                moves.BladeMastery(
-                    user
-                ): 300,  # passive: reduced fatigue on sword attacks
-                moves.CounterGuard(user): 450,  # passive: reduced fatigue for parrying
-            },
-            "Spear": {
-                moves.Thrust(
-                    user
-                ): 50,  # fast piercing thrust (longer range on Spear by weapon stats)
-                moves.PommelStrike(user): 150,  # close-range fallback
-                moves.KeepAway(user): 400,  # minor damage + push target back
-                moves.Lunge(user): 300,  # step-forward + pierce, closes short gaps
-                moves.Impale(
-                    user
-                ): 650,  # penetrating thrust ignoring 60% of protection
-                moves.SentinelsVigil(user): 500,  # passive: range-denial discipline
-            },
-            "Pick": {
-                moves.PommelStrike(user): 125,  # versatile quick attack
-                moves.ArmorPierce(
-                    user
-                ): 250,  # zeroes all protection — powerful enough to cost more than a basic attack
-                moves.ChipAway(user): 350,  # 3 independent light strikes
-                moves.ExploitWeakness(user): 450,  # hit + Disoriented state
-                moves.Stupefy(user): 600,  # heavy pommel; always Disorients on hit
-                moves.WorkTheGap(
-                    user
-                ): 350,  # passive: signature pick ability — stacking protection reduction
-            },
-            "Crossbow": {
-                moves.BroadheadBolt(user): 400,  # heavy bolt, +25 base power
-                moves.AimedShot(user): 500,  # 25-beat aim, +50% power, +15 accuracy
-                moves.PinningBolt(user): 600,  # damage + Disoriented on hit
-                moves.QuickReload(
-                    user
-                ): 400,  # passive: faster reload — addresses the crossbow's primary weakness, worth the investment
-                moves.MarksmanEye(user): 250,  # passive: accuracy at range
-            },
-            "Polearm": {
-                moves.OverheadSmash(
-                    user
-                ): 250,  # heavy vertical strike, high recoil — stronger opener, priced above basic area attacks
-                moves.Sweep(user): 300,  # horizontal arc, all enemies in frontal range
-                moves.BullCharge(user): 350,  # aggressive charge
-                moves.BracePosition(
-                    user
-                ): 500,  # defensive polearm stance (Parrying state)
-                moves.HalberdSpin(user): 700,  # full 360° spin at polearm range
-                moves.ReachMastery(user): 300,  # passive: range extension
-            },
-        }
+        self.subtypes = _subtypes_for()
+
+    def __getstate__(self):
+        # The tree is fully determined by SKILL_COSTS; don't pickle the moves.
+        state = dict(self.__dict__)
+        state["subtypes"] = None
+        return state
+
+    def __setstate__(self, state):
+        # Older saves carry per-player move instances here; either way the
+        # shared table is rebuilt rather than trusted.
+        self.__dict__.update(state)
+        self.subtypes = _subtypes_for()
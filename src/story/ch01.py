@@ -12,7 +12,7 @@ from src.narration import (
     exit_op,
     react,
 )
-import time
+from src.headless import pause
 import random
 
 from src.events import Event
@@ -264,7 +264,7 @@ heard. """
             if room_object == wall_switch:
                 self.tile.objects_here.remove(room_object)
                 break
-        time.sleep(0.5)
+        pause(0.5)
         # Delay event dialog to prevent player from moving before understanding the exit is open
         self.delay_duration = 2000  # milliseconds
         self.delay_mode = "exploration"
@@ -310,7 +310,7 @@ class Ch01BridgeWall(Event):
             if room_object == wall_switch:
                 self.tile.objects_here.remove(room_object)
                 break
-        time.sleep(0.5)
+        pause(0.5)
         # Delay event dialog to prevent player from moving before understanding the exit is open
         self.delay_duration = 2000  # milliseconds
         self.delay_mode = "exploration"
@@ -383,7 +383,7 @@ class Ch01ChestRumblerBattle(Event):
         # Second part of the trigger after user acknowledgment
         cprint("A rock-like creature appears and advances toward Jean!")
         self.tile.spawn_npc("RockRumbler")
-        time.sleep(0.5)
+        pause(0.5)
         self.player.combat_events.append(
             Ch01PostRumbler(
                 player=self.player, tile=self.tile, params=False, repeat=False
@@ -715,19 +715,19 @@ class Ch01PostRumbler3(Event):
             "\nsquarely between the ferocious snapper's eyes. The beast explodes"
             "\ninto brilliant fragments of light."
         )
-        time.sleep(1)
+        pause(1)
         cprint(
             "The other creatures turn toward Jean in alarm. Rock-man takes this"
             "\nopportunity to smash one of them into the wall with a great swing"
             "\nfrom his large column."
         )
-        time.sleep(1)
+        pause(1)
         cprint(
             "Rock-man glances over at Jean and with another gesticulation,"
             "\nnods his head in respect. Both prepare themselves for the "
             "\ndifficult fight that remains."
         )
-        time.sleep(1)
+        pause(1)
 
         # Add Gorran as an ally. If he's already in the party (e.g. via the
         # starting_party_members config option), reuse that instance instead
@@ -793,13 +793,13 @@ class AfterTheRumblerFight(Event):
             self.pass_conditions_to_process()
 
     def process(self):
-        time.sleep(5)
+        pause(5)
         # Speaker id is "Rock-Man" (unnamed) until the naming beat below reveals
         # "Gorran" — matches the in-fiction reveal instead of leaking the name
         # onto the portrait early.
         begin_conversation([("Jean", "left", "neutral"), ("Rock-Man", None, "neutral")])
         narrate("The Rock-Man lowers his club to the ground and turns toward Jean.")
-        time.sleep(3)
+        pause(3)
         say(
             "I suppose I should thank you for saving my skin. What is your name?",
             "Jean",
@@ -810,12 +810,12 @@ class AfterTheRumblerFight(Event):
             "The Rock-Man stands immobile for a long moment, then slowly gestures toward himself. "
             "He begins to speak in low, rumbling tones, little of which Jean can understand."
         )
-        time.sleep(3)
+        pause(3)
         narrate(
             "Seeming to sense Jean's incomprehension, the Rock-Man places his open palm on his chest before emitting what could "
             "best be described as an avalanche falling in love with an earthquake."
         )
-        time.sleep(4)
+        pause(4)
         say(
             "Mmmmm... Go-rra-nnnnnn...",
             "Gorran",
@@ -834,7 +834,7 @@ class AfterTheRumblerFight(Event):
         narrate(
             "Gorran lets out a deep, low rumble, then gestures toward the wall from which he apparently came."
         )
-        time.sleep(3)
+        pause(3)
         narrate(
             "Gorran points at himself, then at Jean, and finally gestures toward the recently opened passage."
         )
@@ -869,7 +869,7 @@ class AfterGorranIntro(Event):
         self.pass_conditions_to_process()
 
     def process(self):
-        time.sleep(1)
+        pause(1)
         narrate(
             "Gorran gestures toward the opening in the wall. The two walk over. Jean can see that the opening is "
             "much too small for him to\npass through. Gorran waves an arm toward it and, miraculously, "
@@ -927,16 +927,16 @@ class Ch01GorranCautionJunction(Event):
         self.pass_conditions_to_process()
 
     def process(self):
-        time.sleep(0.5)
+        pause(0.5)
         cprint(
             "Gorran slows as he enters the junction, his head dropping to read the floor. "
             "He takes one long look — left passage, right passage, the marks on the stone — "
             "then raises a hand briefly: wait.",
             "cyan",
         )
-        time.sleep(1)
+        pause(1)
         cprint("After a moment he lowers it and moves forward, unhurried.", "cyan")
-        time.sleep(0.5)
+        pause(0.5)
 
 
 class Ch01GorranMarkings(Event):
@@ -957,18 +957,18 @@ class Ch01GorranMarkings(Event):
         self.pass_conditions_to_process()
 
     def process(self):
-        time.sleep(0.5)
+        pause(0.5)
         cprint(
             "Gorran pauses at the crystal, fingertips trailing across the worn markings "
             "at its base. He holds the contact a beat longer than passage requires.",
             "cyan",
         )
-        time.sleep(1.5)
+        pause(1.5)
         cprint(
             "When he moves on, his eyes stay ahead — not at the walls, but at the space beyond them.",
             "cyan",
         )
-        time.sleep(0.5)
+        pause(0.5)
 
 
 class Ch01GorranDarkChamber(Event):
@@ -988,18 +988,18 @@ class Ch01GorranDarkChamber(Event):
         self.pass_conditions_to_process()
 
     def process(self):
-        time.sleep(0.5)
+        pause(0.5)
         cprint(
             "Gorran stops entirely. His weight settles — a deliberate stillness, not a pause. "
             "One hand comes back behind him, flat, slow: stay.",
             "cyan",
         )
-        time.sleep(2)
+        pause(2)
         cprint(
             "He does not move. He does not turn. Whatever is ahead, he heard it first.",
             "cyan",
         )
-        time.sleep(1)
+        pause(1)
         # Record that the warning happened — used by Ch01GorranFirstWord as context.
         self.player.universe.story["gorran_dark_chamber_seen"] = "1"
 
@@ -1049,7 +1049,7 @@ class Ch01GorranFirstWord(Event):
             self.tile.remove_event(self.name)
             return
 
-        time.sleep(0.5)
+        pause(0.5)
         begin_conversation(_JEAN_SOLO)
         cprint(
             "The stone here has been moved with intention. Not a collapse — something large "
@@ -1057,12 +1057,12 @@ class Ch01GorranFirstWord(Event):
             "Jean moves forward.",
             "cyan",
         )
-        time.sleep(2)
+        pause(2)
         cprint(
             "From behind him — from Gorran, across the dark chamber, too far back to intercept —",
             "cyan",
         )
-        time.sleep(1.5)
+        pause(1.5)
 
         # The first word. Flat vowel. Consonants too hard. Unmistakably human.
         # Gorran fades onto the stage on this beat — he's speaking from off-screen.
@@ -1073,9 +1073,9 @@ class Ch01GorranFirstWord(Event):
             enter=enter_op("Gorran", side=None),
         )
 
-        time.sleep(2.5)
+        pause(2.5)
         cprint("Jean stops.", "cyan")
-        time.sleep(1.5)
+        pause(1.5)
         # Internal thought — no reaction from Gorran; he's looking past Jean, not at him.
         say(
             "He stands there for a moment. He'd expected a rumble, a sound, the usual. Not that.",
@@ -1083,18 +1083,18 @@ class Ch01GorranFirstWord(Event):
             "surprised",
             thought=True,
         )
-        time.sleep(2)
+        pause(2)
         cprint(
             "He turns. Gorran is at the threshold of the passage behind him, several paces back. "
             "He has not moved into this space. He is looking past Jean, at the corridor ahead.",
             "cyan",
         )
-        time.sleep(1.5)
+        pause(1.5)
         cprint(
             "He doesn't explain. He said the word he had. He waits.",
             "cyan",
         )
-        time.sleep(2)
+        pause(2)
         await_input()
 
         self.player.universe.story["gorran_language_stage"] = "1"
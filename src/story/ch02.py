@@ -4,7 +4,6 @@ Chapter 02 events
 
 from src.events import Event
 from src.functions import print_slow, await_input
-import time
 from src import items
 from src.story.effects import MemoryFlash
 from src.narration import (
@@ -16,6 +15,7 @@ from src.narration import (
     exit_op,
     react,
 )
+from src.headless import pause
 
 # Recurring conversation casts, to avoid retyping the same tuple at every stage.
 _JEAN_SOLO = [("Jean", "left", "neutral")]
@@ -525,31 +525,31 @@ class AfterDefeatingKingSlime(Event):
     def process(self):
         if self.player.universe.story.get("king_slime_defeated"):
             return
-        time.sleep(1)
+        pause(1)
         begin_conversation(_JEAN_SOLO)
         print_slow("The churning stilled. A deep, resonant silence settled over the cavern.")
-        time.sleep(1)
+        pause(1)
         print_slow(
             "Then — gradually — the green receded. Ripple by ripple, the corruption dissolved "
             "outward from the center, the thick slime thinning and clearing until clean, "
             "luminescent blue water filled the chamber."
         )
-        time.sleep(1.5)
+        pause(1.5)
         print_slow(
             "The central stone island was exactly what it always had been. "
             "The light was steady and quiet, blue-white, older than the corruption that had hidden it."
         )
-        time.sleep(1)
+        pause(1)
         print_slow(
             "On the island, something caught the light. "
             "Impossibly sharp. Impossibly beautiful."
         )
-        time.sleep(1.5)
+        pause(1.5)
         print_slow(
             "Jean stood in the clearing water. It was cold — rising back toward its natural level, "
             "lapping at his boots. The fight was over. There was nothing left in the room that needed him."
         )
-        time.sleep(1)
+        pause(1)
         say(
             "He didn't know what to do with his hands when they weren't needed.",
             "Jean",
@@ -561,7 +561,7 @@ class AfterDefeatingKingSlime(Event):
         # so leaving the conversation open would strand Jean's portrait on-screen
         # through an unrelated passage.
         end_conversation()
-        time.sleep(2)
+        pause(2)
 
         # Update the arena tile description to reflect the cleansed state
         self.tile.spawn_object(
@@ -622,32 +622,32 @@ class AfterDefeatingKingSlime(Event):
                 self.tile.npcs_here.append(gorran)
 
         # Narrate Gorran's arrival and his reaction to the cleansed pools
-        time.sleep(1)
+        pause(1)
         print_slow("Then — footsteps. Heavy, deliberate, from the corridor entrance.")
-        time.sleep(0.5)
+        pause(0.5)
         print_slow("Gorran rounded the archway and stopped.")
-        time.sleep(1)
+        pause(1)
         print_slow(
             "He looked at the pools. Clean, blue, still. His great head moved slowly across the chamber, "
             "taking in what it had been and what it was now."
         )
-        time.sleep(1.5)
+        pause(1.5)
         print_slow(
             "He made no sound. He just stood there in the entrance to the arena, "
             "looking at the water the way someone looks at something they thought was gone."
         )
-        time.sleep(1)
+        pause(1)
         print_slow(
             "Then, slowly, he walked to the edge of the nearest pool and lowered himself to one knee. "
             "He extended one wide hand over the surface. Didn't touch it. Just held his palm there, "
             "feeling the cold rise off it."
         )
-        time.sleep(2)
+        pause(2)
         print_slow(
             "A sound from him — low and long, held in the chest. Not quite a word. "
             "He stayed like that for a moment, hand over the water. Then he straightened."
         )
-        time.sleep(1)
+        pause(1)
 
         self._cleanse_pool_tiles(self.player)
 
@@ -803,26 +803,26 @@ class Ch02GorranAtPools(Event):
                 "to the atrium — that great vaulted space with its spring-fed pools — "
                 "facing south, one hand resting against the stone arch."
             )
-            time.sleep(1.5)
+            pause(1.5)
             print_slow(
                 "Jean came up beside him. The air changed here. Even at the threshold he could "
                 "feel it — a heaviness below the mineral scent, something sweet and wrong."
             )
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "Gorran did not look at him. He tapped his own chest twice — slow, deliberate. "
                 "Then he pointed south, toward the deeper passages. Then he drew his hand back."
             )
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "He made a sound. Low and brief. The Golemite equivalent of: I know."
             )
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "He lowered himself beside the arch — that slow, deliberate settling of stone "
                 "finding its position. He would wait here. Jean understood that."
             )
-            time.sleep(1.5)
+            pause(1.5)
             await_input()
 
         self.player.universe.story["gorran_at_pools"] = "1"
@@ -868,21 +868,21 @@ class Ch02ArenaEntrance(Event):
                 "The pool covered the floor from wall to wall, its surface roiling with a "
                 "sickly green luminescence."
             )
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "In the center of that corrupted expanse sat a single stone island. "
                 "On it: a shape. Massive. Waiting."
             )
-            time.sleep(1.5)
+            pause(1.5)
             print_slow(
                 "The green in the water pulsed. The sound that came from it was not a voice — "
                 "it was something older. Something hungry."
             )
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "Jean stepped forward. The water began to churn."
             )
-            time.sleep(1.5)
+            pause(1.5)
 
         self.player.universe.story["arena_entered"] = "1"
         self.tile.remove_event(self.name)
@@ -949,18 +949,18 @@ class Ch02FragmentReminder(Event):
     def _remind(self, player):
         if not player.skip_dialog:
             print_slow("A rumble from behind — low, insistent.")
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "Gorran stood at the entrance to the corridor, one hand braced against the arch. "
                 "He was looking at the island."
             )
-            time.sleep(1)
+            pause(1)
             print_slow("Jean followed his gaze.")
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "The fragment was still there. He'd walked out without it."
             )
-            time.sleep(1.5)
+            pause(1.5)
 
         # Teleport player back to the arena tile
         arena_coords = next(
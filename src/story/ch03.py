@@ -12,7 +12,7 @@ from src.narration import (
     exit_op,
     react,
 )
-import time
+from src.headless import pause
 
 # Recurring conversation cast, to avoid retyping the same tuple at every stage.
 _JEAN_MARA = [("Jean", "left", "neutral"), ("Mara", None, "neutral")]
@@ -58,14 +58,14 @@ class GorranGestureEvent(Event):
     def process(self):
         if not self.player.skip_dialog:
             narrate("\n")
-            time.sleep(0.3)
+            pause(0.3)
             print_slow(
                 "Gorran paused at the gate as it sealed. His palm rested flat against the stone — "
                 "one breath, maybe two. Then he turned without a word and followed.\n"
             )
-            time.sleep(1)
+            pause(1)
             print_slow("Jean did not ask him.\n")
-            time.sleep(0.5)
+            pause(0.5)
         self._set_gate()
 
     def _set_gate(self):
@@ -96,22 +96,22 @@ class EasternRoadTurnbackEvent(Event):
     def process(self):
         if not self.player.skip_dialog:
             narrate("\n")
-            time.sleep(0.3)
+            pause(0.3)
             print_slow("Jean stood at the edge of the road east.\n")
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "The Plains were out there — open ground, light, the kind of distance you could "
                 "just keep walking into. For a moment the road pulled at him in a way he didn't examine.\n"
             )
-            time.sleep(1.5)
+            pause(1.5)
             print_slow(
                 "Then the grind of Gorran's step on the gravel behind him, and whatever the "
                 "feeling was, it passed.\n"
             )
-            time.sleep(1)
+            pause(1)
             begin_conversation([("Jean", "left", "neutral")])
             say("South. That's where this goes.", "Jean", "neutral", thought=True)
-            time.sleep(0.5)
+            pause(0.5)
 
         # Move player west to AddersShelf (5, 4) — tile immediately west of RoadEast
         if self.tile and self.player:
@@ -147,14 +147,14 @@ class NomadCampSmellEvent(Event):
     def process(self):
         if not self.player.skip_dialog:
             narrate("\n")
-            time.sleep(0.3)
+            pause(0.3)
             print_slow(
                 "Jean smelled the camp before he saw it — woodsmoke, dried meat, the particular "
                 "warmth of a fire that had been maintained rather than lit."
             )
-            time.sleep(1)
+            pause(1)
             print_slow("The sound of the river was constant behind it.")
-            time.sleep(0.5)
+            pause(0.5)
         self._set_gate()
 
     def _set_gate(self):
@@ -199,14 +199,14 @@ class CampEntryGreetingEvent(Event):
     def process(self):
         if not self.player.skip_dialog:
             narrate("\n")
-            # time.sleep(0.3)
+            # pause(0.3)
             print_slow(
                 "Jean stopped at the edge of the camp and let himself take it in — the fire, "
                 "the packed earth, the smell of food. The river was close enough to hear."
             )
-            # time.sleep(1)
+            # pause(1)
             print_slow("Gorran stood beside him. Said nothing. That was usual.")
-            # time.sleep(0.5)
+            # pause(0.5)
             begin_conversation(
                 [
                     ("Jean", "left", "neutral"),
@@ -214,56 +214,56 @@ class CampEntryGreetingEvent(Event):
                 ]
             )
             say("Tents.", "Jean", "curious")
-            # time.sleep(0.4)
+            # pause(0.4)
             say(
                 "Real ones, too — sized for people. Not lean-tos, not burrows. "
                 "Somebody built this to last.",
                 "Jean",
                 "curious",
             )
-            # time.sleep(0.6)
+            # pause(0.6)
             say(
                 "Clothes on a line, over there. Someone's doing laundry like the world "
                 "hasn't ended.",
                 "Jean",
                 "neutral",
             )
-            # time.sleep(0.6)
+            # pause(0.6)
             say(
                 "And whatever's cooking on that fire smells like real food. For real, "
                 "human mouths.",
                 "Jean",
                 "happy",
             )
-            # time.sleep(0.5)
+            # pause(0.5)
             print_slow(
                 "Gorran made the low sound he sometimes made — not agreement exactly, "
                 "but not disagreement either. Jean had come to recognize it as a kind "
                 "of knowing."
             )
-            # time.sleep(1)
+            # pause(1)
             # Liss spots Jean, then Gorran, and flees in a fluster
             print_slow(
                 "A girl came around the fire ring at a half-run, dark hair flying, and "
                 "pulled up short when she saw Jean."
             )
-            # time.sleep(0.8)
+            # pause(0.8)
             say(
                 "Oh — hi! You're new. My name's Liss. Are you—",
                 "Liss",
                 "surprised",
                 enter=enter_op("Liss", side="right", emotion="surprised"),
             )
-            # time.sleep(0.5)
+            # pause(0.5)
             print_slow("Her eyes slid past Jean's shoulder and found Gorran.")
-            # time.sleep(0.5)
+            # pause(0.5)
             say(
                 "Oh! OH. You're— he's— that's a real one, isn't it, that's—",
                 "Liss",
                 "surprised",
                 leave=exit_op("Liss", transition="fade"),
             )
-            # time.sleep(0.5)
+            # pause(0.5)
             print_slow(
                 "Whatever she meant to say next dissolved into a half-squeal, half-gasp. "
                 "She backed up two steps, spun, and bolted for the fire ring, hair "
@@ -271,23 +271,23 @@ class CampEntryGreetingEvent(Event):
             )
             # The leave operation is attached to Liss's final spoken beat above
             # so the staged conversation applies it in sequence with the text.
-            # time.sleep(1.5)
+            # pause(1.5)
             print_slow("Jean watched her go, then glanced at Gorran.")
-            # time.sleep(0.5)
+            # pause(0.5)
             say("What exactly was that about?", "Jean", "skeptical")
-            # time.sleep(0.7)
+            # pause(0.7)
             print_slow(
                 "Gorran didn't answer. Of course he didn't. Jean was fairly sure that "
                 "not-answering was itself an answer."
             )
-            # time.sleep(1)
+            # pause(1)
             say(
                 "Well — we're not getting anywhere standing here. Let's ask around, "
                 "see if anyone knows a way across that river.",
                 "Jean",
                 "neutral",
             )
-            # time.sleep(0.5)
+            # pause(0.5)
         self._set_gate()
 
     def _set_gate(self):
@@ -331,66 +331,66 @@ class MaraFirstContactEvent(Event):
     def process(self):
         if not self.player.skip_dialog:
             narrate("\n")
-            time.sleep(0.3)
+            pause(0.3)
             print_slow(
                 "A woman at the camp's western edge had clocked them while they were still fifty "
                 "paces out — Jean was sure of it. By the time he reached her she was back to what "
                 "she'd been doing: crouched over a pack, sorting something with methodical attention."
             )
-            time.sleep(1)
+            pause(1)
             print_slow("She didn't look up.")
-            time.sleep(0.5)
+            pause(0.5)
 
             # Beat 1 — the fee
             begin_conversation(_JEAN_MARA)
             say("Crossing west?", "Mara", "neutral")
-            time.sleep(0.8)
+            pause(0.8)
             print_slow("Not a greeting. A question with a purpose.")
-            time.sleep(0.5)
+            pause(0.5)
             say("That's the idea.", "Jean", "neutral")
-            time.sleep(0.8)
+            pause(0.8)
             say(
                 "Ten gold. Raft holds his weight fine — current's slow this time of year.",
                 "Mara",
                 "neutral",
             )
-            time.sleep(0.8)
+            pause(0.8)
             say("You're sure that's fair?", "Jean", "skeptical")
-            time.sleep(0.8)
+            pause(0.8)
             say(
                 "It's not padded and I'm not in the mood for haggling. Take it or don't.",
                 "Mara",
                 "neutral",
             )
-            time.sleep(1)
+            pause(1)
 
             # Beat 2 — Gorran, appraised aloud; he answers with a rumble, not words
             print_slow("For the first time, her attention moved past Jean to Gorran.")
-            time.sleep(0.8)
+            pause(0.8)
             begin_conversation(_JEAN_MARA_GORRAN)
             say(
                 "Never had one this close. He's not going to take my raft apart, is he?",
                 "Mara",
                 "curious",
             )
-            time.sleep(0.8)
+            pause(0.8)
             say("He'll be fine.", "Jean", "neutral")
-            time.sleep(0.8)
+            pause(0.8)
             print_slow(
                 "A low rumble moved up through Gorran's chest — not aggressive, more the sound "
                 "of a rockslide pausing to consider participating in a conversation. "
                 "The mooring post hummed faintly with it."
             )
-            time.sleep(1)
+            pause(1)
             say(
                 "That's either agreement or he's warming up to eat something. "
                 "How can you tell the difference?",
                 "Mara",
                 "skeptical",
             )
-            time.sleep(0.8)
+            pause(0.8)
             say("No idea. At least he only eats rocks. Small consolation. \n\nWe're headed to a place called the Wailing Badlands.", "Jean", "neutral")
-            time.sleep(1)
+            pause(1)
 
             # Beat 3 — the crucifix, nothing spoken
             react("Jean", "concerned")
@@ -401,7 +401,7 @@ class MaraFirstContactEvent(Event):
                 "why. She noticed him notice it. She noticed him look away. She filed both in her mind without "
                 "comment and went back to sorting."
             )
-            time.sleep(1.5)
+            pause(1.5)
 
             # Beat 4 — the guide offer, stated flat
             begin_conversation(_JEAN_MARA)
@@ -412,22 +412,22 @@ class MaraFirstContactEvent(Event):
                 "Mara",
                 "neutral",
             )
-            time.sleep(0.8)
+            pause(0.8)
             say("What takes you to the... Caves?", "Jean", "curious")
-            time.sleep(0.8)
+            pause(0.8)
             react("Mara", "skeptical")
             print_slow(
                 "She turns back to Jean, holding his gaze for an uncomfortable moment."
             )
-            time.sleep(1.5)
+            pause(1.5)
             say(
                 "Business. My business.",
                 "Mara",
                 "neutral",
             )
-            time.sleep(0.8)
+            pause(0.8)
             say("Alright, fair enough. I accept your terms.", "Jean", "happy")
-            time.sleep(1)
+            pause(1)
 
             # Beat 5 — tied off; sends Jean around the camp
             say(
@@ -437,11 +437,11 @@ class MaraFirstContactEvent(Event):
                 "Mara",
                 "neutral",
             )
-            time.sleep(0.8)
+            pause(0.8)
             print_slow(
                 "She was already back to the pack before the last word had settled."
             )
-            time.sleep(1)
+            pause(1)
         self._set_gate()
 
     def _set_gate(self):
@@ -478,65 +478,65 @@ class DevetIntroEvent(Event):
     def process(self):
         if not self.player.skip_dialog:
             narrate("\n")
-            time.sleep(0.3)
+            pause(0.3)
             print_slow(
                 "An older man was tending the fire — unhurried, each movement economical in the "
                 "way of someone who has done this ten thousand times. He gave Jean one look when "
                 "Jean approached: the look of someone who had seen desperate people cross this "
                 "river before, heading west, and knew most of them weren't running toward something."
             )
-            time.sleep(1.5)
+            pause(1.5)
             print_slow(
                 "He didn't offer this observation aloud. His eyes moved to Gorran once — a brief, "
                 "unhurried assessment, the same one he'd have given an unfamiliar dog — and returned "
                 "to the pot. If a Golemite unsettled him, nothing in his face admitted it."
             )
-            time.sleep(1)
+            pause(1)
 
             begin_conversation(_JEAN_DEVET)
             say("Eat.", "Devet", "neutral")
-            time.sleep(0.5)
+            pause(0.5)
             print_slow(
                 "He filled a bowl from the pot and held it out. It was not a question. "
                 "Root vegetables, some kind of meat, with an enthralling aroma making Jean's stomach growl. "
                 "He began to realize how long it had been since he'd eaten a warm meal. "
                 "More accurately, he wondered just how long that really had been."
             )
-            time.sleep(0.8)
+            pause(0.8)
             say("Thank you.", "Jean", "neutral")
-            time.sleep(0.5)
+            pause(0.5)
             print_slow(
                 "The old man had already turned back to the fire. The thanks hadn't needed an answer."
             )
-            time.sleep(1)
+            pause(1)
 
             say("How long have you been doing this?", "Jean", "curious")
-            time.sleep(0.8)
+            pause(0.8)
             say(
                 "Long enough I don't remember what I was doing before.",
                 "Devet",
                 "neutral",
             )
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "A quiet pause settled in between the two for a moment."
             )
             say("Probably something less useful.", "Devet", "neutral")
-            time.sleep(0.5)
+            pause(0.5)
             react("Jean", "neutral")
             print_slow("It took Jean a second to realize that had been a joke. He lifted the bowl and took a careful sip.")
-            time.sleep(1)
+            pause(1)
 
             say("It's good.", "Jean", "neutral")
-            time.sleep(0.8)
+            pause(0.8)
             say("It's food.", "Devet", "neutral")
-            time.sleep(1)
+            pause(1)
 
             print_slow(
                 "Gorran stood where Jean had left him, still. Gradually, he rumbled and sat on the ground while Jean ate."
                 "His presence had settled into the campfire's edge the way large stones settle: without effort, without apology."
             )
-            time.sleep(1)
+            pause(1)
         self._set_gate()
 
     def _set_gate(self):
@@ -577,14 +577,14 @@ class LissObservingEvent(Event):
     def process(self):
         if not self.player.skip_dialog:
             narrate("\n")
-            time.sleep(0.3)
+            pause(0.3)
             print_slow(
                 "Liss was at the camp's far corner — young, dark-haired, turning a stone over "
                 "in one hand out of habit. Not approaching Gorran. Orbiting him instead, in loose, "
                 "unhurried circles, hands clasped behind her back like someone sizing up a fact "
                 "she wasn't sure she believed yet."
             )
-            time.sleep(1)
+            pause(1)
 
             # Gorran does not react to Liss anywhere in this scene — the prose is
             # explicit that he gives no indication of having heard her.
@@ -594,7 +594,7 @@ class LissObservingEvent(Event):
             print_slow(
                 "She spun a half-turn on one heel, already talking before she'd fully stopped."
             )
-            time.sleep(0.6)
+            pause(0.6)
             say(
                 "Does he sleep? He doesn't look like he's sleeping, but maybe that's just what "
                 "it looks like when he does — do Golemites even close their eyes, or— "
@@ -602,21 +602,21 @@ class LissObservingEvent(Event):
                 "Liss",
                 "curious",
             )
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "Gorran didn't answer. Didn't move. His stillness could have meant anything, "
                 "including no, including yes, including that he'd heard the question and elected "
                 "not to dignify it with the effort of a response."
             )
-            time.sleep(1)
+            pause(1)
             react("Liss", "neutral")
             print_slow(
                 "She reached out and poked his shin once, experimentally — the way you'd poke "
                 "a small animal to check whether it was asleep or just very good at pretending."
             )
-            time.sleep(0.8)
+            pause(0.8)
             say("I've been trying to figure that out for weeks.", "Jean", "neutral")
-            time.sleep(1)
+            pause(1)
 
             # Burst 2 — the stone, held up for comparison
             react("Liss", "curious")
@@ -626,7 +626,7 @@ class LissObservingEvent(Event):
                 "the toe of his foot — stone on stone, a small testing sound, like she expected "
                 "a different note back."
             )
-            time.sleep(1)
+            pause(1)
             say(
                 "Does it hurt? When you crack, I mean. Not that you look cracked. You don't. I "
                 "just mean — a rock cracks and it doesn't feel it, because it's a rock, but "
@@ -634,14 +634,14 @@ class LissObservingEvent(Event):
                 "Liss",
                 "curious",
             )
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "Gorran's eyes moved once — not to her, to the stone in her hand — the way "
                 "something very old regards something very new. Then away again. Nothing else."
             )
-            time.sleep(1)
+            pause(1)
             say("Okay. Well, that was more than just standing there. I guess you don't talk much.", "Liss", "happy")
-            time.sleep(1)
+            pause(1)
 
             # Burst 3 — cold and bone (canonical exchange)
             react("Liss", "surprised")
@@ -651,7 +651,7 @@ class LissObservingEvent(Event):
                 "she'd moved."
             )
             react("Liss", "curious")
-            time.sleep(0.8)
+            pause(0.8)
             say(
                 "You're made of stone — does the cold feel different because of that? Devet "
                 "says it settles in his bones, and I thought, if you're basically already bone, "
@@ -659,21 +659,21 @@ class LissObservingEvent(Event):
                 "Liss",
                 "curious",
             )
-            time.sleep(1)
+            pause(1)
             say("Oh, but not bone. STONE. Still hard and cold. But maybe different?", "Liss", "happy")
-            time.sleep(1)
+            pause(1)
             print_slow("Gorran regarded the nearby river, watching the current weave between boulders.")
-            time.sleep(0.8)
+            pause(0.8)
             say("You don't have to answer.", "Liss", "neutral")
-            time.sleep(0.8)
+            pause(0.8)
             print_slow("He didn't.")
-            time.sleep(0.8)
+            pause(0.8)
             say("I'll probably ask again sometime.", "Liss", "neutral")
-            time.sleep(1)
+            pause(1)
             say("He's not going to answer that one either.", "Jean", "curious")
-            time.sleep(0.8)
+            pause(0.8)
             say("I know. I'll keep asking anyway. Mara says I ask too much, but I think it's fine.", "Liss", "happy")
-            time.sleep(1)
+            pause(1)
 
             # The seed, not the arrival
             react("Liss", "surprised")
@@ -684,33 +684,33 @@ class LissObservingEvent(Event):
                 "weight. He didn't need to. She held on a moment longer than the stumble required, "
                 "then let go, a little sheepish, and didn't try to explain it."
             )
-            time.sleep(1.2)
+            pause(1.2)
             react("Liss", "curious")
             print_slow(
                 "Something in her ran out of questions before it ran out of curiosity. She "
                 "stopped talking, came a few steps closer than she'd allowed herself before, "
                 "and sat, watching the river instead of him."
             )
-            time.sleep(1.5)
+            pause(1.5)
             react("Liss", "neutral")
             print_slow(
                 "Gorran allowed this without acknowledging it. Neither of them said anything "
                 "else."
             )
-            time.sleep(1.2)
+            pause(1.2)
             react("Jean", "happy")
             print_slow(
                 "Jean watched them — the girl and the old stone thing, both passively mesmerized by the "
                 "undulating water — and found he was smiling before he'd decided to."
             )
-            time.sleep(1.2)
+            pause(1.2)
             say("...", "Jean", "concerned")
             print_slow(
                 "Then something moved under it, low and sudden — a tightness in his chest that "
                 "had no name and offered no explanation for itself. It was gone as quickly as it "
                 "came. He didn't chase it. He turned back to the fire."
             )
-            time.sleep(1)
+            pause(1)
         self._set_gate()
 
     def _set_gate(self):
@@ -751,13 +751,13 @@ class IronAndOathIntroEvent(Event):
     def process(self):
         if not self.player.skip_dialog:
             narrate("\n")
-            time.sleep(0.3)
+            pause(0.3)
             print_slow(
                 "The metallic scraping of a hand file against steel and the sharp snap of waxed thread "
                 "echoed beneath the canvas awning. A man in an oil-cured leather apron was sharpening a pommel "
                 "while a sharp-eyed woman beside him inspected the buckle alignment of a leather cuirass."
             )
-            time.sleep(1)
+            pause(1)
 
             begin_conversation(
                 [
@@ -775,9 +775,9 @@ class IronAndOathIntroEvent(Event):
                 "Vespera",
                 "happy",
             )
-            time.sleep(0.8)
+            pause(0.8)
             say("By the forge... That's a Golemite.", "Kaelen", "curious")
-            time.sleep(0.8)
+            pause(0.8)
 
             # Beat 2 — Kaelen's Smithing Eye & Gorran's Presence
             say(
@@ -786,22 +786,22 @@ class IronAndOathIntroEvent(Event):
                 "Kaelen",
                 "curious",
             )
-            time.sleep(1)
+            pause(1)
             say(
                 "A low, subsonic vibration rolled through the gravel underfoot as Gorran shifted his weight. "
                 "The tools hanging from the counter rack chimed softly against one another.",
                 "Gorran",
                 "neutral",
             )
-            time.sleep(1)
+            pause(1)
             say("Gorran travels with me. He isn't armor.", "Jean", "neutral")
-            time.sleep(0.8)
+            pause(0.8)
             say(
                 "No offense intended, friend! A smith sees good structure, he can't help but admire it.",
                 "Kaelen",
                 "happy",
             )
-            time.sleep(1)
+            pause(1)
 
             # Beat 3 — Vespera's Grounding & Sales Pitch
             say(
@@ -810,33 +810,33 @@ class IronAndOathIntroEvent(Event):
                 "Vespera",
                 "skeptical",
             )
-            time.sleep(0.8)
+            pause(0.8)
             say(
                 "You've come down from Grondia, heading across the water. The Badlands will chew through "
                 "cheap straps and dull a soft edge in three days.",
                 "Vespera",
                 "concerned",
             )
-            time.sleep(0.8)
+            pause(0.8)
             say(
                 "Everything on this rack is tempered for long travel. Light enough not to exhaust your arm "
                 "on a ten-mile march, hard enough to take a beating.",
                 "Kaelen",
                 "neutral",
             )
-            time.sleep(1)
+            pause(1)
 
             # Beat 4 — Liss's Stalking & Vespera's Somber Stillness
             print_slow(
                 "At the side of the stall, young Liss was creeping behind a stack of crates, "
                 "staring wide-eyed at Gorran in intense, unblinking research."
             )
-            time.sleep(1)
+            pause(1)
             print_slow(
                 "Trying to sneak closer for a better view, her foot caught a support cord. "
                 "She crashed directly into a wooden rack of practice spears with a loud, wooden clatter."
             )
-            time.sleep(1)
+            pause(1)
 
             begin_conversation(
                 [
@@ -849,11 +849,11 @@ class IronAndOathIntroEvent(Event):
             )
 
             say("Eek!", "Liss", "surprised")
-            time.sleep(0.5)
+            pause(0.5)
             print_slow(
                 "She scrambled up instantly, dark hair flying, and fled into the camp interior without looking back."
             )
-            time.sleep(1)
+            pause(1)
 
             begin_conversation(
                 [
@@ -870,36 +870,36 @@ class IronAndOathIntroEvent(Event):
                 "Kaelen",
                 "happy",
             )
-            time.sleep(1)
+            pause(1)
             react("Vespera", "concerned")
             print_slow(
                 "A sudden, somber stillness settled over Vespera. Her smile faded into a quiet, distant stare "
                 "as she watched the spot where Liss had vanished. Her fingers gently traced the leather spine "
                 "of her ledger."
             )
-            time.sleep(1.5)
+            pause(1.5)
             print_slow(
                 "Kaelen noticed her shift instantly. He set the fallen spear down, stepped over, and quietly "
                 "rested a warm, soot-stained hand on the small of her back."
             )
-            time.sleep(1)
+            pause(1)
             say("Vespera...", "Kaelen", "concerned")
-            time.sleep(0.8)
+            pause(0.8)
             say("I'm alright, love.", "Vespera", "sad")
-            time.sleep(1)
+            pause(1)
             react("Kaelen", "concerned")
             print_slow(
                 "Kaelen noticed her shift instantly. He set the fallen spear down, stepped over, and quietly "
                 "rested a warm, soot-stained hand on the small of her back."
             )
-            time.sleep(1)
+            pause(1)
             say(
                 "Right then. As I was saying — Vespera fits the harness, I balance the blade. "
                 "Nobody leaves our counter with gear that fails 'em.",
                 "Kaelen",
                 "neutral",
             )
-            time.sleep(1)
+            pause(1)
 
             # Beat 5 — Transition to Commerce
             say(
@@ -908,7 +908,7 @@ class IronAndOathIntroEvent(Event):
                 "Vespera",
                 "happy",
             )
-            time.sleep(1)
+            pause(1)
 
         self._set_gate()
 
@@ -956,13 +956,13 @@ class AnvilIntroEvent(Event):
     def process(self):
         if not self.player.skip_dialog:
             narrate("\n")
-            time.sleep(0.3)
+            pause(0.3)
             print_slow(
                 "Jean's attention snagged on the far corner of the stall — a shape "
                 "he'd taken for a heap of stacked stone since he'd arrived. It shifted, "
                 "fractionally, and resolved into something with a shell."
             )
-            time.sleep(1)
+            pause(1)
 
             begin_conversation(
                 [
@@ -974,7 +974,7 @@ class AnvilIntroEvent(Event):
             )
 
             say("That's... alive?", "Jean", "surprised")
-            time.sleep(0.8)
+            pause(0.8)
             say(
                 "That's Anvil. Iron & Oath doesn't move an inch without him — every "
                 "rack, every crate, the hearth stones themselves, all of it rides on "
@@ -982,28 +982,28 @@ class AnvilIntroEvent(Event):
                 "Vespera",
                 "happy",
             )
-            time.sleep(1)
+            pause(1)
             say(
                 "Named him myself. Seemed fitting — the one thing in the stall that "
                 "doesn't move for anybody.",
                 "Kaelen",
                 "happy",
             )
-            time.sleep(0.5)
+            pause(0.5)
             say(
                 "Turned out he meant it rather more literally than I did. I've never "
                 "won an argument with that animal.",
                 "Kaelen",
                 "curious",
             )
-            time.sleep(1)
+            pause(1)
 
             print_slow(
                 "A faint hiss vented from somewhere inside the shell — not alarm, "
                 "just acknowledgment — and the thick sensory stalks tracked Jean's "
                 "hands for a long moment before losing interest."
             )
-            time.sleep(1)
+            pause(1)
 
             say(
                 "How does something that slow keep pace with a camp that has to "
@@ -1011,7 +1011,7 @@ class AnvilIntroEvent(Event):
                 "Jean",
                 "curious",
             )
-            time.sleep(0.8)
+            pause(0.8)
             say(
                 "Ah — now that's the interesting part. He doesn't keep pace. We send "
                 "him off alone, a day ahead, loaded with everything heavy. No rest "
@@ -1020,7 +1020,7 @@ class AnvilIntroEvent(Event):
                 "Kaelen",
                 "curious",
             )
-            time.sleep(0.8)
+            pause(0.8)
             say(
                 "And the river doesn't slow him either. Seals that hatch of his shut "
                 "tight as a strongbox and just walks the bottom of the ford, submerged, "
@@ -1029,16 +1029,16 @@ class AnvilIntroEvent(Event):
                 "Kaelen",
                 "curious",
             )
-            time.sleep(1)
+            pause(1)
             say(
                 "Kaelen. He asked how the animal keeps up, not for the full natural "
                 "history.",
                 "Vespera",
                 "skeptical",
             )
-            time.sleep(0.5)
+            pause(0.5)
             say("I'm answering the question!", "Kaelen", "happy")
-            time.sleep(1)
+            pause(1)
 
             say(
                 "He's not wrong, though. Clean his plates, check the hatch seal, feed "
@@ -1048,7 +1048,7 @@ class AnvilIntroEvent(Event):
                 "Vespera",
                 "neutral",
             )
-            time.sleep(1.2)
+            pause(1.2)
 
             say(
                 "There was something in the way she said it — not the flat, practical "
@@ -1059,14 +1059,14 @@ class AnvilIntroEvent(Event):
                 "neutral",
                 thought=True,
             )
-            time.sleep(1)
+            pause(1)
 
             print_slow(
                 "As if in answer, the great shape shifted its weight and settled "
                 "flush against the ground beside her, foot easing down the way it "
                 "never had for anyone else Jean had watched him tolerate."
             )
-            time.sleep(1)
+            pause(1)
 
             say(
                 "Don't let him hear you say that — he'll expect a written apology "
@@ -1074,7 +1074,7 @@ class AnvilIntroEvent(Event):
                 "Kaelen",
                 "happy",
             )
-            time.sleep(0.8)
+            pause(0.8)
             say(
                 "He's spoiled well past reason and I take full responsibility for it. "
                 "Now — did you come here to admire my livestock, or were you after "
@@ -1082,7 +1082,7 @@ class AnvilIntroEvent(Event):
                 "Vespera",
                 "happy",
             )
-            time.sleep(1)
+            pause(1)
 
         self._set_gate()
 
@@ -1125,7 +1125,7 @@ class MaraObservationEvent(Event):
     def process(self):
         if not self.player.skip_dialog:
             narrate("\n")
-            time.sleep(0.3)
+            pause(0.3)
             # Match any bludgeon/mace (RustedIronMace, Mace, …) — they are
             # sibling Weapon subclasses sharing subtype "Bludgeon", so an exact
             # class-name check missed Jean's starting RustedIronMace.
@@ -1137,26 +1137,26 @@ class MaraObservationEvent(Event):
                 "A while later — Jean was sitting with the bowl, Gorran nearby, the fire "
                 "between them and the river — Mara looked up from what she was sorting."
             )
-            time.sleep(1)
+            pause(1)
             begin_conversation(_JEAN_MARA)
             if has_mace:
                 print_slow(
                     "Her eyes tracked to Jean's mace for just a moment. Then back to her work."
                 )
-                time.sleep(0.5)
+                pause(0.5)
                 say("That's religious kit. You are - or were - a man of the church.", "Mara", "neutral")
             else:
                 print_slow(
                     "Her eyes moved across Jean — his posture, his hands, the way his weight "
                     "sat — and returned to her work."
                 )
-                time.sleep(0.5)
+                pause(0.5)
                 say("You are - or were - a man of the church.", "Mara", "neutral")
-            time.sleep(0.5)
+            pause(0.5)
             print_slow("Not a question.")
-            time.sleep(1)
+            pause(1)
             say("Not a priest, if that's what you mean.", "Jean", "neutral")
-            time.sleep(1)
+            pause(1)
             react("Mara", "curious")
             react("Jean", "concerned")
             print_slow(
@@ -1164,7 +1164,7 @@ class MaraObservationEvent(Event):
                 "He was trying to remember something just out of reach."
             )
             print_slow("Confused, Mara watched Jean for a moment. She filed the exchange. The sorting continued.")
-            time.sleep(1)
+            pause(1)
             say(
                 "When you're ready, head to the ferry landing and we'll be off. "
                 "Don't wait too long - crossing in the dark is unpleasant for everyone.", "Mara", "neutral"
@@ -1203,14 +1203,14 @@ class DemoEndEvent(Event):
     def process(self):
         if not self.player.skip_dialog:
             narrate("\n")
-            time.sleep(0.3)
+            pause(0.3)
             print_slow(
                 "The ferry is ready. The crossing is short — you can see the far bank clearly."
             )
-            time.sleep(1)
+            pause(1)
             print_slow("But beyond the river is where the demo ends.")
-            time.sleep(0.5)
+            pause(0.5)
             print_slow("\n[The full journey continues in the complete release. You may continue exploring the area, but can go no further in the story.]\n")
-            time.sleep(1)
+            pause(1)
             print_slow("\n[Be sure to submit feedback using the Feedback button at the top of the UI, next to 'Account'. Thank you for helping to make this game better! -Alex]\n")
-            time.sleep(1)
+            pause(1)
@@ -5,8 +5,8 @@ Effects are small, one-time-only events typically fired during combat or in resp
 from typing import List, Optional
 
 from src.narration import cprint, narrate, say, begin_conversation
+from src.headless import pause
 import random
-import time
 
 from src.npc import NPC
 import src.functions as functions
@@ -165,10 +165,10 @@ class MemoryFlash(Event):
         if user_input is None:
             # First pass: display the memory and aftermath, then pause for input
             # Pause before the memory begins
-            time.sleep(1)
+            pause(1)
             narrate()
             cprint("For a moment, there is only silence...", "white")
-            time.sleep(0.5)  # Reduced for API responsiveness
+            pause(0.5)  # Reduced for API responsiveness
             narrate()
 
             # Top border with animation
@@ -571,7 +571,7 @@ class StMichael(Shrine):
                 "Suddenly, Jean has the feeling of intense heat all around him. "
                 "He hears a voice echoing inside his head."
             )
-            time.sleep(2)
+            pause(2)
             cprint(
                 """CHILD, THY FAITH PRESERVES THEE. TELL ME THE INSTRUMENT OF JUSTICE THOU DESIREST.""",
                 "red",
@@ -783,7 +783,7 @@ class PulsingGlandEvent(NPCSpawnerEvent):
             "A gland on the wall convulses and ruptures — "
             "a slime drops wetly from the burst sac."
         )
-        time.sleep(0.5)
+        pause(0.5)
         self._do_spawn()
         self.has_run = True
 
@@ -828,11 +828,11 @@ class WhisperingStatue(Event):
         # when absent (the riddle's correct answer / safe default).
         choice = user_input or "1"
 
-        time.sleep(1)
+        pause(1)
 
         if choice == "1":
             cprint("\nThe statue's eyes glow with a soft blue light.", "cyan")
-            time.sleep(1)
+            pause(1)
             cprint('"Wisdom flows like water," the voice rumbles.', "yellow")
             cprint("A hidden compartment opens at the statue's base!", "green")
 
@@ -846,7 +846,7 @@ class WhisperingStatue(Event):
 
         else:
             cprint("\nThe statue's eyes flare with an angry red light.", "red")
-            time.sleep(1)
+            pause(1)
             cprint(
                 '"Foolishness invites destruction," the voice hisses.',
                 "red",
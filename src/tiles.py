@@ -12,6 +12,73 @@ import src.actions as actions  # type: ignore
 import src.functions as functions  # type: ignore
 
 
+class EventList(list):
+    """``MapTile.events_here``: a list that reports spawner churn to the universe.
+
+    Universe keeps a per-map index of the events exposing
+    ``evaluate_for_map_entry`` so the per-tick spawner pass doesn't walk every
+    tile (see ``Universe._evaluate_map_entry_spawners``). Story code appends
+    to and removes from ``events_here`` directly all over the engine, so the
+    list itself tells the index what changed.
+    """
+
+    def __init__(self, tile=None, events=()):
+        super().__init__(events)
+        self.tile = tile
+
+    def _changed(self, added=(), removed=()):
+        tile = getattr(self, "tile", None)  # unset while unpickling
+        universe = getattr(tile, "universe", None)
+        notify = getattr(universe, "_tile_events_changed", None)
+        if callable(notify):
+            notify(tile, added, removed)
+
+    def append(self, event):
+        super().append(event)
+        self._changed(added=(event,))
+
+    def extend(self, events):
+        events = list(events)
+        super().extend(events)
+        self._changed(added=events)
+
+    def __iadd__(self, events):
+        self.extend(events)
+        return self
+
+    def insert(self, index, event):
+        super().insert(index, event)
+        self._changed(added=(event,))
+
+    def remove(self, event):
+        super().remove(event)
+        self._changed(removed=(event,))
+
+    def pop(self, index=-1):
+        event = super().pop(index)
+        self._changed(removed=(event,))
+        return event
+
+    def clear(self):
+        removed = list(self)
+        super().clear()
+        self._changed(removed=removed)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            value = list(value)
+            removed, added = self[key], value
+        else:
+            removed, added = [self[key]], [value]
+        super().__setitem__(key, value)
+        self._changed(added=added, removed=removed)
+
+    def __delitem__(self, key):
+        removed = self[key] if isinstance(key, slice) else [self[key]]
+        super().__delitem__(key)
+        self._changed(removed=removed)
+
+
 class MapTile:
     """The base class for a tile within the world space"""
 
@@ -27,7 +94,7 @@ class MapTile:
         self.y = y
         self.npcs_here = []
         self.items_here = []
-        self.events_here = []
+        self.events_here = EventList(self)
         self.objects_here = []
         self.last_entered = 0  # describes the game_tick when the player last entered. Useful for monster/item respawns.
         self.discovered = False  # when drawing the map for the player,
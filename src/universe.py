@@ -3,9 +3,20 @@ __author__ = "Alex Egbert"
 import src.functions as functions
 import src.secure_pickle as secure_pickle
 import src.map_placeholders as map_placeholders
+import io
+import os
+import copy
+import enum
 import json
+import types
+import zlib
+import pickle
+import random
+import hashlib
 import inspect
 import importlib
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Final
 from src.coordinate_config import CoordinateSystemConfig
@@ -19,6 +30,432 @@ RESOURCES_DIR: Final = Path(__file__).parent / "resources"
 # nest only a handful of levels; this leaves generous headroom.
 MAX_DESERIALIZE_DEPTH: Final = 100
 
+_ALL_DIRECTIONS: Final = frozenset(
+    {
+        "north",
+        "south",
+        "east",
+        "west",
+        "northeast",
+        "northwest",
+        "southeast",
+        "southwest",
+    }
+)
+
+
+@dataclass(frozen=True)
+class TileTemplate:
+    """Parsed, validated description of one JSON map tile.
+
+    Holds everything that is identical for every session -- coordinates, the
+    resolved tile class, text, exits -- plus the raw object payloads, which
+    are only ever *read* when a session instantiates the tile.
+    """
+
+    x: int
+    y: int
+    tile_cls: type
+    title: str
+    description: str
+    block_exit: object  # tuple, or None when the JSON doesn't override it
+    exit_blocks: tuple
+    symbol: object
+    has_symbol: bool
+    bgm: object
+    has_bgm: bool
+    events: tuple
+    items: tuple
+    npcs: tuple
+    objects: tuple
+
+
+@dataclass(frozen=True)
+class MapTemplate:
+    """An immutable, parsed JSON map shared by every session in the process."""
+
+    name: str
+    metadata: object
+    has_metadata: bool
+    tiles: tuple
+    mtime_ns: int
+    size: int
+
+
+# Process-wide map template cache, keyed by resolved path. Universe.build used
+# to re-read and re-parse every map file (and re-resolve every tile class) on
+# each login and new game; templates are now parsed once and only rebuilt when
+# the file's mtime/size changes, so a map edited on disk is still picked up.
+_MAP_TEMPLATES: dict = {}
+_MAP_TEMPLATES_LOCK = threading.Lock()
+
+
+def _parse_map_template(json_path: Path, mtime_ns: int, size: int) -> MapTemplate:
+    # Local import: src.tiles -> src.actions -> src.player -> src.universe
+    # is a circular chain at module-load time, so MapTile must be imported
+    # lazily here rather than at the top of this module.
+    from src.tiles import MapTile
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    map_name = json_path.stem
+    metadata = None
+    has_metadata = False
+    tiles = []
+    # iterate coordinate keys
+    for coord_str, tile_data in raw.items():
+        if coord_str == "metadata":
+            metadata = tile_data
+            has_metadata = True
+            continue
+        try:
+            x_str, y_str = coord_str.strip("()").split(",")
+            x = int(x_str)
+            y = int(y_str)
+        except Exception:
+            continue
+        # ``title`` is a human-readable display name chosen freely by map
+        # designers/the map editor (e.g. "Conclave Archive — Reading Hall",
+        # "RiversEdge") — it has not been a reliable tileset *class* name
+        # for a long time, so it is never used for class resolution here.
+        # A tile only gets a real ``src.tilesets`` subclass when the JSON
+        # explicitly names one via an optional "class" field; otherwise it
+        # is a plain MapTile carrying its description/exits/events/etc.
+        # from JSON data alone (which is how the vast majority of tiles
+        # already work in practice).
+        title = tile_data.get("title") or tile_data.get("id") or f"tile_{x}_{y}"
+        class_name = tile_data.get("class")
+        if class_name:
+            try:
+                tile_cls = functions.seek_class(
+                    class_name, "tilesets", allow_other_modules=False
+                )
+            except ValueError as e:
+                narrate(
+                    f"ERROR: Failed to resolve tile class '{class_name}' "
+                    f"at {coord_str} in map '{map_name}': {e}; falling back to MapTile"
+                )
+                tile_cls = MapTile
+        else:
+            tile_cls = MapTile
+        # block exits (replaces the tile class default) & exits whitelist (blocks
+        # every other direction on top of whatever the tile already blocks)
+        block_exit = None
+        if "block_exit" in tile_data and isinstance(tile_data["block_exit"], list):
+            block_exit = tuple(tile_data["block_exit"])
+        exit_blocks = ()
+        if "exits" in tile_data and isinstance(tile_data["exits"], list):
+            exit_blocks = tuple(sorted(_ALL_DIRECTIONS - set(tile_data["exits"])))
+        tiles.append(
+            TileTemplate(
+                x=x,
+                y=y,
+                tile_cls=tile_cls,
+                title=title,
+                description=tile_data.get("description", ""),
+                block_exit=block_exit,
+                exit_blocks=exit_blocks,
+                symbol=tile_data.get("symbol"),
+                has_symbol="symbol" in tile_data,
+                bgm=tile_data.get("bgm"),
+                has_bgm="bgm" in tile_data,
+                events=tuple(tile_data.get("events", [])),
+                items=tuple(tile_data.get("items", [])),
+                npcs=tuple(tile_data.get("npcs", [])),
+                objects=tuple(tile_data.get("objects", [])),
+            )
+        )
+    return MapTemplate(
+        name=map_name,
+        metadata=metadata,
+        has_metadata=has_metadata,
+        tiles=tuple(tiles),
+        mtime_ns=mtime_ns,
+        size=size,
+    )
+
+
+def get_map_template(json_path) -> MapTemplate:
+    """Return the cached template for ``json_path``, (re)parsing it if stale."""
+    json_path = Path(json_path)
+    try:
+        st = os.stat(json_path)
+    except OSError:
+        # Nothing on disk to key or validate a cache entry against; parse
+        # uncached and let open() raise the real error if the file is gone.
+        return _parse_map_template(json_path, 0, 0)
+    key = str(json_path.resolve())
+    cached = _MAP_TEMPLATES.get(key)
+    if cached is not None and cached.mtime_ns == st.st_mtime_ns and cached.size == st.st_size:
+        return cached
+    with _MAP_TEMPLATES_LOCK:
+        cached = _MAP_TEMPLATES.get(key)
+        if cached is not None and cached.mtime_ns == st.st_mtime_ns and cached.size == st.st_size:
+            return cached
+        template = _parse_map_template(json_path, st.st_mtime_ns, st.st_size)
+        _MAP_TEMPLATES[key] = template
+        return template
+
+
+def clear_map_template_cache():
+    """Drop every cached map template (tests / the map editor's hot reload)."""
+    with _MAP_TEMPLATES_LOCK:
+        _MAP_TEMPLATES.clear()
+    with _PRISTINE_TILES_LOCK:
+        _PRISTINE_TILES.clear()
+
+
+# ---------------- LAZY MAPS -----------------
+# A lazy universe (GameConfig.lazy_maps) keeps one LazyMap slot per shipped map
+# in Universe.maps instead of a fully built tile graph for each. Only the maps
+# the player actually enters are ever built, and maps the player has left can
+# be paged back out to a compressed pickle, so per-session memory scales with
+# maps visited rather than maps shipped (combat-testing-arena, shop-testing
+# and test-chest are never built in a normal run).
+
+
+class _MapPagePickler(pickle.Pickler):
+    """Pickle one map's tiles without dragging the rest of the world along.
+
+    Tiles point at the universe, events/NPCs at the player, and passages or
+    followers can point at other maps; those are written as references and
+    re-bound on page-in, so only the paged map's own objects are copied.
+    """
+
+    def __init__(self, file, universe):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.universe = universe
+        self._map_index = {id(m): i for i, m in enumerate(universe.maps)}
+
+    def persistent_id(self, obj):
+        if obj is self.universe:
+            return ("universe",)
+        if obj is not None and obj is self.universe.player:
+            return ("player",)
+        if isinstance(obj, LazyMap):
+            return ("map", self._map_index[id(obj)])
+        return None
+
+
+class _MapPageUnpickler(secure_pickle.SafeUnpickler):
+    """SafeUnpickler that re-binds the references _MapPagePickler wrote.
+
+    Paged maps ride along inside save files, so they go through the same
+    class gate as the save that carried them.
+    """
+
+    def __init__(self, file, universe):
+        super().__init__(file)
+        self.universe = universe
+
+    def persistent_load(self, pid):
+        kind = pid[0]
+        if kind == "universe":
+            return self.universe
+        if kind == "player":
+            return self.universe.player
+        if kind == "map":
+            return self.universe.maps[pid[1]]
+        raise pickle.UnpicklingError(f"unknown map page reference {pid!r}")
+
+
+class LazyMap(dict):
+    """A ``Universe.maps`` entry whose tiles are built on first use.
+
+    Until something looks past ``"name"`` the slot holds only the name, so the
+    name scans done by teleport, startmap selection and story lookups stay
+    cheap. Any tile access materializes the map *in place* -- ``player.map``
+    and every ``tile.map`` keep pointing at this same dict -- either from the
+    cached template or from the page written by :meth:`page_out`.
+    """
+
+    def __init__(self, universe=None, name=None, source=None):
+        super().__init__()
+        self.universe = universe
+        self.source = source  # template path (str) for the first build
+        self._paged = None  # compressed page once evicted
+        # An unnamed LazyMap is the shell pickle rebuilds into; its items and
+        # state arrive right after, so it must not try to build itself.
+        self._resident = name is None
+        if name is not None:
+            dict.__setitem__(self, "name", name)
+
+    @property
+    def resident(self):
+        """True when the tiles are in memory (built or paged back in)."""
+        return self._resident
+
+    def materialize(self):
+        """Build (or page back in) this map's tiles; a no-op when resident."""
+        if self._resident:
+            return self
+        # Flip first: building tiles hands ``self`` to every MapTile and may
+        # read it back, which must not recurse into another build.
+        self._resident = True
+        universe = self.universe
+        try:
+            if self._paged is not None:
+                page, self._paged = self._paged, None
+                with io.BytesIO(zlib.decompress(page)) as fp:
+                    dict.update(self, _MapPageUnpickler(fp, universe).load())
+            else:
+                universe._instantiate_map(
+                    universe.player, get_map_template(self.source), into=self
+                )
+        except Exception as e:
+            # Same outcome as a map that fails during an eager build: the
+            # map is reported and simply has no tiles.
+            narrate(f"ERROR: Failed to load map from {self.source}: {e}")
+        universe._note_resident(self)
+        return self
+
+    def page_out(self):
+        """Swap this map's tiles for a compressed pickle; returns True if done.
+
+        Refused for the map the player is standing on and for maps holding
+        one of the player's party, whose objects must keep their identity.
+        """
+        if not self._resident or self.universe is None:
+            return False
+        player = self.universe.player
+        if player is not None:
+            if getattr(player, "map", None) is self:
+                return False
+            party = [a for a in getattr(player, "combat_list_allies", []) if a is not player]
+            if party and any(
+                npc is ally
+                for coord, tile in dict.items(self)
+                if isinstance(coord, tuple) and tile is not None
+                for npc in getattr(tile, "npcs_here", [])
+                for ally in party
+            ):
+                return False
+        content = {k: v for k, v in dict.items(self) if k != "name"}
+        with io.BytesIO() as fp:
+            _MapPagePickler(fp, self.universe).dump(content)
+            self._paged = zlib.compress(fp.getvalue())
+        name = dict.get(self, "name")
+        dict.clear(self)
+        dict.__setitem__(self, "name", name)
+        self._resident = False
+        self.universe._note_cold(self)
+        return True
+
+    # Every read past "name" materializes first; "name" itself never does.
+    def __getitem__(self, key):
+        if key != "name" and not self._resident:
+            self.materialize()
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if key != "name" and not self._resident:
+            self.materialize()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        if key != "name" and not self._resident:
+            self.materialize()
+        return dict.__contains__(self, key)
+
+    def __delitem__(self, key):
+        self.materialize()
+        dict.__delitem__(self, key)
+
+    def __iter__(self):
+        self.materialize()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self.materialize()
+        return dict.__len__(self)
+
+    def __bool__(self):
+        # A map always has a name; truthiness checks shouldn't build it.
+        return True
+
+    def keys(self):
+        self.materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self.materialize()
+        return dict.values(self)
+
+    def items(self):
+        self.materialize()
+        return dict.items(self)
+
+    def pop(self, *args):
+        self.materialize()
+        return dict.pop(self, *args)
+
+    def setdefault(self, key, default=None):
+        self.materialize()
+        return dict.setdefault(self, key, default)
+
+    def copy(self):
+        self.materialize()
+        return dict.copy(self)
+
+    def __repr__(self):
+        if self._resident:
+            return dict.__repr__(self)
+        state = "paged" if self._paged is not None else "cold"
+        return f"<LazyMap {dict.get(self, 'name')!r} {state}>"
+
+    def __reduce_ex__(self, protocol):
+        # Saves and session checkpoints carry the map exactly as it is: tiles
+        # when resident, otherwise just the name plus page/template source.
+        # Items and state are restored after the shell is memoized, so the
+        # tile -> map back-references resolve to this same object.
+        return (LazyMap, (), dict(self.__dict__), None, iter(dict.items(self)))
+
+
+class _SpawnerIndex:
+    """The map-entry spawners on one map, in tile/event order.
+
+    Tiles whose ``events_here`` is an EventList keep the index current through
+    ``Universe._tile_events_changed``. Tiles carrying a plain list (hand-built
+    tiles, test doubles) can't report changes, so they are rescanned on every
+    pass exactly as before.
+    """
+
+    __slots__ = ("entries", "untracked", "size")
+
+    def __init__(self, game_map):
+        from src.tiles import EventList, MapTile
+
+        self.entries = {}  # (id(tile), id(event)) -> (tile, event)
+        self.untracked = []
+        self.size = dict.__len__(game_map)
+        for coord, tile in dict.items(game_map):
+            if not isinstance(coord, tuple) or tile is None:
+                continue
+            events = getattr(tile, "events_here", None)
+            if isinstance(tile, MapTile) and type(events) is list:
+                # Tiles restored from saves made before EventList existed.
+                tile.events_here = events = EventList(tile, events)
+            if isinstance(events, EventList):
+                for ev in events:
+                    self.add(tile, ev)
+            else:
+                self.untracked.append(tile)
+
+    def add(self, tile, ev):
+        if hasattr(ev, "evaluate_for_map_entry"):
+            self.entries[(id(tile), id(ev))] = (tile, ev)
+
+    def discard(self, tile, ev):
+        self.entries.pop((id(tile), id(ev)), None)
+
+    def candidates(self):
+        found = list(self.entries.values())
+        for tile in self.untracked:
+            for ev in list(getattr(tile, "events_here", [])):
+                if hasattr(ev, "evaluate_for_map_entry"):
+                    found.append((tile, ev))
+        return found
+
 
 def tile_exists(map_to_check, x, y):
     """Returns the tile at the given coordinates or None if there is no tile.
@@ -51,6 +488,37 @@ class Universe:  # "globals" for the game state can be stored here, as well as a
         self.testing_mode = False  # test mode flag from config
         self.game_config = None  # full GameConfig object for access to all settings
         self.coordinate_config = None  # CoordinateSystemConfig for grid positioning
+        # Lazy map mode (GameConfig.lazy_maps): maps are LazyMap slots built on
+        # first entry. max_resident_maps > 0 pages the least recently entered
+        # maps back out once more than that many are built; 0 never pages out.
+        self.lazy_maps = False
+        self.max_resident_maps = 0
+        self._resident_maps = []  # built LazyMaps, least recently entered first
+        # map name -> JSON file it was built from, so delta saves can find the
+        # template an eager (plain dict) map came from.
+        self.map_sources = {}
+        # id(map) -> (map, _SpawnerIndex); transient, rebuilt on demand.
+        self._spawner_indexes = {}
+        # id(tile) -> last delta-save fingerprint of the tile; transient, see
+        # _unchanged_tiles.
+        self._tile_checks = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Keyed by id(), which means nothing once unpickled.
+        state.pop("_spawner_indexes", None)
+        state.pop("_tile_checks", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._spawner_indexes = {}
+        self._tile_checks = {}
+        # Universes pickled before lazy maps existed.
+        self.__dict__.setdefault("lazy_maps", False)
+        self.__dict__.setdefault("max_resident_maps", 0)
+        self.__dict__.setdefault("_resident_maps", [])
+        self.__dict__.setdefault("map_sources", {})
 
     def get_tile(self, x, y):
         """Get tile at coordinates from the current player's map."""
@@ -78,6 +546,55 @@ class Universe:  # "globals" for the game state can be stored here, as well as a
                 if "start" in location["name"] and self.starting_map_default is None:
                     self.starting_map_default = location
 
+    def touch_map(self, game_map):
+        """Record that the player just entered ``game_map``.
+
+        Keeps the lazy-mode residency order up to date and pages out the least
+        recently entered maps beyond ``max_resident_maps``. Eager maps (plain
+        dicts) are ignored.
+        """
+        # Entering a map rebuilds its spawner index, which also picks up any
+        # one-shot spawner whose has_run was reset while it was retired.
+        self._spawner_indexes.pop(id(game_map), None)
+        if not isinstance(game_map, LazyMap):
+            return
+        game_map.materialize()
+        self._resident_maps = [m for m in self._resident_maps if m is not game_map]
+        self._resident_maps.append(game_map)
+        self._evict_cold_maps()
+
+    def _note_resident(self, game_map):
+        if not any(m is game_map for m in self._resident_maps):
+            self._resident_maps.append(game_map)
+        self._evict_cold_maps()
+
+    def _note_cold(self, game_map):
+        self._spawner_indexes.pop(id(game_map), None)
+        self._resident_maps = [m for m in self._resident_maps if m is not game_map]
+
+    def _evict_cold_maps(self):
+        budget = self.max_resident_maps
+        if budget <= 0:
+            return
+        # Oldest first; maps that refuse (the player's own, party members on
+        # board) simply stay resident until they can go.
+        for game_map in list(self._resident_maps[:-budget]):
+            if len(self._resident_maps) <= budget:
+                break
+            game_map.page_out()
+
+    def map_residency(self):
+        """Count maps by state: built, paged out, or never built."""
+        counts = {"resident": 0, "paged": 0, "cold": 0}
+        for game_map in self.maps:
+            if not isinstance(game_map, LazyMap) or game_map.resident:
+                counts["resident"] += 1
+            elif game_map._paged is not None:
+                counts["paged"] += 1
+            else:
+                counts["cold"] += 1
+        return counts
+
     # ---------------- JSON MAP SUPPORT -----------------
     def _json_maps_root_candidates(self):
         """Return candidate directories that may contain json map files."""
@@ -230,8 +747,7 @@ class Universe:  # "globals" for the game state can be stored here, as well as a
             cls = getattr(module, cls_name)
             # Try to supply only parameters accepted by __init__ (excluding self)
             try:
-                sig = inspect.signature(cls.__init__)
-                pnames = [p.name for p in sig.parameters.values() if p.name != "self"]
+                pnames = map_placeholders._init_param_names(cls)
                 init_kwargs = {k: v for k, v in props.items() if k in pnames}
                 # If 'player' is a parameter, pass self.player
                 if "player" in pnames and "player" not in init_kwargs:
@@ -278,195 +794,201 @@ class Universe:  # "globals" for the game state can be stored here, as well as a
             return None
 
     def _load_single_json_map(self, player, json_path: Path):
-        # Local import: src.tiles -> src.actions -> src.player -> src.universe
-        # is a circular chain at module-load time, so MapTile must be imported
-        # lazily here rather than at the top of this module.
-        from src.tiles import MapTile
+        json_path = Path(json_path)
+        self.map_sources[json_path.stem] = str(json_path)
+        if self.lazy_maps:
+            # Only the name is needed up front; the file is parsed (or found
+            # in the template cache) when the map is first entered.
+            self.maps.append(LazyMap(self, json_path.stem, str(json_path)))
+            return
+        self.maps.append(self._instantiate_map(player, get_map_template(json_path)))
 
-        with open(json_path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-        map_name = json_path.stem
-        this_map: dict = {"name": map_name}
-        # iterate coordinate keys
-        for coord_str, tile_data in raw.items():
-            if coord_str == "metadata":
-                this_map["metadata"] = tile_data
-                continue
+    def _map_template(self, game_map):
+        """Return the template ``game_map`` was built from, or None if unknown."""
+        name = dict.get(game_map, "name")
+        if not isinstance(name, str) or Path(name).name != name:
+            return None
+        candidates = [getattr(game_map, "source", None), self.map_sources.get(name)]
+        candidates += [root / f"{name}.json" for root in self._json_maps_root_candidates()]
+        for source in candidates:
+            if source and os.path.isfile(source):
+                return get_map_template(source)
+        return None
+
+    def _rehydrate_tile(self, tile, game_map, x, y, tt):
+        """Rebuild a tile a delta save stored as "unchanged" from its template.
+
+        ``tt`` is the TileTemplate at ``(x, y)`` in the map's template, or None
+        when the template no longer has one.
+        """
+        if tt is None:
+            # The map file changed or went missing since the save was written;
+            # keep the tile (other objects may point at it) but leave it bare.
+            narrate(
+                f"ERROR: No template tile at ({x}, {y}) in map "
+                f"'{dict.get(game_map, 'name')}'; restoring an empty tile"
+            )
+            type(tile).__init__(tile, self, game_map, x, y)
+            return tile
+        return self._instantiate_tile(self.player, game_map, tt, into=tile)
+
+    def _instantiate_map(self, player, template: MapTemplate, into=None) -> dict:
+        """Build this session's live tiles/NPCs/items/events from a template.
+
+        Every runtime object is constructed fresh (constructors roll names,
+        personalities and stock), so sessions never share mutable state with
+        each other or with the cached template. ``into`` fills an existing map
+        dict (a LazyMap materializing in place) instead of a new one.
+        """
+        this_map: dict = {} if into is None else into
+        this_map["name"] = template.name
+        if template.has_metadata:
+            this_map["metadata"] = copy.deepcopy(template.metadata)
+        for tt in template.tiles:
+            self._instantiate_tile(player, this_map, tt)
+        return this_map
+
+    def _instantiate_tile(self, player, this_map, tt: TileTemplate, into=None):
+        """Build one live tile (and its events/items/NPCs/objects) from ``tt``.
+
+        ``into`` initializes an existing, still-empty tile object in place (a
+        tile a delta save left as a template reference) instead of a new one.
+        """
+        x, y = tt.x, tt.y
+        if into is None:
+            tile_instance = tt.tile_cls(self, this_map, x, y)
+        else:
+            tile_instance = into
+            type(into).__init__(into, self, this_map, x, y)
+        # Store tile name from JSON title; only if the class didn't set its own.
+        # MapTile.__init__ never sets self.name, so getattr returns None for generic tiles.
+        if not getattr(tile_instance, "name", None):
+            tile_instance.name = tt.title
+        # Override description from JSON only if one was provided (tile subclasses
+        # may hardcode their own description via super().__init__; respect that as default)
+        if tt.description:
+            tile_instance.description = tt.description
+        if tt.block_exit is not None:
+            tile_instance.block_exit = list(tt.block_exit)
+        for _dir in tt.exit_blocks:
+            if _dir not in tile_instance.block_exit:
+                tile_instance.block_exit.append(_dir)
+        if tt.has_symbol and hasattr(tile_instance, "symbol"):
             try:
-                x_str, y_str = coord_str.strip("()").split(",")
-                x = int(x_str)
-                y = int(y_str)
+                tile_instance.symbol = tt.symbol
             except Exception:
-                continue
-            # ``title`` is a human-readable display name chosen freely by map
-            # designers/the map editor (e.g. "Conclave Archive — Reading Hall",
-            # "RiversEdge") — it has not been a reliable tileset *class* name
-            # for a long time, so it is never used for class resolution here.
-            # A tile only gets a real ``src.tilesets`` subclass when the JSON
-            # explicitly names one via an optional "class" field; otherwise it
-            # is a plain MapTile carrying its description/exits/events/etc.
-            # from JSON data alone (which is how the vast majority of tiles
-            # already work in practice).
-            title = tile_data.get("title") or tile_data.get("id") or f"tile_{x}_{y}"
-            description = tile_data.get("description", "")
-            class_name = tile_data.get("class")
-            if class_name:
+                pass
+        # bgm — transferred from JSON so _resolve_bgm can pick it up
+        # without relying solely on map-name fallback
+        if tt.has_bgm:
+            tile_instance.bgm = tt.bgm
+        # events
+        for ev_payload in tt.events:
+            inst = self._deserialize_saved_instance(ev_payload, tile=tile_instance)
+            if inst:
                 try:
-                    tile_cls = functions.seek_class(
-                        class_name, "tilesets", allow_other_modules=False
-                    )
-                except ValueError as e:
-                    narrate(
-                        f"ERROR: Failed to resolve tile class '{class_name}' "
-                        f"at {coord_str} in map '{map_name}': {e}; falling back to MapTile"
-                    )
-                    tile_cls = MapTile
-            else:
-                tile_cls = MapTile
-            tile_instance = tile_cls(self, this_map, x, y)
-            # Store tile name from JSON title; only if the class didn't set its own.
-            # MapTile.__init__ never sets self.name, so getattr returns None for generic tiles.
-            if not getattr(tile_instance, "name", None):
-                tile_instance.name = title
-            # Override description from JSON only if one was provided (tile subclasses
-            # may hardcode their own description via super().__init__; respect that as default)
-            if description:
-                tile_instance.description = description
-            # block exits & symbol
-            if "block_exit" in tile_data and isinstance(tile_data["block_exit"], list):
-                tile_instance.block_exit = list(tile_data["block_exit"])
-            # exits whitelist: if the JSON specifies allowed exits, block every other direction
-            _all_dirs = {
-                "north",
-                "south",
-                "east",
-                "west",
-                "northeast",
-                "northwest",
-                "southeast",
-                "southwest",
-            }
-            if "exits" in tile_data and isinstance(tile_data["exits"], list):
-                allowed = set(tile_data["exits"])
-                for _dir in _all_dirs - allowed:
-                    if _dir not in tile_instance.block_exit:
-                        tile_instance.block_exit.append(_dir)
-            if "symbol" in tile_data and hasattr(tile_instance, "symbol"):
-                try:
-                    tile_instance.symbol = tile_data["symbol"]
-                except Exception:
-                    pass
-            # bgm — transferred from JSON so _resolve_bgm can pick it up
-            # without relying solely on map-name fallback
-            if "bgm" in tile_data:
-                tile_instance.bgm = tile_data["bgm"]
-            # events
-            for ev_payload in tile_data.get("events", []):
-                inst = self._deserialize_saved_instance(ev_payload, tile=tile_instance)
-                if inst:
-                    try:
-                        # Robust handling for events whose __init__ could not be executed (missing required args like 'tile').
-                        # If the event instance lacks a 'tile' attribute entirely, attempt re-instantiation supplying player & tile.
-                        if not hasattr(inst, "tile"):
+                    # Robust handling for events whose __init__ could not be executed (missing required args like 'tile').
+                    # If the event instance lacks a 'tile' attribute entirely, attempt re-instantiation supplying player & tile.
+                    if not hasattr(inst, "tile"):
+                        try:
+                            cls = inst.__class__
+                            sig = inspect.signature(cls.__init__)
+                            params = sig.parameters
+                            init_kwargs = {}
+                            if "player" in params:
+                                init_kwargs["player"] = player
+                            if "tile" in params:
+                                init_kwargs["tile"] = tile_instance
+                            if "params" in params:
+                                init_kwargs["params"] = None
+                            if "repeat" in params:
+                                init_kwargs["repeat"] = False
+                            if "name" in params:
+                                # Preserve existing name attribute if any, else class name
+                                init_kwargs["name"] = getattr(
+                                    inst, "name", cls.__name__
+                                )
+                            reinited = cls(**init_kwargs)
+                            inst = reinited
+                        except Exception:
+                            # Fallback: synthesize minimal attributes
                             try:
-                                cls = inst.__class__
-                                sig = inspect.signature(cls.__init__)
-                                params = sig.parameters
-                                init_kwargs = {}
-                                if "player" in params:
-                                    init_kwargs["player"] = player
-                                if "tile" in params:
-                                    init_kwargs["tile"] = tile_instance
-                                if "params" in params:
-                                    init_kwargs["params"] = None
-                                if "repeat" in params:
-                                    init_kwargs["repeat"] = False
-                                if "name" in params:
-                                    # Preserve existing name attribute if any, else class name
-                                    init_kwargs["name"] = getattr(
-                                        inst, "name", cls.__name__
-                                    )
-                                reinited = cls(**init_kwargs)
-                                inst = reinited
+                                inst.player = player
                             except Exception:
-                                # Fallback: synthesize minimal attributes
-                                try:
-                                    inst.player = player
-                                except Exception:
-                                    pass
-                                try:
-                                    inst.tile = tile_instance
-                                except Exception:
-                                    pass
-                        # If 'tile' exists but is None, assign it now.
-                        if (
-                            hasattr(inst, "tile")
-                            and getattr(inst, "tile", None) is None
-                        ):
-                            inst.tile = tile_instance
-                        # Always ensure player reference if attribute exists or expected by common pattern.
-                        if hasattr(inst, "player"):
-                            inst.player = player
-                        tile_instance.events_here.append(inst)
-                    except Exception:
-                        pass
-            # items
-            for it_payload in tile_data.get("items", []):
-                inst = self._deserialize_saved_instance(it_payload, tile=tile_instance)
-                if inst:
-                    if hasattr(inst, "player"):
-                        inst.player = player
-                    # Only assign tile if attribute exists and is currently None
-                    try:
-                        if (
-                            hasattr(inst, "tile")
-                            and getattr(inst, "tile", None) is None
-                        ):
-                            inst.tile = tile_instance
-                    except Exception:
-                        pass
-                    tile_instance.items_here.append(inst)
-            # npcs
-            for npc_payload in tile_data.get("npcs", []):
-                inst = self._deserialize_saved_instance(npc_payload, tile=tile_instance)
-                if inst:
-                    if hasattr(inst, "player"):
-                        inst.player = player
-                    # Ensure NPCs know which room they occupy. Some NPC classes expect 'current_room',
-                    # others may use 'tile'. Set whichever attribute exists and is None so deserialized merchants
-                    # have their current_room populated without overwriting an existing reference.
-                    try:
-                        if (
-                            hasattr(inst, "current_room")
-                            and getattr(inst, "current_room", None) is None
-                        ):
-                            inst.current_room = tile_instance
-                        if (
-                            hasattr(inst, "tile")
-                            and getattr(inst, "tile", None) is None
-                        ):
-                            inst.tile = tile_instance
-                    except Exception:
-                        pass
-                    tile_instance.npcs_here.append(inst)
-            # objects
-            for obj_payload in tile_data.get("objects", []):
-                inst = self._deserialize_saved_instance(obj_payload, tile=tile_instance)
-                if inst:
+                                pass
+                            try:
+                                inst.tile = tile_instance
+                            except Exception:
+                                pass
+                    # If 'tile' exists but is None, assign it now.
+                    if (
+                        hasattr(inst, "tile")
+                        and getattr(inst, "tile", None) is None
+                    ):
+                        inst.tile = tile_instance
+                    # Always ensure player reference if attribute exists or expected by common pattern.
                     if hasattr(inst, "player"):
                         inst.player = player
-                    # Ensure objects receive a reference to their tile if they expect it, but don't overwrite
-                    try:
-                        if (
-                            hasattr(inst, "tile")
-                            and getattr(inst, "tile", None) is None
-                        ):
-                            inst.tile = tile_instance
-                    except Exception:
-                        pass
-                    tile_instance.objects_here.append(inst)
-            this_map[(x, y)] = tile_instance
-        self.maps.append(this_map)
+                    tile_instance.events_here.append(inst)
+                except Exception:
+                    pass
+        # items
+        for it_payload in tt.items:
+            inst = self._deserialize_saved_instance(it_payload, tile=tile_instance)
+            if inst:
+                if hasattr(inst, "player"):
+                    inst.player = player
+                # Only assign tile if attribute exists and is currently None
+                try:
+                    if (
+                        hasattr(inst, "tile")
+                        and getattr(inst, "tile", None) is None
+                    ):
+                        inst.tile = tile_instance
+                except Exception:
+                    pass
+                tile_instance.items_here.append(inst)
+        # npcs
+        for npc_payload in tt.npcs:
+            inst = self._deserialize_saved_instance(npc_payload, tile=tile_instance)
+            if inst:
+                if hasattr(inst, "player"):
+                    inst.player = player
+                # Ensure NPCs know which room they occupy. Some NPC classes expect 'current_room',
+                # others may use 'tile'. Set whichever attribute exists and is None so deserialized merchants
+                # have their current_room populated without overwriting an existing reference.
+                try:
+                    if (
+                        hasattr(inst, "current_room")
+                        and getattr(inst, "current_room", None) is None
+                    ):
+                        inst.current_room = tile_instance
+                    if (
+                        hasattr(inst, "tile")
+                        and getattr(inst, "tile", None) is None
+                    ):
+                        inst.tile = tile_instance
+                except Exception:
+                    pass
+                tile_instance.npcs_here.append(inst)
+        # objects
+        for obj_payload in tt.objects:
+            inst = self._deserialize_saved_instance(obj_payload, tile=tile_instance)
+            if inst:
+                if hasattr(inst, "player"):
+                    inst.player = player
+                # Ensure objects receive a reference to their tile if they expect it, but don't overwrite
+                try:
+                    if (
+                        hasattr(inst, "tile")
+                        and getattr(inst, "tile", None) is None
+                    ):
+                        inst.tile = tile_instance
+                except Exception:
+                    pass
+                tile_instance.objects_here.append(inst)
+        this_map[(x, y)] = tile_instance
+        return tile_instance
 
     def game_tick_events(self):
         """
@@ -489,28 +1011,379 @@ class Universe:  # "globals" for the game state can be stored here, as well as a
         # ones (each event guards its own has_run/repeat state internally).
         self._evaluate_map_entry_spawners(process_repeats=True)
 
+    def _spawner_index(self, game_map):
+        cached = self._spawner_indexes.get(id(game_map))
+        if (
+            cached is not None
+            and cached[0] is game_map
+            and cached[1].size == dict.__len__(game_map)
+        ):
+            return cached[1]
+        index = _SpawnerIndex(game_map)
+        self._spawner_indexes[id(game_map)] = (game_map, index)
+        return index
+
+    def _tile_events_changed(self, tile, added, removed):
+        """EventList hook: keep the owning map's spawner index in step."""
+        game_map = getattr(tile, "map", None)
+        cached = self._spawner_indexes.get(id(game_map))
+        if cached is None or cached[0] is not game_map:
+            return  # not indexed yet; the first pass will scan it
+        index = cached[1]
+        for ev in removed:
+            # The same event may sit on the tile twice; keep it while it does.
+            if not any(e is ev for e in tile.events_here):
+                index.discard(tile, ev)
+        for ev in added:
+            index.add(tile, ev)
+
     def _evaluate_map_entry_spawners(self, process_repeats=False):
-        """Scan current map for events that expose evaluate_for_map_entry() and trigger them."""
+        """Trigger the current map's events that expose evaluate_for_map_entry().
+
+        Runs every tick and on every step, so it walks the map's spawner index
+        (O(spawners)) rather than every tile's events (O(tiles x events)).
+        """
         try:
             current_map = self.player.map
             if not isinstance(current_map, dict):
                 return
-            for coord, tile in current_map.items():
-                if not isinstance(
-                    coord, tuple
-                ):  # skip non-coordinate entries like 'name'
-                    continue
-                if tile is None:
+            index = self._spawner_index(current_map)
+            # Snapshot: evaluating an event may add or remove events.
+            for tile, ev in index.candidates():
+                has_run = getattr(ev, "has_run", False)
+                is_repeat = getattr(ev, "repeat", False)
+                if has_run and not is_repeat:
+                    # A spent one-shot can never qualify again; retire it
+                    # until the map is next entered and re-indexed.
+                    index.discard(tile, ev)
                     continue
-                # Work on a shallow copy since event list may mutate during iteration
-                for ev in list(getattr(tile, "events_here", [])):
-                    if hasattr(ev, "evaluate_for_map_entry"):
-                        has_run = getattr(ev, "has_run", False)
-                        is_repeat = getattr(ev, "repeat", False)
-                        if (not has_run) or (process_repeats and is_repeat):
-                            try:
-                                ev.evaluate_for_map_entry(self.player)
-                            except Exception:
-                                continue
+                if (not has_run) or (process_repeats and is_repeat):
+                    try:
+                        ev.evaluate_for_map_entry(self.player)
+                    except Exception:
+                        continue
         except Exception:
             pass
+
+
+# ---------------- DELTA SAVES -----------------
+# A full save pickles every built tile of every map, although most of them are
+# exactly what the shipped map JSON produces. serialize_delta_save writes those
+# unchanged tiles as references instead, and DeltaSaveUnpickler rebuilds them
+# from the cached templates on load, so a save carries only what the player
+# changed: visited or modified tiles, moved/killed NPCs, taken items, etc.
+#
+# "Unchanged" is decided by pickling each live tile on its own (with the
+# universe, player, maps and other tiles written as references) and comparing
+# the digest against the same for a fresh build of the template. Templates are
+# built twice and only tiles whose two builds agree get a digest: a tile whose
+# constructors roll random state (names, stock) never matches, so it is always
+# saved in full, exactly as before.
+#
+# A tile's fingerprint is kept on the universe and reused by the next save
+# while the tile's own attributes and the contents of its npc/item/object/
+# event lists are the same objects as before (see _tile_signature). Tiles on
+# the player's current map are fingerprinted on every save, since that is
+# where the game changes things inside those objects; the rest are only
+# fingerprinted again once something is moved, added, removed or reassigned
+# on them.
+
+# Per template: id(template) -> (template, {(x, y): digest}, shared), where
+# ``shared`` holds (by id) the objects every build of it reaches.
+_PRISTINE_TILES: dict = {}
+_PRISTINE_TILES_LOCK = threading.Lock()
+
+# Objects that pickle by reference; the same one turning up inside and outside
+# an unchanged tile is not sharing anything.
+_BY_REFERENCE: Final = (
+    type,
+    enum.Enum,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.ModuleType,
+)
+
+
+def _fingerprint_ref(*ref):  # pragma: no cover - fingerprints are never loaded
+    raise pickle.UnpicklingError(f"tile fingerprint reference {ref!r}")
+
+
+class _TileFingerprinter(pickle.Pickler):
+    """Pickle one tile for comparison, writing everything outside it as refs.
+
+    The universe, player, LazyMaps and other tiles go through
+    ``reducer_override``, which the C pickler only consults for objects it
+    has no built-in handler for, so fingerprinting runs at close to plain
+    pickle speed. The tile's own map is usually a plain dict, which never
+    reaches ``reducer_override``; it is pre-seeded into the memo instead and
+    written as a back-reference. Every other instance pickled as part of the
+    tile is collected in ``instances``.
+    """
+
+    def __init__(self, file, refs, tile, game_map):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._refs = refs
+        self._tile = tile
+        self.memo = {id(game_map): (0, game_map)}
+        self.instances = []
+
+    def reducer_override(self, obj):
+        if obj is not self._tile:
+            ref = self._refs.get(id(obj))
+            if ref is not None:
+                return _fingerprint_ref, ref
+            if not isinstance(obj, _BY_REFERENCE):
+                self.instances.append(obj)
+        return NotImplemented
+
+
+def _fingerprint_refs(universe, maps):
+    """id -> reference for the objects a tile fingerprint must not copy."""
+    refs = {id(universe): ("universe",)}
+    if universe.player is not None:
+        refs[id(universe.player)] = ("player",)
+    for game_map in maps:
+        name = dict.get(game_map, "name")
+        refs[id(game_map)] = ("map", name)
+        for coord, tile in dict.items(game_map):
+            if isinstance(coord, tuple) and tile is not None:
+                refs[id(tile)] = ("tile", name, coord)
+    return refs
+
+
+def _tile_fingerprint(tile, game_map, refs):
+    """Pickle ``tile`` on its own; returns (digest, instances inside it)."""
+    with io.BytesIO() as fp:
+        pickler = _TileFingerprinter(fp, refs, tile, game_map)
+        pickler.dump(tile)
+        return hashlib.sha256(fp.getbuffer()).digest(), pickler.instances
+
+
+def _build_fingerprints(universe, template):
+    """Build ``template`` once; returns ({(x, y): digest}, {id: instance})."""
+    game_map = universe._instantiate_map(universe.player, template)
+    refs = _fingerprint_refs(universe, [game_map])
+    digests = {}
+    instances = {}
+    for coord, tile in dict.items(game_map):
+        if isinstance(coord, tuple) and tile is not None:
+            try:
+                digests[coord], reached = _tile_fingerprint(tile, game_map, refs)
+            except Exception:
+                continue  # never matches, so the live tile is saved in full
+            instances.update((id(obj), obj) for obj in reached)
+    return digests, instances
+
+
+def _pristine_tiles(template, scratch):
+    """(digests, shared) for fresh builds of ``template`` (cached).
+
+    ``digests`` maps each coordinate whose tile comes out the same in two
+    independent builds to that tile's fingerprint. ``shared`` maps the ids of
+    instances both builds reach, i.e. module level data every build shares,
+    to the objects themselves; a live tile holding one of those is not
+    sharing anything a rebuild would lose. Keeping just those objects keeps
+    their ids unique without keeping the builds. ``scratch`` is a list that
+    holds the throwaway Universe the builds hang off, made on first need.
+    """
+    cached = _PRISTINE_TILES.get(id(template))
+    if cached is not None and cached[0] is template:
+        return cached[1], cached[2]
+    # Building the throwaway copies must not shift the session's random stream.
+    rng_state = random.getstate()
+    try:
+        if not scratch:
+            # Local import: src.player imports this module.
+            from src.player import Player
+
+            scratch.append(Universe(Player()))
+        first, first_reached = _build_fingerprints(scratch[0], template)
+        second, second_reached = _build_fingerprints(scratch[0], template)
+    finally:
+        random.setstate(rng_state)
+    digests = {coord: digest for coord, digest in first.items() if second.get(coord) == digest}
+    shared = {key: obj for key, obj in first_reached.items() if key in second_reached}
+    with _PRISTINE_TILES_LOCK:
+        _PRISTINE_TILES[id(template)] = (template, digests, shared)
+    return digests, shared
+
+
+def _tile_signature(tile):
+    """A shallow snapshot of ``tile``: its attributes and what its lists hold.
+
+    Equal snapshots mean no attribute of the tile was reassigned and nothing
+    was added to or removed from its lists (npcs, items, objects, events,
+    blocked exits); the objects inside may still have changed. Scalars compare
+    by value, lists by their members' identities, anything else (the map, the
+    universe) by identity.
+    """
+    parts = []
+    for key, value in vars(tile).items():
+        if value is None or isinstance(value, (bool, int, float, str)):
+            parts.append((key, value))
+        elif isinstance(value, list):
+            parts.append((key, id(value), tuple(map(id, value))))
+        else:
+            parts.append((key, id(value)))
+    return tuple(parts)
+
+
+def _unchanged_tiles(universe):
+    """Find the tiles that still match their template.
+
+    Returns ``(unchanged, owners)``: id(tile) -> (map, tile) for each of
+    them, and id -> id(tile) for those tiles and every instance inside them.
+    An instance reachable from two such tiles would come back as two copies,
+    so the tiles involved are saved in full instead.
+    """
+    refs = _fingerprint_refs(universe, universe.maps)
+    player_map = getattr(universe.player, "map", None)
+    previous = universe._tile_checks
+    checks = {}
+    scratch = []
+    unchanged = {}
+    owners = {}
+    split = set()
+    for game_map in universe.maps:
+        if isinstance(game_map, LazyMap) and not game_map.resident:
+            continue  # cold maps are already just a name, paged maps a page
+        template = universe._map_template(game_map)
+        if template is None:
+            continue
+        digests, shared = _pristine_tiles(template, scratch)
+        for coord, tile in dict.items(game_map):
+            expected = digests.get(coord) if isinstance(coord, tuple) else None
+            if expected is None or tile is None:
+                continue
+            key = id(tile)
+            # The player's map is never trusted from the cache (None never
+            # equals a snapshot), so its entries are refreshed once it is left.
+            signature = None if game_map is player_map else _tile_signature(tile)
+            cached = previous.get(key)
+            if cached is not None and cached[0] is tile and cached[1] is not None and cached[1] == signature:
+                digest, instances = cached[2], cached[3]
+            else:
+                try:
+                    digest, instances = _tile_fingerprint(tile, game_map, refs)
+                except Exception:
+                    continue  # the full pickle will report it
+            checks[key] = (tile, signature, digest, instances)
+            if digest != expected:
+                continue
+            unchanged[key] = (game_map, tile)
+            owners[key] = key
+            for obj in instances:
+                obj_id = id(obj)
+                if obj_id in shared:
+                    continue
+                owner = owners.setdefault(obj_id, key)
+                if owner != key:
+                    split.update((owner, key))
+    universe._tile_checks = checks
+    for key in split:
+        del unchanged[key]
+    if split:
+        owners = {obj_id: key for obj_id, key in owners.items() if key in unchanged}
+    return unchanged, owners
+
+
+def _template_tile(universe, tile_cls, game_map, x, y):
+    """Stands in for an unchanged tile in a delta save; see DeltaSaveUnpickler."""
+    raise pickle.UnpicklingError("delta saves must be loaded with DeltaSaveUnpickler")
+
+
+class _DeltaSavePickler(pickle.Pickler):
+    """Pickle a save, writing unchanged tiles as template references.
+
+    An instance from inside an unchanged tile that is reached some other way
+    would load as a separate copy; its tile is recorded in ``escaped`` and
+    must be saved in full.
+    """
+
+    def __init__(self, file, universe, unchanged, owners):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._universe = universe
+        self._unchanged = unchanged
+        self._owners = owners
+        self.escaped = set()
+
+    def reducer_override(self, obj):
+        key = self._owners.get(id(obj))
+        if key is None:
+            return NotImplemented
+        if key != id(obj):
+            self.escaped.add(key)
+            return NotImplemented
+        game_map, tile = self._unchanged[key]
+        return _template_tile, (self._universe, type(tile), game_map, tile.x, tile.y)
+
+
+def serialize_delta_save(obj, universe):
+    """Pickle ``obj`` like ``serialize_for_save``, minus unchanged tiles.
+
+    Tiles of ``universe`` that still match their map template are written as
+    references; load the result with :class:`DeltaSaveUnpickler`.
+    """
+    unchanged, owners = _unchanged_tiles(universe)
+    while True:
+        fp = secure_pickle.ChunkedSaveWriter()
+        pickler = _DeltaSavePickler(fp, universe, unchanged, owners)
+        pickler.dump(obj)
+        if not pickler.escaped:
+            return fp.finish()
+        for key in pickler.escaped:
+            del unchanged[key]
+        owners = {obj_id: key for obj_id, key in owners.items() if key in unchanged}
+
+
+class DeltaSaveUnpickler(secure_pickle.SafeUnpickler):
+    """SafeUnpickler that also reads saves from :func:`serialize_delta_save`.
+
+    Each tile reference becomes an empty tile object while unpickling (so
+    everything pointing at it keeps its identity) and is rebuilt from its
+    template once the rest of the save has loaded. Full saves contain no
+    references and load exactly as with SafeUnpickler.
+    """
+
+    def __init__(self, file, **kwargs):
+        super().__init__(file, **kwargs)
+        self._unchanged = {}
+
+    def find_class(self, module, name):
+        if name == "_template_tile" and module in (__name__, "universe"):
+            return self._template_tile
+        return super().find_class(module, name)
+
+    def _template_tile(self, universe, tile_cls, game_map, x, y):
+        from src.tiles import MapTile
+
+        if not (
+            isinstance(universe, Universe)
+            and isinstance(tile_cls, type)
+            and issubclass(tile_cls, MapTile)
+            and isinstance(game_map, dict)
+            and type(x) is int
+            and type(y) is int
+        ):
+            raise pickle.UnpicklingError(
+                f"malformed template tile reference at ({x!r}, {y!r})"
+            )
+        key = (id(game_map), x, y)
+        entry = self._unchanged.get(key)
+        if entry is None:
+            entry = (tile_cls.__new__(tile_cls), universe, game_map, x, y)
+            self._unchanged[key] = entry
+        return entry[0]
+
+    def load(self):
+        obj = super().load()
+        # id(map) -> {(x, y): TileTemplate}; one template lookup per map.
+        layouts = {}
+        for tile, universe, game_map, x, y in self._unchanged.values():
+            layout = layouts.get(id(game_map))
+            if layout is None:
+                template = universe._map_template(game_map)
+                tiles = template.tiles if template is not None else ()
+                layout = layouts[id(game_map)] = {(tt.x, tt.y): tt for tt in tiles}
+            universe._rehydrate_tile(tile, game_map, x, y, layout.get((x, y)))
+        return obj
@@ -49,6 +49,8 @@ class TestCombatStrategistAPI:
                         None,
                         session_id=ANY,
                         session_data=ANY,
+                        since_seq=None,
+                        beat_encoding=None,
                     )
 
     def test_execute_combined_move_missing_target(self, app, client, authenticated_session):
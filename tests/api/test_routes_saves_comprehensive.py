@@ -407,10 +407,10 @@ class TestAutosaveDuringCombat:
         adapter = self._make_combat_adapter()
         player._combat_adapter = adapter
 
-        # Force pickle.dumps to fail for any player instance
+        # Force serialization to fail for any player instance
         with patch("src.api.services.game_service.db") as mock_db:
             mock_db.execute = self._mock_db_execute(rows=[])
-            with patch("pickle.dumps", side_effect=pickle.PicklingError("injected failure")):
+            with patch("src.secure_pickle.serialize_for_save", side_effect=pickle.PicklingError("injected failure")):
                 with pytest.raises(Exception):
                     asyncio.run(
                         service.save_game(player, "Autosave", user_id="user-123", is_autosave=True)
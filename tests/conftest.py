@@ -59,10 +59,10 @@ def _no_real_sleep(request, monkeypatch):
 
     Many engine code paths (story narration pacing in src/story/*.py in
     particular — ~145 time.sleep() calls across src/) use real sleeps for
-    dramatic timing during actual play. Only one narrow code path
-    (GameService._build_event_patches) patches time.sleep for tests that go
-    through it; tests that construct/call Event or move classes directly
-    bypass that harness and pay the real delay (previously several seconds
+    dramatic timing during actual play. Only the GameService event/interact
+    paths run the engine headless (src/headless.py) for tests that go
+    through them; tests that construct/call Event or move classes directly
+    bypass that and pay the real delay (previously several seconds
     per test in some story/event test files). This fixture closes that gap
     suite-wide instead of requiring every such test to remember to patch it.
 
@@ -1127,6 +1127,48 @@ class TestCombatRoutes:
         assert rv.status_code == 200
         assert rv.get_json()["success"] is True
 
+    def test_get_combat_status_forwards_since_seq(self, client):
+        c, app = client
+        rv = c.get("/api/combat/status?since_seq=12", headers=AUTH_HEADER)
+        assert rv.status_code == 200
+        assert app._test_gs.get_combat_status.call_args.kwargs["since_seq"] == 12
+
+    def test_get_combat_status_rejects_non_integer_since_seq(self, client):
+        c, app = client
+        rv = c.get("/api/combat/status?since_seq=abc", headers=AUTH_HEADER)
+        assert rv.status_code == 400
+        app._test_gs.get_combat_status.assert_not_called()
+
+    def test_execute_move_forwards_since_seq(self, client):
+        c, app = client
+        rv = c.post(
+            "/api/combat/move",
+            json={"move_type": "attack", "move_id": "slash", "since_seq": 4},
+            headers=AUTH_HEADER,
+        )
+        assert rv.status_code == 200
+        assert app._test_gs.execute_move.call_args.kwargs["since_seq"] == 4
+
+    def test_execute_move_forwards_beat_encoding(self, client):
+        c, app = client
+        rv = c.post(
+            "/api/combat/move",
+            json={"move_type": "attack", "move_id": "slash", "beat_encoding": "delta"},
+            headers=AUTH_HEADER,
+        )
+        assert rv.status_code == 200
+        assert app._test_gs.execute_move.call_args.kwargs["beat_encoding"] == "delta"
+
+    def test_execute_move_rejects_unknown_beat_encoding(self, client):
+        c, app = client
+        rv = c.post(
+            "/api/combat/move",
+            json={"move_type": "attack", "move_id": "slash", "beat_encoding": "gzip"},
+            headers=AUTH_HEADER,
+        )
+        assert rv.status_code == 400
+        app._test_gs.execute_move.assert_not_called()
+
     def test_get_combat_status_no_auth(self, client):
         c, _ = client
         rv = c.get("/api/combat/status")
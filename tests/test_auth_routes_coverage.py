@@ -269,6 +269,27 @@ class TestLogin:
                 )
         assert rv.status_code == 500
 
+    def test_login_shed_when_password_pool_is_full(self, app):
+        from src.api.password_pool import PasswordPoolBusy
+        from src.api.routes.auth import _login_limiter
+
+        _login_limiter.clear_all()
+        with patch(
+            "src.api.routes.auth.auth_service.authenticate_user",
+            new_callable=AsyncMock,
+            side_effect=PasswordPoolBusy("16 password hashing calls already waiting"),
+        ):
+            with app.test_client() as c:
+                rv = c.post(
+                    "/auth/login",
+                    json={"username": "Jean", "password": "pw"},
+                )
+        assert rv.status_code == 503
+        assert rv.headers["Retry-After"] == "1"
+        assert rv.get_json()["error"] == "service_busy"
+        # Shedding is not a failed attempt against the account.
+        assert _login_limiter.size() == 0
+
 
 class TestLoginRateLimitBoundedGrowth:
     """GitHub issue #284: the login throttle's in-memory store must not grow
@@ -0,0 +1,155 @@
+"""Tests for delta-encoded beat snapshots (``src/api/beat_frames.py``)."""
+
+import copy
+import json
+
+from src.api.beat_frames import apply_beat_encoding, decode_beat_frames, encode_beat_frames
+from src.api.combat_adapter import ApiCombatAdapter
+from src.npc import Slime
+from tests._combat_fixtures import engage, make_npc, make_player
+
+
+def _combatant(cid, hp=10, x=0):
+    return {
+        "id": cid,
+        "name": cid.title(),
+        "hp": hp,
+        "position": {"x": x, "y": 0},
+        "equipment": {"weapon": {"name": "Longsword", "damage": 12}},
+        "passives": [{"name": "Grit"}],
+    }
+
+
+def _frame(round_num, player, enemies, log=()):
+    return {
+        "status": "active",
+        "round": round_num,
+        "player": player,
+        "allies": [],
+        "enemies": enemies,
+        "combatants": [player] + enemies,
+        "last_move_outcome": "",
+        "log": list(log),
+    }
+
+
+def _frames():
+    jean = _combatant("player", hp=50)
+    slime_a, slime_b = _combatant("enemy_1", x=5), _combatant("enemy_2", x=9)
+    first = _frame(1, jean, [slime_a, slime_b])
+    second = copy.deepcopy(first)
+    second["round"] = 2
+    second["enemies"][0]["hp"] = 4
+    second["combatants"][1]["hp"] = 4
+    second["log"] = [{"message": "Jean slashes!", "seq": 1}]
+    third = copy.deepcopy(second)
+    third["round"] = 3
+    third["enemies"] = third["enemies"][1:]
+    third["combatants"] = [third["player"], third["enemies"][0]]
+    third["last_move_outcome"] = "Slime is defeated."
+    return [first, second, third]
+
+
+def test_delta_carries_only_what_changed():
+    encoded = encode_beat_frames(_frames())
+    hit = encoded["beat_deltas"][0]
+
+    assert hit["set"] == {"round": 2}
+    assert hit["combatants"] == {"enemy_1": {"hp": 4}}
+    assert hit["log"] == [{"message": "Jean slashes!", "seq": 1}]
+    assert "order" not in hit and "enemies" not in hit
+
+
+def test_roster_changes_are_sent_as_ids():
+    death = encode_beat_frames(_frames())["beat_deltas"][1]
+
+    assert death["enemies"] == ["enemy_2"]
+    assert death["order"] == ["player", "enemy_2"]
+    assert death["set"] == {"round": 3, "last_move_outcome": "Slime is defeated."}
+    assert "combatants" not in death
+
+
+def test_decode_round_trips():
+    frames = _frames()
+    encoded = encode_beat_frames(copy.deepcopy(frames))
+
+    assert decode_beat_frames(encoded["beat_base"], encoded["beat_deltas"]) == frames
+
+
+def test_new_combatant_and_dropped_fields_round_trip():
+    frames = _frames()[:2]
+    later = copy.deepcopy(frames[1])
+    reinforcement = _combatant("enemy_3", x=12)
+    later["enemies"].append(reinforcement)
+    later["combatants"].append(reinforcement)
+    del later["combatants"][0]["passives"]  # shared with later["player"]
+    del later["last_move_outcome"]
+    frames.append(later)
+
+    encoded = encode_beat_frames(copy.deepcopy(frames))
+
+    assert encoded["beat_deltas"][1]["added"] == [reinforcement]
+    assert decode_beat_frames(encoded["beat_base"], encoded["beat_deltas"]) == frames
+
+
+def test_frames_without_usable_ids_are_not_encoded():
+    frames = _frames()
+    frames[1]["enemies"][1]["id"] = "enemy_1"
+    frames[1]["combatants"][2]["id"] = "enemy_1"
+
+    assert encode_beat_frames(frames) is None
+    assert encode_beat_frames([]) is None
+
+
+def test_apply_beat_encoding_is_opt_in():
+    payload = {"beat_states": _frames()}
+    assert apply_beat_encoding(payload, None) is payload
+    assert "beat_states" in payload
+
+    apply_beat_encoding(payload, "delta")
+
+    assert "beat_states" not in payload
+    assert payload["beat_encoding"] == "delta"
+    assert len(payload["beat_deltas"]) == 2
+
+
+def test_multi_beat_move_shrinks_and_round_trips():
+    jean = make_player(weapon="Sword")
+    slimes = [make_npc(cls=Slime, hp=400) for _ in range(4)]
+    for slime in slimes:
+        slime.damage = 0
+    engage(jean, slimes)
+    adapter = ApiCombatAdapter(jean)
+    adapter.initialize_combat(slimes)
+    rest = next(m for m in jean.known_moves if m.name == "Rest")
+    jean.current_move = rest
+
+    frames = adapter._execute_move_inner(rest)["beat_states"]
+    encoded = encode_beat_frames(frames)
+
+    assert len(frames) > 2
+    assert decode_beat_frames(encoded["beat_base"], encoded["beat_deltas"]) == frames
+    assert len(json.dumps(encoded)) < len(json.dumps(frames)) / 2
+    # Equipment and passives never change mid-move, so no delta repeats them.
+    for delta in encoded["beat_deltas"]:
+        for fields in delta.get("combatants", {}).values():
+            assert "equipment" not in fields and "passives" not in fields
+
+
+def test_combat_state_serializes_each_combatant_once(make_player, make_npc, monkeypatch):
+    from src.api.serializers.combat import CombatantSerializer, CombatStateSerializer
+
+    jean = make_player(weapon="Sword")
+    slimes = [make_npc(cls=Slime) for _ in range(3)]
+    calls = []
+    original = CombatantSerializer.serialize_combatant
+    monkeypatch.setattr(
+        CombatantSerializer,
+        "serialize_combatant",
+        staticmethod(lambda c, reference=None: calls.append(c) or original(c, reference)),
+    )
+
+    state = CombatStateSerializer.serialize_combat_state(jean, slimes)
+
+    assert len(calls) == 4
+    assert state["combatants"] == [state["player"]] + state["enemies"]
@@ -0,0 +1,87 @@
+"""Tests for the benchmark runner behind tools/benchmark.py.
+
+The suite itself is run by hand or in CI; these pin the statistics and the
+baseline comparison so a broken runner can't report a clean diff.
+"""
+
+import pytest
+
+from tools.bench.runner import (
+    BASELINE_VERSION,
+    BenchResult,
+    compare,
+    measure,
+    percentile,
+    to_baseline,
+)
+
+
+def _result(name="demo", **overrides):
+    fields = dict(
+        name=name, iterations=10, p50_ms=1.0, p95_ms=2.0, p99_ms=3.0, mean_ms=1.2,
+        max_ms=3.5, alloc_peak_kib=10.0, alloc_retained_kib=0.0, alloc_blocks=0,
+    )
+    fields.update(overrides)
+    return BenchResult(**fields)
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        samples = list(range(1, 101))
+
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 95) == 95
+        assert percentile(samples, 99) == 99
+        assert percentile(samples, 100) == 100
+
+    def test_single_sample(self):
+        assert percentile([7.0], 99) == 7.0
+
+    def test_empty_rejected(self):
+        with pytest.raises(ValueError):
+            percentile([], 50)
+
+
+class TestCompare:
+    def test_flags_only_metrics_past_threshold(self):
+        baseline = to_baseline([_result()])
+        current = _result(p50_ms=1.2, p99_ms=4.5)
+
+        rows = {r["metric"]: r for r in compare(baseline, [current], threshold=0.25)}
+
+        assert not rows["p50_ms"]["regressed"]
+        assert rows["p99_ms"]["regressed"]
+        assert rows["p99_ms"]["change"] == 0.5
+
+    def test_new_benchmark_never_regresses(self):
+        rows = compare(to_baseline([]), [_result("brand_new")])
+
+        assert rows and all(r["baseline"] is None and not r["regressed"] for r in rows)
+
+    def test_version_mismatch_rejected(self):
+        with pytest.raises(ValueError):
+            compare({"version": BASELINE_VERSION + 1, "results": {}}, [_result()])
+
+
+def test_measure_runs_every_phase():
+    class Counting:
+        name = "counting"
+
+        def __init__(self):
+            self.runs = 0
+            self.cleanups = 0
+
+        def run(self):
+            self.runs += 1
+            return [0] * 1000
+
+        def after_each(self):
+            self.cleanups += 1
+
+    bench = Counting()
+    result = measure(bench, iterations=10, warmup=2, alloc_iterations=3)
+
+    assert bench.runs == bench.cleanups == 15
+    assert result.iterations == 10
+    assert result.p50_ms <= result.p95_ms <= result.p99_ms <= result.max_ms
+    assert result.alloc_peak_kib > 0
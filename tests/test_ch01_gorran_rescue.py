@@ -71,7 +71,7 @@ def event(player, tile):
 def _rescue(event, choice="a"):
     """Run stage 1 (prompt) then stage 2 (the rescue), with I/O stubbed."""
     with (
-        patch('src.story.ch01.time.sleep'),
+        patch('src.story.ch01.pause'),
         patch('src.functions.add_enemies_to_combat') as mock_add_enemies,
     ):
         event.process(user_input=None)
@@ -82,7 +82,7 @@ def _rescue(event, choice="a"):
 class TestRescueWiring:
     def test_stage_one_only_prompts(self, event, player, tile):
         """The first pass must not spawn anything — it just asks the question."""
-        with patch('src.story.ch01.time.sleep'):
+        with patch('src.story.ch01.pause'):
             event.process(user_input=None)
 
         assert event.needs_input is True
@@ -72,7 +72,7 @@ def _run(event):
     """Process the event with sleeps stubbed; return (messages, sleep_seconds)."""
     slept = []
     with capture_narration() as msgs:
-        with patch('src.story.ch01.time.sleep', side_effect=slept.append):
+        with patch('src.story.ch01.pause', side_effect=slept.append):
             event.process()
     return msgs, slept
 
@@ -92,7 +92,7 @@ class TestGorranTraversalBeats:
         assert ev.name == event_name
         assert ev.repeat is False
 
-        with patch('src.story.ch01.time.sleep'):
+        with patch('src.story.ch01.pause'):
             ev.check_conditions()
 
         # check_conditions fires straight through to process(), and because the
@@ -365,7 +365,7 @@ class TestAfterDefeatingKingSlimeProcess:
 
         return AfterDefeatingKingSlime(player=self.player, tile=self.tile)
 
-    @patch("src.story.ch02.time.sleep")
+    @patch("src.story.ch02.pause")
     @patch("src.story.ch02.print_slow")
     def test_process_already_defeated_returns_early(self, mock_print, mock_sleep):
         """The story flag is the ONLY gate on re-running the aftermath.
@@ -390,7 +390,7 @@ class TestAfterDefeatingKingSlimeProcess:
         """Return a minimal pools map dict that _cleanse_pool_tiles won't crash on."""
         return {"name": "grondelith-mineral-pools"}
 
-    @patch("src.story.ch02.time.sleep")
+    @patch("src.story.ch02.pause")
     @patch("src.story.ch02.print_slow")
     def test_process_sets_story_flag(self, mock_print, mock_sleep):
         self.player.map = {}
@@ -399,7 +399,7 @@ class TestAfterDefeatingKingSlimeProcess:
         evt.process()
         assert self.player.universe.story.get("king_slime_defeated") == "1"
 
-    @patch("src.story.ch02.time.sleep")
+    @patch("src.story.ch02.pause")
     @patch("src.story.ch02.print_slow")
     def test_process_grants_mineral_fragment_to_inventory(self, mock_print, mock_sleep):
         # #378/#371: fragment is granted straight to inventory, not spawned as
@@ -412,7 +412,7 @@ class TestAfterDefeatingKingSlimeProcess:
         granted = self.player.add_items_to_inventory.call_args[0][0]
         assert any(i.__class__.__name__ == "MineralFragment" for i in granted)
 
-    @patch("src.story.ch02.time.sleep")
+    @patch("src.story.ch02.pause")
     @patch("src.story.ch02.print_slow")
     def test_process_spawns_tile_description(self, mock_print, mock_sleep):
         self.player.map = {}
@@ -423,7 +423,7 @@ class TestAfterDefeatingKingSlimeProcess:
         args = self.tile.spawn_object.call_args
         assert args[0][0] == "TileDescription"
 
-    @patch("src.story.ch02.time.sleep")
+    @patch("src.story.ch02.pause")
     @patch("src.story.ch02.print_slow")
     def test_process_removes_event_from_tile(self, mock_print, mock_sleep):
         self.player.map = {}
@@ -432,7 +432,7 @@ class TestAfterDefeatingKingSlimeProcess:
         evt.process()
         self.tile.remove_event.assert_called_with(evt.name)
 
-    @patch("src.story.ch02.time.sleep")
+    @patch("src.story.ch02.pause")
     @patch("src.story.ch02.print_slow")
     def test_process_with_gorran_in_atrium(self, mock_print, mock_sleep):
         """Gorran found in atrium tile should be moved to arena tile."""
@@ -452,7 +452,7 @@ class TestAfterDefeatingKingSlimeProcess:
         assert gorran.tile == self.tile
         assert gorran in self.tile.npcs_here
 
-    @patch("src.story.ch02.time.sleep")
+    @patch("src.story.ch02.pause")
     @patch("src.story.ch02.print_slow")
     def test_process_with_gorran_in_allies_list(self, mock_print, mock_sleep):
         """Gorran found in allies list but not in atrium — should be relocated."""
@@ -471,7 +471,7 @@ class TestAfterDefeatingKingSlimeProcess:
         assert gorran.tile == self.tile
         assert gorran in self.tile.npcs_here
 
-    @patch("src.story.ch02.time.sleep")
+    @patch("src.story.ch02.pause")
     @patch("src.story.ch02.print_slow")
     def test_process_no_gorran_anywhere(self, mock_print, mock_sleep):
         """No Gorran anywhere — process should complete without error."""
@@ -482,7 +482,7 @@ class TestAfterDefeatingKingSlimeProcess:
         evt.process()
         assert self.player.universe.story.get("king_slime_defeated") == "1"
 
-    @patch("src.story.ch02.time.sleep")
+    @patch("src.story.ch02.pause")
     @patch("src.story.ch02.print_slow")
     def test_process_queues_memory_flash_event(self, mock_print, mock_sleep):
         """A Ch02KingSlimeMemoryFlash should be queued on the tile."""
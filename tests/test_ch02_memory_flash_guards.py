@@ -93,7 +93,7 @@ class TestCh02KingSlimeMemoryFlashGuards(unittest.TestCase):
     # ------------------------------------------------------------------
 
     @patch('src.story.effects.memory_border')
-    @patch('src.story.effects.time.sleep')
+    @patch('src.story.effects.pause')
     def test_process_completion_sets_story_flag_and_finishes(self, _sleep, _border):
         """process('continue') closes the flash: flag set, no further input wanted."""
         from src.narration import capture_narration
@@ -110,7 +110,7 @@ class TestCh02KingSlimeMemoryFlashGuards(unittest.TestCase):
         self.assertFalse(any("BOOM." == m.get("text") for m in msgs))
 
     @patch('src.story.effects.memory_border')
-    @patch('src.story.effects.time.sleep')
+    @patch('src.story.effects.pause')
     def test_process_first_pass_shows_the_memory_and_waits(self, _sleep, _border):
         """The display pass narrates the memory and pauses — without arming the flag.
 
@@ -319,7 +319,7 @@ class TestInitializeCombatScenarioTypes:
             ),
             patch("src.api.combat_adapter.random.uniform", return_value=1.25),
             patch(
-                "src.api.combat_adapter.positions.recalculate_proximity_dict",
+                "src.api.combat_adapter.positions.SpatialIndex.sync",
                 side_effect=capture,
             ),
         ):
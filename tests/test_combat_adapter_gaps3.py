@@ -630,7 +630,7 @@ class TestInvalidPendingMoveIndexGuards:
 
 
 # ---------------------------------------------------------------------------
-# _synchronize_distances — dead-entry cleanup + default-distance + reverse map
+# _synchronize_distances — dead-entry cleanup, index rows, default distance
 # ---------------------------------------------------------------------------
 
 
@@ -677,53 +677,43 @@ class TestSynchronizeDistancesBranches:
         assert player in enemy.combat_proximity
         assert player.combat_proximity[enemy] == enemy.combat_proximity[player]
 
-    def test_reverse_mapping_defensive_branch(self):
-        """Exercise the "Ensure reverse mapping" tail loop.
+    def test_positioned_units_take_index_rows_without_the_dead(self):
+        from src.positions import CombatPosition
 
-        Given the rest of _synchronize_distances, this branch is unreachable
-        through any internally-consistent proximity-dict state: the main
-        sync loop's `if each_enemy in each_ally.combat_proximity` check has no
-        guard, so any pair the reverse loop could fix would already have been
-        fixed by the main loop first. A stateful dict (lying on its first
-        __contains__ check, telling the truth on the second) is used purely
-        to reach this defensive tail loop for coverage purposes.
-        """
+        player = _make_player()
+        enemy = _make_enemy()
+        dead_ally = _make_enemy(name="Fallen", alive=False, friend=True)
+        player.combat_position = CombatPosition(0, 0)
+        enemy.combat_position = CombatPosition(3, 4)
+        dead_ally.combat_position = CombatPosition(6, 8)
+        player.combat_list_allies = [player, dead_ally]
+        player.combat_list = [enemy]
+        adapter = _make_adapter(player)
 
-        class _StatefulDict(dict):
-            def __init__(self):
-                super().__init__()
-                self._checked = False
+        adapter._synchronize_distances()
 
-            def __contains__(self, key):
-                if not self._checked:
-                    self._checked = True
-                    return False
-                return True
+        assert player.combat_proximity == {enemy: 5}
+        assert enemy.combat_proximity == {player: 5}
+        # The dead unit keeps its own row; nobody keeps it in theirs.
+        assert dead_ally.combat_proximity == {player: 10, enemy: 5}
 
-            def __getitem__(self, key):
-                return 42
+    def test_mixed_pair_gets_a_default_distance(self):
+        """A positioned ally facing an enemy with no position falls back to
+        the randomised default_proximity, both ways."""
+        from src.positions import CombatPosition
 
         player = _make_player()
         enemy = _make_enemy()
-        ally_position = MagicMock()  # truthy, non-None combat_position
-        player.combat_position = ally_position
-        enemy.combat_position = ally_position
+        del enemy.combat_position
+        player.combat_position = CombatPosition(0, 0)
         player.combat_list_allies = [player]
         player.combat_list = [enemy]
-        stateful = _StatefulDict()
-
         adapter = _make_adapter(player)
-        with patch("src.api.combat_adapter.positions") as mock_pos:
-            # The top-of-function coordinate recalc overwrites combat_proximity for
-            # every unit with a combat_position — return the stateful dict for the
-            # ally specifically (and a plain empty dict for the enemy) so it's the
-            # object still in play once the main sync loop runs.
-            mock_pos.recalculate_proximity_dict.side_effect = (
-                lambda unit, others: stateful if unit is player else {}
-            )
-            adapter._synchronize_distances()
-
-        assert enemy.combat_proximity.get(player) == 42
+
+        adapter._synchronize_distances()
+
+        assert 7 <= player.combat_proximity[enemy] <= 12
+        assert enemy.combat_proximity == {player: player.combat_proximity[enemy]}
 
 
 # ---------------------------------------------------------------------------
@@ -85,6 +85,37 @@ def test_refresh_suggestions_count(adapter, player):
         adapter.refresh_suggestions()
         mock_get.assert_called_with(ANY, max_suggestions=3)
 
+def test_superseded_refresh_is_dropped_before_the_strategist_call(adapter, player):
+    """A burst of refreshes costs one strategist call, for the latest state."""
+    from src.api.suggestion_pool import SuggestionPool
+
+    pool = SuggestionPool(max_workers=1)
+    queued = []
+    with patch('src.api.combat_adapter.get_suggestion_pool', return_value=pool), \
+         patch.object(pool, 'submit', side_effect=lambda key, job: queued.append((key, job)) or True), \
+         patch.object(adapter.strategist, 'get_suggestions', return_value=[]) as mock_get:
+        for _ in range(3):
+            adapter.refresh_suggestions()
+
+        # The pool only keeps the last job per key; the earlier ones, even if
+        # they had been dispatched, must notice they are stale.
+        assert len({key for key, _ in queued}) == 1
+        for _, job in queued:
+            job()
+
+    assert mock_get.call_count == 1
+    assert player.suggestions_loading is False
+
+
+def test_refresh_skipped_when_pool_is_saturated(adapter, player):
+    pool = MagicMock()
+    pool.submit.return_value = False
+    with patch('src.api.combat_adapter.get_suggestion_pool', return_value=pool):
+        adapter.refresh_suggestions()
+
+    assert player.suggestions_loading is False
+
+
 def test_handle_combined_selection(adapter, player):
     adapter.input_type = "move_selection"
     adapter.awaiting_input = True
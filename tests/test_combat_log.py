@@ -0,0 +1,177 @@
+"""Tests for the indexed, bounded combat log and its ``since_seq`` cursor."""
+
+import copy
+import pickle
+
+from src.api.combat_log import CombatLog, apply_log_cursor, combat_log_of
+from src.npc import Slime
+
+
+def _entry(message, round_num=1, source_id=None):
+    entry = {"message": message, "round": round_num, "type": "combat"}
+    if source_id is not None:
+        entry["animation"] = {"source_id": source_id}
+    return entry
+
+
+class _Holder:
+    def __init__(self, log):
+        self.combat_log = log
+
+
+# ---------------------------------------------------------------------------
+# CombatLog
+# ---------------------------------------------------------------------------
+
+
+def test_entries_are_stamped_with_increasing_seq():
+    log = CombatLog()
+    log.append(_entry("a"))
+    log.append(_entry("b"))
+
+    assert [e["seq"] for e in log] == [1, 2]
+    assert log.last_seq == 2
+
+
+def test_dedup_index_keys_on_message_round_and_source():
+    log = CombatLog([_entry("Slash!", 3, "slime_1")])
+
+    assert log.contains("Slash!", 3, "slime_1")
+    assert not log.contains("Slash!", 3, "slime_2")
+    assert not log.contains("Slash!", 4, "slime_1")
+    assert not log.contains("Slash!", 3)
+
+
+def test_cap_evicts_oldest_and_forgets_their_keys():
+    log = CombatLog(max_entries=3)
+    for i in range(5):
+        log.append(_entry(f"line {i}", i))
+
+    assert [e["message"] for e in log] == ["line 2", "line 3", "line 4"]
+    assert log.first_seq == 3 and log.last_seq == 5
+    assert not log.contains("line 0", 0)
+    assert log.contains("line 4", 4)
+
+
+def test_since_returns_only_newer_entries():
+    log = CombatLog(_entry(str(i), i) for i in range(10))
+
+    assert [e["seq"] for e in log.since(7)] == [8, 9, 10]
+    assert log.since(10) == []
+    assert len(log.since(0)) == 10
+
+
+def test_pickles_and_copies_as_a_plain_list():
+    log = CombatLog([_entry("a"), _entry("b")])
+
+    restored = pickle.loads(pickle.dumps(log))
+    assert type(restored) is list
+    assert type(copy.deepcopy(log)) is list
+    assert restored == list(log)
+
+
+def test_rewrapping_a_plain_list_keeps_existing_seqs():
+    holder = _Holder([{"message": "x", "round": 1, "seq": 41}, {"message": "y", "round": 1}])
+
+    log = combat_log_of(holder)
+
+    assert holder.combat_log is log
+    assert [e["seq"] for e in log] == [41, 42]
+    log.append(_entry("z"))
+    assert log.last_seq == 43
+
+
+def test_direct_appends_from_the_engine_are_indexed():
+    # src/moves appends to player.combat_log directly, bypassing the adapter.
+    log = CombatLog()
+    log.append({"message": "You feel refreshed.", "round": 2})
+
+    assert log.contains("You feel refreshed.", 2)
+    assert log[0]["seq"] == 1
+
+
+# ---------------------------------------------------------------------------
+# apply_log_cursor
+# ---------------------------------------------------------------------------
+
+
+def test_cursor_scopes_payload_and_reports_next_seq():
+    holder = _Holder(CombatLog(_entry(str(i), i) for i in range(6)))
+    payload = {"log": holder.combat_log}
+
+    apply_log_cursor(payload, holder, 4)
+
+    assert [e["seq"] for e in payload["log"]] == [5, 6]
+    assert payload["log_seq"] == 6
+    assert payload["log_truncated"] is False
+
+
+def test_without_cursor_the_full_log_is_kept():
+    holder = _Holder(CombatLog([_entry("a")]))
+    payload = {"log": holder.combat_log}
+
+    apply_log_cursor(payload, holder, None)
+
+    assert payload["log"] is holder.combat_log
+    assert payload["log_seq"] == 1
+    assert "log_truncated" not in payload
+
+
+def test_cursor_behind_the_cap_is_flagged_truncated():
+    holder = _Holder(CombatLog((_entry(str(i), i) for i in range(10)), max_entries=4))
+    payload = {"log": holder.combat_log}
+
+    apply_log_cursor(payload, holder, 2)
+
+    assert [e["seq"] for e in payload["log"]] == [7, 8, 9, 10]
+    assert payload["log_truncated"] is True
+
+
+def test_cursor_from_a_previous_fight_resets():
+    holder = _Holder(CombatLog([_entry("new fight")]))
+    payload = {"log": holder.combat_log}
+
+    apply_log_cursor(payload, holder, 250)
+
+    assert [e["message"] for e in payload["log"]] == ["new fight"]
+    assert payload["log_reset"] is True
+
+
+def test_payload_without_log_is_untouched():
+    payload = {"error": "Not in combat"}
+    assert apply_log_cursor(payload, _Holder([]), 3) == {"error": "Not in combat"}
+
+
+# ---------------------------------------------------------------------------
+# ApiCombatAdapter / GameService
+# ---------------------------------------------------------------------------
+
+
+def test_adapter_dedups_through_the_index(make_player, make_npc, make_adapter):
+    jean = make_player(weapon="Sword")
+    adapter = make_adapter(jean, enemies=[make_npc(cls=Slime, hp=40)])
+    before = len(jean.combat_log)
+
+    adapter._add_log_entry(5, "The slime wobbles.")
+    adapter._add_log_entry(5, "The slime wobbles.")
+    adapter._add_log_entry(6, "The slime wobbles.")
+
+    assert isinstance(jean.combat_log, CombatLog)
+    assert len(jean.combat_log) == before + 2
+
+
+def test_status_poll_size_stays_flat_as_the_fight_grows(
+    game_service, make_player, make_npc, make_adapter
+):
+    jean = make_player(weapon="Sword")
+    jean._combat_adapter = make_adapter(jean, enemies=[make_npc(cls=Slime, hp=40)])
+    cursor = game_service.get_combat_status(jean)["log_seq"]
+
+    sizes = []
+    for beat in range(50):
+        jean._combat_adapter._add_log_entry(100 + beat, f"Beat {beat} passes.")
+        status = game_service.get_combat_status(jean, since_seq=cursor)
+        sizes.append(len(status["log"]))
+        cursor = status["log_seq"]
+
+    assert sizes == [1] * 50
@@ -0,0 +1,88 @@
+"""Tests for the headless combat simulator behind tools/combat_sim.py.
+
+The simulator is a balance tool, so what matters is that a seed replays the
+same fight (in-process or in a worker pool) and that the report adds up.
+"""
+
+import random
+
+import pytest
+
+from tools.bench.combat_sim import (
+    SCENARIOS,
+    HeadlessCombatAdapter,
+    Scenario,
+    run_fight,
+    simulate,
+)
+
+_SHORT = Scenario("short", ("Slime",), weapon="Dagger", max_beats=60)
+
+
+def _outcomes(report):
+    return [(r.seed, r.outcome, r.beats, r.player_hp) for r in report.results]
+
+
+class TestRunFight:
+    def test_same_seed_replays_the_same_fight(self):
+        first = run_fight(_SHORT, 11)
+        second = run_fight(_SHORT, 11)
+
+        assert (first.outcome, first.beats, first.player_hp) == (
+            second.outcome, second.beats, second.player_hp
+        )
+
+    def test_fight_ends_within_max_beats(self):
+        result = run_fight(Scenario("cap", ("Slime",), max_beats=3), 1)
+
+        assert result.beats <= 3
+        assert result.outcome in ("win", "loss", "timeout")
+
+    def test_global_rng_is_restored(self):
+        random.seed(99)
+        expected = random.random()
+        random.seed(99)
+        run_fight(_SHORT, 4)
+
+        assert random.random() == expected
+
+    def test_headless_adapter_keeps_no_log(self, monkeypatch):
+        adapters = []
+        original = HeadlessCombatAdapter.__init__
+
+        def spy(self, *args, **kwargs):
+            original(self, *args, **kwargs)
+            adapters.append(self)
+
+        monkeypatch.setattr(HeadlessCombatAdapter, "__init__", spy)
+        run_fight(_SHORT, 2)
+
+        player = adapters[0].player
+        assert len(player.combat_log) == 0
+        assert adapters[0].get_combat_state() == {}
+
+
+class TestSimulate:
+    def test_report_adds_up(self):
+        report = simulate(_SHORT, 6, seed=3)
+
+        assert report.fights == 6
+        assert report.wins + report.losses + report.timeouts == 6
+        assert report.beats_total == sum(r.beats for r in report.results)
+        assert [r.seed for r in report.results] == list(range(3, 9))
+        assert 0.0 <= report.win_rate <= 1.0
+        assert report.to_dict()["win_rate"] == report.win_rate
+        assert "results" not in report.to_dict()
+
+    def test_pool_matches_single_process(self):
+        serial = simulate(_SHORT, 4, workers=1, seed=20)
+        pooled = simulate(_SHORT, 4, workers=2, seed=20)
+
+        assert _outcomes(pooled) == _outcomes(serial)
+
+    @pytest.mark.parametrize("name", sorted(SCENARIOS))
+    def test_builtin_scenarios_run(self, name):
+        base = SCENARIOS[name]
+        scenario = Scenario(base.name, base.enemies, weapon=base.weapon, max_beats=20)
+
+        assert simulate(scenario, 1).fights == 1
@@ -1,7 +1,7 @@
 import pytest
 import json
 from unittest.mock import MagicMock, patch
-from ai.combat_strategist import CombatStrategist
+from ai.combat_strategist import CombatStrategist, SuggestionCache, combat_fingerprint
 from ai.llm_client import GenericLLMClient
 
 class MockLLMClient:
@@ -129,3 +129,90 @@ def test_non_list_suggestions_handling(strategist):
         # When suggestions aren't a list, fallback suggestions are returned (with Check move)
         assert len(suggestions) >= 1
         assert suggestions[0]["move_name"] == "Check"
+
+
+# ---------------------------------------------------------------------------
+# Fingerprint + suggestion cache
+# ---------------------------------------------------------------------------
+
+def _beat(hp=80, distance=6, beats_left=3, heat=1.0):
+    return {
+        "player": {"hp": hp, "max_hp": 100, "fatigue": 60, "max_fatigue": 100, "heat": heat},
+        "enemies": [{
+            "id": "enemy_1", "hp": 30, "max_hp": 40, "distance": distance,
+            "move_in_process": {"name": "SlimeVolley", "beats_left": beats_left, "current_stage": 1},
+        }],
+        "history": ["Jean attacks Slime!"],
+        "available_moves": [
+            {"name": "Slash", "viable_targets": [{"id": "enemy_1"}]},
+            {"name": "Dodge"},
+        ],
+    }
+
+
+class TestCombatFingerprint:
+    def test_small_changes_within_a_band_share_a_fingerprint(self):
+        a = _beat(hp=80, distance=6)
+        b = _beat(hp=78, distance=8)
+        b["history"] = ["Something else entirely"]
+
+        assert combat_fingerprint(a) == combat_fingerprint(b)
+
+    @pytest.mark.parametrize("change", [
+        {"hp": 20},            # crosses into HP CRITICAL
+        {"distance": 1},       # point-blank
+        {"beats_left": 1},     # telegraphed hit now imminent
+        {"heat": 2.5},         # BLAZING
+    ])
+    def test_tactically_relevant_changes_do_not(self, change):
+        assert combat_fingerprint(_beat()) != combat_fingerprint(_beat(**change))
+
+    def test_available_moves_and_count_are_part_of_it(self):
+        fewer = _beat()
+        fewer["available_moves"] = fewer["available_moves"][:1]
+
+        assert combat_fingerprint(fewer) != combat_fingerprint(_beat())
+        assert combat_fingerprint(_beat(), 1) != combat_fingerprint(_beat(), 2)
+
+
+class TestSuggestionCache:
+    def test_repeated_beat_skips_the_llm(self, strategist):
+        with patch.object(strategist.client, 'generate_structured',
+                          wraps=strategist.client.generate_structured) as gen:
+            first = strategist.get_suggestions(_beat())
+            second = strategist.get_suggestions(_beat(hp=79))
+
+        assert gen.call_count == 1
+        assert second == first
+        assert strategist.cache.stats()["hit_rate"] == 0.5
+
+    def test_cached_results_are_copies(self, strategist):
+        strategist.get_suggestions(_beat())[0]["move_name"] = "Mutated"
+
+        assert strategist.get_suggestions(_beat())[0]["move_name"] == "Slash"
+
+    def test_fallback_results_are_not_cached(self, strategist):
+        with patch.object(strategist.client, 'generate_structured', return_value=None):
+            strategist.get_suggestions(_beat())
+
+        assert strategist.cache.stats()["entries"] == 0
+
+    def test_entries_expire(self):
+        cache = SuggestionCache(ttl=10)
+        with patch("ai.combat_strategist.time.monotonic", return_value=100.0):
+            cache.put("k", [{"move_name": "Slash"}])
+        with patch("ai.combat_strategist.time.monotonic", return_value=111.0):
+            assert cache.get("k") is None
+
+        assert cache.stats()["expired"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = SuggestionCache(max_entries=2)
+        cache.put("a", [])
+        cache.put("b", [])
+        cache.get("a")
+        cache.put("c", [])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == []
+        assert cache.stats()["evicted"] == 1
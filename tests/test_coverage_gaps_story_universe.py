@@ -203,7 +203,7 @@ class TestCh01StartOpenWall:
         tile.block_exit = ["east"]
         with (
             patch("src.story.ch01.cprint"),
-            patch("src.story.ch01.time.sleep"),
+            patch("src.story.ch01.pause"),
         ):
             ev.process()
         assert "east" not in tile.block_exit
@@ -213,7 +213,7 @@ class TestCh01StartOpenWall:
         tile.block_exit = ["east"]
         with (
             patch("src.story.ch01.cprint"),
-            patch("src.story.ch01.time.sleep"),
+            patch("src.story.ch01.pause"),
         ):
             ev.process()
         assert hasattr(ev, "delay_duration")
@@ -230,7 +230,7 @@ class TestCh01StartOpenWall:
         tile.objects_here = [wall]
         with (
             patch("src.story.ch01.cprint"),
-            patch("src.story.ch01.time.sleep"),
+            patch("src.story.ch01.pause"),
         ):
             ev.process()
         assert wall not in tile.objects_here
@@ -269,7 +269,7 @@ class TestCh01BridgeWall:
         ev, player, tile = self._make()
         with (
             patch("src.story.ch01.cprint"),
-            patch("src.story.ch01.time.sleep"),
+            patch("src.story.ch01.pause"),
         ):
             ev.process()
         assert "east" not in tile.block_exit
@@ -278,7 +278,7 @@ class TestCh01BridgeWall:
         ev, player, tile = self._make()
         with (
             patch("src.story.ch01.cprint"),
-            patch("src.story.ch01.time.sleep"),
+            patch("src.story.ch01.pause"),
         ):
             ev.process()
         assert ev.delay_mode == "exploration"
@@ -367,7 +367,7 @@ class TestCh01ChestRumblerBattle:
         tile.spawn_npc = Mock(return_value=fake_npc)
         with (
             patch("src.story.ch01.cprint"),
-            patch("src.story.ch01.time.sleep"),
+            patch("src.story.ch01.pause"),
         ):
             ev.process(user_input="continue")
         tile.spawn_npc.assert_called_with("RockRumbler")
@@ -495,7 +495,7 @@ class TestCh01PostRumbler2:
         with (
             patch("src.story.ch01.cprint"),
             patch("src.story.ch01.colored", return_value="x"),
-            patch("src.story.ch01.time.sleep"),
+            patch("src.story.ch01.pause"),
         ):
             ev.process()
         assert player.hp == player.maxhp
@@ -511,7 +511,7 @@ class TestCh01PostRumbler2:
         with (
             patch("src.story.ch01.cprint"),
             patch("src.story.ch01.colored", return_value="x"),
-            patch("src.story.ch01.time.sleep"),
+            patch("src.story.ch01.pause"),
         ):
             ev.process()
         tile.spawn_npc.assert_called_with("RockRumbler")
@@ -569,7 +569,7 @@ class TestCh01PostRumbler3:
         player.combat_events = [ev]
         with (
             patch("src.story.ch01.cprint"),
-            patch("src.story.ch01.time.sleep"),
+            patch("src.story.ch01.pause"),
             patch("src.story.ch01.random.randint", return_value=0),
             patch("src.functions.add_enemies_to_combat"),
         ):
@@ -620,7 +620,7 @@ class TestAfterTheRumblerFight:
         player.combat_list_allies = [rock_man]
         tile.npcs_here = [rock_man]
         with (
-            patch("src.story.ch01.time.sleep"),
+            patch("src.story.ch01.pause"),
             patch("src.story.ch01.print"),
         ):
             ev.process()
@@ -737,7 +737,7 @@ class TestCh01GorranFirstWord:
         ev, player, tile = self._make(skip_dialog=False)
         with (
             patch("src.story.ch01.cprint"),
-            patch("src.story.ch01.time.sleep"),
+            patch("src.story.ch01.pause"),
             patch("src.story.ch01.await_input"),
         ):
             ev.process()
@@ -1035,7 +1035,7 @@ class TestCh02ArenaEntrance:
         player.skip_dialog = False
         with (
             patch("src.story.ch02.print_slow"),
-            patch("src.story.ch02.time.sleep"),
+            patch("src.story.ch02.pause"),
             patch("src.story.ch02.await_input"),
         ):
             ev.process()
@@ -1089,7 +1089,7 @@ class TestAfterDefeatingKingSlime:
         ev, player, tile = self._make()
         with (
             patch("src.story.ch02.print_slow"),
-            patch("src.story.ch02.time.sleep"),
+            patch("src.story.ch02.pause"),
         ):
             ev.process()
         assert player.universe.story.get("king_slime_defeated") == "1"
@@ -1100,7 +1100,7 @@ class TestAfterDefeatingKingSlime:
         ev, player, tile = self._make()
         with (
             patch("src.story.ch02.print_slow"),
-            patch("src.story.ch02.time.sleep"),
+            patch("src.story.ch02.pause"),
         ):
             ev.process()
         player.add_items_to_inventory.assert_called_once()
@@ -1113,7 +1113,7 @@ class TestAfterDefeatingKingSlime:
         ev, player, tile = self._make()
         with (
             patch("src.story.ch02.print_slow"),
-            patch("src.story.ch02.time.sleep"),
+            patch("src.story.ch02.pause"),
         ):
             ev.process()
         tile.spawn_object.assert_called()
@@ -1127,7 +1127,7 @@ class TestAfterDefeatingKingSlime:
         player.map = {(2, 1): atrium_tile}  # process() uses player.map, not universe.current_map
         with (
             patch("src.story.ch02.print_slow"),
-            patch("src.story.ch02.time.sleep"),
+            patch("src.story.ch02.pause"),
         ):
             ev.process()
         assert gorran not in atrium_tile.npcs_here
@@ -1143,7 +1143,7 @@ class TestAfterDefeatingKingSlime:
         player.universe.current_map.tiles = {}  # no atrium tile
         with (
             patch("src.story.ch02.print_slow"),
-            patch("src.story.ch02.time.sleep"),
+            patch("src.story.ch02.pause"),
         ):
             ev.process()
         assert gorran in tile.npcs_here
@@ -1176,7 +1176,7 @@ class TestAfterDefeatingKingSlime_CleanseTiles:
         ev = self.cls(player=player, tile=tile)
         with (
             patch("src.story.ch02.print_slow"),
-            patch("src.story.ch02.time.sleep"),
+            patch("src.story.ch02.pause"),
         ):
             ev.process()
 
@@ -1280,7 +1280,7 @@ class TestCh02FragmentReminder:
         player.map["name"] = "grondia"
         with (
             patch("src.story.ch02.print_slow"),
-            patch("src.story.ch02.time.sleep"),
+            patch("src.story.ch02.pause"),
         ):
             ev._remind(player)
         player.teleport.assert_called()
@@ -1528,7 +1528,7 @@ class TestGorranGestureEvent:
         printed = []
         with (
             patch("src.story.ch03.print_slow", side_effect=lambda *a, **kw: printed.append(a)),
-            patch("src.story.ch03.time.sleep"),
+            patch("src.story.ch03.pause"),
             patch("src.story.ch03.print"),
         ):
             ev.process()
@@ -1579,7 +1579,7 @@ class TestNomadCampSmellEvent:
         player.skip_dialog = False
         with (
             patch("src.story.ch03.print_slow") as mock_print,
-            patch("src.story.ch03.time.sleep"),
+            patch("src.story.ch03.pause"),
         ):
             ev.process()
         assert mock_print.called
@@ -1652,7 +1652,7 @@ class TestMaraFirstContactEvent:
         with (
             patch("src.story.ch03.print_slow") as mock_print,
             patch("src.story.ch03.say") as mock_say,
-            patch("src.story.ch03.time.sleep"),
+            patch("src.story.ch03.pause"),
         ):
             ev.process()
         assert mock_print.called
@@ -1732,7 +1732,7 @@ class TestDevetIntroEvent:
         with (
             patch("src.story.ch03.print_slow") as mock_print,
             patch("src.story.ch03.say") as mock_say,
-            patch("src.story.ch03.time.sleep"),
+            patch("src.story.ch03.pause"),
         ):
             ev.process()
         assert mock_print.called
@@ -1810,7 +1810,7 @@ class TestLissObservingEvent:
         with (
             patch("src.story.ch03.print_slow") as mock_print,
             patch("src.story.ch03.say") as mock_say,
-            patch("src.story.ch03.time.sleep"),
+            patch("src.story.ch03.pause"),
         ):
             ev.process()
         assert mock_print.called
@@ -1910,7 +1910,7 @@ class TestAnvilIntroEvent:
             patch("src.story.ch03.print_slow") as mock_print,
             patch("src.story.ch03.say") as mock_say,
             patch("src.story.ch03.begin_conversation") as mock_begin,
-            patch("src.story.ch03.time.sleep"),
+            patch("src.story.ch03.pause"),
         ):
             ev.process()
         assert mock_print.called
@@ -1978,7 +1978,7 @@ class TestEasternRoadTurnbackEvent:
         player.universe.get_tile.return_value = west_tile
         with (
             patch("src.story.ch03.print_slow"),
-            patch("src.story.ch03.time.sleep"),
+            patch("src.story.ch03.pause"),
         ):
             ev.process()
         assert player.current_room is west_tile
@@ -2089,7 +2089,7 @@ class TestMaraObservationEvent:
         with (
             patch("src.story.ch03.print_slow"),
             patch("src.story.ch03.say") as mock_say,
-            patch("src.story.ch03.time.sleep"),
+            patch("src.story.ch03.pause"),
         ):
             ev.process()
         mock_say.assert_any_call(
@@ -2110,7 +2110,7 @@ class TestMaraObservationEvent:
         with (
             patch("src.story.ch03.print_slow") as mock_print,
             patch("src.story.ch03.say") as mock_say,
-            patch("src.story.ch03.time.sleep"),
+            patch("src.story.ch03.pause"),
         ):
             ev.process()
         mock_say.assert_any_call(
@@ -2211,7 +2211,7 @@ class TestCampEntryGreetingEvent:
         with (
             patch("src.story.ch03.print_slow") as mock_print,
             patch("src.story.ch03.say") as mock_say,
-            patch("src.story.ch03.time.sleep"),
+            patch("src.story.ch03.pause"),
         ):
             ev.process()
         assert mock_print.called
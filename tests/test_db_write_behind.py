@@ -0,0 +1,233 @@
+"""Tests for the write-behind queue in ``src/api/db.py`` and the autosave path
+that uses it when ``DB_WRITE_BEHIND`` is on.
+
+The queue tests drive :class:`WriteBehindQueue` with a recording client; the
+end-to-end tests run ``GameService`` against a real libsql ``file:`` database.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.api.db import WriteBehindQueue, db
+from src.api.migrations import init_db
+from src.api.services.game_service import GameService
+from src.player import Player
+
+
+class _RecordingClient:
+    """Records each ``batch`` call; the first one can be held open."""
+
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.fail_on = fail_on
+        self.hold = threading.Event()
+        self.hold.set()
+        self.entered = threading.Event()
+        self.closed = False
+
+    async def batch(self, statements):
+        self.entered.set()
+        self.hold.wait(5)
+        if self.fail_on is not None and any(sql == self.fail_on for sql, _ in statements):
+            raise RuntimeError("constraint failed")
+        self.batches.append(list(statements))
+        return [f"result:{sql}" for sql, _ in statements]
+
+    async def close(self):
+        self.closed = True
+
+
+def _held_queue(client, **kwargs):
+    """A queue whose writer is stuck in a first batch until ``client.hold`` is set."""
+    queue = WriteBehindQueue(lambda: client, **kwargs)
+    client.hold.clear()
+    queue.enqueue([("warmup", [])])
+    assert client.entered.wait(5)
+    return queue
+
+
+class TestWriteBehindQueue:
+    def test_last_write_wins_per_key(self):
+        client = _RecordingClient()
+        queue = _held_queue(client)
+
+        first = queue.enqueue([("save", ["v1"])], key=("autosave", "u1"))
+        second = queue.enqueue([("save", ["v2"])], key=("autosave", "u1"))
+        other = queue.enqueue([("save", ["w1"])], key=("autosave", "u2"))
+        client.hold.set()
+
+        assert first is second
+        assert first.result(5) == ["result:save"]
+        assert other.result(5) == ["result:save"]
+        assert client.batches[1] == [("save", ["v2"]), ("save", ["w1"])]
+        queue.close(5)
+        stats = queue.stats()
+        assert (stats["enqueued"], stats["coalesced"], stats["batches"]) == (4, 1, 2)
+        assert client.closed
+
+    def test_unkeyed_writes_are_never_coalesced(self):
+        client = _RecordingClient()
+        queue = _held_queue(client)
+
+        queue.enqueue([("insert", [1])])
+        queue.enqueue([("insert", [2])])
+        client.hold.set()
+
+        assert queue.flush(5)
+        assert client.batches[1] == [("insert", [1]), ("insert", [2])]
+        queue.close(5)
+
+    def test_batches_are_capped(self):
+        client = _RecordingClient()
+        queue = _held_queue(client, max_batch=2)
+
+        for n in range(5):
+            queue.enqueue([("insert", [n])])
+        client.hold.set()
+
+        assert queue.flush(5)
+        assert [len(b) for b in client.batches[1:]] == [2, 2, 1]
+        queue.close(5)
+
+    def test_a_failing_entry_does_not_sink_its_batch(self):
+        client = _RecordingClient(fail_on="bad")
+        queue = _held_queue(client)
+
+        good = queue.enqueue([("good", [1])])
+        bad = queue.enqueue([("bad", [2])])
+        later = queue.enqueue([("good", [3])])
+        client.hold.set()
+
+        assert good.result(5) == ["result:good"]
+        assert later.result(5) == ["result:good"]
+        with pytest.raises(RuntimeError, match="constraint failed"):
+            bad.result(5)
+        queue.close(5)
+        assert queue.stats()["failed"] == 1
+
+    def test_future_for_tracks_waiting_and_in_flight_entries(self):
+        client = _RecordingClient()
+        queue = WriteBehindQueue(lambda: client)
+        client.hold.clear()
+
+        future = queue.enqueue([("save", [1])], key="k")
+        assert client.entered.wait(5)
+        assert queue.future_for("k") is future  # in flight
+        client.hold.set()
+        future.result(5)
+        assert queue.flush(5)
+        assert queue.future_for("k") is None
+        queue.close(5)
+
+    def test_closed_queue_refuses_writes(self):
+        queue = WriteBehindQueue(_RecordingClient)
+        queue.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            queue.enqueue([("save", [])])
+
+
+@pytest.fixture
+def file_db(tmp_path, monkeypatch):
+    """Point the ``db`` singleton at a fresh libsql ``file:`` database."""
+    monkeypatch.setenv("TURSO_DATABASE_URL", f"file:{tmp_path / 'saves.db'}")
+    monkeypatch.delenv("TURSO_AUTH_TOKEN", raising=False)
+    monkeypatch.setattr(db, "_client", None, raising=False)
+    monkeypatch.setattr(db, "_write_queue", None, raising=False)
+    asyncio.run(init_db())
+    yield db
+    asyncio.run(db.close())
+
+
+def _player(level):
+    player = Player()
+    player.level = level
+    return player
+
+
+async def _autosave_rows(database, user_id):
+    res = await database.execute(
+        "SELECT id, level FROM saves WHERE user_id = ? AND is_autosave = TRUE", [user_id]
+    )
+    return [tuple(row) for row in res.rows]
+
+
+class TestAutosaveWriteBehind:
+    def test_off_by_default(self, file_db, monkeypatch):
+        monkeypatch.delenv("DB_WRITE_BEHIND", raising=False)
+
+        async def scenario():
+            save_id = await GameService().save_game(_player(3), "Autosave", "u1", is_autosave=True)
+            return save_id, await _autosave_rows(file_db, "u1")
+
+        save_id, rows = asyncio.run(scenario())
+
+        assert rows == [(save_id, 3)]
+        assert file_db.write_stats() is None
+
+    def test_autosaves_coalesce_into_one_row(self, file_db, monkeypatch):
+        monkeypatch.setenv("DB_WRITE_BEHIND", "1")
+        service = GameService()
+
+        async def scenario():
+            ids = [
+                await service.save_game(_player(level), "Autosave", "u1", is_autosave=True)
+                for level in (1, 2, 3)
+            ]
+            saves = await service.list_saves("u1")
+            return ids, saves, await _autosave_rows(file_db, "u1")
+
+        ids, saves, rows = asyncio.run(scenario())
+
+        assert len(set(ids)) == 1
+        assert rows == [(ids[0], 3)]
+        assert [(s["id"], s["level"]) for s in saves] == [(ids[0], 3)]
+        stats = file_db.write_stats()
+        assert stats["enqueued"] == 3 and stats["failed"] == 0
+
+    def test_existing_autosave_is_updated_in_place(self, file_db, monkeypatch):
+        monkeypatch.delenv("DB_WRITE_BEHIND", raising=False)
+        first_id = asyncio.run(GameService().save_game(_player(1), "Autosave", "u1", is_autosave=True))
+        monkeypatch.setenv("DB_WRITE_BEHIND", "1")
+        service = GameService()
+
+        async def scenario():
+            save_id = await service.save_game(_player(5), "Autosave", "u1", is_autosave=True)
+            loaded = await service.load_game(save_id, "u1")
+            return save_id, loaded
+
+        save_id, loaded = asyncio.run(scenario())
+
+        assert save_id == first_id
+        assert loaded.level == 5
+        assert asyncio.run(_autosave_rows(file_db, "u1")) == [(first_id, 5)]
+
+    def test_delete_waits_for_the_queued_autosave(self, file_db, monkeypatch):
+        monkeypatch.setenv("DB_WRITE_BEHIND", "1")
+        service = GameService()
+
+        async def scenario():
+            save_id = await service.save_game(_player(2), "Autosave", "u1", is_autosave=True)
+            deleted = await service.delete_save(save_id, "u1")
+            new_id = await service.save_game(_player(4), "Autosave", "u1", is_autosave=True)
+            await file_db.wait_for_writes(("autosave", "u1"))
+            return save_id, deleted, new_id, await _autosave_rows(file_db, "u1")
+
+        save_id, deleted, new_id, rows = asyncio.run(scenario())
+
+        assert deleted is True
+        assert new_id != save_id
+        assert rows == [(new_id, 4)]
+
+    def test_manual_saves_stay_synchronous(self, file_db, monkeypatch):
+        monkeypatch.setenv("DB_WRITE_BEHIND", "1")
+
+        async def scenario():
+            save_id = await GameService().save_game(_player(2), "slot 1", "u1")
+            res = await file_db.execute("SELECT name FROM saves WHERE id = ?", [save_id])
+            return [tuple(row) for row in res.rows]
+
+        assert asyncio.run(scenario()) == [("slot 1",)]
+        assert file_db.write_stats() is None
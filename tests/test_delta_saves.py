@@ -0,0 +1,280 @@
+"""Tests for delta saves (``serialize_delta_save`` / ``DeltaSaveUnpickler``).
+
+A delta save writes tiles that still match their map template as references
+and rebuilds them on load, so the contract pinned here is "loads back the same
+world a full save would", with the identities the engine relies on intact.
+"""
+
+import io
+import json
+import pickle
+import random
+from unittest.mock import patch
+
+import pytest
+
+import src.secure_pickle as secure_pickle
+import src.universe as universe_module
+from src.api.services.game_service import GameService
+from src.config_manager import GameConfig
+from src.functions import _safe_pickle_load
+from src.player import Player
+from src.universe import (
+    DeltaSaveUnpickler,
+    LazyMap,
+    Universe,
+    clear_map_template_cache,
+    serialize_delta_save,
+)
+
+_MAPS = {
+    "alpha": {
+        "(0, 0)": {"title": "Alpha Gate", "items": [{"class": "items.Restorative", "params": {}}]},
+        # Slimes roll their stats, so this tile never matches a fresh build.
+        "(1, 0)": {"title": "Alpha East", "npcs": [{"class": "npc.Slime", "params": {}}]},
+        "(2, 0)": {"title": "Alpha Armory", "items": [{"class": "items.Shortsword", "params": {}}]},
+    },
+    "beta": {"(0, 0)": {"title": "Beta Gate"}, "(1, 0)": {"title": "Beta East"}},
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_map_template_cache()
+    yield
+    clear_map_template_cache()
+
+
+def _build(tmp_path, lazy=False):
+    for name, tiles in _MAPS.items():
+        (tmp_path / f"{name}.json").write_text(json.dumps(tiles), encoding="utf-8")
+    player = Player()
+    universe = Universe(player)
+    universe.lazy_maps = lazy
+    for name in _MAPS:
+        universe._load_single_json_map(player, tmp_path / f"{name}.json")
+    player.universe = universe
+    player.map = _slot(universe, "alpha")
+    player.current_room = player.map[(0, 0)]
+    return player, universe
+
+
+@pytest.fixture
+def world(tmp_path):
+    return _build(tmp_path)
+
+
+def _slot(universe, name):
+    return next(m for m in universe.maps if m.get("name") == name)
+
+
+def _load(blob):
+    clear_map_template_cache()  # rebuild from disk, as a fresh process would
+    return _safe_pickle_load(io.BytesIO(blob))
+
+
+def _tiles(game_map):
+    return {coord: tile for coord, tile in game_map.items() if isinstance(coord, tuple)}
+
+
+class TestRoundTrip:
+    def test_untouched_world_is_mostly_references(self, world):
+        player, universe = world
+
+        unchanged, _ = universe_module._unchanged_tiles(universe)
+
+        assert sorted((t.map["name"], t.x, t.y) for _, t in unchanged.values()) == [
+            ("alpha", 0, 0), ("alpha", 2, 0), ("beta", 0, 0), ("beta", 1, 0),
+        ]
+        assert len(serialize_delta_save(player, universe)) < len(
+            secure_pickle.serialize_for_save(player)
+        )
+
+    def test_load_rebuilds_unchanged_tiles_in_place(self, world):
+        player, universe = world
+        player.current_room.discovered = True  # the player's own tile changed
+
+        restored = _load(serialize_delta_save(player, universe))
+
+        restored_universe = restored.universe
+        alpha = _slot(restored_universe, "alpha")
+        assert restored.map is alpha
+        assert restored.current_room is alpha[(0, 0)]
+        assert restored.current_room.discovered is True
+        for game_map in restored_universe.maps:
+            for coord, tile in _tiles(game_map).items():
+                assert (tile.x, tile.y) == coord
+                assert tile.map is game_map
+                assert tile.universe is restored_universe
+        armory = alpha[(2, 0)]
+        assert armory.name == "Alpha Armory"
+        assert [type(i).__name__ for i in armory.items_here] == ["Shortsword"]
+        assert _slot(restored_universe, "beta")[(1, 0)].name == "Beta East"
+
+    def test_changes_survive_and_rolled_npcs_are_kept(self, world):
+        player, universe = world
+        alpha = _slot(universe, "alpha")
+        player.inventory.append(alpha[(0, 0)].items_here.pop())
+        slime = alpha[(1, 0)].npcs_here[0]
+        slime.hp = 0
+        universe.story["gorran_first"] = "1"
+
+        restored = _load(serialize_delta_save(player, universe))
+
+        restored_alpha = _slot(restored.universe, "alpha")
+        assert restored_alpha[(0, 0)].items_here == []
+        assert type(restored.inventory[-1]).__name__ == "Restorative"
+        restored_slime = restored_alpha[(1, 0)].npcs_here[0]
+        assert restored_slime.name == slime.name
+        assert restored_slime.hp == 0
+        assert restored.universe.story["gorran_first"] == "1"
+
+    def test_an_item_reached_from_outside_keeps_its_tile_in_full(self, world):
+        player, universe = world
+        gate = _slot(universe, "alpha")[(0, 0)]
+        potion = gate.items_here[0]
+        player.inventory.append(potion)  # shared, not moved: the tile still matches
+
+        assert id(gate) in universe_module._unchanged_tiles(universe)[0]
+        restored = _load(serialize_delta_save(player, universe))
+
+        restored_gate = _slot(restored.universe, "alpha")[(0, 0)]
+        assert restored.inventory[-1] is restored_gate.items_here[0]
+
+    def test_full_saves_still_load(self, world):
+        player, _ = world
+
+        restored = _load(secure_pickle.serialize_for_save(player))
+
+        assert restored.map is _slot(restored.universe, "alpha")
+
+    def test_lazy_maps_keep_their_state(self, tmp_path):
+        player, universe = _build(tmp_path, lazy=True)
+
+        restored = _load(serialize_delta_save(player, universe))
+
+        assert restored.universe.map_residency() == {"resident": 1, "paged": 0, "cold": 1}
+        alpha = _slot(restored.universe, "alpha")
+        assert isinstance(alpha, LazyMap)
+        assert restored.map is alpha
+        assert alpha[(2, 0)].map is alpha
+
+    def test_saving_does_not_shift_the_random_stream(self, world):
+        player, universe = world
+        random.seed(7)
+        expected = random.random()
+
+        random.seed(7)
+        serialize_delta_save(player, universe)
+
+        assert random.random() == expected
+
+
+class TestFingerprintCache:
+    def _fingerprinted(self, universe, monkeypatch):
+        seen = []
+        real = universe_module._tile_fingerprint
+
+        def counting(tile, game_map, refs):
+            seen.append((game_map["name"], tile.x, tile.y))
+            return real(tile, game_map, refs)
+
+        monkeypatch.setattr(universe_module, "_tile_fingerprint", counting)
+        universe_module._unchanged_tiles(universe)
+        return sorted(seen)
+
+    def test_only_the_players_map_and_touched_tiles_are_fingerprinted_again(self, world, monkeypatch):
+        player, universe = world
+        universe_module._unchanged_tiles(universe)
+        beta = _slot(universe, "beta")
+
+        # The Slime tile rolls its stats, so it never has a digest to check.
+        assert self._fingerprinted(universe, monkeypatch) == [("alpha", 0, 0), ("alpha", 2, 0)]
+
+        beta[(1, 0)].description = "Rubble fills the passage."
+        assert self._fingerprinted(universe, monkeypatch) == [
+            ("alpha", 0, 0), ("alpha", 2, 0), ("beta", 1, 0),
+        ]
+        assert id(beta[(1, 0)]) not in universe_module._unchanged_tiles(universe)[0]
+
+    def test_a_change_inside_an_object_on_the_players_map_is_seen(self, world):
+        player, universe = world
+        armory = _slot(universe, "alpha")[(2, 0)]
+        assert id(armory) in universe_module._unchanged_tiles(universe)[0]
+
+        armory.items_here[0].name = "Bent Shortsword"
+
+        assert id(armory) not in universe_module._unchanged_tiles(universe)[0]
+
+    def test_pristine_builds_are_not_kept(self, world):
+        from src.tiles import MapTile
+
+        _, universe = world
+        universe_module._unchanged_tiles(universe)
+
+        kept = [
+            obj
+            for _, _, shared in universe_module._PRISTINE_TILES.values()
+            for obj in shared.values()
+        ]
+        assert not [obj for obj in kept if isinstance(obj, (MapTile, Universe, Player))]
+
+
+class TestLoaderSafety:
+    def test_plain_safe_unpickler_refuses_a_delta_save(self, world):
+        player, universe = world
+        blob = serialize_delta_save(player, universe)
+
+        with pytest.raises(pickle.UnpicklingError, match="DeltaSaveUnpickler"):
+            secure_pickle.safe_pickle_load(io.BytesIO(blob), max_bytes=None)
+
+    def test_a_reference_to_a_non_tile_class_is_rejected(self):
+        class _Forged:
+            def __reduce__(self):
+                return universe_module._template_tile, (Universe(), dict, {}, 0, 0)
+
+        payload = pickle.dumps([_Forged()], protocol=pickle.HIGHEST_PROTOCOL)
+
+        with pytest.raises(pickle.UnpicklingError, match="malformed template tile"):
+            DeltaSaveUnpickler(io.BytesIO(payload)).load()
+
+    def test_a_tile_missing_from_the_template_comes_back_empty(self, world, tmp_path):
+        player, universe = world
+        blob = serialize_delta_save(player, universe)
+        (tmp_path / "beta.json").write_text(json.dumps({"(0, 0)": {"title": "Beta Gate"}}), encoding="utf-8")
+
+        restored = _load(blob)
+
+        tile = _slot(restored.universe, "beta")[(1, 0)]
+        assert (tile.x, tile.y) == (1, 0)
+        assert tile.npcs_here == [] and tile.items_here == []
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+
+class _FakeDb:
+    def __init__(self):
+        self.calls = []
+
+    async def execute(self, sql, params=None):
+        self.calls.append((sql, params))
+        return _FakeResult([[0]] if "COUNT(*)" in sql else [])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("delta", [False, True])
+async def test_save_game_follows_the_delta_saves_setting(world, delta):
+    player, universe = world
+    player.game_config = GameConfig(delta_saves=delta)
+    db = _FakeDb()
+
+    with patch("src.api.db.db", db):
+        await GameService().save_game(player, "slot 1", "user-1")
+
+    blob = db.calls[-1][1][3]
+    full = secure_pickle.serialize_for_save(player)
+    assert (len(blob) < len(full)) is delta
+    assert _load(blob).map.get("name") == "alpha"
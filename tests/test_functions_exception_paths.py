@@ -542,6 +542,8 @@ def _install_fake_enchant_tables(monkeypatch, **classes):
         setattr(mod, name, cls)
     monkeypatch.setitem(sys.modules, "src.enchant_tables", mod)
     monkeypatch.setattr(src, "enchant_tables", mod, raising=False)
+    # The tier/group index is built once per process; rebuild it from the fake.
+    monkeypatch.setattr(functions, "_enchantment_index", None)
     # Force a single deterministic roll: group 0 (prefix).
     import random
 
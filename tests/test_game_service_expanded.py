@@ -29,13 +29,12 @@ The Turso client is the only thing stubbed; every assertion is on the bytes and
 the SQL parameters that actually reach it.
 """
 
-import hashlib
-import struct
+import pickle
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.secure_pickle import HEADER_MAGIC, HEADER_SIZE, HEADER_VERSION
+from src.secure_pickle import CHUNKED_HEADER_VERSION, HEADER_MAGIC, verify_and_strip_header
 from tests._gs_fixtures import GRID_3X3, live_world
 
 
@@ -95,17 +94,16 @@ class TestSaveGameIntegrity:
 
         blob = _saved_blob(db)
         assert blob[:4] == HEADER_MAGIC == b"HOVS"
-        assert blob[4] == HEADER_VERSION
+        assert blob[4] == CHUNKED_HEADER_VERSION
 
-    async def test_header_digest_matches_the_payload(self, game_service, player, db):
-        """The sha256 is what ``load_game`` checks; a wrong one bricks the save."""
+    async def test_frame_digests_match_the_payload(self, game_service, player, db):
+        """The sha256 chain is what ``load_game`` checks; a wrong one bricks the save."""
         db.execute.side_effect = [_result(rows=[[0]]), _result()]
 
         await game_service.save_game(player, "MySave", "user123")
 
-        blob = _saved_blob(db)
-        _magic, _version, digest = struct.Struct(">4sB32s").unpack(blob[:HEADER_SIZE])
-        assert digest == hashlib.sha256(blob[HEADER_SIZE:]).digest()
+        payload = verify_and_strip_header(_saved_blob(db))
+        assert pickle.loads(payload).name == player.name
 
     async def test_the_saved_bytes_load_back_into_an_equivalent_player(
         self, game_service, player, db
@@ -746,7 +746,7 @@ class TestGetCombatStatus:
 
         status = game_service.get_combat_status(jean)
 
-        assert status == {"combat_active": False, "log": [], "battle_state": None}
+        assert status == {"combat_active": False, "log": [], "log_seq": 0, "battle_state": None}
 
     def test_in_combat_the_battle_state_names_the_enemy(
         self, game_service, make_world, grid_3x3
@@ -1,4 +1,4 @@
-"""GameService's internal plumbing: output cleaning, event queueing, BGM, patches.
+"""GameService's internal plumbing: output cleaning, event queueing, BGM, headless runs.
 
 History
 -------
@@ -23,14 +23,19 @@ weakest copies of tests that now live properly in
 What remains — and what this file is now about — is the **private plumbing every
 event path runs through**: ``_clean_event_output``, ``_store_pending_event`` /
 ``_queue_interactive_event``, ``_resolve_bgm``, ``_serialize_active_states`` and
-the event-patch construction. These are cheap to test directly and nothing else
+headless event runs. These are cheap to test directly and nothing else
 covers them.
 """
 
+import threading
+from unittest.mock import patch
+
 import pytest
 
+import src.animations as animations
 from src.api.services.game_service import GameService
 from src.events import Event
+from src.headless import headless, is_headless, pause
 from tests._gs_fixtures import GRID_3X3, live_world
 
 
@@ -312,69 +317,57 @@ class TestSerializeActiveStates:
         ]
 
 
-class TestEventTargetModules:
-    """``_get_event_target_modules`` decides what ``_build_event_patches`` neutralizes."""
+class _PacedEvent(Event):
+    """Sleeps and animates like a story beat, recording what it saw."""
 
-    ENGINE_MODULES = {
-        "src.functions",
-        "src.player",
-        "src.interface",
-        "src.items",
-        "src.objects",
-        "src.events",
-        "src.story.effects",
-    }
+    def __init__(self, **kwargs):
+        super().__init__(name="Paced", **kwargs)
+        self.saw_headless = None
 
-    def test_animations_are_included_by_default(self, game_service):
-        modules = game_service._get_event_target_modules(Event(name="E"))
-        assert "src.animations" in modules
+    def check_conditions(self):
+        self.saw_headless = is_headless()
+        pause(5)
+        animations.animate_to_main_screen("fireball")
 
-    def test_animations_can_be_excluded(self, game_service):
-        modules = game_service._get_event_target_modules(
-            Event(name="E"), include_animations=False
-        )
-        assert "src.animations" not in modules
-
-    def test_the_core_engine_modules_are_always_targeted(self, game_service):
-        modules = set(game_service._get_event_target_modules(Event(name="E")))
-        assert self.ENGINE_MODULES <= modules
-
-    def test_the_events_own_module_is_added(self, game_service):
-        """A story event defined outside ``src.events`` still gets patched."""
-        modules = game_service._get_event_target_modules(Event(name="E"))
-        assert Event.__module__ in modules
-
-    def test_module_paths_are_all_canonical(self, game_service):
-        """Bare-name imports create duplicate module objects — see CLAUDE.md."""
-        modules = game_service._get_event_target_modules(Event(name="E"))
-        assert all(m.startswith("src.") or m.startswith("tests") for m in modules)
-
-    def test_patches_suppress_real_sleeping(self, game_service):
-        """An event that pauses dramatically must not block the HTTP request."""
-        import contextlib
-        import time
-
-        patches = game_service._build_event_patches(["src.functions"])
-        with contextlib.ExitStack() as stack:
-            for p in patches:
-                with contextlib.suppress(AttributeError, ImportError, TypeError, ValueError):
-                    stack.enter_context(p)
-            started = time.monotonic()
-            time.sleep(5)
-            assert time.monotonic() - started < 1
-
-    def test_patch_list_covers_every_requested_module(self, game_service):
-        one = game_service._build_event_patches(["src.functions"])
-        two = game_service._build_event_patches(["src.functions", "src.items"])
-        # One shared time.sleep patch, then three per module.
-        assert len(one) == 1 + 3
-        assert len(two) == 1 + 3 * 2
-
-    def test_duplicate_modules_are_patched_once(self, game_service):
-        patches = game_service._build_event_patches(
-            ["src.functions", "src.functions", "src.functions"]
-        )
-        assert len(patches) == 1 + 3
+
+class TestHeadlessEventRuns:
+    """Event paths run the engine headless instead of patching module globals."""
+
+    def test_tile_events_run_headless(self, game_service, player, tile):
+        event = _PacedEvent(player=player, tile=tile)
+        tile.events_here.append(event)
+
+        with patch("time.sleep") as sleep:
+            game_service.trigger_tile_events(player, tile, {})
+
+        assert event.saw_headless is True
+        sleep.assert_not_called()
+
+    def test_headless_ends_with_the_event_run(self, game_service, player, tile):
+        tile.events_here.append(_PacedEvent(player=player, tile=tile))
+
+        game_service.trigger_tile_events(player, tile, {})
+
+        assert not is_headless()
+
+    def test_pause_sleeps_outside_headless(self):
+        with patch("time.sleep") as sleep:
+            pause(0.5)
+            with headless():
+                pause(0.5)
+
+        sleep.assert_called_once_with(0.5)
+
+    def test_headless_is_local_to_the_thread(self):
+        """A headless request must not silence another thread's pacing."""
+        seen = []
+        with headless():
+            worker = threading.Thread(target=lambda: seen.append(is_headless()))
+            worker.start()
+            worker.join()
+            assert is_headless()
+
+        assert seen == [False]
 
 
 class TestStaticUniverseHelpers:
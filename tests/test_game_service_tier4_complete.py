@@ -347,6 +347,7 @@ class TestGameServiceCombatMethods:
         assert gs.get_combat_status(player) == {
             "combat_active": False,
             "log": [],
+            "log_seq": 0,
             "battle_state": None,
         }
 
@@ -2464,7 +2464,7 @@ class TestSaveGame:
         mock_player.level = 5
         mock_player.time_elapsed = 120
 
-        with patch("src.api.db.db", db_mock), patch("pickle.dumps", return_value=b"pickled"):
+        with patch("src.api.db.db", db_mock), patch("src.secure_pickle.serialize_for_save", return_value=b"pickled"):
             save_id = await game_service.save_game(mock_player, "MySave", "user123", is_autosave=False)
 
         assert isinstance(save_id, str)
@@ -2480,7 +2480,7 @@ class TestSaveGame:
         mock_player.map = None
         mock_player.current_room = None
 
-        with patch("src.api.db.db", db_mock), patch("pickle.dumps", return_value=b"pickled"):
+        with patch("src.api.db.db", db_mock), patch("src.secure_pickle.serialize_for_save", return_value=b"pickled"):
             save_id = await game_service.save_game(mock_player, "Autosave", "user123", is_autosave=True)
 
         assert isinstance(save_id, str)
@@ -2496,7 +2496,7 @@ class TestSaveGame:
         mock_player.map = MagicMock()
         mock_player.map.get = MagicMock(return_value="MapObjName")
 
-        with patch("src.api.db.db", db_mock), patch("pickle.dumps", return_value=b"pickled"):
+        with patch("src.api.db.db", db_mock), patch("src.secure_pickle.serialize_for_save", return_value=b"pickled"):
             save_id = await game_service.save_game(mock_player, "Autosave", "user123", is_autosave=True)
 
         assert save_id == "existing-save-id"
@@ -2531,7 +2531,7 @@ class TestSaveGame:
         mock_player.map = None
         mock_player.current_room = None
 
-        with patch("src.api.db.db", db_mock), patch("pickle.dumps", return_value=b"pickled"):
+        with patch("src.api.db.db", db_mock), patch("src.secure_pickle.serialize_for_save", return_value=b"pickled"):
             save_id = await game_service.save_game(mock_player, "Autosave", "user123", is_autosave=True)
 
         assert isinstance(save_id, str)
@@ -2550,7 +2550,7 @@ class TestSaveGame:
         mock_player.game_config = GameConfig(autosave_enabled=False)
         mock_player.map = {"name": "Dark Grotto"}
 
-        with patch("src.api.db.db", db_mock), patch("pickle.dumps", return_value=b"pickled"):
+        with patch("src.api.db.db", db_mock), patch("src.secure_pickle.serialize_for_save", return_value=b"pickled"):
             save_id = await game_service.save_game(mock_player, "MySave", "user123", is_autosave=False)
 
         assert isinstance(save_id, str)
@@ -2567,7 +2567,7 @@ class TestSaveGame:
         mock_player._combat_adapter = adapter_marker
         mock_player.map = {"name": "Map"}
 
-        with patch("src.api.db.db", db_mock), patch("pickle.dumps", return_value=b"pickled"):
+        with patch("src.api.db.db", db_mock), patch("src.secure_pickle.serialize_for_save", return_value=b"pickled"):
             await game_service.save_game(mock_player, "Save1", "user123", is_autosave=False)
 
         assert mock_player._combat_adapter is adapter_marker
@@ -0,0 +1,73 @@
+"""Tests for the one-time item class registry and the enchantment index.
+
+Both replace per-call ``inspect.getmembers`` scans, so the contract pinned
+here is "same classes, same order" as the scan they replaced.
+"""
+
+import inspect
+
+import src.enchant_tables as enchant_tables
+import src.functions as functions
+import src.items as items
+from src.items import Item, ItemRegistry, Restorative, Shortsword, Weapon
+
+
+def _scanned_item_classes():
+    return [
+        (name, obj)
+        for name, obj in inspect.getmembers(items, inspect.isclass)
+        if obj is not Item and issubclass(obj, Item)
+    ]
+
+
+class TestItemRegistry:
+    def test_module_registry_matches_a_reflection_scan_in_order(self):
+        assert list(items.item_registry().classes) == _scanned_item_classes()
+
+    def test_registry_is_built_once(self):
+        assert items.item_registry() is items.item_registry()
+
+    def test_names_at_level_matches_the_old_loot_scan(self):
+        registry = items.item_registry()
+        for level in (0, 1, 2, 3, 4):
+            expected = [
+                name for name, obj in inspect.getmembers(items)
+                if inspect.isclass(obj) and hasattr(obj, "level") and obj.level == level
+            ]
+            assert list(registry.names_at_level(level)) == expected
+        assert registry.names_at_level(12345) == ()
+
+    def test_subclasses_of_is_memoized_and_filtered(self):
+        registry = items.item_registry()
+        weapons = registry.subclasses_of(Weapon)
+
+        assert weapons is registry.subclasses_of(Weapon)
+        assert Shortsword in weapons
+        assert Restorative not in weapons
+        assert all(issubclass(cls, Weapon) for cls in weapons)
+
+    def test_non_item_members_are_dropped_and_order_is_kept(self):
+        registry = ItemRegistry([
+            ("Shortsword", Shortsword),
+            ("Item", Item),
+            ("Junk", "not a class"),
+            ("Inspect", inspect.Signature),
+            ("Restorative", Restorative),
+        ])
+
+        assert registry.classes == (("Shortsword", Shortsword), ("Restorative", Restorative))
+
+
+class TestEnchantmentIndex:
+    def test_index_matches_instantiated_groups(self):
+        index = functions._enchantments_by_tier_and_group()
+        expected = {}
+        for _, cls in inspect.getmembers(enchant_tables, inspect.isclass):
+            if hasattr(cls, "tier"):
+                key = (int(cls.tier), cls(Shortsword()).group)
+                expected.setdefault(key, []).append(cls)
+
+        assert {key: list(classes) for key, classes in index.items()} == expected
+
+    def test_index_is_built_once(self):
+        assert functions._enchantments_by_tier_and_group() is functions._enchantments_by_tier_and_group()
@@ -0,0 +1,151 @@
+"""Tests for lazy map materialization and page-out in ``Universe``.
+
+A lazy universe holds a LazyMap slot per shipped map and builds tiles only on
+first entry. The tests pin the identities the rest of the engine relies on
+(``player.map is area``, ``tile.map is area``) across build, page-out,
+page-in and save round trips.
+"""
+
+import io
+import json
+
+import pytest
+
+import src.secure_pickle as secure_pickle
+from src.player import Player
+from src.universe import LazyMap, Universe, clear_map_template_cache
+
+_MAPS = {
+    "alpha": {
+        "(0, 0)": {"title": "Alpha Gate", "npcs": [{"class": "npc.Slime", "params": {}}]},
+        "(1, 0)": {"title": "Alpha East"},
+    },
+    "beta": {"(0, 0)": {"title": "Beta Gate"}},
+    "gamma": {"(0, 0)": {"title": "Gamma Gate"}},
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_map_template_cache()
+    yield
+    clear_map_template_cache()
+
+
+@pytest.fixture
+def world(tmp_path):
+    for name, tiles in _MAPS.items():
+        (tmp_path / f"{name}.json").write_text(json.dumps(tiles), encoding="utf-8")
+    player = Player()
+    universe = Universe(player)
+    universe.player = player
+    universe.lazy_maps = True
+    for name in _MAPS:
+        universe._load_single_json_map(player, tmp_path / f"{name}.json")
+    player.universe = universe
+    return player, universe
+
+
+def _slot(universe, name):
+    return next(m for m in universe.maps if m.get("name") == name)
+
+
+class TestLazyBuild:
+    def test_maps_start_cold(self, world):
+        _, universe = world
+
+        assert all(isinstance(m, LazyMap) for m in universe.maps)
+        assert universe.map_residency() == {"resident": 0, "paged": 0, "cold": 3}
+
+    def test_name_lookups_do_not_build(self, world):
+        _, universe = world
+
+        alpha = _slot(universe, "alpha")
+
+        assert alpha["name"] == "alpha"
+        assert alpha
+        assert not alpha.resident
+
+    def test_tile_access_builds_in_place(self, world):
+        _, universe = world
+        alpha = _slot(universe, "alpha")
+
+        tile = alpha[(0, 0)]
+
+        assert alpha.resident
+        assert tile.map is alpha
+        assert tile.universe is universe
+        assert tile.npcs_here[0].current_room is tile
+
+    def test_teleport_builds_only_the_destination(self, world):
+        player, universe = world
+
+        player.teleport("beta", (0, 0))
+
+        assert player.map is _slot(universe, "beta")
+        assert universe.map_residency() == {"resident": 1, "paged": 0, "cold": 2}
+
+
+class TestPageOut:
+    def test_budget_pages_out_least_recent_map(self, world):
+        player, universe = world
+        universe.max_resident_maps = 1
+
+        player.teleport("alpha", (0, 0))
+        player.teleport("beta", (0, 0))
+
+        alpha = _slot(universe, "alpha")
+        assert not alpha.resident
+        assert repr(alpha) == "<LazyMap 'alpha' paged>"
+        assert universe.map_residency() == {"resident": 1, "paged": 1, "cold": 1}
+
+    def test_current_map_is_never_paged_out(self, world):
+        player, universe = world
+        player.teleport("alpha", (0, 0))
+
+        assert player.map.page_out() is False
+        assert player.map.resident
+
+    def test_page_in_restores_state_and_references(self, world):
+        player, universe = world
+        alpha = _slot(universe, "alpha")
+        alpha[(0, 0)].discovered = True
+        slime = alpha[(0, 0)].npcs_here[0]
+        slime.name = "Renamed Slime"
+
+        assert alpha.page_out() is True
+        tile = alpha[(0, 0)]
+
+        assert tile.discovered is True
+        assert tile.map is alpha
+        assert tile.universe is universe
+        assert tile.npcs_here[0].name == "Renamed Slime"
+        assert tile.npcs_here[0].current_room is tile
+
+    def test_map_holding_a_party_member_stays_resident(self, world):
+        player, universe = world
+        alpha = _slot(universe, "alpha")
+        companion = alpha[(0, 0)].npcs_here[0]
+        player.combat_list_allies.append(companion)
+
+        assert alpha.page_out() is False
+        assert alpha[(0, 0)].npcs_here[0] is companion
+
+
+def test_save_round_trip_keeps_cold_paged_and_resident_maps(world):
+    player, universe = world
+    universe.max_resident_maps = 1
+    player.teleport("alpha", (0, 0))
+    player.teleport("beta", (0, 0))
+
+    blob = secure_pickle.serialize_for_save(player)
+    restored = secure_pickle.safe_pickle_load(io.BytesIO(blob), max_bytes=None)
+
+    restored_universe = restored.universe
+    assert restored_universe.map_residency() == {"resident": 1, "paged": 1, "cold": 1}
+    assert restored.map is _slot(restored_universe, "beta")
+    alpha = _slot(restored_universe, "alpha")
+    assert alpha[(0, 0)].map is alpha
+    assert alpha[(0, 0)].universe is restored_universe
+    gamma = _slot(restored_universe, "gamma")
+    assert gamma[(0, 0)].name == "Gamma Gate"
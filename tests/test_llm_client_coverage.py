@@ -4,7 +4,7 @@ Covers provider selection/validation, model discovery + ranking + disk cache,
 retry/fallback logic, request/response parsing (ollama + openrouter, SDK + HTTP),
 failure-tracking, and the Mynx/NpcChat adapters built on GenericLLMClient.
 
-All network access is mocked: `requests.get`/`requests.post` are patched per-test,
+All network access is mocked: `requests.get`/`requests.Session.post` are patched per-test,
 `openai.OpenAI` is monkeypatched with fakes for SDK-path coverage, and
 `threading.Thread` is patched where the production code would otherwise spawn a
 real (infinite-loop) background thread.
@@ -870,7 +870,9 @@ class TestGeneratePlain:
         client._available = True
         with patch.object(client, "_ollama_chat", return_value="plain text") as mock_chat:
             result = client.generate_plain("sys", "user")
-        mock_chat.assert_called_once_with(system_prompt="sys", user_prompt="user", structured=False)
+        mock_chat.assert_called_once_with(
+            system_prompt="sys", user_prompt="user", structured=False, on_token=None
+        )
         assert result == "plain text"
 
     def test_openrouter_dispatch(self, monkeypatch):
@@ -960,7 +962,9 @@ class TestGenerateStructured:
         client._available = True
         with patch.object(client, "_ollama_chat", return_value={"a": 1}) as mock_chat:
             result = client.generate_structured("sys", "user")
-        mock_chat.assert_called_once_with(system_prompt="sys", user_prompt="user", structured=True)
+        mock_chat.assert_called_once_with(
+            system_prompt="sys", user_prompt="user", structured=True, on_token=None
+        )
         assert result == {"a": 1}
 
     def test_openrouter_dispatch(self, monkeypatch):
@@ -1020,7 +1024,7 @@ class TestOllamaChat:
         client = self._client(monkeypatch)
         resp = MagicMock(status_code=200)
         resp.json.return_value = {"message": {"content": "hello world"}}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=False)
         assert result == "hello world"
 
@@ -1031,7 +1035,7 @@ class TestOllamaChat:
             {"type": "thinking", "thinking": "..."},
             {"type": "text", "text": "final answer"},
         ]}}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=False)
         assert result == "final answer"
 
@@ -1039,7 +1043,7 @@ class TestOllamaChat:
         client = self._client(monkeypatch)
         resp = MagicMock(status_code=200)
         resp.json.return_value = {"choices": [{"message": {"content": "from choices"}}]}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=False)
         assert result == "from choices"
 
@@ -1047,7 +1051,7 @@ class TestOllamaChat:
         client = self._client(monkeypatch)
         resp = MagicMock(status_code=200)
         resp.json.return_value = {"choices": [{"content": "direct content"}]}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=False)
         assert result == "direct content"
 
@@ -1055,7 +1059,7 @@ class TestOllamaChat:
         client = self._client(monkeypatch)
         resp = MagicMock(status_code=200)
         resp.json.return_value = {"output": [{"content": "part one"}, "part two"]}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=False)
         assert "part one" in result and "part two" in result
 
@@ -1063,7 +1067,7 @@ class TestOllamaChat:
         client = self._client(monkeypatch)
         resp = MagicMock(status_code=200)
         resp.json.return_value = {"result": "result string content"}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=False)
         assert result == "result string content"
 
@@ -1071,7 +1075,7 @@ class TestOllamaChat:
         client = self._client(monkeypatch)
         resp = MagicMock(status_code=200)
         resp.json.return_value = {"result": {"content": "result dict content"}}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=False)
         assert result == "result dict content"
 
@@ -1079,7 +1083,7 @@ class TestOllamaChat:
         client = self._client(monkeypatch)
         resp = MagicMock(status_code=200)
         resp.json.return_value = {"text": "top level text"}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=False)
         assert result == "top level text"
 
@@ -1088,7 +1092,7 @@ class TestOllamaChat:
         resp = MagicMock(status_code=200)
         resp.json.side_effect = Exception("not json")
         resp.text = "raw fallback text"
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=False)
         assert result == "raw fallback text"
 
@@ -1096,14 +1100,14 @@ class TestOllamaChat:
         client = self._client(monkeypatch)
         resp = MagicMock(status_code=200)
         resp.json.return_value = {"message": {"content": '{"action": "groom"}'}}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=True)
         assert result == {"action": "groom"}
 
     def test_non_200_status_returns_none(self, monkeypatch):
         client = self._client(monkeypatch)
         resp = MagicMock(status_code=404)
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=False)
         assert result is None
 
@@ -1125,7 +1129,7 @@ class TestOllamaChat:
         here would surface as a 500 on an ordinary movement request.
         """
         client = self._client(monkeypatch)
-        with patch("requests.post", side_effect=exc):
+        with patch("requests.Session.post", side_effect=exc):
             assert client._ollama_chat("sys", "user", structured=False) is None
 
     def test_request_payload_carries_the_assembled_prompt(self, monkeypatch):
@@ -1139,7 +1143,7 @@ class TestOllamaChat:
         client = self._client(monkeypatch)
         resp = MagicMock(status_code=200)
         resp.json.return_value = {"message": {"content": "ok"}}
-        with patch("requests.post", return_value=resp) as mock_post:
+        with patch("requests.Session.post", return_value=resp) as mock_post:
             client._ollama_chat("SYSTEM RULES", "USER CONTEXT", structured=False)
 
         url = mock_post.call_args[0][0]
@@ -1159,7 +1163,7 @@ class TestOllamaChat:
         resp = MagicMock(status_code=200)
         resp.json.return_value = ["not", "a", "dict"]
         resp.text = "raw text used"
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = client._ollama_chat("sys", "user", structured=False)
         assert result == "raw text used"
 
@@ -1344,7 +1348,7 @@ class TestOpenrouterChatSingle:
         http_resp = MagicMock(status_code=200)
         http_resp.json.return_value = {"choices": [{"message": {"content": "http fallback"}}]}
         with patch.object(client, "_get_sdk_client", return_value=sdk), \
-             patch("requests.post", return_value=http_resp):
+             patch("requests.Session.post", return_value=http_resp):
             result = client._openrouter_chat_single("model/x", "sys", "user", structured=False)
         assert result == "http fallback"
 
@@ -1355,7 +1359,7 @@ class TestOpenrouterChatSingle:
         http_resp = MagicMock(status_code=200)
         http_resp.json.return_value = {"choices": [{"message": {"content": "http after sdk error"}}]}
         with patch.object(client, "_get_sdk_client", return_value=sdk), \
-             patch("requests.post", return_value=http_resp):
+             patch("requests.Session.post", return_value=http_resp):
             result = client._openrouter_chat_single("model/x", "sys", "user", structured=False)
         assert result == "http after sdk error"
 
@@ -1364,7 +1368,7 @@ class TestOpenrouterChatSingle:
         http_resp = MagicMock(status_code=200)
         http_resp.json.return_value = {"choices": [{"message": {"content": "direct http"}}]}
         with patch.object(client, "_get_sdk_client", return_value=None), \
-             patch("requests.post", return_value=http_resp):
+             patch("requests.Session.post", return_value=http_resp):
             result = client._openrouter_chat_single("model/x", "sys", "user", structured=False)
         assert result == "direct http"
 
@@ -1372,7 +1376,7 @@ class TestOpenrouterChatSingle:
         client = self._client(monkeypatch)
         http_resp = MagicMock(status_code=429)
         with patch.object(client, "_get_sdk_client", return_value=None), \
-             patch("requests.post", return_value=http_resp):
+             patch("requests.Session.post", return_value=http_resp):
             result = client._openrouter_chat_single("model/x", "sys", "user", structured=False)
         assert result is None
         assert client._is_model_failed("model/x") is True
@@ -1382,7 +1386,7 @@ class TestOpenrouterChatSingle:
         http_resp = MagicMock(status_code=200)
         http_resp.json.return_value = {"error": {"message": "bad request"}}
         with patch.object(client, "_get_sdk_client", return_value=None), \
-             patch("requests.post", return_value=http_resp):
+             patch("requests.Session.post", return_value=http_resp):
             result = client._openrouter_chat_single("model/x", "sys", "user", structured=False)
         assert result is None
 
@@ -1391,7 +1395,7 @@ class TestOpenrouterChatSingle:
         http_resp = MagicMock(status_code=200)
         http_resp.json.return_value = {"choices": [{"message": {"content": None, "reasoning": "reasoning text"}}]}
         with patch.object(client, "_get_sdk_client", return_value=None), \
-             patch("requests.post", return_value=http_resp):
+             patch("requests.Session.post", return_value=http_resp):
             result = client._openrouter_chat_single("model/x", "sys", "user", structured=False)
         assert result == "reasoning text"
 
@@ -1400,7 +1404,7 @@ class TestOpenrouterChatSingle:
         http_resp = MagicMock(status_code=200)
         http_resp.json.return_value = {"choices": [{"text": "legacy completion text"}]}
         with patch.object(client, "_get_sdk_client", return_value=None), \
-             patch("requests.post", return_value=http_resp):
+             patch("requests.Session.post", return_value=http_resp):
             result = client._openrouter_chat_single("model/x", "sys", "user", structured=False)
         assert result == "legacy completion text"
 
@@ -1409,7 +1413,7 @@ class TestOpenrouterChatSingle:
         http_resp = MagicMock(status_code=200)
         http_resp.json.return_value = {"choices": [{}]}
         with patch.object(client, "_get_sdk_client", return_value=None), \
-             patch("requests.post", return_value=http_resp):
+             patch("requests.Session.post", return_value=http_resp):
             result = client._openrouter_chat_single("model/x", "sys", "user", structured=False)
         assert result is None
 
@@ -1417,14 +1421,14 @@ class TestOpenrouterChatSingle:
         client = self._client(monkeypatch)
         http_resp = MagicMock(status_code=500, text="server error")
         with patch.object(client, "_get_sdk_client", return_value=None), \
-             patch("requests.post", return_value=http_resp):
+             patch("requests.Session.post", return_value=http_resp):
             result = client._openrouter_chat_single("model/x", "sys", "user", structured=False)
         assert result is None
 
     def test_http_exception_returns_none(self, monkeypatch):
         client = self._client(monkeypatch)
         with patch.object(client, "_get_sdk_client", return_value=None), \
-             patch("requests.post", side_effect=Exception("connection reset")):
+             patch("requests.Session.post", side_effect=Exception("connection reset")):
             result = client._openrouter_chat_single("model/x", "sys", "user", structured=False)
         assert result is None
 
@@ -1433,7 +1437,7 @@ class TestOpenrouterChatSingle:
         http_resp = MagicMock(status_code=200)
         http_resp.json.return_value = {"choices": [{"message": {"content": '{"action": "play"}'}}]}
         with patch.object(client, "_get_sdk_client", return_value=None), \
-             patch("requests.post", return_value=http_resp):
+             patch("requests.Session.post", return_value=http_resp):
             result = client._openrouter_chat_single("model/x", "sys", "user", structured=True)
         assert result == {"action": "play"}
 
@@ -1444,7 +1448,7 @@ class TestOpenrouterChatSingle:
         http_resp = MagicMock(status_code=200)
         http_resp.json.return_value = {"choices": [{"message": {"content": "ok"}}]}
         with patch.object(client, "_get_sdk_client", return_value=None), \
-             patch("requests.post", return_value=http_resp) as mock_post:
+             patch("requests.Session.post", return_value=http_resp) as mock_post:
             client._openrouter_chat_single("model/x", "sys", "user", structured=False)
         headers = mock_post.call_args.kwargs["headers"]
         assert headers["HTTP-Referer"] == "https://example.com"
@@ -2031,7 +2035,7 @@ class TestCallOllama:
         resp = MagicMock()
         resp.raise_for_status = MagicMock()
         resp.json.return_value = {"message": {"content": "  hello there  "}}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = adapter._call_ollama("sys", "user", 100, 0.5)
         assert result == "hello there"
 
@@ -2041,14 +2045,14 @@ class TestCallOllama:
         resp = MagicMock()
         resp.raise_for_status = MagicMock()
         resp.json.return_value = {"message": {"content": "   "}}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = adapter._call_ollama("sys", "user", 100, 0.5)
         assert result is None
 
     def test_request_exception_returns_none(self, monkeypatch):
         monkeypatch.setenv("NPC_CHAT_LLM_ENABLED", "0")
         adapter = NpcChatLLMAdapter()
-        with patch("requests.post", side_effect=Exception("boom")):
+        with patch("requests.Session.post", side_effect=Exception("boom")):
             result = adapter._call_ollama("sys", "user", 100, 0.5)
         assert result is None
 
@@ -2084,7 +2088,7 @@ class TestCallOpenrouter:
         resp = MagicMock()
         resp.raise_for_status = MagicMock()
         resp.json.return_value = {"choices": [{"message": {"content": "  npc reply  "}}]}
-        with patch("requests.post", return_value=resp) as mock_post:
+        with patch("requests.Session.post", return_value=resp) as mock_post:
             result = adapter._call_openrouter("sys", "user", 100, 0.5)
         assert result == "npc reply"
         headers = mock_post.call_args.kwargs["headers"]
@@ -2099,7 +2103,7 @@ class TestCallOpenrouter:
         resp = MagicMock()
         resp.raise_for_status = MagicMock()
         resp.json.return_value = {"choices": [{"message": {"content": "   "}}]}
-        with patch("requests.post", return_value=resp):
+        with patch("requests.Session.post", return_value=resp):
             result = adapter._call_openrouter("sys", "user", 100, 0.5)
         assert result is None
 
@@ -2108,7 +2112,7 @@ class TestCallOpenrouter:
         adapter = NpcChatLLMAdapter()
         adapter._openrouter_api_key = "key"
         adapter.model = "model/x"
-        with patch("requests.post", side_effect=Exception("boom")):
+        with patch("requests.Session.post", side_effect=Exception("boom")):
             result = adapter._call_openrouter("sys", "user", 100, 0.5)
         assert result is None
 
@@ -0,0 +1,295 @@
+"""Pooled and streaming HTTP transport for the LLM clients.
+
+Runs ``GenericLLMClient`` / ``NpcChatLLMAdapter`` against a real local HTTP
+server speaking the Ollama (NDJSON) and OpenAI/OpenRouter (server-sent events)
+streaming formats, so connection reuse and incremental delivery are observed on
+the wire rather than asserted against a mock.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ai.llm_client import GenericLLMClient, NpcChatLLMAdapter, _StreamingJSON
+from tests._npc_fixtures import ready_npc
+from tests._gs_fixtures import live_world
+
+TURN_JSON = (
+    '{"npc_text": "The pass is shut until the thaw.", '
+    '"conversation_quality": "neutral", "reputation_delta": 0, "loquacity_delta": 0, '
+    '"jean_options": [{"tone": "direct", "text": "When does the thaw usually come?"}, '
+    '{"tone": "guarded", "text": "Then I will wait and see for myself."}, '
+    '{"tone": "open", "text": "Have you crossed it yourself in the spring?"}]}'
+)
+
+
+def _tokens(text, size=7):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class _FakeLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is visible
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        # Ollama's availability probe.
+        raw = json.dumps({"models": [{"name": "fake"}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        server.requests.append((self.path, body))
+        server.connections.add(self.client_address)
+        ollama = self.path.endswith("/api/chat")
+        if not body.get("stream"):
+            text = "".join(server.tokens)
+            if ollama:
+                payload = {"message": {"role": "assistant", "content": text}, "done": True}
+            else:
+                payload = {"choices": [{"message": {"content": text}}]}
+            raw = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson" if ollama else "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i, token in enumerate(server.tokens):
+            if i == server.hold_after:
+                # Don't finish until the client shows it has rendered something.
+                server.released_early = server.release.wait(5)
+            if ollama:
+                event = json.dumps({"message": {"role": "assistant", "content": token}, "done": False}) + "\n"
+            else:
+                event = "data: " + json.dumps({"choices": [{"delta": {"content": token}}]}) + "\n\n"
+            self._chunk(event.encode())
+        self._chunk((json.dumps({"done": True}) + "\n" if ollama else "data: [DONE]\n\n").encode())
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+
+@pytest.fixture
+def fake_llm():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeLLMHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.connections = set()
+    server.tokens = _tokens("hello from the fake model")
+    server.hold_after = None
+    server.release = threading.Event()
+    server.released_early = None
+    server.url = "http://127.0.0.1:%d" % server.server_address[1]
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_transport(monkeypatch):
+    GenericLLMClient.reset_class_state()
+    for var in ("MYNX_LLM_MODEL", "NPC_CHAT_LLM_MODEL", "OPENROUTER_BASE_URL"):
+        monkeypatch.delenv(var, raising=False)
+    yield
+    GenericLLMClient.close_transports()
+
+
+def _ollama_client(monkeypatch, url):
+    monkeypatch.setenv("MYNX_LLM_ENABLED", "1")
+    monkeypatch.setenv("MYNX_LLM_PROVIDER", "ollama")
+    monkeypatch.setenv("MYNX_LLM_MODEL", "fake")
+    monkeypatch.setenv("OLLAMA_BASE_URL", url)
+    return GenericLLMClient()
+
+
+def _npc_adapter(monkeypatch, provider, url):
+    monkeypatch.setenv("MYNX_LLM_ENABLED", "0")
+    monkeypatch.setenv("NPC_CHAT_LLM_ENABLED", "1")
+    monkeypatch.setenv("NPC_CHAT_LLM_PROVIDER", provider)
+    monkeypatch.setenv("NPC_CHAT_LLM_MODEL", "fake")
+    monkeypatch.setenv("OLLAMA_BASE_URL", url)
+    monkeypatch.setenv("OPENROUTER_BASE_URL", url + "/v1")
+    monkeypatch.setenv("OPENROUTER_API_KEY", "sk-test")
+    return NpcChatLLMAdapter()
+
+
+# ---------------------------------------------------------------------------
+# Connection pooling
+# ---------------------------------------------------------------------------
+
+
+def test_consecutive_calls_reuse_one_connection(monkeypatch, fake_llm):
+    client = _ollama_client(monkeypatch, fake_llm.url)
+
+    for _ in range(3):
+        assert client._ollama_chat("sys", "user", structured=False) == "hello from the fake model"
+
+    assert len(fake_llm.requests) == 3
+    assert len(fake_llm.connections) == 1
+
+
+def test_clients_share_the_provider_session(monkeypatch, fake_llm):
+    first = _ollama_client(monkeypatch, fake_llm.url)
+    second = _ollama_client(monkeypatch, fake_llm.url)
+
+    assert first._http_session("ollama") is second._http_session("ollama")
+    assert first._http_session("ollama") is not first._http_session("openrouter")
+    first._ollama_chat("sys", "user", structured=False)
+    second._ollama_chat("sys", "user", structured=False)
+    assert len(fake_llm.connections) == 1
+
+
+def test_sdk_client_is_built_once_per_key(monkeypatch):
+    import openai
+
+    built = []
+
+    class FakeOpenAI:
+        def __init__(self, base_url, api_key):
+            built.append((base_url, api_key))
+
+    monkeypatch.setattr(openai, "OpenAI", FakeOpenAI)
+    client = GenericLLMClient()
+    client._openrouter_api_key = "key"
+
+    assert client._get_sdk_client() is client._get_sdk_client()
+    client._openrouter_api_key = "other"
+    client._get_sdk_client()
+    assert [key for _, key in built] == ["key", "other"]
+
+
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+
+def test_ollama_stream_delivers_tokens_as_they_arrive(monkeypatch, fake_llm):
+    client = _ollama_client(monkeypatch, fake_llm.url)
+    fake_llm.hold_after = 2
+    seen = []
+
+    def on_token(piece):
+        seen.append(piece)
+        fake_llm.release.set()
+
+    result = client.generate_plain("sys", "user", on_token=on_token)
+
+    assert fake_llm.requests[0][1]["stream"] is True
+    assert fake_llm.released_early is True
+    assert seen == fake_llm.tokens
+    assert result == "hello from the fake model"
+
+
+def test_streamed_structured_reply_parses_like_a_blocking_one(monkeypatch, fake_llm):
+    client = _ollama_client(monkeypatch, fake_llm.url)
+    fake_llm.tokens = _tokens('```json\n{"action": "sniff", "duration_seconds": 2}\n```', 5)
+
+    streamed = client.generate_structured("sys", "user", on_token=lambda piece: None)
+    blocking = client.generate_structured("sys", "user")
+
+    assert streamed == blocking == {"action": "sniff", "duration_seconds": 2}
+
+
+@pytest.mark.parametrize("provider", ["ollama", "openrouter"])
+def test_generate_turn_renders_npc_text_before_completion(monkeypatch, fake_llm, provider):
+    adapter = _npc_adapter(monkeypatch, provider, fake_llm.url)
+    fake_llm.tokens = _tokens(TURN_JSON)
+    # Hold the stream while the options are still to come.
+    fake_llm.hold_after = len(_tokens(TURN_JSON[:TURN_JSON.index("conversation_quality")]))
+    partial = []
+
+    def on_npc_text(text):
+        partial.append(text)
+        if text == "The pass is shut until the thaw.":
+            fake_llm.release.set()
+
+    result = adapter.generate_turn("sys", [], is_opening=True, on_npc_text=on_npc_text)
+
+    assert fake_llm.released_early is True
+    assert partial[-1] == "The pass is shut until the thaw."
+    assert all(later.startswith(earlier) for earlier, later in zip(partial, partial[1:]))
+    assert result["npc_text"] == "The pass is shut until the thaw."
+    assert len(result["jean_options"]) == 3
+
+
+def test_openrouter_stream_uses_server_sent_events(monkeypatch, fake_llm):
+    adapter = _npc_adapter(monkeypatch, "openrouter", fake_llm.url)
+    seen = []
+
+    result = adapter._call_llm("sys", "user", on_token=seen.append)
+
+    path, body = fake_llm.requests[0]
+    assert path == "/v1/chat/completions"
+    assert body["stream"] is True
+    assert "".join(seen) == result == "hello from the fake model"
+
+
+def test_chat_open_streams_through_a_real_adapter(monkeypatch, fake_llm):
+    adapter = _npc_adapter(monkeypatch, "ollama", fake_llm.url)
+    fake_llm.tokens = _tokens(TURN_JSON)
+    npc = ready_npc(adapter)
+    partial = []
+
+    result = npc.chat_open(live_world()[0], on_npc_text=partial.append)
+
+    assert result["npc_opening"] == "The pass is shut until the thaw."
+    assert partial and partial[-1] == result["npc_opening"]
+    assert len(result["jean_options"]) == 3
+
+
+def test_chat_open_without_callback_keeps_the_blocking_call(monkeypatch, fake_llm):
+    adapter = _npc_adapter(monkeypatch, "ollama", fake_llm.url)
+    fake_llm.tokens = [TURN_JSON]
+
+    result = ready_npc(adapter).chat_open(live_world()[0])
+
+    assert result["npc_opening"] == "The pass is shut until the thaw."
+    assert fake_llm.requests[0][1]["stream"] is False
+
+
+# ---------------------------------------------------------------------------
+# Incremental JSON reader
+# ---------------------------------------------------------------------------
+
+
+def test_streaming_json_decodes_escapes_split_across_chunks():
+    reply = '{"npc_text": "Say \\"when\\" \\u00e9t\\u00e9.\\nDone", "x": 1}'
+    reader = _StreamingJSON(watch=("npc_text",))
+    for ch in reply:
+        reader.feed(ch)
+
+    assert reader.fields["npc_text"] == 'Say "when" été.\nDone'
+    assert reader.complete
+    assert reader.value() == json.loads(reply)
+
+
+def test_streaming_json_ignores_nested_and_unwatched_fields():
+    reply = (
+        'Sure:\n```json\n{"meta": {"npc_text": "inner"}, "other": "skip", '
+        '"list": ["npc_text"], "npc_text": "outer"}\n```'
+    )
+    reader = _StreamingJSON(watch=("npc_text",))
+    grown = []
+    for piece in _tokens(reply, 4):
+        grown.extend(reader.feed(piece))
+
+    assert reader.fields == {"npc_text": "outer"}
+    assert {field for field, _ in grown} == {"npc_text"}
+    assert reader.value()["meta"] == {"npc_text": "inner"}
@@ -1,7 +1,18 @@
 import os
 import types
 from unittest.mock import patch
-from ai.llm_client import MynxLLMAdapter
+
+import pytest
+
+from ai.llm_client import GenericLLMClient, MynxLLMAdapter
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sdk_clients():
+    """SDK clients are cached per key; drop them so each test's fake is used."""
+    GenericLLMClient.close_transports()
+    yield
+    GenericLLMClient.close_transports()
 
 
 class _DummyMessage:
@@ -289,6 +289,24 @@ class TestNPCBucket:
         assert king2.maxhp == 9999
         assert king2.is_boss is True  # class-hardcoded default preserved
 
+    def test_resistance_override_round_trips_as_a_stat_block(self):
+        """Resistances are StatBlocks, not dicts: they must still be authored
+        as plain objects and come back as working resistances."""
+        from src.combatant import StatBlock
+        from src.functions import combat_resistance, refresh_stat_bonuses
+        from src.npc._enemies import Slime
+
+        slime = Slime()
+        slime.resistance_base["fire"] = 0.25
+        payload = to_placeholder(slime)
+        authored = payload["params"]["overrides"]["resistance_base"]
+        assert type(authored) is dict and authored["fire"] == 0.25
+
+        restored = instantiate_placeholder(payload)
+        assert isinstance(restored.resistance_base, StatBlock)
+        refresh_stat_bonuses(restored)
+        assert combat_resistance(restored, "fire") == 0.25
+
     def test_merchant_shop_config_delta_survives_pruning(self):
         """MiloCurioDealer's own __init__ takes no args -- like the hardcoded
         enemy classes, its whole shop config can only reach the instance via
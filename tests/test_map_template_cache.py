@@ -0,0 +1,138 @@
+"""Tests for the process-wide map template cache behind ``Universe.build``.
+
+Templates are parsed once per file and shared by every session, so the tests
+pin the two properties that makes safe: a stale file is re-parsed, and no
+session ever receives (or mutates) an object owned by the template.
+"""
+
+import json
+import os
+
+import pytest
+
+import src.universe as universe_module
+from src.map_placeholders import _init_param_names
+from src.player import Player
+from src.universe import Universe, clear_map_template_cache, get_map_template
+
+_TILES = {
+    "(0, 0)": {
+        "title": "Origin",
+        "description": "Where it starts.",
+        "exits": ["east"],
+        "items": [{"class": "items.Restorative", "params": {}}],
+        "npcs": [{"class": "npc.Slime", "params": {}}],
+    },
+    "(1, 0)": {"title": "East", "block_exit": ["north"]},
+    "metadata": {"display_name": "Cache Test"},
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_map_template_cache()
+    yield
+    clear_map_template_cache()
+
+
+@pytest.fixture
+def map_file(tmp_path):
+    path = tmp_path / "cache-test.json"
+    path.write_text(json.dumps(_TILES), encoding="utf-8")
+    return path
+
+
+def _build(map_file):
+    player = Player()
+    universe = Universe(player)
+    universe.player = player
+    universe._load_single_json_map(player, map_file)
+    return universe.maps[-1]
+
+
+class TestGetMapTemplate:
+    def test_second_lookup_is_a_cache_hit(self, map_file):
+        assert get_map_template(map_file) is get_map_template(map_file)
+
+    def test_template_captures_parsed_tiles(self, map_file):
+        template = get_map_template(map_file)
+
+        assert template.name == "cache-test"
+        assert template.has_metadata
+        coords = {(t.x, t.y) for t in template.tiles}
+        assert coords == {(0, 0), (1, 0)}
+
+    def test_modified_file_is_reparsed(self, map_file):
+        first = get_map_template(map_file)
+        tiles = dict(_TILES)
+        tiles["(2, 0)"] = {"title": "Added later"}
+        map_file.write_text(json.dumps(tiles), encoding="utf-8")
+        # Guarantee a visible mtime change even on coarse-grained filesystems.
+        st = os.stat(map_file)
+        os.utime(map_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        second = get_map_template(map_file)
+
+        assert second is not first
+        assert len(second.tiles) == 3
+
+    def test_parse_happens_once(self, map_file, monkeypatch):
+        calls = []
+        real = universe_module._parse_map_template
+
+        def counting(*args):
+            calls.append(args[0])
+            return real(*args)
+
+        monkeypatch.setattr(universe_module, "_parse_map_template", counting)
+        _build(map_file)
+        _build(map_file)
+
+        assert len(calls) == 1
+
+
+class TestInstantiateFromTemplate:
+    def test_sessions_get_independent_objects(self, map_file):
+        first = _build(map_file)
+        second = _build(map_file)
+
+        assert first[(0, 0)] is not second[(0, 0)]
+        assert first[(0, 0)].npcs_here[0] is not second[(0, 0)].npcs_here[0]
+        assert first["metadata"] == second["metadata"]
+        assert first["metadata"] is not second["metadata"]
+
+    def test_mutating_a_session_leaves_template_untouched(self, map_file):
+        live = _build(map_file)
+        live["metadata"]["display_name"] = "Renamed"
+        live[(1, 0)].block_exit.append("south")
+
+        again = _build(map_file)
+
+        assert again["metadata"]["display_name"] == "Cache Test"
+        assert again[(1, 0)].block_exit == ["north"]
+
+    def test_exits_whitelist_blocks_every_other_direction(self, map_file):
+        origin = _build(map_file)[(0, 0)]
+
+        assert "east" not in origin.block_exit
+        assert {"north", "south", "west"} <= set(origin.block_exit)
+
+    def test_objects_are_wired_to_their_tile(self, map_file):
+        origin = _build(map_file)[(0, 0)]
+
+        assert origin.name == "Origin"
+        assert origin.npcs_here[0].current_room is origin
+
+
+def test_init_param_names_tracks_redefined_init():
+    class Widget:
+        def __init__(self, a):
+            pass
+
+    assert _init_param_names(Widget) == frozenset({"a"})
+
+    def replacement(self, b, c=1):
+        pass
+
+    Widget.__init__ = replacement
+    assert _init_param_names(Widget) == frozenset({"b", "c"})
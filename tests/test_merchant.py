@@ -7,7 +7,8 @@ import types
 import pytest
 
 from src.npc import Merchant
-from src.items import Item, Shortsword, Restorative, Gold
+import src.items as items_module
+from src.items import Item, ItemRegistry, Shortsword, Restorative, Gold
 from src.shop_conditions import ValueModifierCondition, RestockWeightBoostCondition, UniqueItemInjectionCondition
 from src.objects import Container
 
@@ -65,6 +66,10 @@ class RandSeq:
         # deterministic first element
         return seq[0]
 
+def _restrict_item_classes(monkeypatch, *members):
+    """Limit the item registry restocks draw from to ``(name, class)`` members."""
+    monkeypatch.setattr(items_module, "_registry", ItemRegistry(members))
+
 # ---------- Tests ----------
 
 def make_merchant(stock_count=5, always=None, specialties=None, enchant_rate=1.0):
@@ -189,10 +194,7 @@ def test_fill_remaining_stock_basic(monkeypatch):
     m, room, _ = make_merchant(stock_count=3)
 
     # Force candidate list to only Restorative to guarantee spawn success
-    def fake_getmembers(module, predicate):
-        return [("Restorative", Restorative)]
-
-    monkeypatch.setattr('inspect.getmembers', fake_getmembers)
+    _restrict_item_classes(monkeypatch, ("Restorative", Restorative))
     monkeypatch.setattr('random.uniform', lambda a, b: a)
     m._fill_remaining_stock([])
     assert len(m.inventory) == 3
@@ -211,10 +213,7 @@ def test_fill_remaining_stock_respects_container_capacity(monkeypatch):
     cont.stock_count = 2
     room.objects.append(cont)
     # Restrict candidates
-    def fake_getmembers(module, predicate):
-        from src.items import Restorative
-        return [("Restorative", Restorative)]
-    monkeypatch.setattr('inspect.getmembers', fake_getmembers)
+    _restrict_item_classes(monkeypatch, ("Restorative", Restorative))
     monkeypatch.setattr('random.uniform', lambda a,b: a)
     m._fill_remaining_stock([cont])
     assert len(m.inventory) <= 1
@@ -233,10 +232,7 @@ def test_relic_excluded_from_random_restock(monkeypatch):
     from src.items import Relic
     m, room, _ = make_merchant(stock_count=5)
 
-    def fake_getmembers(module, predicate):
-        return [("Relic", Relic), ("Restorative", Restorative)]
-
-    monkeypatch.setattr('inspect.getmembers', fake_getmembers)
+    _restrict_item_classes(monkeypatch, ("Relic", Relic), ("Restorative", Restorative))
     monkeypatch.setattr('random.uniform', lambda a, b: a)
     m._fill_remaining_stock([])
     assert len(m.inventory) == 5
@@ -275,10 +271,7 @@ def test_restock_weight_boost_condition_shifts_the_draw(monkeypatch, boosted, ex
             RestockWeightBoostCondition(weight_multiplier=5.0, target_class=Restorative)
         ]
 
-    def fake_getmembers(module, predicate):
-        return [("Shortsword", Shortsword), ("Restorative", Restorative)]
-
-    monkeypatch.setattr('inspect.getmembers', fake_getmembers)
+    _restrict_item_classes(monkeypatch, ("Shortsword", Shortsword), ("Restorative", Restorative))
     monkeypatch.setattr('random.uniform', lambda a, b: (a + b) / 2.0)
     m._fill_remaining_stock([])
 
@@ -376,13 +369,28 @@ def test_fill_remaining_stock_empty_candidate_early_return(monkeypatch):
     m, room, _ = make_merchant(stock_count=3)
     # Ensure inventory starts empty
     assert len(m.inventory) == 0
-    # Patch inspect.getmembers to only return Item (which is skipped) -> empty candidates
-    import inspect as _inspect
-    from src.items import Item as _Item
-    def fake_getmembers(module, predicate):
-        return [("Item", _Item)]
-    monkeypatch.setattr('inspect.getmembers', fake_getmembers)
+    # Registry holding only Item (which is skipped) -> empty candidates
+    _restrict_item_classes(monkeypatch, ("Item", Item))
     # Also patch random.uniform defensively (should not be called meaningfully)
     monkeypatch.setattr('random.uniform', lambda a,b: a)
     m._fill_remaining_stock([])
     assert len(m.inventory) == 0, "Inventory should remain empty when no candidates available"
+
+
+@pytest.mark.parametrize("roll", [0.0, 0.5, 1.0, 1.0001, 2.5, 3.0, 5.9, 6.0])
+def test_restock_table_picks_what_the_linear_walk_picked(monkeypatch, roll):
+    """The cumulative table must map each uniform roll to the same class as
+    the per-item walk it replaced (first class whose running weight >= roll)."""
+    from src.npc._shop import _RestockTable
+
+    weight_map = {Shortsword: 1.0, Restorative: 2.0, Gold: 3.0}
+    monkeypatch.setattr('random.uniform', lambda a, b: roll)
+
+    expected, acc = None, 0.0
+    for cls, w in weight_map.items():
+        acc += w
+        if roll <= acc:
+            expected = cls
+            break
+
+    assert _RestockTable(weight_map).draw() is expected
@@ -196,3 +196,46 @@ def test_combat_engage_without_allies():
 
     assert npc in player.combat_list
     assert npc.in_combat is True
+
+
+# ---------------------------------------------------------------------------
+# MoveTable / per-selection AI bonus scope
+# ---------------------------------------------------------------------------
+
+
+def test_move_table_picks_exactly_like_the_expanded_list():
+    import random
+
+    from src.npc._combat import MoveTable
+
+    names, weights = ["rest", "attack", "advance", "dodge"], [1, 5, 4, 1]
+    expanded = [name for name, weight in zip(names, weights) for _ in range(weight)]
+    table = MoveTable(names, weights)
+
+    random.seed(7)
+    picked = [table.pick() for _ in range(200)]
+    random.seed(7)
+    assert picked == [expanded[random.randint(0, len(expanded) - 1)] for _ in range(200)]
+    assert table.total == len(expanded)
+    assert not MoveTable([], [])
+
+
+def test_select_move_works_out_the_ai_situation_once(make_player, make_npc):
+    from src.npc import Slime
+    from src.npc_ai_config import NPCAIConfig
+
+    slime = make_npc(cls=Slime)
+    slime.player_ref = slime.target = make_player()
+    config = slime.ai_config = NPCAIConfig(slime.player_ref)
+    calls = []
+    real = config._compute_bonus_situation
+    config._compute_bonus_situation = lambda npc: calls.append(npc) or real(npc)
+
+    slime.select_move()
+    assert calls == [slime]
+    assert config._selection is None  # scope closed
+
+    # Outside select_move every call still sees the NPC's current state.
+    config.get_weighted_move_bonus(slime, "Dodge")
+    config.get_weighted_move_bonus(slime, "Dodge")
+    assert len(calls) == 3
@@ -1152,6 +1152,21 @@ class TestInteractWithPlayerFallback:
 
         mock_sleep.assert_not_called()
 
+    def test_headless_fallback_never_sleeps(self):
+        """The API's interact endpoint runs ``pet``/``play``/``talk`` under
+        ``headless()``; the fallback delay must not hold that request."""
+        from src.headless import headless
+        from src.npc import Mynx
+
+        mynx = Mynx()
+        mynx._llm_adapter = None
+        with patch("time.sleep") as mock_sleep:
+            with patch.dict(os.environ, {"MYNX_FALLBACK_DELAY": "1.5"}), headless():
+                result = mynx.pet(MagicMock())
+
+        mock_sleep.assert_not_called()
+        assert result == mynx._llm_last_response["description"]
+
     def test_room_roster_includes_present_npcs_and_always_the_mynx(self):
         """The roster is the allow-list of names the LLM may use. It is built
         from ``current_room.npcs_here`` and must always contain the mynx
@@ -1941,7 +1956,7 @@ class TestInteractWithPlayerSleepException:
         and must not truncate the return value."""
         m = _make_mynx()
         m._llm_adapter = None
-        with patch("src.npc._llm.time.sleep", side_effect=RuntimeError("boom")) as sleeper:
+        with patch("src.npc._llm.pause", side_effect=RuntimeError("boom")) as sleeper:
             with patch.dict(os.environ, {"MYNX_FALLBACK_DELAY": "1.5"}):
                 result = m.interact_with_player(player=MagicMock(), prompt="pet")
 
@@ -8,7 +8,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.npc import Merchant, MiloCurioDealer, JamboHealsU
 from src.npc._shop import MerchantShopMixin
-from src.items import Item, Shortsword, Restorative, Gold, Consumable
+import src.items as items_module
+from src.items import Item, ItemRegistry, Shortsword, Restorative, Gold, Consumable
 from src.objects import Container
 from src.shop_conditions import ValueModifierCondition, RestockWeightBoostCondition, UniqueItemInjectionCondition
 
@@ -311,9 +312,8 @@ def test_a_non_class_member_of_the_items_module_is_skipped_not_fatal():
     m.current_room = room
     m.stock_count = 2
 
-    with patch("inspect.getmembers", lambda *a, **k: [
-        ("Shortsword", Shortsword), ("Faulty", "not_a_class")
-    ]):
+    registry = ItemRegistry([("Shortsword", Shortsword), ("Faulty", "not_a_class")])
+    with patch.object(items_module, "_registry", registry):
         m._fill_remaining_stock([])
 
     assert len(m.inventory) == 2
@@ -326,7 +326,7 @@ def test_no_candidate_classes_at_all_means_no_stock_and_no_crash():
     m.current_room = room
     m.stock_count = 3
 
-    with patch("inspect.getmembers", lambda *a, **k: []):
+    with patch.object(items_module, "_registry", ItemRegistry([])):
         m._fill_remaining_stock([])
 
     assert m.inventory == []
@@ -358,12 +358,12 @@ def test_a_specialty_class_is_weighted_three_times_a_plain_candidate():
     captured = {}
 
     def capture_uniform(low, high):
-        captured["total"] = high
+        # The restock draw comes first; later calls are enchantment rolls.
+        captured.setdefault("total", high)
         return 0.0
 
-    with patch("inspect.getmembers", lambda *a, **k: [
-        ("Shortsword", Shortsword), ("Restorative", Restorative)
-    ]):
+    registry = ItemRegistry([("Shortsword", Shortsword), ("Restorative", Restorative)])
+    with patch.object(items_module, "_registry", registry):
         with patch("random.uniform", capture_uniform):
             m._fill_remaining_stock([])
 
@@ -439,6 +439,32 @@ def test_a_container_whose_allowed_types_are_junk_is_skipped_for_the_merchant():
     assert len(m.inventory) == 2
 
 
+def test_an_unfillable_container_does_not_use_up_the_draws():
+    """A container nothing fits must not soak up the draw budget, or a
+    failed constructor leaves the merchant short with no draws left to
+    retry."""
+    import src.npc._shop as shop_module
+
+    m = MockMerchant()
+    m.current_room = FakeRoom()
+    m.stock_count = 2
+    cont = Container(name="Cabinet", merchant=m)
+    cont.stock_count = 5
+    cont.allowed_item_types = [object()]
+    real = shop_module._new_merchandise
+    calls = []
+
+    def fail_first(cls):
+        calls.append(cls)
+        return None if len(calls) == 1 else real(cls)
+
+    with patch.object(shop_module, "_new_merchandise", fail_first):
+        m._fill_remaining_stock([cont])
+
+    assert len(m.inventory) == 2
+    assert cont.inventory == []
+
+
 def test_items_route_into_an_eligible_container_ahead_of_the_merchant():
     """The placement preference the container guard above is the negative of."""
     m = MockMerchant()
@@ -449,32 +475,50 @@ def test_items_route_into_an_eligible_container_ahead_of_the_merchant():
     cont.stock_count = 3
     cont.allowed_item_types = [Shortsword]
 
-    with patch("inspect.getmembers", lambda *a, **k: [("Shortsword", Shortsword)]):
+    with patch.object(items_module, "_registry", ItemRegistry([("Shortsword", Shortsword)])):
         m._fill_remaining_stock([cont])
 
     assert len(cont.inventory) == 3
     assert all(isinstance(i, Shortsword) for i in cont.inventory)
 
 
-def test_a_room_that_cannot_spawn_stocks_nothing_and_does_not_hang():
-    """``spawn_item`` raising is caught per-iteration; with every spawn failing
-    the loop must still terminate (via the 1000-iteration safety cap) and leave
-    the inventory empty rather than partially populated."""
-    m = MockMerchant()
-    room = FakeRoom()
+def test_an_item_that_cannot_be_built_stocks_nothing_and_does_not_hang():
+    """A candidate whose constructor raises is skipped per draw; with every
+    draw failing the restock must still terminate (via the 1000-draw safety
+    cap) and leave the inventory empty rather than partially populated."""
 
-    def faulty_spawn(*args, **kwargs):
-        raise RuntimeError("Failed to spawn")
+    class Unbuildable(Item):
+        def __init__(self):
+            raise RuntimeError("Failed to build")
 
-    room.spawn_item = faulty_spawn
+    m = MockMerchant()
+    room = FakeRoom()
     m.current_room = room
     m.stock_count = 2
 
-    m._fill_remaining_stock([])
+    with patch.object(items_module, "_registry", ItemRegistry([("Unbuildable", Unbuildable)])):
+        m._fill_remaining_stock([])
 
     assert m.inventory == []
 
 
+def test_restock_stocks_directly_without_spawning_into_the_room():
+    """Restocked goods go straight onto the shelf: nothing is spawned into
+    the room first (and so nothing is left behind there)."""
+    m = MockMerchant()
+    room = FakeRoom()
+    room.spawn_item = MagicMock(side_effect=AssertionError("restock must not spawn"))
+    m.current_room = room
+    m.stock_count = 3
+
+    with patch.object(items_module, "_registry", ItemRegistry([("Shortsword", Shortsword)])):
+        m._fill_remaining_stock([])
+
+    assert len(m.inventory) == 3
+    assert all(isinstance(i, Shortsword) and i.merchandise for i in m.inventory)
+    assert room.items_here == []
+
+
 def test_an_item_whose_value_raises_is_still_stocked_without_a_base_value(monkeypatch):
     """``setattr(spawned, "base_value", spawned.value)`` raises for an item
     with a broken ``value`` property. The item must still reach the shelf —
@@ -503,7 +547,7 @@ def test_an_item_whose_value_raises_is_still_stocked_without_a_base_value(monkey
             raise AttributeError("Value not accessible")
 
     monkeypatch.setattr(items_module, "BadItem", BadItem, raising=False)
-    monkeypatch.setattr("inspect.getmembers", lambda *a, **k: [("BadItem", BadItem)])
+    monkeypatch.setattr(items_module, "_registry", ItemRegistry([("BadItem", BadItem)]))
 
     m = MockMerchant()
     room = FakeRoom()
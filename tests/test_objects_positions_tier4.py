@@ -535,7 +535,7 @@ class TestHealingSpringParams:
         spring = HealingSpring(player=player, tile=tile)
         spring.event = event
 
-        with patch("src.objects.time.sleep"):
+        with patch("src.objects.pause"):
             with patch("src.objects.functions.await_input"):
                 spring.drink(player)
 
@@ -622,7 +622,7 @@ class TestMarketBellRepeatEvent:
 
         bell = MarketBell(player=player, tile=tile, event=event)
 
-        with patch("src.objects.time.sleep"):
+        with patch("src.objects.pause"):
             with patch("src.objects.functions.await_input"):
                 bell.ring()
 
@@ -638,7 +638,7 @@ class TestMarketBellRepeatEvent:
 
         bell = MarketBell(player=player, tile=tile, event=event)
 
-        with patch("src.objects.time.sleep"):
+        with patch("src.objects.pause"):
             with patch("src.objects.functions.await_input"):
                 bell.ring()
 
@@ -654,7 +654,7 @@ class TestMarketBellRepeatEvent:
 
         bell = MarketBell(player=player, tile=tile, event=event)
 
-        with patch("src.objects.time.sleep"):
+        with patch("src.objects.pause"):
             with patch("src.objects.functions.await_input"):
                 bell.ring()
 
@@ -674,7 +674,7 @@ class TestFountainRepeatEvent:
 
         fountain = Fountain(player=player, tile=tile, event=event)
 
-        with patch("src.objects.time.sleep"):
+        with patch("src.objects.pause"):
             with patch("src.objects.functions.await_input"):
                 fountain.drink()
 
@@ -751,7 +751,7 @@ class TestNoticeBoardEvent:
 
         board = NoticeBoard(player=player, tile=tile, event=event)
 
-        with patch("src.objects.time.sleep"):
+        with patch("src.objects.pause"):
             with patch("src.objects.functions.await_input"):
                 board.read()
 
@@ -866,7 +866,7 @@ class TestMarketGongRepeat:
 
         gong = MarketGong(player=player, tile=tile, event=event)
 
-        with patch("src.objects.time.sleep"):
+        with patch("src.objects.pause"):
             with patch("src.objects.functions.await_input"):
                 gong.strike()
 
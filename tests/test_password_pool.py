@@ -0,0 +1,283 @@
+"""Tests for the bounded Argon2 password-hashing pool."""
+
+import asyncio
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from werkzeug.serving import BaseWSGIServer
+
+from src.api.password_pool import PasswordHashPool, PasswordPoolBusy
+
+
+class _Gate:
+    """A call that blocks until released, recording that it ran."""
+
+    def __init__(self, log, name):
+        self.log = log
+        self.name = name
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.started.set()
+        self.release.wait(5)
+        self.log.append(self.name)
+        return self.name
+
+
+def _drain(pool, timeout=5):
+    """Wait until every worker has run out of work and exited."""
+    deadline = time.monotonic() + timeout
+    while pool.stats()["workers"]:
+        assert time.monotonic() < deadline, pool.stats()
+        time.sleep(0.005)
+
+
+def test_results_and_exceptions_reach_the_caller():
+    pool = PasswordHashPool(max_workers=1)
+
+    assert asyncio.run(pool.run(lambda a, b: a + b, 2, 3)) == 5
+    with pytest.raises(ValueError, match="mismatch"):
+        asyncio.run(pool.run(MagicMock(side_effect=ValueError("mismatch"))))
+
+    _drain(pool)
+    stats = pool.stats()
+    assert (stats["completed"], stats["raised"]) == (1, 1)
+
+
+def test_concurrency_is_capped_and_calls_run_in_order():
+    pool = PasswordHashPool(max_workers=2, max_in_flight=5)
+    ran = []
+    gates = [_Gate(ran, f"c{i}") for i in range(5)]
+    futures = [pool.submit(gate) for gate in gates]
+    assert gates[0].started.wait(5) and gates[1].started.wait(5)
+
+    stats = pool.stats()
+    assert (stats["workers"], stats["running"], stats["pending"]) == (2, 2, 3)
+    assert not gates[2].started.is_set()
+
+    for gate in gates:
+        gate.release.set()
+    assert [f.result(5) for f in futures] == [f"c{i}" for i in range(5)]
+    _drain(pool)
+    assert pool.stats()["peak_pending"] == 3
+
+
+def test_a_full_pool_fails_fast():
+    """Admission counts the running call too: one running plus two waiting
+    fills ``max_in_flight=3``."""
+    pool = PasswordHashPool(max_workers=1, max_in_flight=3)
+    ran = []
+    blocker = _Gate(ran, "blocker")
+    pool.submit(blocker)
+    assert blocker.started.wait(5)
+    queued = [pool.submit(ran.append, n) for n in range(2)]
+
+    with pytest.raises(PasswordPoolBusy):
+        pool.submit(ran.append, "shed")
+
+    blocker.release.set()
+    for future in queued:
+        future.result(5)
+    _drain(pool)
+    assert ran == ["blocker", 0, 1]
+    stats = pool.stats()
+    assert (stats["submitted"], stats["rejected"]) == (4, 1)
+    assert (stats["peak_in_flight"], stats["in_flight"]) == (3, 0)
+    assert stats["max_wait_ms"] >= stats["avg_wait_ms"] > 0
+
+
+def test_a_cancelled_call_is_skipped():
+    pool = PasswordHashPool(max_workers=1)
+    ran = []
+    blocker = _Gate(ran, "blocker")
+    pool.submit(blocker)
+    assert blocker.started.wait(5)
+
+    assert pool.submit(ran.append, "cancelled").cancel()
+    blocker.release.set()
+    _drain(pool)
+
+    assert ran == ["blocker"]
+
+
+def test_the_event_loop_keeps_running_while_a_hash_is_in_flight():
+    pool = PasswordHashPool(max_workers=1)
+    ran = []
+    gate = _Gate(ran, "hash")
+
+    async def scenario():
+        task = asyncio.ensure_future(pool.run(gate))
+        await asyncio.get_running_loop().run_in_executor(None, gate.started.wait, 5)
+        ticks = 0
+        for _ in range(3):
+            await asyncio.sleep(0)
+            ticks += 1
+        gate.release.set()
+        return ticks, await task
+
+    assert asyncio.run(scenario()) == (3, "hash")
+
+
+class TestAuthService:
+    """AuthService hashes and verifies through the pool, never inline."""
+
+    @pytest.fixture
+    def svc(self):
+        from src.api.services.auth_service import AuthService
+
+        return AuthService()
+
+    def test_verify_and_hash_run_on_pool_threads(self, svc):
+        from src.api.services import auth_service as module
+
+        callers = []
+        svc.ph = MagicMock()
+        svc.ph.verify.side_effect = lambda *_: callers.append(threading.current_thread().name)
+        svc.ph.check_needs_rehash.return_value = False
+        db = MagicMock(execute=AsyncMock(return_value=MagicMock(rows=[["u1", "jean", "$h", 0, None]])))
+
+        with patch.object(module, "db", db):
+            user = asyncio.run(svc.authenticate_user("jean", "secret"))
+
+        assert user["id"] == "u1"
+        assert callers == ["password-hash-worker"]
+
+    @pytest.mark.parametrize("rows", [[], [["u1", "jean", "$h", 0, None]]])
+    def test_a_saturated_pool_is_not_a_failed_login(self, svc, rows):
+        """Known and unknown usernames both surface PasswordPoolBusy, never
+        ``None`` (which the route would count as a failed attempt)."""
+        from src.api.services import auth_service as module
+
+        svc.ph = MagicMock()
+        busy = MagicMock(run=AsyncMock(side_effect=PasswordPoolBusy("full")))
+        db = MagicMock(execute=AsyncMock(return_value=MagicMock(rows=rows)))
+
+        with patch.object(module, "db", db), patch.object(module, "get_password_pool", return_value=busy):
+            with pytest.raises(PasswordPoolBusy):
+                asyncio.run(svc.authenticate_user("jean", "secret"))
+
+    def test_a_busy_pool_skips_the_rehash_not_the_login(self, svc):
+        from src.api.services import auth_service as module
+
+        svc.ph = MagicMock()
+        svc.ph.check_needs_rehash.return_value = True
+        pool = MagicMock(run=AsyncMock(side_effect=[None, PasswordPoolBusy("full")]))
+        db = MagicMock(execute=AsyncMock(return_value=MagicMock(rows=[["u1", "jean", "$old", 0, None]])))
+
+        with patch.object(module, "db", db), patch.object(module, "get_password_pool", return_value=pool):
+            user = asyncio.run(svc.authenticate_user("jean", "secret"))
+
+        assert user["id"] == "u1"
+        assert db.execute.await_count == 1  # the lookup; no password_hash UPDATE
+
+    def test_real_argon2_round_trip(self, svc):
+        from src.api.services import auth_service as module
+
+        password_hash = asyncio.run(module.get_password_pool().run(svc.ph.hash, "correct horse battery"))
+        db = MagicMock(execute=AsyncMock(return_value=MagicMock(rows=[["u1", "jean", password_hash, 0, None]])))
+
+        with patch.object(module, "db", db):
+            assert asyncio.run(svc.authenticate_user("jean", "correct horse battery"))["id"] == "u1"
+            assert asyncio.run(svc.authenticate_user("jean", "wrong horse battery")) is None
+
+
+class _ThreadPoolServer(BaseWSGIServer):
+    """One process serving requests on a fixed set of threads, like the
+    Procfile's ``gunicorn -w 1 --threads N``."""
+
+    def __init__(self, app, threads):
+        super().__init__("127.0.0.1", 0, app)
+        self._executor = ThreadPoolExecutor(threads)
+
+    def process_request(self, request, client_address):
+        self._executor.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False)
+
+
+def _request(url, payload=None, headers=None):
+    data = json.dumps(payload).encode() if payload is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json", **(headers or {})})
+    try:
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def test_a_login_burst_leaves_threads_for_gameplay():
+    """Four request threads, a pool admitting two logins: while two hashes are
+    stuck, the rest of the burst is shed with 503 and a gameplay request is
+    served at once instead of queueing behind the logins."""
+    from src.api.app import create_app
+    from src.api.config import TestingConfig
+    from src.api.services import auth_service as module
+
+    app, _ = create_app(TestingConfig)
+    pool = PasswordHashPool(max_workers=1, max_in_flight=2)
+    ran = []
+    hashes = [_Gate(ran, "h1"), _Gate(ran, "h2")]
+    ph = MagicMock()
+    ph.verify.side_effect = lambda *_: hashes[len(ran)]()
+    ph.check_needs_rehash.return_value = False
+    db = MagicMock(execute=AsyncMock(return_value=MagicMock(rows=[["u1", "jean", "$h", 0, None]])))
+
+    server = _ThreadPoolServer(app, threads=4)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}/api"
+    statuses = []
+    try:
+        with patch.object(module, "get_password_pool", return_value=pool), \
+                patch.object(module, "db", db), patch.object(module.auth_service, "ph", ph):
+            _, body = _request(f"{base}/test/session", {"username": "gameplay"})
+            headers = {"Authorization": f"Bearer {body['session_id']}"}
+
+            logins = [
+                threading.Thread(target=lambda: statuses.append(
+                    _request(f"{base}/auth/login", {"username": "jean", "password": "pw"})[0]
+                ))
+                for _ in range(6)
+            ]
+            for login in logins:
+                login.start()
+            assert hashes[0].started.wait(5)
+            deadline = time.monotonic() + 5
+            while len(statuses) < 4:
+                assert time.monotonic() < deadline, statuses
+                time.sleep(0.005)
+
+            started = time.monotonic()
+            status, _ = _request(f"{base}/world", headers=headers)
+            elapsed = time.monotonic() - started
+
+            for gate in hashes:
+                gate.release.set()
+            for login in logins:
+                login.join(10)
+    finally:
+        for gate in hashes:
+            gate.release.set()
+        server.shutdown()
+        server.server_close()
+
+    assert status == 200
+    assert elapsed < 2  # the hashes were held for up to 5 s
+    assert sorted(statuses) == [200, 200, 503, 503, 503, 503]
+    assert pool.stats()["rejected"] == 4
@@ -205,7 +205,7 @@ class TestInventoryCoverage:
         with (
             patch("src.player._inventory.tile_exists", return_value=tile),
             patch("builtins.print"),
-            patch("src.player._inventory.time"),
+            patch("src.player._inventory.pause"),
         ):
             p.drop_merchandise_items()
 
@@ -37,6 +37,7 @@ from src.positions import (
     nearest_flank_bearing,
     turn_toward,
     recalculate_proximity_dict,
+    SpatialIndex,
 )
 
 
@@ -851,5 +852,66 @@ class TestBackwardCompatibility:
         assert result[target] == 5  # 5 feet away
 
 
+class _Unit:
+    def __init__(self, x, y):
+        self.combat_position = CombatPosition(x, y)
+
+
+class TestSpatialIndex:
+    """SpatialIndex must agree with recalculate_proximity_dict."""
+
+    def _assert_matches(self, index, units):
+        for unit in units:
+            expected = recalculate_proximity_dict(unit, units)
+            got = index.proximity(unit)
+            assert got == expected
+            assert list(got) == list(expected)
+
+    def test_matches_full_recalculation_through_moves(self):
+        import random
+
+        rng = random.Random(7)
+        units = [_Unit(rng.randint(0, 50), rng.randint(0, 50)) for _ in range(12)]
+        index = SpatialIndex()
+        index.sync(units)
+        self._assert_matches(index, units)
+        for _ in range(20):
+            mover = rng.choice(units)
+            if rng.random() < 0.5:
+                mover.combat_position = CombatPosition(rng.randint(0, 50), rng.randint(0, 50))
+            else:
+                # In-place edits (Swap Places) must be noticed too.
+                mover.combat_position.x = rng.randint(0, 50)
+            index.sync(units)
+            self._assert_matches(index, units)
+
+    def test_sync_reports_only_moved_units(self):
+        a, b, c = _Unit(0, 0), _Unit(3, 4), _Unit(10, 0)
+        index = SpatialIndex()
+        assert index.sync([a, b, c]) == [a, b, c]
+        assert index.sync([a, b, c]) == []
+        b.combat_position = CombatPosition(6, 8)
+        assert index.sync([a, b, c]) == [b]
+        assert index.distance(a, b) == 10
+
+    def test_roster_changes_and_missing_positions(self):
+        a, b, c = _Unit(0, 0), _Unit(3, 4), _Unit(10, 0)
+        index = SpatialIndex()
+        index.sync([a, b, c])
+        c.combat_position = None
+        index.sync([a, b, c])
+        assert index.proximity(a) == {b: 5}
+        assert index.proximity(c) == {}
+        index.sync([b, a])
+        self._assert_matches(index, [b, a])
+
+    def test_proximity_returns_a_copy(self):
+        a, b = _Unit(0, 0), _Unit(3, 4)
+        index = SpatialIndex()
+        index.sync([a, b])
+        index.proximity(a).clear()
+        assert index.proximity(a) == {b: 5}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -183,3 +183,87 @@ def test_refresh_stat_bonuses_ignores_unknown_resistance_keys():
     # fire updated, plasma ignored (not in base dict)
     assert t.resistance['fire'] == 1.1
     assert 'plasma' not in t.resistance
+
+
+# ---------------------------------------------------------------------------
+# ensure_stat_bonuses: the per-beat, cached refresh
+# ---------------------------------------------------------------------------
+
+
+def _counting_resets(monkeypatch):
+    calls = []
+    real_reset = functions.reset_stats
+    monkeypatch.setattr(functions, "reset_stats", lambda t: calls.append(t) or real_reset(t))
+    return calls
+
+
+def test_ensure_stat_bonuses_skips_when_nothing_changed(monkeypatch):
+    t = MockTarget(name="Goblin")
+    t.inventory.append(MockItem(add_str=3))
+    functions.refresh_stat_bonuses(t)
+    resets = _counting_resets(monkeypatch)
+
+    for _ in range(5):
+        functions.ensure_stat_bonuses(t)
+
+    assert resets == []
+    assert t.strength == t.strength_base + 3
+
+
+def test_ensure_stat_bonuses_sees_state_and_equipment_changes():
+    t = MockTarget(name="Goblin")
+    club = MockItem(add_str=3, isequipped=False)
+    t.inventory.append(club)
+    functions.ensure_stat_bonuses(t)
+    assert t.strength == t.strength_base
+
+    club.isequipped = True
+    functions.ensure_stat_bonuses(t)
+    assert t.strength == t.strength_base + 3
+
+    t.states.append(MockState(add_str=-2))  # bare append, no explicit refresh
+    functions.ensure_stat_bonuses(t)
+    assert t.strength == t.strength_base + 1
+
+    t.states.clear()
+    t.strength_base += 1  # level-up allocation
+    functions.ensure_stat_bonuses(t)
+    assert t.strength == t.strength_base + 3
+
+
+def test_ensure_stat_bonuses_resets_direct_writes_like_a_full_refresh():
+    t = MockTarget(name="Goblin")
+    functions.ensure_stat_bonuses(t)
+
+    t.finesse = 99
+    t.resistance["fire"] = 0.0
+    functions.ensure_stat_bonuses(t)
+
+    assert t.finesse == t.finesse_base
+    assert t.resistance["fire"] == 1.0
+
+
+def test_ensure_stat_bonuses_still_clamps_fatigue():
+    t = MockTarget(name="Goblin")
+    t.fatigue = 10
+    functions.ensure_stat_bonuses(t)
+
+    t.fatigue = t.maxfatigue + 50
+    functions.ensure_stat_bonuses(t)
+
+    assert t.fatigue == t.maxfatigue
+
+
+def test_stat_cache_is_not_pickled_or_copied(make_npc):
+    import pickle
+
+    from src.npc import Slime
+
+    slime = make_npc(cls=Slime)
+    functions.refresh_stat_bonuses(slime)
+    assert hasattr(slime, functions.STAT_BONUS_CACHE_ATTR)
+
+    for clone in (copy.deepcopy(slime), pickle.loads(pickle.dumps(slime))):
+        assert not hasattr(clone, functions.STAT_BONUS_CACHE_ATTR)
+        functions.ensure_stat_bonuses(clone)
+        assert clone.strength == slime.strength
@@ -0,0 +1,203 @@
+"""Tests for the opt-in request instrumentation (src/api/profiling.py)."""
+
+import time
+
+import pytest
+
+from src.api.app import create_app
+from src.api.config import TestingConfig
+from src.api.profiling import RequestStats, SessionProfiler, _Histogram
+
+
+class ProfilingConfig(TestingConfig):
+    REQUEST_PROFILING = True
+    PROFILING_TOKEN = "s3cret"
+
+
+_TOKEN = {"X-Profiling-Token": "s3cret"}
+
+
+@pytest.fixture(scope="module")
+def app():
+    app, _ = create_app(ProfilingConfig)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    app.request_stats.reset()
+    return app.test_client()
+
+
+def _session(client):
+    resp = client.post("/api/test/session", json={"username": "profiled"})
+    return {"Authorization": f"Bearer {resp.get_json()['session_id']}"}
+
+
+def _spin(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _stats(client):
+    return client.get("/api/internal/stats", headers=_TOKEN).get_json()["routes"]
+
+
+class TestHistogram:
+    def test_quantiles_report_bucket_upper_bounds(self):
+        h = _Histogram()
+        for ms in [0.3] * 90 + [7.0] * 9 + [40.0]:
+            h.add(ms)
+
+        assert h.quantile(0.50) == 0.5
+        assert h.quantile(0.95) == 10
+        assert h.quantile(0.99) == 10
+        assert h.quantile(1.0) == 40.0
+
+    def test_overflow_reports_observed_max(self):
+        h = _Histogram()
+        h.add(123456.0)
+
+        assert h.quantile(0.5) == 123456.0
+        assert h.snapshot()["buckets"] == {"overflow": 1}
+
+
+def test_self_times_and_unattributed_add_up_to_total():
+    stats = RequestStats()
+    stats.record("GET /x", 10.0, {"game_service": 6.0}, {"game_service": 4.0, "serializer": 2.0})
+
+    phases = stats.snapshot()["routes"]["GET /x"]["phases"]
+
+    assert phases["game_service"]["inclusive_ms"] == 6.0
+    assert phases["unattributed"]["self_ms"] == 4.0
+    assert sum(p["self_ms"] for p in phases.values()) == 10.0
+
+
+class TestInstrumentedApp:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("REQUEST_PROFILING", raising=False)
+        plain, _ = create_app(TestingConfig)
+
+        assert not hasattr(plain, "request_stats")
+        assert plain.test_client().get("/api/internal/stats").status_code == 404
+
+    def test_route_latency_and_phases_recorded(self, client):
+        headers = _session(client)
+        for _ in range(3):
+            assert client.get("/api/world", headers=headers).status_code == 200
+
+        route = _stats(client)["GET /api/world"]
+
+        assert route["count"] == 3
+        assert route["p50_ms"] is not None
+        for phase in ("session_lookup", "game_service", "jsonify"):
+            assert route["phases"][phase]["requests"] == 3
+        assert route["phases"]["game_service"]["inclusive_ms"] > 0
+        assert route["phases"]["unattributed"]["requests"] == 3
+
+    def test_password_hashing_queue_is_reported(self, client):
+        stats = client.get("/api/internal/stats", headers=_TOKEN).get_json()["password_hashing"]
+
+        assert {"pending", "running", "peak_pending", "rejected", "max_wait_ms"} <= set(stats)
+
+    def test_write_behind_counters_are_reported(self, client):
+        assert "db_write_behind" in client.get("/api/internal/stats", headers=_TOKEN).get_json()
+
+    def test_unmatched_routes_share_one_series(self, client):
+        client.get("/api/nope/1")
+        client.get("/api/nope/2")
+
+        assert _stats(client)["GET <unmatched>"]["count"] == 2
+
+    def test_non_loopback_caller_needs_token(self, client):
+        remote = {"REMOTE_ADDR": "203.0.113.9"}
+
+        assert client.get("/api/internal/stats", environ_base=remote).status_code == 404
+        assert client.get(
+            "/api/internal/stats", environ_base=remote,
+            headers={"X-Profiling-Token": "wrong"},
+        ).status_code == 404
+        assert client.get(
+            "/api/internal/stats", environ_base=remote,
+            headers={"X-Profiling-Token": "s3cret"},
+        ).status_code == 200
+
+
+    def test_loopback_without_the_token_is_refused_when_one_is_set(self, client):
+        """Behind a same-host proxy every caller is 127.0.0.1, so loopback
+        alone never stands in for a configured token."""
+        loopback = {"REMOTE_ADDR": "127.0.0.1"}
+
+        assert client.get("/api/internal/stats", environ_base=loopback).status_code == 404
+        assert client.post("/api/internal/stats/reset", environ_base=loopback).status_code == 404
+
+
+@pytest.mark.parametrize("trust, expected", [(False, 404), (True, 200)])
+def test_tokenless_loopback_access_is_opt_in(trust, expected):
+    class TokenlessConfig(ProfilingConfig):
+        PROFILING_TOKEN = None
+        PROFILING_TRUST_LOOPBACK = trust
+
+    app, _ = create_app(TokenlessConfig)
+    client = app.test_client()
+
+    assert client.get("/api/internal/stats", environ_base={"REMOTE_ADDR": "127.0.0.1"}).status_code == expected
+    assert client.get("/api/internal/stats", environ_base={"REMOTE_ADDR": "203.0.113.9"}).status_code == 404
+
+
+class TestSessionCapture:
+    def test_samples_only_the_armed_session(self, app, client, monkeypatch):
+        headers = _session(client)
+        other = _session(client)
+        session_id = headers["Authorization"][7:]
+        monkeypatch.setattr(app.session_profiler, "interval", 0.001)
+        get_room = app.game_service.get_current_room
+
+        def slow_room(*args, **kwargs):
+            # Long enough that a 1ms sampler cannot miss it.
+            _spin(0.02)
+            return get_room(*args, **kwargs)
+
+        monkeypatch.setattr(app.game_service, "get_current_room", slow_room)
+
+        resp = client.post(f"/api/internal/profile/{session_id}", json={"requests": 2}, headers=_TOKEN)
+        assert resp.status_code == 202
+
+        client.get("/api/world", headers=other)
+        for _ in range(3):
+            client.get("/api/world", headers=headers)
+
+        capture = client.get(f"/api/internal/profile/{session_id}", headers=_TOKEN).get_json()
+        assert capture["requests"] == 2
+        assert capture["pending"] == 0
+        assert capture["routes"] == {"GET /api/world": 2}
+        assert capture["samples"] > 0
+        assert "slow_room" in capture["collapsed"]
+        assert capture["collapsed"].splitlines()[0].rsplit(" ", 1)[1].isdigit()
+
+    def test_unknown_session_rejected(self, client):
+        assert client.post("/api/internal/profile/nope", headers=_TOKEN).status_code == 404
+        assert client.get("/api/internal/profile/nope", headers=_TOKEN).status_code == 404
+
+    def test_request_count_clamped_and_captures_bounded(self):
+        profiler = SessionProfiler()
+
+        assert profiler.arm("a", 0) == 1
+        assert profiler.arm("a", 10**6) == 500
+        for i in range(100):
+            profiler.arm(f"s{i}")
+        assert profiler.capture("a") is None
+        assert profiler.capture("s99") is not None
+
+    def test_sampler_collects_the_request_thread(self):
+        profiler = SessionProfiler(interval=0.001)
+        profiler.arm("busy", 1)
+
+        sampler = profiler.start("busy")
+        _spin(0.05)
+        profiler.finish("busy", "GET /busy", sampler)
+
+        capture = profiler.capture("busy")
+        assert capture["samples"] > 0
+        assert "test_sampler_collects_the_request_thread" in capture["collapsed"]
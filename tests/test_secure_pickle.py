@@ -5,6 +5,7 @@ Covers the Phase 1 (issue #13) hardening of save deserialization:
   * allow-list fail (unknown class raises in strict mode)
   * placeholder path (legacy / non-strict mode still loads unknown classes)
   * oversize payload rejected before unpickling
+  * integrity headers, including compressed, chunked version 2 saves
   * structured event logging (rewrite / placeholder / rejection)
   * env-var strict-mode toggle
 """
@@ -343,6 +344,76 @@ def test_sandbox_reports_worker_failure_on_garbage():
         sp.load_in_subprocess(b"not a pickle at all", strict=True, timeout=60)
 
 
+def test_sandbox_one_shot_path_still_available():
+    from src import items
+
+    data = sp.serialize_for_save(items.Gold(7))
+    assert sp.load_in_subprocess(data, timeout=60, pooled=False)["format_version"] == 2
+
+
+class _SleepReduce:
+    def __reduce__(self):
+        # select, not time.sleep: conftest swaps time.sleep for a stub.
+        import select
+        return (select.select, ([], [], [], 60))
+
+
+@pytest.fixture
+def sandbox_pool():
+    pool = sp.SandboxPool(max_jobs=3)
+    yield pool
+    pool.close()
+
+
+def _idle_pids(pool):
+    return [worker.proc.pid for worker in pool._idle]
+
+
+def test_sandbox_pool_reuses_a_worker_up_to_max_jobs(sandbox_pool):
+    from src import items
+
+    data = sp.serialize_for_save(items.Gold(7))
+    pids = []
+    for _ in range(4):
+        pids.append(_idle_pids(sandbox_pool)[0])
+        assert sandbox_pool.load(data, timeout=60)["format_version"] == 2
+
+    assert pids[0] == pids[1] == pids[2]
+    assert pids[3] != pids[0]
+    assert len(sandbox_pool._idle) == 1
+
+
+def test_sandbox_pool_retires_a_worker_that_failed(sandbox_pool):
+    first = _idle_pids(sandbox_pool)[0]
+
+    with pytest.raises(sp.SandboxError) as exc:
+        sandbox_pool.load(b"not a pickle at all", timeout=60)
+
+    assert "UnpicklingError" in str(exc.value)
+    assert _idle_pids(sandbox_pool) != [first]
+
+
+def test_sandbox_pool_kills_a_worker_past_its_timeout(sandbox_pool):
+    from src import items
+
+    sandbox_pool.load(sp.serialize_for_save(items.Gold(1)), timeout=60)  # warm
+    worker = sandbox_pool._idle[0]
+
+    with pytest.raises(sp.SandboxError) as exc:
+        sandbox_pool.load(sp.serialize_for_save(_SleepReduce()), strict=False, timeout=1)
+
+    assert "terminated" in str(exc.value)
+    assert worker.proc.poll() is not None
+    assert worker not in sandbox_pool._idle
+
+
+def test_sandbox_pool_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        sp.SandboxPool(size=0)
+    with pytest.raises(ValueError):
+        sp.SandboxPool(max_jobs=0)
+
+
 # ---------------------------------------------------------------------------
 # Phase 4: allow-list manifest drift guard
 # ---------------------------------------------------------------------------
@@ -471,7 +542,8 @@ def test_payload_over_the_real_default_cap_is_rejected():
     """Uses the module default (no max_bytes override), with a payload that
     genuinely exceeds 5 MB -- a cap tested only at max_bytes=10 would not
     notice DEFAULT_MAX_SAVE_BYTES being widened to, say, 5 GB."""
-    oversize = sp.serialize_for_save({"pad": "x" * (sp.DEFAULT_MAX_SAVE_BYTES + 1024)})
+    oversize = sp.serialize_for_save(
+        {"pad": "x" * (sp.DEFAULT_MAX_SAVE_BYTES + 1024)}, codec=None)
     assert len(oversize) > sp.DEFAULT_MAX_SAVE_BYTES
     with pytest.raises(sp.SaveTooLargeError) as exc:
         sp.safe_pickle_load(io.BytesIO(oversize))
@@ -533,7 +605,8 @@ def test_each_tamper_mode_is_detected_independently(mutate, label):
 # Filtered rather than skipped inside the body: a runtime skip would silently
 # shrink the matrix if HEADER_VERSION ever moved into it.
 @pytest.mark.parametrize(
-    "version", [v for v in (0, 2, 99, 255) if v != sp.HEADER_VERSION])
+    "version", [v for v in (0, 2, 3, 99, 255)
+                if v not in (sp.HEADER_VERSION, sp.CHUNKED_HEADER_VERSION)])
 def test_unknown_header_versions_are_rejected(version):
     payload = pickle.dumps({"a": 1}, pickle.HIGHEST_PROTOCOL)
     digest = __import__("hashlib").sha256(payload).digest()
@@ -570,6 +643,117 @@ def test_tampering_with_a_headered_save_cannot_swap_in_a_gadget():
         sp.safe_pickle_load(io.BytesIO(forged), strict=True)
 
 
+# ---------------------------------------------------------------------------
+# Version 2: compressed, chunked saves verified frame by frame
+# ---------------------------------------------------------------------------
+
+# Incompressible, so the save spans several frames.
+_BIG = {"blob": bytes(range(256)) * 4 + __import__("os").urandom(3 * sp.SAVE_CHUNK_SIZE)}
+
+
+def _frames(blob):
+    """Return ``(offset, size)`` of every frame header in a version 2 save."""
+    frames, offset = [], sp._CHUNKED_HEADER_STRUCT.size
+    while offset < len(blob):
+        size, _digest = sp._FRAME_STRUCT.unpack_from(blob, offset)
+        frames.append((offset, size))
+        offset += sp._FRAME_STRUCT.size + size
+    return frames
+
+
+class _ReadSizes(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.sizes = []
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.sizes.append(len(chunk))
+        return chunk
+
+
+@pytest.mark.parametrize("codec", sorted(sp.SAVE_CODECS))
+def test_v2_round_trips_and_compresses(codec):
+    payload = {"rooms": [{"name": f"Room {i}", "items": [f"potion {n}" for n in range(20)]}
+                         for i in range(200)]}
+
+    blob = sp.serialize_for_save(payload, codec=codec)
+
+    assert blob[:4] == sp.HEADER_MAGIC
+    assert blob[4] == sp.CHUNKED_HEADER_VERSION
+    assert len(blob) * 3 < len(sp.serialize_for_save(payload, codec=None))
+    assert sp.safe_pickle_load(io.BytesIO(blob)) == payload
+    assert pickle.loads(sp.verify_and_strip_header(blob)) == payload
+
+
+def test_v2_is_the_default_and_unknown_codecs_are_refused():
+    assert sp.serialize_for_save({"a": 1})[4] == sp.CHUNKED_HEADER_VERSION
+    with pytest.raises(ValueError):
+        sp.serialize_for_save({"a": 1}, codec="brotli")
+
+
+def test_v2_is_read_a_frame_at_a_time():
+    blob = sp.serialize_for_save(_BIG)
+    assert len(_frames(blob)) > 3
+    fp = _ReadSizes(blob)
+
+    assert sp.safe_pickle_load(fp, max_bytes=None) == _BIG
+    assert max(fp.sizes) <= sp.SAVE_CHUNK_SIZE
+
+
+def _flip(blob, index):
+    return blob[:index] + bytes([blob[index] ^ 0xFF]) + blob[index + 1:]
+
+
+def _v2_tampers():
+    blob = sp.serialize_for_save(_BIG)
+    (first, _), (second, size), *_rest, (end, _) = _frames(blob)
+    frame_header = sp._FRAME_STRUCT.size
+    return [
+        (_flip(blob, 5), "codec byte flipped"),
+        (_flip(blob, 13), "declared length flipped"),
+        (_flip(blob, second + frame_header + size // 2), "byte in a middle frame flipped"),
+        (_flip(blob, second + 10), "middle frame digest flipped"),
+        (_flip(blob, second + 1), "middle frame size flipped"),
+        (blob[:second] + blob[second + frame_header + size:], "middle frame dropped"),
+        (blob[:first] + blob[second:end] + blob[first:second] + blob[end:], "frames reordered"),
+        (blob[:end], "end frame removed"),
+        (blob[:second + 100], "truncated mid-frame"),
+        (blob + b"\x00" * 8, "trailing data"),
+    ]
+
+
+@pytest.mark.parametrize("tampered,label", _v2_tampers(), ids=lambda v: v if isinstance(v, str) else "")
+def test_each_v2_tamper_mode_is_detected(tampered, label):
+    with pytest.raises((sp.SaveIntegrityError, sp.SaveTooLargeError)):
+        sp.safe_pickle_load(io.BytesIO(tampered), max_bytes=None)
+    with pytest.raises((sp.SaveIntegrityError, sp.SaveTooLargeError)):
+        sp.verify_and_strip_header(tampered)
+
+
+def test_v2_declared_length_over_the_cap_is_refused_before_any_opcode(tmp_path):
+    sentinel = tmp_path / "fired"
+    blob = sp.serialize_for_save(
+        {"evil": _MkdirReduce(str(sentinel)), "pad": "x" * (sp.DEFAULT_MAX_SAVE_BYTES + 1024)})
+    assert len(blob) < sp.DEFAULT_MAX_SAVE_BYTES  # it compresses, the cap still holds
+
+    with pytest.raises(sp.SaveTooLargeError):
+        sp.safe_pickle_load(io.BytesIO(blob), strict=False)
+    assert not sentinel.exists()
+
+
+def test_v2_payload_longer_than_declared_is_refused():
+    """A save that lies about its length (digests recomputed) can't inflate
+    past what the size cap was checked against."""
+    writer = sp.ChunkedSaveWriter()
+    pickle.Pickler(writer, pickle.HIGHEST_PROTOCOL).dump({"pad": "x" * 100_000})
+    writer._length = 1000
+    blob = writer.finish()
+
+    with pytest.raises(sp.SaveIntegrityError, match="longer"):
+        sp.safe_pickle_load(io.BytesIO(blob))
+
+
 # ---------------------------------------------------------------------------
 # Malicious __reduce__ payloads: constructed AND executed against the loader
 # ---------------------------------------------------------------------------
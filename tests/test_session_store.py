@@ -0,0 +1,313 @@
+"""Tests for the shared session store behind SessionManager.
+
+Two SessionManager instances pointed at the same SQLite file stand in for two
+gunicorn workers: whatever one checkpoints, the other must re-hydrate, and a
+stale copy must never overwrite a newer checkpoint.
+"""
+
+import pytest
+
+from src.api.services.session_manager import MinimalPlayer, SessionManager
+from src.api.services.session_store import (
+    SessionStoreError,
+    SqliteSessionStore,
+    create_session_store,
+    dump_state,
+    load_state,
+)
+
+
+@pytest.fixture
+def store_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'sessions.db'}"
+
+
+@pytest.fixture
+def workers(monkeypatch, store_url):
+    """Two managers sharing one store, each with its own connection."""
+    monkeypatch.delenv("CONFIG_FILE", raising=False)
+    a = SessionManager(store=create_session_store(store_url))
+    b = SessionManager(store=create_session_store(store_url))
+    return a, b
+
+
+class TestCreateSessionStore:
+    @pytest.mark.parametrize("url", [None, "", "memory", " MEMORY "])
+    def test_memory_urls_mean_no_store(self, url):
+        assert create_session_store(url) is None
+
+    def test_sqlite_url_builds_store(self, store_url):
+        store = create_session_store(store_url)
+        assert isinstance(store, SqliteSessionStore)
+        assert store.shared is True
+
+    def test_unknown_scheme_rejected(self):
+        with pytest.raises(SessionStoreError):
+            create_session_store("redis://localhost")
+
+    def test_sqlite_without_path_rejected(self):
+        with pytest.raises(SessionStoreError):
+            create_session_store("sqlite:")
+
+
+class TestStateRoundTrip:
+    def test_player_and_data_share_one_pickle(self):
+        player = MinimalPlayer("jean")
+        player.hp = 12
+        data = {"pending_events": {"e1": {"event": {"owner": player}}}}
+
+        restored_player, restored_data = load_state(dump_state(player, data))
+
+        assert restored_player.hp == 12
+        # Identity across player and session data survives the checkpoint.
+        assert restored_data["pending_events"]["e1"]["event"]["owner"] is restored_player
+
+    def test_combat_adapter_is_stripped_and_restored(self):
+        import threading
+
+        player = MinimalPlayer("jean")
+        adapter = threading.Lock()  # unpicklable on purpose
+        player._combat_adapter = adapter
+
+        restored, _ = load_state(dump_state(player, {}))
+
+        assert not hasattr(restored, "_combat_adapter")
+        assert player._combat_adapter is adapter
+
+
+class TestSharedSessions:
+    def test_second_worker_rehydrates_created_session(self, workers):
+        a, b = workers
+        session_id, player_id = a.create_session("jean")
+
+        player = b.get_player(session_id)
+
+        assert player is not None
+        assert player is not a.players[player_id]
+        assert player.name == a.players[player_id].name
+
+    def test_checkpoint_is_visible_to_other_worker(self, workers):
+        a, b = workers
+        session_id, _ = a.create_session("jean")
+
+        b_player = b.get_player(session_id)
+        b_player.hp = 3
+        b.get_session(session_id).data["timezone"] = "UTC"
+        assert b.save_session(session_id) is True
+
+        assert a.get_player(session_id).hp == 3
+        assert a.get_session(session_id).data["timezone"] == "UTC"
+
+    def test_unchanged_version_keeps_local_object(self, workers):
+        a, _ = workers
+        session_id, player_id = a.create_session("jean")
+        local = a.players[player_id]
+
+        assert a.get_player(session_id) is local
+
+    def test_stale_checkpoint_is_rejected(self, workers):
+        a, b = workers
+        session_id, _ = a.create_session("jean")
+        b.get_player(session_id)
+        b.save_session(session_id)
+
+        # Worker A still believes the first version is current.
+        session = a.sessions[session_id]
+        player = a.players[session.player_id]
+        assert a.store.checkpoint(session, player, a._versions[session_id]) is None
+
+    def test_concurrent_write_is_reported_not_overwritten(self, workers):
+        a, b = workers
+        session_id, _ = a.create_session("jean")
+        a_player = a.get_player(session_id)
+
+        b_player = b.get_player(session_id)
+        b_player.hp = 3
+        assert b.save_session(session_id) is True
+
+        a_player.hp = 7
+        assert a.save_session(session_id) is False
+        # B's checkpoint survives and A re-hydrates it on next access.
+        assert a.get_player(session_id).hp == 3
+
+    def test_set_player_does_not_swallow_a_concurrent_write(self, workers):
+        a, b = workers
+        session_id, _ = a.create_session("jean")
+        b.get_player(session_id)
+        assert b.save_session(session_id) is True
+
+        replacement = MinimalPlayer("jean")
+        replacement.hp = 1
+        a.set_player(session_id, replacement)
+
+        assert b.get_player(session_id) is not replacement
+        assert a.get_player(session_id).hp != 1
+
+    def test_release_only_writes_checked_out_sessions(self, workers, monkeypatch):
+        a, _ = workers
+        session_id, _ = a.create_session("jean")
+        calls = []
+        monkeypatch.setattr(a, "save_session", lambda sid: calls.append(sid))
+
+        a.release(session_id)
+        assert calls == []
+
+        a.get_player(session_id)
+        a.release(session_id)
+        assert calls == [session_id]
+
+    def test_release_reports_a_discarded_write(self, workers):
+        a, b = workers
+        session_id, _ = a.create_session("jean")
+        a.get_player(session_id).hp = 7
+        b.get_player(session_id).hp = 3
+        assert b.save_session(session_id) is True
+
+        assert a.release(session_id) is False
+        # Reported once; the next request starts from B's checkpoint.
+        assert a.release(session_id) is True
+        assert a.get_player(session_id).hp == 3
+
+    def test_lease_keeps_other_workers_out_until_checkin(self, workers):
+        a, b = workers
+        session_id, _ = a.create_session("jean")
+        assert a.checkout(session_id)
+
+        assert b.checkout(session_id, timeout=0.05) is False
+        a.checkin(session_id)
+        assert b.checkout(session_id, timeout=0.05) is True
+        b.checkin(session_id)
+
+    def test_expired_lease_is_taken_over(self, workers):
+        a, _ = workers
+        session_id, _ = a.create_session("jean")
+        # A worker that died mid-request leaves a lease that has run out.
+        assert a.store.acquire_lease(session_id, "dead-worker", ttl=-1)
+
+        assert a.checkout(session_id, timeout=0.05) is True
+        a.checkin(session_id)
+
+    def test_expiry_propagates_between_workers(self, workers):
+        a, b = workers
+        session_id, _ = a.create_session("jean")
+        assert b.get_session(session_id) is not None
+
+        a.expire_session(session_id)
+
+        assert b.get_session(session_id) is None
+        assert session_id not in b.sessions
+
+    def test_active_count_comes_from_store(self, workers):
+        a, b = workers
+        a.create_session("jean")
+        a.create_session("gorran")
+
+        assert b.get_active_session_count() == 2
+        assert {s["username"] for s in b.get_all_sessions()} == {"jean", "gorran"}
+
+
+def test_memory_mode_never_checks_out(monkeypatch):
+    monkeypatch.delenv("CONFIG_FILE", raising=False)
+    manager = SessionManager()
+    session_id, _ = manager.create_session("jean")
+
+    manager.get_player(session_id)
+
+    assert manager.store is None
+    assert manager._checked_out == set()
+    assert manager.save_session(session_id) is True
+
+
+class TestOverlappingRequests:
+    """Two threads of one worker serving the same session at once."""
+
+    @pytest.fixture
+    def app(self, monkeypatch, store_url):
+        from src.api.app import create_app
+        from src.api.config import TestingConfig
+
+        monkeypatch.delenv("CONFIG_FILE", raising=False)
+
+        class StoreConfig(TestingConfig):
+            SESSION_STORE_URL = store_url
+
+        app, _ = create_app(StoreConfig)
+        return app
+
+    def test_second_request_waits_for_the_first_checkpoint(self, app):
+        import threading
+
+        client = app.test_client()
+        session_id = client.post("/api/test/session", json={"username": "jean"}).get_json()["session_id"]
+        headers = {"Authorization": f"Bearer {session_id}"}
+        store = app.session_manager.store
+        real_checkpoint = store.checkpoint
+        entered, go = threading.Event(), threading.Event()
+        results = []
+
+        def slow_checkpoint(session, player, expected_version):
+            if not entered.is_set():
+                entered.set()
+                go.wait(2)
+            results.append(real_checkpoint(session, player, expected_version))
+            return results[-1]
+
+        store.checkpoint = slow_checkpoint
+        statuses = []
+
+        def heal():
+            statuses.append(client.post("/api/test/heal", headers=headers).status_code)
+
+        first = threading.Thread(target=heal)
+        first.start()
+        assert entered.wait(5)
+        second = threading.Thread(target=heal)
+        second.start()
+        threading.Event().wait(0.2)  # let the second request reach the session
+        go.set()
+        first.join(5)
+        second.join(5)
+
+        assert statuses == [200, 200]
+        assert None not in results and len(results) == 2
+        assert session_id in app.session_manager.sessions
+
+    def test_checkout_times_out_instead_of_hanging(self, workers):
+        a, _ = workers
+        session_id, _ = a.create_session("jean")
+        assert a.checkout(session_id)
+
+        import threading
+
+        outcome = []
+        waiter = threading.Thread(target=lambda: outcome.append(a.checkout(session_id, timeout=0.05)))
+        waiter.start()
+        waiter.join(5)
+        a.checkin(session_id)
+
+        assert outcome == [False]
+        assert a.checkout(session_id, timeout=0.05)
+        a.checkin(session_id)
+
+    def test_write_lost_to_another_worker_answers_409(self, app, store_url):
+        client = app.test_client()
+        session_id = client.post("/api/test/session", json={"username": "jean"}).get_json()["session_id"]
+        headers = {"Authorization": f"Bearer {session_id}"}
+        other = SessionManager(store=create_session_store(store_url))
+        store = app.session_manager.store
+        real_checkpoint = store.checkpoint
+
+        def checkpoint_after_other_worker(session, player, expected_version):
+            # Another worker writes without waiting for the lease, as it would
+            # once a lease outlived its TTL.
+            other.get_player(session_id)
+            assert other.save_session(session_id) is True
+            return real_checkpoint(session, player, expected_version)
+
+        store.checkpoint = checkpoint_after_other_worker
+        response = client.post("/api/test/heal", headers=headers)
+        store.checkpoint = real_checkpoint
+
+        assert response.status_code == 409
+        assert response.get_json()["error"] == "session_conflict"
+        assert client.post("/api/test/heal", headers=headers).status_code == 200
@@ -0,0 +1,131 @@
+"""Skill-tree entries are shared prototypes; learning one gives the player their own move."""
+
+import pickle
+import random
+
+import src.skilltree as skilltree
+from src.functions import learn_all_skills_from_skilltree
+from src.player import Player
+
+
+def _entry(player, category, class_name):
+    return next(
+        (skill, cost)
+        for skill, cost in player.skilltree.subtypes[category].items()
+        if type(skill).__name__ == class_name
+    )
+
+
+class TestSharedPrototypes:
+    def test_players_share_entries_but_not_the_tables(self):
+        a, b = Player(), Player()
+
+        assert _entry(a, "Dagger", "Slash")[0] is _entry(b, "Dagger", "Slash")[0]
+        assert a.skilltree.subtypes is not b.skilltree.subtypes
+        assert a.skilltree.subtypes["Dagger"] is not b.skilltree.subtypes["Dagger"]
+
+    def test_prototypes_belong_to_no_one(self):
+        player = Player()
+
+        for skills in player.skilltree.subtypes.values():
+            for skill in skills:
+                assert skill.user is None
+                assert getattr(skill, "target", None) is None
+                assert skilltree.is_prototype(skill)
+
+    def test_prototypes_keep_nothing_of_the_first_player(self, monkeypatch):
+        monkeypatch.setattr(skilltree, "_prototypes", None)
+        monkeypatch.setattr(skilltree, "_shared_subtypes", None)
+        player = Player()
+        owned = {id(player)} | {
+            id(value)
+            for value in vars(player).values()
+            if not isinstance(value, (int, float, str, type(None)))
+        }
+
+        for prototype in skilltree._prototypes.values():
+            assert not [attr for attr, value in vars(prototype).items() if id(value) in owned]
+
+    def test_tree_matches_the_cost_table(self):
+        player = Player()
+
+        for category, costs in skilltree.SKILL_COSTS.items():
+            assert {type(s): exp for s, exp in player.skilltree.subtypes[category].items()} == costs
+
+    def test_a_class_in_several_categories_has_one_prototype(self):
+        player = Player()
+
+        assert _entry(player, "Dagger", "QuickSwap")[0] is _entry(player, "Axe", "QuickSwap")[0]
+        assert _entry(player, "Dagger", "QuickSwap")[1] == 450
+        assert _entry(player, "Axe", "QuickSwap")[1] == 520
+
+    def test_building_the_table_leaves_the_global_rng_alone(self, monkeypatch):
+        monkeypatch.setattr(skilltree, "_prototypes", None)
+        monkeypatch.setattr(skilltree, "_shared_subtypes", None)
+        random.seed(5)
+        expected = random.random()
+        random.seed(5)
+
+        Player()
+
+        assert random.random() == expected
+
+
+class TestLearning:
+    def test_learn_skill_adds_an_owned_instance(self):
+        player = Player()
+        prototype, _ = _entry(player, "Dagger", "Backstab")
+
+        learned = player.learn_skill(prototype)
+
+        assert learned is not prototype
+        assert type(learned) is type(prototype)
+        assert learned.user is player
+        assert learned in player.known_moves
+        assert prototype.user is None
+
+    def test_learn_skill_keeps_an_owned_move_as_is(self):
+        player = Player()
+        move = type(_entry(player, "Dagger", "Backstab")[0])(player)
+
+        assert player.learn_skill(move) is move
+
+    def test_learn_all_skills_binds_every_move_to_the_player(self):
+        player = Player()
+
+        learn_all_skills_from_skilltree(player)
+
+        assert not any(skilltree.is_prototype(m) for m in player.known_moves)
+        assert all(m.user is player for m in player.known_moves if hasattr(m, "user"))
+
+
+class TestPickling:
+    def test_tree_pickles_without_its_moves_and_comes_back_whole(self):
+        player = Player()
+
+        data = pickle.dumps(player.skilltree)
+        restored = pickle.loads(data)
+
+        assert b"Slash" not in data
+        assert restored.subtypes == player.skilltree.subtypes
+
+    def test_restoring_first_builds_the_table_without_a_player(self, monkeypatch):
+        data = pickle.dumps(Player().skilltree)
+        monkeypatch.setattr(skilltree, "_prototypes", None)
+        monkeypatch.setattr(skilltree, "_shared_subtypes", None)
+
+        def no_player(self, *args, **kwargs):
+            raise AssertionError("unpickling a skill tree must not build a Player")
+
+        monkeypatch.setattr(Player, "__init__", no_player)
+        restored = pickle.loads(data)
+
+        assert {c: {type(s): exp for s, exp in skills.items()} for c, skills in restored.subtypes.items()} == skilltree.SKILL_COSTS
+
+    def test_legacy_state_with_per_player_moves_is_replaced(self):
+        player = Player()
+        legacy = skilltree.Skilltree.__new__(skilltree.Skilltree)
+
+        legacy.__setstate__({"subtypes": {"Dagger": {type(_entry(player, "Dagger", "Slash")[0])(player): 15}}})
+
+        assert legacy.subtypes == player.skilltree.subtypes
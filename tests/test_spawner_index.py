@@ -0,0 +1,132 @@
+"""Tests for the per-map spawner index behind Universe._evaluate_map_entry_spawners.
+
+The tick pass walks only the events that expose ``evaluate_for_map_entry``;
+these tests pin that the index follows EventList mutations, retires spent
+one-shots, and never evaluates anything a full tile scan wouldn't have.
+"""
+
+import pickle
+
+from src.tiles import EventList, MapTile
+from src.universe import Universe
+
+
+class Spawner:
+    def __init__(self, repeat=False):
+        self.has_run = False
+        self.repeat = repeat
+        self.calls = 0
+
+    def evaluate_for_map_entry(self, player):
+        self.calls += 1
+
+
+class Plain:
+    """An event with no map-entry hook; must never be indexed."""
+
+
+class Player:
+    in_combat = False
+
+    def __init__(self, game_map):
+        self.map = game_map
+
+    def cycle_states(self):
+        pass
+
+
+def _world(width=3):
+    universe = Universe()
+    game_map = {"name": "index-test"}
+    for x in range(width):
+        game_map[(x, 0)] = MapTile(universe, game_map, x, 0)
+    universe.player = Player(game_map)
+    return universe, game_map
+
+
+def test_events_here_is_an_event_list():
+    _, game_map = _world()
+
+    assert isinstance(game_map[(0, 0)].events_here, EventList)
+
+
+def test_only_spawners_are_indexed():
+    universe, game_map = _world()
+    spawner = Spawner()
+    game_map[(1, 0)].events_here.extend([Plain(), spawner])
+
+    universe._evaluate_map_entry_spawners()
+
+    index = universe._spawner_index(game_map)
+    assert [ev for _, ev in index.candidates()] == [spawner]
+    assert spawner.calls == 1
+
+
+def test_index_follows_appends_and_removals():
+    universe, game_map = _world()
+    universe._evaluate_map_entry_spawners()  # build the index while empty
+    spawner = Spawner(repeat=True)
+
+    game_map[(2, 0)].events_here.append(spawner)
+    universe._evaluate_map_entry_spawners(process_repeats=True)
+    game_map[(2, 0)].events_here.remove(spawner)
+    universe._evaluate_map_entry_spawners(process_repeats=True)
+
+    assert spawner.calls == 1
+    assert universe._spawner_index(game_map).candidates() == []
+
+
+def test_spent_one_shot_is_retired():
+    universe, game_map = _world()
+    spawner = Spawner()
+    game_map[(0, 0)].events_here.append(spawner)
+    universe._evaluate_map_entry_spawners()
+    spawner.has_run = True
+
+    universe._evaluate_map_entry_spawners(process_repeats=True)
+
+    assert spawner.calls == 1
+    assert universe._spawner_index(game_map).candidates() == []
+
+
+def test_map_entry_reindexes_a_reset_one_shot():
+    universe, game_map = _world()
+    spawner = Spawner()
+    spawner.has_run = True
+    game_map[(0, 0)].events_here.append(spawner)
+    universe._evaluate_map_entry_spawners()  # retires it
+    spawner.has_run = False
+
+    universe.touch_map(game_map)
+    universe._evaluate_map_entry_spawners()
+
+    assert spawner.calls == 1
+
+
+def test_plain_list_tiles_are_still_scanned():
+    universe = Universe()
+
+    class Tile:
+        events_here = []
+
+    tile = Tile()
+    game_map = {"name": "doubles", (0, 0): tile}
+    universe.player = Player(game_map)
+    universe._evaluate_map_entry_spawners()
+    spawner = Spawner()
+
+    tile.events_here.append(spawner)
+    universe._evaluate_map_entry_spawners()
+
+    assert spawner.calls == 1
+
+
+def test_index_is_not_pickled():
+    universe, game_map = _world()
+    game_map[(0, 0)].events_here.append(Plain())
+    universe._evaluate_map_entry_spawners()
+
+    restored = pickle.loads(pickle.dumps(universe))
+
+    assert restored._spawner_indexes == {}
+    assert isinstance(restored.player.map[(0, 0)].events_here, EventList)
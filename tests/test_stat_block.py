@@ -0,0 +1,171 @@
+"""StatBlock, the array-backed resistance map on every combatant.
+
+It replaces four dicts per combatant, so the contract pinned here is "behaves
+like the dict it replaced" plus the bulk operations reset_stats() and the
+stat-bonus cache rely on.
+"""
+
+import copy
+import math
+import pickle
+
+import pytest
+
+import src.functions as functions
+from src.combatant import StatBlock, _DEFAULT_RESISTANCE, _DEFAULT_STATUS_RESISTANCE
+
+
+def _block(**values):
+    return StatBlock(values)
+
+
+class TestMappingBehaviour:
+    def test_reads_and_writes_like_a_dict(self):
+        block = _block(fire=1.0, ice=0.5)
+
+        block["fire"] = 2
+        block["ice"] += 0.25
+
+        assert block["fire"] == 2.0
+        assert block["ice"] == 0.75
+        assert block.get("shock") is None
+        assert block.get("shock", 1.0) == 1.0
+        assert list(block) == ["fire", "ice"]
+        assert len(block) == 2
+        assert "fire" in block and "shock" not in block
+        with pytest.raises(KeyError):
+            block["shock"]
+
+    def test_equals_plain_dicts_both_ways(self):
+        block = StatBlock(_DEFAULT_RESISTANCE)
+
+        assert block == _DEFAULT_RESISTANCE
+        assert _DEFAULT_RESISTANCE == block
+        assert dict(block) == _DEFAULT_RESISTANCE
+        assert block != dict(_DEFAULT_RESISTANCE, fire=0.5)
+
+    def test_zero_and_negative_zero_are_equal(self):
+        assert _block(fire=0.0) == _block(fire=-0.0)
+
+    def test_keys_outside_the_layout_and_non_numbers_still_work(self):
+        block = _block(fire=1.0)
+
+        block["plasma"] = 3.0
+        block["fire"] = "immune"
+
+        assert block["plasma"] == 3.0
+        assert block["fire"] == "immune"
+        assert dict(block) == {"fire": "immune", "plasma": 3.0}
+
+        block["fire"] = 0.5
+        assert dict(block) == {"fire": 0.5, "plasma": 3.0}
+
+    def test_delete_and_clear(self):
+        block = StatBlock(_DEFAULT_STATUS_RESISTANCE)
+
+        del block["stun"]
+        assert "stun" not in block
+        assert len(block) == len(_DEFAULT_STATUS_RESISTANCE) - 1
+        with pytest.raises(KeyError):
+            del block["stun"]
+
+        block.clear()
+        assert dict(block) == {}
+
+        block.update(_DEFAULT_STATUS_RESISTANCE)
+        assert block == _DEFAULT_STATUS_RESISTANCE
+
+    def test_copies_are_independent(self):
+        block = StatBlock(_DEFAULT_RESISTANCE)
+
+        for clone in (block.copy(), copy.copy(block), copy.deepcopy(block)):
+            clone["fire"] = 9.0
+            assert block["fire"] == 1.0
+            assert clone["fire"] == 9.0
+
+
+class TestBulkOperations:
+    def test_reset_to_matches_clear_and_update(self):
+        base = StatBlock(_DEFAULT_RESISTANCE)
+        base["fire"] = 0.5
+        live = base.copy()
+        live["ice"] = 3.0
+        del live["pure"]
+        live["plasma"] = 1.0
+
+        live.reset_to(base)
+
+        assert live == base
+        assert list(live) == list(base)
+
+    def test_reset_to_a_plain_dict(self):
+        live = StatBlock(_DEFAULT_RESISTANCE)
+
+        live.reset_to({"fire": 0.5})
+
+        assert dict(live) == {"fire": 0.5}
+
+    def test_clamp_min_skips_nan_and_absent_slots(self):
+        block = _block(fire=math.nan, ice=-1.0, shock=0.5)
+        del block["shock"]
+        block["plasma"] = -2.0
+
+        block.clamp_min(0.0)
+
+        assert math.isnan(block["fire"])
+        assert block["ice"] == 0.0
+        assert block["plasma"] == 0.0
+        assert "shock" not in block
+
+
+class TestPickling:
+    def test_round_trip(self):
+        block = StatBlock(_DEFAULT_STATUS_RESISTANCE)
+        del block["stun"]
+        block["plasma"] = "odd"
+
+        restored = pickle.loads(pickle.dumps(block))
+
+        assert restored == block
+        assert list(restored) == list(block)
+
+    def test_equal_blocks_are_written_once_per_pickle(self):
+        one = StatBlock(_DEFAULT_STATUS_RESISTANCE)
+        many = [one.copy() for _ in range(10)]
+
+        assert len(pickle.dumps(many)) < 2 * len(pickle.dumps([one]))
+        assert pickle.loads(pickle.dumps(many)) == many
+
+    def test_legacy_combatant_dicts_are_packed_on_load(self, make_npc):
+        npc = make_npc()
+        state = npc.__getstate__()
+        for attr in ("resistance", "resistance_base", "status_resistance", "status_resistance_base"):
+            state[attr] = dict(state[attr])
+        legacy = type(npc).__new__(type(npc))
+
+        legacy.__setstate__(state)
+
+        assert type(legacy.resistance) is StatBlock
+        assert type(legacy.status_resistance_base) is StatBlock
+        assert legacy.status_resistance == npc.status_resistance
+
+
+class TestCombatants:
+    def test_combatants_store_statblocks(self, make_npc):
+        npc = make_npc()
+
+        for attr in ("resistance", "resistance_base", "status_resistance", "status_resistance_base"):
+            assert type(getattr(npc, attr)) is StatBlock
+        assert npc.status_resistance is not npc.status_resistance_base
+
+    def test_refresh_merges_bonuses_and_the_cache_sees_direct_writes(self, make_npc):
+        npc = make_npc()
+        npc.states.append(type("Ward", (), {"add_resistance": {"fire": -0.5, "plasma": 1.0}})())
+
+        functions.refresh_stat_bonuses(npc)
+        assert npc.resistance["fire"] == 0.5
+        assert "plasma" not in npc.resistance
+
+        npc.resistance["fire"] = 7.0
+        functions.ensure_stat_bonuses(npc)
+        assert npc.resistance["fire"] == 0.5
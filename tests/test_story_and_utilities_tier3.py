@@ -175,7 +175,7 @@ class TestCh01StartOpenWall(unittest.TestCase):
             player=self.player, tile=self.tile, repeat=True
         )
 
-        with patch("src.story.ch01.time.sleep"):
+        with patch("src.story.ch01.pause"):
             event.process()
 
         self.assertEqual(self.tile.block_exit, [])
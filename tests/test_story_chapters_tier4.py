@@ -256,7 +256,7 @@ class TestCh01StartOpenWall(unittest.TestCase):
         self.tile.objects_here = [wall_depression]
 
         with patch('src.story.ch01.cprint'):
-            with patch('src.story.ch01.time.sleep'):
+            with patch('src.story.ch01.pause'):
                 event.process()
 
         self.assertNotIn("east", self.tile.block_exit)
@@ -269,7 +269,7 @@ class TestCh01StartOpenWall(unittest.TestCase):
         self.tile.objects_here = [wall_depression]
 
         with patch('src.story.ch01.cprint'):
-            with patch('src.story.ch01.time.sleep'):
+            with patch('src.story.ch01.pause'):
                 event.process()
 
         self.assertNotIn(wall_depression, self.tile.objects_here)
@@ -308,7 +308,7 @@ class TestCh01StartOpenWall(unittest.TestCase):
         self.tile.objects_here = [wall_depression]
 
         with patch('src.story.ch01.cprint'):
-            with patch('src.story.ch01.time.sleep'):
+            with patch('src.story.ch01.pause'):
                 event.process()
 
         self.assertEqual(event.delay_duration, 2000)
@@ -358,7 +358,7 @@ class TestCh01BridgeWall(unittest.TestCase):
         self.tile.objects_here = [wall_depression]
 
         with patch('src.story.ch01.cprint'):
-            with patch('src.story.ch01.time.sleep'):
+            with patch('src.story.ch01.pause'):
                 event.process()
 
         self.assertNotIn("east", self.tile.block_exit)
@@ -371,7 +371,7 @@ class TestCh01BridgeWall(unittest.TestCase):
         self.tile.objects_here = [wall_depression]
 
         with patch('src.story.ch01.cprint'):
-            with patch('src.story.ch01.time.sleep'):
+            with patch('src.story.ch01.pause'):
                 event.process()
 
         self.assertIn("doorway", self.tile.description)
@@ -384,7 +384,7 @@ class TestCh01BridgeWall(unittest.TestCase):
         self.tile.objects_here = [wall_depression]
 
         with patch('src.story.ch01.cprint'):
-            with patch('src.story.ch01.time.sleep'):
+            with patch('src.story.ch01.pause'):
                 event.process()
 
         # Wall depression should be removed (after description if it exists)
@@ -488,7 +488,7 @@ class TestCh01ChestRumblerBattle(unittest.TestCase):
         event = Ch01ChestRumblerBattle(self.player, self.tile)
         event.tile.events_here = [event]
         with patch('src.story.ch01.cprint'):
-            with patch('src.story.ch01.time.sleep'):
+            with patch('src.story.ch01.pause'):
                 event.process(user_input="continue")
 
         self.tile.spawn_npc.assert_called_once_with("RockRumbler")
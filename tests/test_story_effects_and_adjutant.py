@@ -115,7 +115,7 @@ class TestMemoryFlash:
     def test_process_first_pass_sets_needs_input(self, mock_player, mock_tile):
         flash = self._make_flash(mock_player, mock_tile)
         with (
-            patch("src.story.effects.time.sleep"),
+            patch("src.story.effects.pause"),
             patch("src.story.effects.cprint"),
             patch("src.story.effects.memory_border"),
         ):
@@ -127,7 +127,7 @@ class TestMemoryFlash:
     def test_process_first_pass_builds_description(self, mock_player, mock_tile):
         flash = self._make_flash(mock_player, mock_tile)
         with (
-            patch("src.story.effects.time.sleep"),
+            patch("src.story.effects.pause"),
             patch("src.story.effects.cprint"),
             patch("src.story.effects.memory_border"),
         ):
@@ -317,7 +317,7 @@ class TestStMichael:
     def test_process_first_pass_sets_needs_input(self, mock_player, mock_tile):
         event = self._make_event(mock_player, mock_tile)
         with (
-            patch("src.story.effects.time.sleep"),
+            patch("src.story.effects.pause"),
             patch("src.story.effects.cprint"),
         ):
             event.process(user_input=None)
@@ -557,7 +557,7 @@ class TestPulsingGlandEvent:
 
         event = PulsingGlandEvent(player=mock_player, tile=mock_tile)
         event.spawn_tile = mock_tile
-        with patch("src.story.effects.time.sleep"):
+        with patch("src.story.effects.pause"):
             event.process()
         captured = capsys.readouterr()
         assert "gland" in captured.out.lower() or "slime" in captured.out.lower()
@@ -569,7 +569,7 @@ class TestPulsingGlandEvent:
         event = PulsingGlandEvent(player=mock_player, tile=mock_tile)
         event.has_run = True
         with patch.object(event, "_do_spawn") as mock_spawn:
-            with patch("src.story.effects.time.sleep"):
+            with patch("src.story.effects.pause"):
                 event.process()
         mock_spawn.assert_not_called()
 
@@ -613,7 +613,7 @@ class TestWhisperingStatue:
         statue.tile = mock_tile
         mock_tile.events_here = [statue]
         with (
-            patch("src.story.effects.time.sleep"),
+            patch("src.story.effects.pause"),
             patch("src.story.effects.cprint"),
         ):
             statue.process(user_input="1")
@@ -625,7 +625,7 @@ class TestWhisperingStatue:
         statue.tile = mock_tile
         mock_tile.events_here = [statue]
         with (
-            patch("src.story.effects.time.sleep"),
+            patch("src.story.effects.pause"),
             patch("src.story.effects.cprint"),
         ):
             statue.process(user_input="2")
@@ -637,7 +637,7 @@ class TestWhisperingStatue:
         statue.tile = mock_tile
         mock_tile.events_here = [statue]
         with (
-            patch("src.story.effects.time.sleep"),
+            patch("src.story.effects.pause"),
             patch("src.story.effects.cprint"),
         ):
             statue.process(user_input="1")
@@ -648,7 +648,7 @@ class TestWhisperingStatue:
         statue.tile = mock_tile
         mock_tile.events_here = [statue]
         with (
-            patch("src.story.effects.time.sleep"),
+            patch("src.story.effects.pause"),
             patch("src.story.effects.cprint"),
         ):
             statue.process(user_input="")
@@ -663,7 +663,7 @@ class TestWhisperingStatue:
         slime.awareness = 10
         mock_tile.spawn_npc.return_value = slime
         with (
-            patch("src.story.effects.time.sleep"),
+            patch("src.story.effects.pause"),
             patch("src.story.effects.cprint"),
         ):
             statue.process(user_input="3")
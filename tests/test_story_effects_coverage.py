@@ -108,7 +108,7 @@ def test_memory_flash_edge_cases():
 
     # check_conditions() calls pass_conditions_to_process() -> process(user_input=None),
     # which sets needs_input=True. Patch all I/O before calling it.
-    with patch('src.story.effects.cprint'), patch('src.story.effects.time.sleep'), \
+    with patch('src.story.effects.cprint'), patch('src.story.effects.pause'), \
             patch('src.animations.animate_to_main_screen'):
 
         # 1. check_conditions / first-pass process (user_input=None)
@@ -345,7 +345,7 @@ def test_st_michael_shrine(capsys):
     assert len(ev.get_input_options()) == 3
     
     # process with user_input = None (CLI presentation path)
-    with patch('src.story.effects.time.sleep'), patch('src.story.effects.cprint'):
+    with patch('src.story.effects.pause'), patch('src.story.effects.cprint'):
         ev.process(user_input=None)
         assert ev.needs_input is True
         
@@ -645,7 +645,7 @@ def test_whispering_statue_correct_answer():
 
     # check_conditions triggers process chain (it calls pass_conditions_to_process)
     # We test process() directly in API mode instead to avoid terminal input()
-    with patch('src.story.effects.cprint'), patch('src.story.effects.time.sleep'):
+    with patch('src.story.effects.cprint'), patch('src.story.effects.pause'):
         ev.process(user_input="1")  # correct answer
         assert ev.completed is True
         assert ev.needs_input is False
@@ -662,7 +662,7 @@ def test_whispering_statue_wrong_answer():
     ev = WhisperingStatue(player, tile)
     tile.events_here.append(ev)
 
-    with patch('src.story.effects.cprint'), patch('src.story.effects.time.sleep'):
+    with patch('src.story.effects.cprint'), patch('src.story.effects.pause'):
         ev.process(user_input="2")  # wrong answer
         assert ev.completed is True
         # A Slime should have been spawned (wrong answer punishment)
@@ -678,7 +678,7 @@ def test_whispering_statue_empty_choice_defaults():
     ev = WhisperingStatue(player, tile)
     tile.events_here.append(ev)
 
-    with patch('src.story.effects.cprint'), patch('src.story.effects.time.sleep'):
+    with patch('src.story.effects.cprint'), patch('src.story.effects.pause'):
         ev.process(user_input="")  # empty → defaults to "1"
         assert ev.completed is True
         assert any(item.name == "Gold" for item in tile.spawned_items)
@@ -692,7 +692,7 @@ def test_whispering_statue_repeat_stays_in_tile():
     ev = WhisperingStatue(player, tile, repeat=True)
     tile.events_here.append(ev)
 
-    with patch('src.story.effects.cprint'), patch('src.story.effects.time.sleep'):
+    with patch('src.story.effects.cprint'), patch('src.story.effects.pause'):
         ev.process(user_input="1")
         assert ev in tile.events_here
 
@@ -711,7 +711,7 @@ def test_whispering_statue_check_conditions():
     ev = WhisperingStatue(player, tile)
     tile.events_here.append(ev)
 
-    with patch('src.story.effects.time.sleep'):
+    with patch('src.story.effects.pause'):
         ev.check_conditions()
 
     assert ev.completed is True
@@ -800,7 +800,7 @@ def test_whispering_statue_cli_eoferror_fallback():
     ev = WhisperingStatue(player, tile)
     tile.events_here.append(ev)
 
-    with patch('src.story.effects.cprint'), patch('src.story.effects.time.sleep'), \
+    with patch('src.story.effects.cprint'), patch('src.story.effects.pause'), \
             patch('builtins.input', side_effect=EOFError):
         ev.process(user_input=None)
         assert ev.completed is True
@@ -0,0 +1,111 @@
+"""Tests for the bounded, coalescing combat-suggestion pool."""
+
+import threading
+import time
+
+from src.api.suggestion_pool import SuggestionPool
+
+
+class _Gate:
+    """A job that blocks until released, recording that it ran."""
+
+    def __init__(self, log, name):
+        self.log = log
+        self.name = name
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.started.set()
+        self.release.wait(5)
+        self.log.append(self.name)
+
+
+def _drain(pool, timeout=5):
+    """Wait until every worker has run out of work and exited."""
+    deadline = time.monotonic() + timeout
+    while pool.stats()["workers"]:
+        assert time.monotonic() < deadline, pool.stats()
+        time.sleep(0.005)
+
+
+def test_queued_job_for_a_key_is_replaced_not_run():
+    pool = SuggestionPool(max_workers=1)
+    ran = []
+    blocker = _Gate(ran, "blocker")
+    pool.submit("other", blocker)
+    assert blocker.started.wait(5)
+
+    pool.submit("s1", lambda: ran.append("gen1"))
+    pool.submit("s1", lambda: ran.append("gen2"))
+    blocker.release.set()
+    _drain(pool)
+
+    assert ran == ["blocker", "gen2"]
+    assert pool.stats()["coalesced"] == 1
+
+
+def test_one_running_job_per_key():
+    pool = SuggestionPool(max_workers=4)
+    ran = []
+    first = _Gate(ran, "first")
+    pool.submit("s1", first)
+    assert first.started.wait(5)
+
+    second = threading.Event()
+    pool.submit("s1", second.set)
+
+    # Free workers exist, but the key's next job waits for the running one.
+    assert not second.wait(0.1)
+    first.release.set()
+    assert second.wait(5)
+
+
+def test_worker_count_is_bounded():
+    pool = SuggestionPool(max_workers=2)
+    ran = []
+    gates = [_Gate(ran, f"s{i}") for i in range(5)]
+    for i, gate in enumerate(gates):
+        pool.submit(f"s{i}", gate)
+    assert gates[0].started.wait(5) and gates[1].started.wait(5)
+
+    stats = pool.stats()
+    assert stats["workers"] == 2
+    assert stats["running"] == 2
+    assert stats["pending"] == 3
+
+    for gate in gates:
+        gate.release.set()
+    _drain(pool)
+    assert sorted(ran) == [f"s{i}" for i in range(5)]
+
+
+def test_saturated_pool_rejects_new_keys():
+    pool = SuggestionPool(max_workers=1, max_pending=2)
+    ran = []
+    blocker = _Gate(ran, "blocker")
+    pool.submit("busy", blocker)
+    assert blocker.started.wait(5)
+
+    assert pool.submit("a", lambda: None)
+    assert pool.submit("b", lambda: None)
+    assert not pool.submit("c", lambda: None)
+    # A key that is already waiting can still be refreshed.
+    assert pool.submit("a", lambda: None)
+
+    assert pool.stats()["rejected"] == 1
+    blocker.release.set()
+
+
+def test_failing_job_does_not_stop_the_worker():
+    pool = SuggestionPool(max_workers=1)
+
+    def boom():
+        raise RuntimeError("llm down")
+
+    pool.submit("s1", boom)
+    _drain(pool)
+
+    stats = pool.stats()
+    assert stats["failed"] == 1
+    assert stats["workers"] == 0
@@ -21,7 +21,7 @@ class TestWhisperingStatue(unittest.TestCase):
         self.tile.events_here = []
         self.event = WhisperingStatue(self.player, self.tile)
         self.tile.events_here.append(self.event)
-        sleep_patcher = patch('src.story.effects.time.sleep')
+        sleep_patcher = patch('src.story.effects.pause')
         sleep_patcher.start()
         self.addCleanup(sleep_patcher.stop)
 
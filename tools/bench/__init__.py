@@ -0,0 +1 @@
+"""Heart of Virtue API benchmark suite (run via tools/benchmark.py)."""
@@ -0,0 +1,198 @@
+"""Benchmarks for the API hot paths.
+
+Each benchmark drives the real Flask app in-process through the harness
+GameClient (or the service it wraps), exactly as tools/bug_hunt.py does, so
+the numbers include routing, session lookup and JSON encoding.
+"""
+
+import io
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.functions import _safe_pickle_load
+from src.secure_pickle import serialize_for_save
+from tools.harness.client import GameClient
+
+_REVERSE = {"north": "south", "south": "north", "east": "west", "west": "east"}
+
+
+class BenchmarkError(RuntimeError):
+    """A benchmark's precondition failed, so its numbers would be meaningless."""
+
+
+class Benchmark(ABC):
+    name: str = "base"
+    description: str = ""
+
+    def setup(self, app) -> None:
+        """Prepare state once, outside the timed region."""
+
+    @abstractmethod
+    def run(self) -> None:
+        """One timed call."""
+
+    def after_each(self) -> None:
+        """Untimed cleanup after every call."""
+
+    def teardown(self) -> None:
+        """Release anything setup() created."""
+
+
+class _SessionBenchmark(Benchmark):
+    """Base for benchmarks that act as one logged-in player."""
+
+    def setup(self, app) -> None:
+        self.app = app
+        self.client = GameClient(app)
+        self.client.create_session(f"bench_{self.name}")
+        self.player = app.session_manager.get_player(self.client.session_id)
+
+    def teardown(self) -> None:
+        self.client.destroy_session()
+
+    def _expect_ok(self, response, what):
+        if response.status_code >= 300:
+            raise BenchmarkError(
+                f"{what} returned {response.status_code}: {self.client.parse(response)}"
+            )
+
+
+class CreateSessionBench(Benchmark):
+    name = "create_session"
+    description = "SessionManager.create_session (new player + universe build)."
+
+    def setup(self, app) -> None:
+        self.sessions = app.session_manager
+        self._last = None
+
+    def run(self) -> None:
+        self._last, _ = self.sessions.create_session("bench_create")
+
+    def after_each(self) -> None:
+        if self._last:
+            self.sessions.expire_session(self._last)
+            self._last = None
+
+
+class WorldMoveBench(_SessionBenchmark):
+    name = "world_move"
+    description = "POST /api/world/move, stepping back and forth between two tiles."
+
+    def setup(self, app) -> None:
+        super().setup(app)
+        self._steps = self._find_round_trip()
+        self._i = 0
+
+    def _find_round_trip(self) -> List[str]:
+        for direction, back in _REVERSE.items():
+            there = self.client.post("/api/world/move", json={"direction": direction})
+            if there.status_code != 200:
+                continue
+            home = self.client.post("/api/world/move", json={"direction": back})
+            if home.status_code == 200:
+                return [direction, back]
+        raise BenchmarkError("no walkable round trip from the starting tile")
+
+    def run(self) -> None:
+        direction = self._steps[self._i % 2]
+        self._i += 1
+        self._expect_ok(
+            self.client.post("/api/world/move", json={"direction": direction}),
+            f"move {direction}",
+        )
+
+
+class TilesBatchBench(_SessionBenchmark):
+    name = "world_tiles_batch"
+    description = "POST /api/world/tiles/batch for the 3x3 block around the player."
+
+    def setup(self, app) -> None:
+        super().setup(app)
+        x, y = self.player.location_x, self.player.location_y
+        self._body = {
+            "coordinates": [
+                {"x": x + dx, "y": y + dy} for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+            ]
+        }
+
+    def run(self) -> None:
+        self._expect_ok(
+            self.client.post("/api/world/tiles/batch", json=self._body), "tiles/batch"
+        )
+
+
+class CombatCommandBench(_SessionBenchmark):
+    name = "combat_process_command"
+    description = "ApiCombatAdapter.process_command for a full no-target move (Check)."
+
+    def setup(self, app) -> None:
+        super().setup(app)
+        tile = self.player.current_room or self.player.universe.get_tile(
+            self.player.location_x, self.player.location_y
+        )
+        enemy = tile.spawn_npc("Slime")
+        # Neither side may die mid-run, or the adapter stops accepting input.
+        enemy.maxhp = enemy.hp = 10**9
+        self.player.maxhp = self.player.hp = 10**9
+        self._expect_ok(
+            self.client.post("/api/combat/start", json={"enemy_id": str(id(enemy))}),
+            "combat/start",
+        )
+        self.adapter = self.player._combat_adapter
+        self._command = {"type": "select_move", "move_index": self._move_index("Check")}
+        # The adapter emits over SocketIO, which needs an app context.
+        self._ctx = app.app_context()
+        self._ctx.push()
+
+    def _move_index(self, move_name) -> int:
+        for i, option in enumerate(self.adapter.available_options):
+            if isinstance(option, dict) and option.get("name") == move_name:
+                return option.get("index", i)
+        raise BenchmarkError(f"combat move {move_name!r} not offered")
+
+    def run(self) -> None:
+        result = self.adapter.process_command(self._command)
+        if result.get("error"):
+            raise BenchmarkError(f"process_command: {result['error']}")
+
+    def teardown(self) -> None:
+        self._ctx.pop()
+        super().teardown()
+
+
+class SaveSerializeBench(_SessionBenchmark):
+    name = "save_serialize"
+    description = "secure_pickle.serialize_for_save of a fresh session's player."
+
+    def run(self) -> None:
+        serialize_for_save(self.player)
+
+
+class SaveLoadBench(_SessionBenchmark):
+    name = "save_load"
+    description = "functions._safe_pickle_load of that save (verify + restricted unpickle)."
+
+    def setup(self, app) -> None:
+        super().setup(app)
+        self._blob = serialize_for_save(self.player)
+
+    def run(self) -> None:
+        if _safe_pickle_load(io.BytesIO(self._blob)) is None:
+            raise BenchmarkError("save failed to load")
+
+
+_ALL_BENCHMARKS = [
+    CreateSessionBench,
+    WorldMoveBench,
+    TilesBatchBench,
+    CombatCommandBench,
+    SaveSerializeBench,
+    SaveLoadBench,
+]
+
+
+def get_benchmarks(name: Optional[str] = None) -> List[Benchmark]:
+    """Return fresh instances of all benchmarks, or only the named one."""
+    if name:
+        return [cls() for cls in _ALL_BENCHMARKS if cls.name == name]
+    return [cls() for cls in _ALL_BENCHMARKS]
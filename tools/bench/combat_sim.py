@@ -0,0 +1,294 @@
+"""Headless, seeded combat simulation for balance runs and engine throughput.
+
+Drives the real combat engine -- :class:`ApiCombatAdapter`'s beat machinery,
+``Move.cast``/``Move.advance`` and ``NPC.select_move`` -- without Flask, a
+session, narration capture or socket emits. Each fight is seeded, so a
+``(scenario, seed)`` pair always replays the same fight, and fights are
+independent, so a batch fans out across a :mod:`multiprocessing` pool.
+
+The player is driven by a small autopilot: whenever it has no move in
+flight it picks, uniformly at random, one of its ready moves that has a target
+in range (preferring damaging moves), aimed at the nearest enemy; with none in
+range it closes the gap with Advance, or opens it with Withdraw when enemies
+are inside the weapon's minimum reach.
+"""
+
+import math
+import multiprocessing
+import os
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+# Silence Mynx LLM calls before anything imports the chat stack.
+os.environ.setdefault("MYNX_LLM_ENABLED", "0")
+os.environ.setdefault("MYNX_FALLBACK_DELAY", "0")
+os.environ.setdefault("MYNX_LLM_PROVIDER", "none")
+
+import src.items as items  # noqa: E402
+import src.npc as npc_module  # noqa: E402
+from src.api.combat_adapter import ApiCombatAdapter  # noqa: E402
+from src.narration import capture_narration  # noqa: E402
+from src.player import Player  # noqa: E402
+from src.tiles import MapTile  # noqa: E402
+
+from tools.bench.runner import percentile  # noqa: E402
+
+# Player moves that need an extra prompt (a duration or a heading) in the UI;
+# the autopilot never picks them.
+_PROMPTED_MOVES = frozenset({"Turn", "Check", "Use Item"})
+
+DEFAULT_MAX_BEATS = 300
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One matchup: the enemy classes (names in ``src.npc``) and the player's weapon."""
+
+    name: str
+    enemies: Sequence[str]
+    weapon: Optional[str] = None  # an item class name in src.items
+    max_beats: int = DEFAULT_MAX_BEATS
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "slime": Scenario("slime", ("Slime",), weapon="Longsword"),
+    "slime_pack": Scenario("slime_pack", ("Slime", "Slime", "Slime"), weapon="Longsword"),
+    "bats": Scenario("bats", ("CaveBat", "CaveBat"), weapon="Longsword"),
+    "mixed": Scenario("mixed", ("Slime", "CaveBat", "Slime"), weapon="Dagger"),
+}
+
+
+@dataclass
+class FightResult:
+    seed: int
+    outcome: str  # "win", "loss" or "timeout"
+    beats: int
+    seconds: float
+    player_hp: int
+
+
+@dataclass
+class SimReport:
+    scenario: str
+    fights: int
+    workers: int
+    wins: int
+    losses: int
+    timeouts: int
+    beats_mean: float
+    beats_p50: float
+    beats_p95: float
+    beats_total: int
+    wall_seconds: float
+    beats_per_second: float
+    fights_per_second: float
+    results: List[FightResult] = field(default_factory=list, repr=False)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.fights if self.fights else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.pop("results")
+        data["win_rate"] = self.win_rate
+        return data
+
+
+class HeadlessCombatAdapter(ApiCombatAdapter):
+    """The API adapter with everything that exists only for the client removed.
+
+    Narration, the combat log, animation events, suggestion fetching, beat
+    streaming and state serialization are all no-ops; the rules -- distance
+    sync, NPC turns, state cycling, heat -- are the inherited ones.
+    """
+
+    @contextmanager
+    def _capture_output(self):
+        yield
+
+    def _add_log_entry(self, *args, **kwargs):
+        pass
+
+    def _emit_animation_log(self, beat, animation_data):
+        pass
+
+    def refresh_suggestions(self):
+        pass
+
+    def _maybe_init_streamer(self, initial_state):
+        pass
+
+    def _get_available_moves(self):
+        return []
+
+    def get_combat_state(self):
+        return {}
+
+
+def _build_fight(scenario: Scenario):
+    """Create a fresh player and enemies and wire them into one encounter."""
+    arena = MapTile(None, None, 0, 0, "Simulation arena")
+    player = Player()
+    player.current_room = arena
+    if scenario.weapon:
+        player.eq_weapon = getattr(items, scenario.weapon)()
+    enemies = [getattr(npc_module, name)() for name in scenario.enemies]
+    arena.npcs_here = list(enemies)
+
+    player.friend = True
+    player.in_combat = True
+    player.combat_list = list(enemies)
+    player.combat_list_allies = [player]
+    for enemy in enemies:
+        enemy.friend = False
+        enemy.in_combat = True
+        enemy.combat_list = [player]
+        enemy.combat_list_allies = list(enemies)
+
+    adapter = HeadlessCombatAdapter(player)
+    adapter.initialize_combat(enemies)
+    return adapter, player
+
+
+def _choose_move(adapter, player, rng):
+    """Pick the autopilot's next move and target, or ``(None, None)`` to idle."""
+    ready = [
+        m for m in player.known_moves
+        if m.current_stage == 0
+        and m.name not in _PROMPTED_MOVES
+        and not getattr(m, "needs_duration", False)
+        and m.fatigue_cost <= player.fatigue
+        and m.viable()
+    ]
+    in_range = []
+    for move in ready:
+        if not move.targeted:
+            continue
+        targets = adapter._get_available_targets(move)
+        enemies = [t for t in targets if not t["is_ally"]]
+        if enemies:
+            in_range.append((move, enemies[0]["id"]))
+    if in_range:
+        damaging = [pair for pair in in_range if adapter._move_deals_damage(pair[0])]
+        move, target_id = rng.choice(damaging or in_range)
+        return move, adapter._lookup_combatant(target_id)
+    # Nothing in range: close the distance, or back off if every enemy is
+    # inside the weapon's minimum reach.
+    nearest = min(player.combat_list, key=lambda e: player.combat_proximity.get(e, math.inf))
+    too_close = player.combat_proximity.get(nearest, math.inf) < _min_reach(player)
+    wanted = "Withdraw" if too_close else "Advance"
+    for move in ready:
+        if move.name == wanted:
+            return move, nearest
+    return None, None
+
+
+def _min_reach(player):
+    """The shortest distance at which any of the player's attacks can land."""
+    reaches = [
+        m.mvrange[0] for m in player.known_moves
+        if m.targeted and m.name not in ("Advance", "Withdraw") and hasattr(m, "mvrange")
+    ]
+    return min(reaches, default=0)
+
+
+def _run_beat(adapter, player):
+    """One beat of the adapter's move loop, minus serialization and capture."""
+    adapter._synchronize_distances()
+    for move in player.known_moves:
+        move.advance(player)
+    adapter._process_npc_turns()
+    player.cycle_states()
+    adapter._update_heat()
+    player.combat_beat += 1
+
+
+def run_fight(scenario: Scenario, seed: int) -> FightResult:
+    """Play one fight to a win, a loss or ``scenario.max_beats``."""
+    state = random.getstate()
+    random.seed(seed)
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    try:
+        with capture_narration() as messages:
+            adapter, player = _build_fight(scenario)
+            outcome = "timeout"
+            beats = 0
+            while beats < scenario.max_beats:
+                if player.current_move is None:
+                    move, target = _choose_move(adapter, player, rng)
+                    if move is not None:
+                        move.target = target if move.targeted else player
+                        move.user = player
+                        player.current_move = move
+                        move.cast()
+                        if getattr(move, "instant", False):
+                            guard = 0
+                            while player.current_move is move and guard < 10:
+                                move.advance(player)
+                                guard += 1
+                            continue
+                _run_beat(adapter, player)
+                beats += 1
+                del messages[:]
+                if not player.is_alive() and not player.check_revive():
+                    outcome = "loss"
+                    break
+                if not player.combat_list:
+                    outcome = "win"
+                    break
+    finally:
+        random.setstate(state)
+    return FightResult(
+        seed=seed,
+        outcome=outcome,
+        beats=beats,
+        seconds=time.perf_counter() - start,
+        player_hp=player.hp,
+    )
+
+
+def _run_fight_job(job):
+    return run_fight(*job)
+
+
+def simulate(scenario: Scenario, fights: int, workers: int = 1, seed: int = 0) -> SimReport:
+    """Run ``fights`` seeded fights (seeds ``seed .. seed + fights - 1``).
+
+    ``workers > 1`` spreads them over a process pool; results are identical to
+    a single-process run because every fight is seeded independently.
+    """
+    jobs = [(scenario, seed + i) for i in range(fights)]
+    start = time.perf_counter()
+    if workers > 1:
+        chunksize = max(1, fights // (workers * 8))
+        # spawn, not fork: the engine may already have started threads
+        # (suggestion fetches, loggers) and forking those can deadlock.
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            results = pool.map(_run_fight_job, jobs, chunksize=chunksize)
+    else:
+        results = [_run_fight_job(job) for job in jobs]
+    wall = time.perf_counter() - start
+
+    beats = [r.beats for r in results]
+    total = sum(beats)
+    return SimReport(
+        scenario=scenario.name,
+        fights=fights,
+        workers=workers,
+        wins=sum(r.outcome == "win" for r in results),
+        losses=sum(r.outcome == "loss" for r in results),
+        timeouts=sum(r.outcome == "timeout" for r in results),
+        beats_mean=total / fights if fights else 0.0,
+        beats_p50=percentile(beats, 50) if beats else 0.0,
+        beats_p95=percentile(beats, 95) if beats else 0.0,
+        beats_total=total,
+        wall_seconds=wall,
+        beats_per_second=total / wall if wall else 0.0,
+        fights_per_second=fights / wall if wall else 0.0,
+        results=results,
+    )
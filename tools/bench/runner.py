@@ -0,0 +1,164 @@
+"""Timing/allocation measurement and baseline comparison for benchmarks."""
+
+import gc
+import math
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+# Baseline files carry this so a format change is detected rather than
+# silently compared field-by-field against the wrong numbers.
+BASELINE_VERSION = 1
+
+
+@dataclass
+class BenchResult:
+    name: str
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+    alloc_peak_kib: float  # median per-call peak of newly allocated memory
+    alloc_retained_kib: float  # median per-call memory still held afterwards
+    alloc_blocks: int  # median per-call change in live allocator blocks
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile (``pct`` in 0-100) of ``samples``."""
+    if not samples:
+        raise ValueError("percentile of an empty sample")
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _median(values):
+    return percentile(values, 50)
+
+
+def measure(bench, iterations: int, warmup: int = 3, alloc_iterations: Optional[int] = None) -> BenchResult:
+    """Run ``bench`` (already set up) and summarize latency and allocations.
+
+    Latency and allocations are measured in separate passes: tracemalloc
+    slows every allocation down several-fold, so timing under it would
+    report the tracer, not the code.
+    """
+    if alloc_iterations is None:
+        alloc_iterations = max(1, min(iterations, 20))
+
+    # The engine narrates to stdout on nearly every call; writing that to the
+    # terminal would dominate the timings and bury the report.
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        for _ in range(warmup):
+            bench.run()
+            bench.after_each()
+
+        samples = []
+        gc_was_enabled = gc.isenabled()
+        gc.collect()
+        # Collections are the engine's cost too, but letting one land at a
+        # random iteration turns p99 into noise; collect between calls instead.
+        gc.disable()
+        try:
+            for _ in range(iterations):
+                start = time.perf_counter_ns()
+                bench.run()
+                samples.append((time.perf_counter_ns() - start) / 1e6)
+                bench.after_each()
+                gc.collect(0)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        peaks, retained, blocks = [], [], []
+        tracemalloc.start()
+        try:
+            for _ in range(alloc_iterations):
+                gc.collect()
+                before, _ = tracemalloc.get_traced_memory()
+                blocks_before = sys.getallocatedblocks()
+                tracemalloc.reset_peak()
+                bench.run()
+                _, peak = tracemalloc.get_traced_memory()
+                # Garbage cycles the call left behind aren't "retained".
+                gc.collect()
+                after, _ = tracemalloc.get_traced_memory()
+                blocks.append(sys.getallocatedblocks() - blocks_before)
+                peaks.append(peak - before)
+                retained.append(after - before)
+                bench.after_each()
+        finally:
+            tracemalloc.stop()
+
+    return BenchResult(
+        name=bench.name,
+        iterations=iterations,
+        p50_ms=round(percentile(samples, 50), 3),
+        p95_ms=round(percentile(samples, 95), 3),
+        p99_ms=round(percentile(samples, 99), 3),
+        mean_ms=round(sum(samples) / len(samples), 3),
+        max_ms=round(max(samples), 3),
+        alloc_peak_kib=round(_median(peaks) / 1024, 1),
+        alloc_retained_kib=round(_median(retained) / 1024, 1),
+        alloc_blocks=int(_median(blocks)),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+
+# Metrics compared against the baseline; for all of them, higher is worse.
+_COMPARED = ("p50_ms", "p95_ms", "p99_ms", "alloc_peak_kib")
+
+
+def to_baseline(results: List[BenchResult]) -> dict:
+    return {
+        "version": BASELINE_VERSION,
+        "python": sys.version.split()[0],
+        "results": {r.name: r.to_dict() for r in results},
+    }
+
+
+def compare(baseline: dict, results: List[BenchResult], threshold: float = 0.25) -> List[Dict]:
+    """Return one row per compared metric; ``regressed`` marks the bad ones.
+
+    A metric regresses when it exceeds the baseline by more than
+    ``threshold`` (a fraction: 0.25 == 25% slower/larger). Benchmarks absent
+    from the baseline are reported with ``baseline=None`` and never regress.
+    """
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(
+            f"baseline version {baseline.get('version')!r} != {BASELINE_VERSION}; "
+            "re-record it with --update-baseline"
+        )
+    known = baseline.get("results", {})
+    rows = []
+    for result in results:
+        base = known.get(result.name)
+        for metric in _COMPARED:
+            current = getattr(result, metric)
+            before = base.get(metric) if base else None
+            if before is None:
+                rows.append({"name": result.name, "metric": metric, "baseline": None,
+                             "current": current, "change": None, "regressed": False})
+                continue
+            change = (current - before) / before if before else 0.0
+            rows.append({
+                "name": result.name,
+                "metric": metric,
+                "baseline": before,
+                "current": current,
+                "change": round(change, 3),
+                "regressed": change > threshold,
+            })
+    return rows
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""Heart of Virtue — API hot-path benchmark suite.
+
+Runs the benchmarks in tools/bench/cases.py in-process against the Flask app
+(TestingConfig, no servers needed) and reports p50/p95/p99 latency plus
+per-call allocations. Results can be recorded as a JSON baseline and later
+runs compared against it, so a regression shows up as a diff.
+
+Usage:
+    python tools/benchmark.py                        # run all, compare to baseline
+    python tools/benchmark.py --bench world_move -n 500
+    python tools/benchmark.py --update-baseline      # re-record the baseline
+    python tools/benchmark.py --output /tmp/bench.json
+
+Latency baselines are machine-specific: re-record on the machine that does
+the comparing (CI runner, your laptop) rather than trusting the committed
+numbers across hardware. Allocation figures travel much better.
+
+Exit codes:
+    0  — ran; nothing regressed beyond --threshold
+    1  — one or more metrics regressed beyond --threshold
+    2  — setup failed (import error, benchmark precondition, bad baseline)
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# Bootstrap: project root on sys.path. src/ is deliberately NOT added: every
+# local import uses the canonical `src.` path.
+# ---------------------------------------------------------------------------
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Silence Mynx LLM calls; a network round trip would swamp every timing.
+os.environ.setdefault("MYNX_LLM_ENABLED", "0")
+os.environ.setdefault("MYNX_FALLBACK_DELAY", "0")
+os.environ.setdefault("MYNX_LLM_PROVIDER", "none")
+
+DEFAULT_BASELINE = ROOT / "tools" / "bench" / "baseline.json"
+
+try:
+    from src.api.app import create_app
+    from src.api.config import TestingConfig
+except Exception as exc:
+    print(f"[benchmark] FATAL: could not import Flask app — {exc}", file=sys.stderr)
+    sys.exit(2)
+
+from tools.bench.cases import BenchmarkError, get_benchmarks  # noqa: E402
+from tools.bench.runner import compare, measure, to_baseline  # noqa: E402
+
+
+def _print_results(results, rows):
+    print(f"\n{'benchmark':<24}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'peak KiB':>11}{'kept KiB':>11}{'blocks':>9}")
+    for r in results:
+        print(f"{r.name:<24}{r.p50_ms:>10.3f}{r.p95_ms:>10.3f}{r.p99_ms:>10.3f}"
+              f"{r.alloc_peak_kib:>11.1f}{r.alloc_retained_kib:>11.1f}{r.alloc_blocks:>9}")
+    if rows is None:
+        return
+    changed = [row for row in rows if row["baseline"] is not None]
+    if not changed:
+        print("\n[benchmark] No baseline entries for these benchmarks.")
+        return
+    print(f"\n{'vs baseline':<24}{'metric':<16}{'before':>10}{'now':>10}{'change':>9}")
+    for row in changed:
+        flag = "  REGRESSED" if row["regressed"] else ""
+        print(f"{row['name']:<24}{row['metric']:<16}{row['baseline']:>10}"
+              f"{row['current']:>10}{row['change']:>+9.0%}{flag}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Heart of Virtue API benchmark suite.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--bench", metavar="NAME", help="Run only the named benchmark.")
+    parser.add_argument("-n", "--iterations", type=int, default=200,
+                        help="Timed calls per benchmark (default: 200).")
+    parser.add_argument("--warmup", type=int, default=5,
+                        help="Untimed calls before measuring (default: 5).")
+    parser.add_argument("--baseline", metavar="FILE", default=str(DEFAULT_BASELINE),
+                        help="Baseline JSON to compare against / update.")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write this run's results to --baseline instead of comparing.")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Fractional increase that counts as a regression (default: 0.25).")
+    parser.add_argument("--output", metavar="FILE", help="Also write this run's results to FILE.")
+    args = parser.parse_args()
+
+    benchmarks = get_benchmarks(name=args.bench)
+    if not benchmarks:
+        print(f"[benchmark] Unknown benchmark: {args.bench!r}", file=sys.stderr)
+        return 2
+
+    try:
+        app, _ = create_app(TestingConfig)
+    except Exception as exc:
+        print(f"[benchmark] FATAL: create_app failed — {exc}", file=sys.stderr)
+        return 2
+
+    results = []
+    for bench in benchmarks:
+        print(f"[benchmark] {bench.name} — {bench.description}", flush=True)
+        try:
+            bench.setup(app)
+            try:
+                results.append(measure(bench, args.iterations, warmup=args.warmup))
+            finally:
+                bench.teardown()
+        except BenchmarkError as exc:
+            print(f"[benchmark] FATAL: {bench.name}: {exc}", file=sys.stderr)
+            return 2
+
+    current = to_baseline(results)
+    if args.output:
+        out_path = Path(args.output)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(current, indent=2) + "\n")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        # Merge so re-recording one benchmark keeps the others' entries.
+        merged = current
+        if baseline_path.exists():
+            merged = json.loads(baseline_path.read_text())
+            merged["results"].update(current["results"])
+            merged["python"] = current["python"]
+        baseline_path.write_text(json.dumps(merged, indent=2, sort_keys=True) + "\n")
+        _print_results(results, None)
+        print(f"\n[benchmark] Baseline written to {baseline_path}")
+        return 0
+
+    rows = None
+    if baseline_path.exists():
+        try:
+            rows = compare(json.loads(baseline_path.read_text()), results, args.threshold)
+        except ValueError as exc:
+            print(f"[benchmark] FATAL: {exc}", file=sys.stderr)
+            return 2
+    _print_results(results, rows)
+    return 1 if rows and any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,21 @@
 """WSGI entry point for production deployments.
 
 async_mode="threading" — WebSockets work with Werkzeug (dev) and fall back to
-long-polling behind gunicorn sync workers (acceptable for single-player).
+long-polling behind gunicorn's threaded workers (acceptable for single-player).
 
 Usage (gunicorn, threading mode):
-    gunicorn -w 1 --bind "0.0.0.0:${PORT:-5000}" wsgi:app
+    gunicorn -w 1 --threads ${WEB_THREADS:-8} --bind "0.0.0.0:${PORT:-5000}" wsgi:app
+
+--threads matters even for one worker: Flask holds a request thread for the
+whole of an ``async def`` view, so a plain sync worker serves one request at a
+time and a login's Argon2 hash stalls every gameplay request behind it. The
+password pool admits at most half of WEB_THREADS logins at once (see
+src/api/password_pool.py), leaving the other threads for gameplay.
+
+Several workers on one host need a shared session store, since each worker
+otherwise keeps its sessions in its own memory:
+    SESSION_STORE_URL=sqlite:////var/lib/hov/sessions.db \
+        gunicorn -w 4 --threads ${WEB_THREADS:-8} --bind "0.0.0.0:${PORT:-5000}" wsgi:app
 
 Or with flask run (dev):
     python tools/run_api.py